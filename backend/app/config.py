@@ -1,5 +1,8 @@
 """Application configuration loaded from environment variables."""
 
+from datetime import date, time
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 from pydantic import Field, model_validator
 
@@ -19,6 +22,10 @@ class Settings(BaseSettings):
     DB_HOST: str = "localhost"
     DB_PORT: int = 3306
     DATABASE_URL: str | None = None
+    DB_UUID_BINARY: bool = Field(
+        default=False,
+        description="Store UUID keys as BINARY(16) instead of CHAR(36) (see migrations/001_uuid_binary16.sql)",
+    )
 
     @model_validator(mode="after")
     def assemble_db_connection(self) -> "Settings":
@@ -42,6 +49,97 @@ class Settings(BaseSettings):
     RATE_LIMIT_PER_MINUTE: int = 60
     RATE_LIMIT_BULK_PER_MINUTE: int = 10
 
+    # List filters (GET /employees, GET /attendance): repeated or comma-separated values
+    LIST_FILTER_MAX_VALUES: int = Field(default=500, ge=1, description="Max values per multi-value list filter")
+
+    # Idempotency-Key store (POST create endpoints)
+    IDEMPOTENCY_TTL_SECONDS: int = Field(default=24 * 60 * 60, description="How long a stored response can be replayed")
+    IDEMPOTENCY_MAX_ENTRIES: int = Field(default=10_000, description="LRU bound on stored responses")
+
+    # Response compression
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = Field(default=1024, description="Bodies smaller than this (bytes) are sent uncompressed")
+    COMPRESSION_GZIP_LEVEL: int = Field(default=6, ge=1, le=9)
+    COMPRESSION_BROTLI_QUALITY: int = Field(default=4, ge=0, le=11)
+
+    # Change feed
+    CHANGES_SETTLE_SECONDS: int = Field(
+        default=2,
+        description="Minimum hold-back for recent changes; on MySQL the feed also waits for the oldest "
+        "open writing transaction, so late-committing rows are not skipped",
+    )
+    CHANGES_TOMBSTONE_RETENTION_DAYS: int = Field(
+        default=30,
+        ge=1,
+        description="Delete tombstones older than this (scripts.purge_tombstones); older cursors get 410",
+    )
+
+    # Batch endpoint
+    BATCH_MAX_REQUESTS: int = Field(default=20, description="Max GET sub-requests per POST /batch")
+
+    # Attendance upsert (POST /attendance/upsert[/batch]) — how a re-sent record merges into the stored one:
+    # replace = incoming wins when given, fill = only fills a NULL, keep = never changed,
+    # earliest / latest = the smaller / larger of the two. Fields not listed are kept.
+    ATTENDANCE_UPSERT_RULES: dict[
+        Literal["status", "check_in", "check_out", "notes"], Literal["replace", "fill", "keep", "earliest", "latest"]
+    ] = Field(default={"status": "replace", "check_in": "earliest", "check_out": "latest", "notes": "fill"})
+    ATTENDANCE_UPSERT_MAX_BATCH: int = Field(default=1_000, description="Max records per POST /attendance/upsert/batch")
+
+    # Write-behind attendance intake (POST /attendance/intake, app/services/attendance_intake.py)
+    ATTENDANCE_INTAKE_ENABLED: bool = False
+    ATTENDANCE_INTAKE_QUEUE_SIZE: int = Field(default=10_000, ge=1, description="Queued records before 429")
+    ATTENDANCE_INTAKE_BATCH_SIZE: int = Field(default=500, ge=1, description="Records per multi-row write")
+    ATTENDANCE_INTAKE_FLUSH_MS: int = Field(default=200, ge=1, description="Max wait for a batch to fill")
+    ATTENDANCE_INTAKE_MAX_RESULTS: int = Field(default=100_000, description="LRU bound on pollable intake results")
+
+    # NDJSON bulk ingest (POST /attendance/bulk, app/services/ndjson_ingest.py)
+    ATTENDANCE_NDJSON_BATCH_SIZE: int = Field(default=500, ge=1, description="Lines per write transaction")
+    ATTENDANCE_NDJSON_MAX_LINE_BYTES: int = Field(default=64 * 1024, description="Longer lines are rejected")
+
+    # Background jobs (/jobs, app/services/job_runner.py)
+    JOBS_ENABLED: bool = Field(default=True, description="Run queued jobs in this process")
+    JOB_WORKERS: int = Field(default=2, ge=1, description="Jobs run concurrently per process")
+    JOB_PROCESS_WORKERS: int = Field(
+        default=2, ge=0, description="Process pool for CPU-bound job steps; 0 = run them in a thread"
+    )
+    JOB_POLL_SECONDS: float = Field(default=2.0, gt=0, description="Queue poll / heartbeat interval")
+    JOB_STALE_SECONDS: int = Field(default=60, description="A running job without a heartbeat this long is requeued")
+    JOB_MAX_ATTEMPTS: int = Field(default=3, ge=1)
+    JOB_RESULT_DIR: str | None = Field(default=None, description="Job inputs and results; unset = <tmp>/hrms-jobs")
+    JOB_RETENTION_HOURS: int = Field(default=7 * 24, description="Finished jobs and their files are deleted after this")
+    JOB_IMPORT_MAX_BYTES: int = Field(default=200 * 1024 * 1024, description="Largest accepted import upload")
+
+    # Attendance archival (scripts.archive_attendance)
+    ATTENDANCE_ARCHIVE_AFTER_MONTHS: int = Field(
+        default=24, ge=1, description="Whole months of attendance kept in the live (partitioned) table"
+    )
+    ATTENDANCE_ARCHIVE_BATCH_SIZE: int = Field(default=5_000, description="Rows moved per archival transaction")
+    ATTENDANCE_PARTITIONS_AHEAD: int = Field(default=3, description="Future monthly partitions kept pre-created (MySQL)")
+    ATTENDANCE_SNAPSHOT_DIR: str | None = Field(
+        default=None,
+        description="Memory-mapped columnar files of closed archived months (scripts.snapshot_attendance); unset = off",
+    )
+
+    # Dashboard aggregation backend: "sql" (DashboardRepository) or "columnar"
+    # (in-process NumPy engine, app/services/columnar_engine.py — needs numpy)
+    DASHBOARD_BACKEND: Literal["sql", "columnar"] = "sql"
+    DASHBOARD_TREND_MAX_DAYS: int = Field(default=366, description="Longest range accepted by /dashboard/trend")
+
+    # Analytics (/analytics/absenteeism — needs numpy)
+    ANALYTICS_MAX_DAYS: int = Field(default=731, description="Longest range accepted by /analytics endpoints")
+    ANALYTICS_CACHE_MAX_ENTRIES: int = Field(default=64, description="LRU bound on cached analytics responses")
+    HEATMAP_MAX_DAYS: int = Field(default=92, description="Longest range accepted by /analytics/heatmap (a quarter)")
+    WORKDAY_START: time = Field(default=time(9, 0), description="Check-ins after this count as late arrivals")
+    WORKDAY_END: time = Field(default=time(18, 0), description="Check-outs before this count as early departures")
+
+    # Nightly auto-absent job (app/services/auto_absent.py, scripts.mark_absent)
+    AUTO_ABSENT_ENABLED: bool = Field(default=False, description="Run the auto-absent job in-process every day")
+    AUTO_ABSENT_AT: time = Field(default=time(23, 55), description="Local time of the daily in-process run")
+
+    # Working-day calendar (app/services/work_calendar.py)
+    WEEKEND_DAYS: set[int] = Field(default={5, 6}, description="Non-working weekdays, Monday = 0")
+    HOLIDAYS: set[date] = Field(default_factory=set, description='Non-working dates, e.g. ["2025-12-25"]')
+
     # Logging
     LOG_LEVEL: str = "INFO"
     SLOW_QUERY_THRESHOLD_MS: int = Field(default=200, description="Warn on queries exceeding this threshold (ms)")
@@ -1,7 +1,11 @@
 """Database engine, session management, and base model."""
 
+from sqlalchemy import Date, DateTime, Integer
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql.functions import FunctionElement
 
 from app.config import settings
 
@@ -18,6 +22,75 @@ async_session_factory = async_sessionmaker(
 )
 
 
+# MySQL DATETIME has second precision. SQLite stores DATETIME as text, so pin it
+# to the format CURRENT_TIMESTAMP produces; otherwise server-default and
+# Python-supplied timestamps compare inconsistently (keyset cursors, MAX()).
+Timestamp = DateTime().with_variant(
+    sqlite.DATETIME(
+        storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
+    ),
+    "sqlite",
+)
+
+
+class seconds_of_day(FunctionElement):
+    """Seconds after midnight of a TIME column, for in-SQL duration arithmetic."""
+
+    type = Integer()
+    inherit_cache = True
+
+
+@compiles(seconds_of_day)
+def _seconds_of_day_mysql(element, compiler, **kw):
+    return f"TIME_TO_SEC({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(seconds_of_day, "sqlite")
+def _seconds_of_day_sqlite(element, compiler, **kw):
+    # TIME is stored as 'HH:MM:SS.ffffff' text; strftime reads it as a time on 2000-01-01
+    value = compiler.process(element.clauses, **kw)
+    return f"(CAST(strftime('%s', {value}) AS INTEGER) - CAST(strftime('%s', '00:00') AS INTEGER))"
+
+
+class add_days(FunctionElement):
+    """``add_days(date, n)`` — the DATE n days after a DATE expression."""
+
+    type = Date()
+    inherit_cache = True
+
+
+@compiles(add_days)
+def _add_days_mysql(element, compiler, **kw):
+    day, days = (compiler.process(clause, **kw) for clause in element.clauses)
+    # CAST keeps the result a DATE even when the first argument is a bound string
+    return f"CAST(DATE_ADD({day}, INTERVAL {days} DAY) AS DATE)"
+
+
+@compiles(add_days, "sqlite")
+def _add_days_sqlite(element, compiler, **kw):
+    # DATE is stored as 'YYYY-MM-DD' text, which date() reads and writes
+    day, days = (compiler.process(clause, **kw) for clause in element.clauses)
+    return f"date({day}, '+' || ({days}) || ' days')"
+
+
+class weekday(FunctionElement):
+    """Day of week of a DATE expression, Monday = 0 (as Python's date.weekday())."""
+
+    type = Integer()
+    inherit_cache = True
+
+
+@compiles(weekday)
+def _weekday_mysql(element, compiler, **kw):
+    return f"WEEKDAY({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(weekday, "sqlite")
+def _weekday_sqlite(element, compiler, **kw):
+    # strftime('%w') counts from Sunday = 0
+    return f"((CAST(strftime('%w', {compiler.process(element.clauses, **kw)}) AS INTEGER) + 6) % 7)"
+
+
 class Base(DeclarativeBase):
     """Declarative base for all ORM models."""
     pass
@@ -8,12 +8,20 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
-from app.database import dispose_db, init_db
+from app.database import async_session_factory, dispose_db, init_db
+from app.middleware.compression import CompressionMiddleware
 from app.middleware.error_handler import register_error_handlers
 from app.middleware.rate_limiter import RateLimiterMiddleware
 from app.middleware.request_id import RequestIdMiddleware
 from app.middleware.request_logger import RequestLoggerMiddleware
-from app.routes import attendance, dashboard, employee
+from app.routes import analytics, attendance, batch, changes, dashboard, employee, jobs
+from app.services import auto_absent
+from app.services.analytics_service import analytics_cache_stats
+from app.services.attendance_intake import attendance_intake
+from app.services.columnar_engine import available as columnar_available, columnar_engine
+from app.services.idempotency import idempotency_store
+from app.services.job_runner import job_runner
+from app.services.single_flight import coalescing_stats
 
 
 def configure_logging() -> None:
@@ -38,8 +46,21 @@ async def lifespan(app: FastAPI):
         await init_db()
         logger.info("Database tables created (development mode)")
 
+    if settings.AUTO_ABSENT_ENABLED:
+        auto_absent.start_nightly()
+    if settings.ATTENDANCE_INTAKE_ENABLED:
+        attendance_intake.start()
+    if settings.JOBS_ENABLED:
+        job_runner.start()
+    if settings.DASHBOARD_BACKEND == "columnar" and columnar_available():
+        columnar_engine.start_warmup(async_session_factory)
+
     yield
 
+    await columnar_engine.stop_warmup()
+    await job_runner.stop()
+    await attendance_intake.stop()
+    await auto_absent.stop_nightly()
     await dispose_db()
     logger.info(f"{settings.APP_NAME} shut down")
 
@@ -66,6 +87,8 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    if settings.COMPRESSION_ENABLED:
+        app.add_middleware(CompressionMiddleware)
     app.add_middleware(RateLimiterMiddleware)
     app.add_middleware(RequestLoggerMiddleware)
     app.add_middleware(RequestIdMiddleware)
@@ -77,10 +100,26 @@ def create_app() -> FastAPI:
     app.include_router(employee.router, prefix=settings.API_V1_PREFIX)
     app.include_router(attendance.router, prefix=settings.API_V1_PREFIX)
     app.include_router(dashboard.router, prefix=settings.API_V1_PREFIX)
+    app.include_router(analytics.router, prefix=settings.API_V1_PREFIX)
+    app.include_router(changes.router, prefix=settings.API_V1_PREFIX)
+    app.include_router(batch.router, prefix=settings.API_V1_PREFIX)
+    app.include_router(jobs.router, prefix=settings.API_V1_PREFIX)
 
     # --- Health endpoint ---
     @app.get("/api/v1/health", tags=["Health"])
     async def health_check():
         return {"status": "ok", "app": settings.APP_NAME, "env": settings.APP_ENV}
 
+    # --- In-process performance counters ---
+    @app.get("/api/v1/metrics", tags=["Health"])
+    async def metrics():
+        return {
+            "single_flight": coalescing_stats(),
+            "idempotency": idempotency_store.stats(),
+            "columnar_engine": columnar_engine.stats(),
+            "analytics_cache": analytics_cache_stats(),
+            "attendance_intake": attendance_intake.stats(),
+            "jobs": job_runner.stats(),
+        }
+
     return app
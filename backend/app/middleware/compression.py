@@ -0,0 +1,215 @@
+"""Negotiated response compression middleware (brotli / gzip).
+
+List pages and dashboard breakdowns are shipped as JSON over slow branch-office
+links; compressing them typically shrinks payloads 5-10x for a small CPU cost.
+
+Implemented as a pure ASGI middleware (not BaseHTTPMiddleware) so streaming
+responses such as exports are compressed chunk by chunk instead of buffered.
+"""
+
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+try:  # Optional dependency — brotli is only offered when installed
+    import brotli
+except ImportError:  # pragma: no cover - depends on environment
+    brotli = None
+
+# Payloads that are already compressed or must not be buffered by proxies
+EXCLUDED_CONTENT_TYPES = (
+    "image/",
+    "audio/",
+    "video/",
+    "application/zip",
+    "application/gzip",
+    "text/event-stream",
+)
+
+
+def _parse_accept_encoding(value: str) -> dict[str, float]:
+    """Parse an Accept-Encoding header into {coding: q-value}."""
+    codings: dict[str, float] = {}
+    for part in value.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        codings[token] = q
+    return codings
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """Pick the best supported coding for the client, preferring brotli."""
+    codings = _parse_accept_encoding(accept_encoding)
+    wildcard = codings.get("*", 0.0)
+    candidates = ["br", "gzip"] if brotli is not None else ["gzip"]
+
+    best, best_q = None, 0.0
+    for coding in candidates:
+        q = codings.get(coding, wildcard)
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class _Compressor:
+    """Incremental compressor with a uniform interface for each coding."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._impl = brotli.Compressor(quality=brotli_quality)
+        else:
+            # wbits=31 → gzip container
+            self._impl = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it so the client can decode progressively."""
+        if self.encoding == "br":
+            return self._impl.process(data) + self._impl.flush()
+        return self._impl.compress(data) + self._impl.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._impl.finish()
+        return self._impl.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """Compress response bodies based on the client's Accept-Encoding.
+
+    Behaviour:
+        - Prefers brotli when the library is installed, falls back to gzip
+        - Skips bodies below COMPRESSION_MINIMUM_SIZE (single-message responses)
+        - Skips responses that already carry a Content-Encoding
+        - Streams multi-chunk responses without buffering them
+        - Always adds ``Vary: Accept-Encoding`` to compressible responses
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int | None = None,
+        gzip_level: int | None = None,
+        brotli_quality: int | None = None,
+    ):
+        self.app = app
+        self.minimum_size = (
+            minimum_size if minimum_size is not None else settings.COMPRESSION_MINIMUM_SIZE
+        )
+        self.gzip_level = gzip_level if gzip_level is not None else settings.COMPRESSION_GZIP_LEVEL
+        self.brotli_quality = (
+            brotli_quality if brotli_quality is not None else settings.COMPRESSION_BROTLI_QUALITY
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(
+            self.app, encoding, self.minimum_size, self.gzip_level, self.brotli_quality
+        )
+        await responder(scope, receive, send)
+
+
+class _CompressionResponder:
+    """Per-request state machine wrapping the downstream ``send`` callable."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        encoding: str,
+        minimum_size: int,
+        gzip_level: int,
+        brotli_quality: int,
+    ):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.send: Send | None = None
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+        self.compressor: _Compressor | None = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    async def send_with_compression(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            # Hold the start message until we know whether the body is compressed
+            self.initial_message = message
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] in (204, 206, 304)
+                or content_type.startswith(EXCLUDED_CONTENT_TYPES)
+            )
+            if self.passthrough:
+                await self.send(message)
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+            if not more_body and len(body) < self.minimum_size:
+                # Too small to be worth the CPU — send untouched
+                await self.send(self.initial_message)
+                await self.send(message)
+                return
+
+            self.compressor = _Compressor(self.encoding, self.gzip_level, self.brotli_quality)
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+
+            if not more_body:
+                compressed = self.compressor.compress(body) + self.compressor.finish()
+                headers["Content-Length"] = str(len(compressed))
+                await self.send(self.initial_message)
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+
+            # Streaming: length is unknown up front
+            if "content-length" in headers:
+                del headers["Content-Length"]
+            await self.send(self.initial_message)
+
+        if self.compressor is None:
+            # Uncompressed small response followed by stray messages
+            await self.send(message)
+            return
+
+        chunk = self.compressor.compress(body) if body else b""
+        if not more_body:
+            chunk += self.compressor.finish()
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
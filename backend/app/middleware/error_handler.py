@@ -4,18 +4,18 @@ Maps application exceptions and DB errors to the global error response contract.
 Never leaks internal details (SQL, stack traces, table names).
 """
 
-import logginggg
+import logging
 
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponseeeehelloworldddmm
+from fastapi.responses import JSONResponse
 
-from app.services.exceptionssss import AppException
+from app.services.exceptions import AppException
 
-logger = logginger.getLogger(__name__)
+logger = logging.getLogger(__name__)
 
 
-def register_error_handlerser(app: FastAPI) -> None:
+def register_error_handlers(app: FastAPI) -> None:
     """Register all exception handlers on the FastAPI app."""
 
     @app.exception_handler(AppException)
@@ -28,6 +28,7 @@ def register_error_handlerser(app: FastAPI) -> None:
                 "message": exc.message,
                 "details": exc.details,
             },
+            headers=exc.headers,
         )
 
     @app.exception_handler(RequestValidationError)
@@ -1,6 +1,11 @@
 """ORM model package."""
 
+from app.models.department import Department
 from app.models.employee import Employee
 from app.models.attendance import Attendance
+from app.models.attendance_archive import AttendanceArchive
+from app.models.archive_horizon import ArchiveHorizon
+from app.models.change_tombstone import ChangeTombstone
+from app.models.job import Job
 
-__all__ = ["Employee", "Attendance"]
+__all__ = ["Department", "Employee", "Attendance", "AttendanceArchive", "ArchiveHorizon", "ChangeTombstone", "Job"]
@@ -0,0 +1,37 @@
+"""Archive horizon ORM model — how far attendance has been closed and archived."""
+
+from datetime import date, datetime
+
+from sqlalchemy import Date, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base, Timestamp
+
+
+class ArchiveHorizon(Base):
+    """Single row (id = 1) recording the attendance archive horizon.
+
+    ``closed_through`` is advanced when an archival run starts: from then on
+    writes dated on or before it are rejected, and readers consult the
+    archive for ranges reaching back to it. ``archived_through`` is advanced
+    to the same date only once the run has moved every row, so everything
+    on or before it is in ``attendance_archive`` — snapshot files and
+    partition drops key off it. Both are stored rather than derived from
+    MAX(attendance_archive.date), which says nothing about whether a date
+    was archived whole.
+    """
+
+    __tablename__ = "attendance_archive_horizon"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, default=1)
+    closed_through: Mapped[date | None] = mapped_column(Date, nullable=True)
+    archived_through: Mapped[date | None] = mapped_column(Date, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        Timestamp,
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ArchiveHorizon(closed_through={self.closed_through}, archived_through={self.archived_through})>"
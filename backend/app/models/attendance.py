@@ -1,22 +1,23 @@
 """Attendance ORM model with composite uniqueness and CHECK constraints."""
 
-import uuid
 from datetime import date, datetime, time
 
 from sqlalchemy import (
     CheckConstraint,
     Date,
-    DateTime,
     ForeignKey,
-    String,
+    Index,
+    Integer,
     Text,
     Time,
     UniqueConstraint,
     func,
+    literal_column,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, Timestamp
+from app.models.types import STATUS_CODES, StatusCode, UUIDKey, new_id
 
 
 class Attendance(Base):
@@ -25,39 +26,49 @@ class Attendance(Base):
     Invariants enforced at DB level:
         - INV-3: UNIQUE(employee_id, date) — one record per employee per day
         - INV-4: FK to employee with ON DELETE CASCADE
-        - INV-6: status CHECK constraint for closed value set
-        - INV-9: created_at / updated_at are system-managed
+        - INV-6: status CHECK constraint for closed value set (1-byte codes)
+        - INV-9: created_at / updated_at / version are system-managed
     """
 
     __tablename__ = "attendance"
     __table_args__ = (
         UniqueConstraint("employee_id", "date", name="uq_attendance_emp_date"),
         CheckConstraint(
-            "status IN ('PRESENT', 'ABSENT', 'HALF_DAY', 'ON_LEAVE')",
+            f"status IN ({', '.join(str(code) for code in STATUS_CODES.values())})",
             name="ck_attendance_status",
         ),
+        # Change feed keyset scan on (updated_at, id); also serves MAX(updated_at) for ETags
+        Index("idx_attendance_updated_at_id", "updated_at", "id"),
+        # list(): date range / exact date + ORDER BY date DESC, created_at DESC without a filesort
+        Index("idx_attendance_date_created_at", "date", "created_at"),
+        # list(status=...): equality first, then the same range + sort
+        Index("idx_attendance_status_date_created_at", "status", "date", "created_at"),
+        # Dashboard aggregates: covering for date range → join key → status
+        Index("idx_attendance_date_employee_status", "date", "employee_id", "status"),
+        # Worked-hours / punctuality aggregates: covering for date range → join key → times
+        Index("idx_attendance_date_employee_times", "date", "employee_id", "check_in", "check_out"),
+        # employee_id lookups (and the FK) use the uq_attendance_emp_date prefix
     )
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDKey(),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
-        doc="UUID primary key",
+        default=new_id,
+        doc="UUIDv7 primary key — time-ordered",
     )
     employee_id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDKey(),
         ForeignKey("employee.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     date: Mapped[date] = mapped_column(
         Date,
         nullable=False,
-        index=True,
     )
     status: Mapped[str] = mapped_column(
-        String(20),
+        StatusCode(),
         nullable=False,
+        doc="Stored as a 1-byte code (see STATUS_CODES); read/written as the status name",
     )
     check_in: Mapped[time | None] = mapped_column(
         Time,
@@ -72,21 +83,33 @@ class Attendance(Base):
         nullable=True,
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        Timestamp,
         nullable=False,
         server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        Timestamp,
         nullable=False,
         server_default=func.now(),
         onupdate=func.now(),
     )
+    # Bumped by every UPDATE: updated_at has 1s precision, so detail ETags need
+    # this to tell two writes within the same second apart
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+        server_default="1",
+        onupdate=literal_column("version") + 1,
+    )
 
-    # Relationship — many-to-one
+    # Relationship — many-to-one. employee_id is a NOT NULL FK, so eager loads
+    # use an INNER JOIN: the chain attendance → employee → department stays a
+    # plain nested loop instead of a materialized (employee JOIN department).
     employee: Mapped["Employee"] = relationship(
         "Employee",
         back_populates="attendances",
+        innerjoin=True,
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,53 @@
+"""Archived attendance ORM model — cold storage for rows past the archive horizon."""
+
+from datetime import date, datetime, time
+
+from sqlalchemy import Date, Index, Integer, Text, Time, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.database import Base, Timestamp
+from app.models.types import StatusCode, UUIDKey
+
+
+class AttendanceArchive(Base):
+    """Attendance rows older than ``ATTENDANCE_ARCHIVE_AFTER_MONTHS``.
+
+    Column-for-column copy of ``attendance`` so the two can be UNION ALL'd
+    into one source. Rows are moved here by ``scripts.archive_attendance``
+    and are read-only from the API's point of view. There is deliberately no
+    FK to employee: employee deletes clean this table up in the repository.
+    Exposes the same attributes as Attendance (including ``employee``), so
+    list endpoints render archived rows unchanged.
+    """
+
+    __tablename__ = "attendance_archive"
+    __table_args__ = (
+        # INV-3 still holds for archived history
+        UniqueConstraint("employee_id", "date", name="uq_attendance_archive_emp_date"),
+        # Same access paths as the live table (see Attendance.__table_args__)
+        Index("idx_attendance_archive_date_created_at", "date", "created_at"),
+        Index("idx_attendance_archive_date_employee_status", "date", "employee_id", "status"),
+        Index("idx_attendance_archive_date_employee_times", "date", "employee_id", "check_in", "check_out"),
+    )
+
+    id: Mapped[str] = mapped_column(UUIDKey(), primary_key=True)
+    employee_id: Mapped[str] = mapped_column(UUIDKey(), nullable=False)
+    date: Mapped[date] = mapped_column(Date, nullable=False)
+    status: Mapped[str] = mapped_column(StatusCode(), nullable=False)
+    check_in: Mapped[time | None] = mapped_column(Time, nullable=True)
+    check_out: Mapped[time | None] = mapped_column(Time, nullable=True)
+    notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(Timestamp, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(Timestamp, nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # Relationship — many-to-one, read-only (no FK constraint to infer it from)
+    employee: Mapped["Employee"] = relationship(
+        "Employee",
+        primaryjoin="foreign(AttendanceArchive.employee_id) == Employee.id",
+        viewonly=True,
+        innerjoin=True,
+    )
+
+    def __repr__(self) -> str:
+        return f"<AttendanceArchive(id={self.id}, employee={self.employee_id}, date={self.date})>"
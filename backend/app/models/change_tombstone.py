@@ -0,0 +1,47 @@
+"""Tombstone ORM model — records hard deletes for the change feed."""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base, Timestamp
+from app.models.types import UUIDKey
+
+
+class ChangeTombstone(Base):
+    """One row per hard-deleted employee or attendance record.
+
+    Employee and attendance deletes are hard deletes, so without a tombstone
+    an incremental consumer of ``GET /changes`` could never learn that a row
+    disappeared. Cascaded attendance deletes (INV-8) get tombstones too.
+    """
+
+    __tablename__ = "change_tombstone"
+    __table_args__ = (
+        # Change-feed cursor scan: WHERE (deleted_at, id) > (:ts, :id) ORDER BY deleted_at, id
+        Index("idx_change_tombstone_deleted_at_id", "deleted_at", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    entity: Mapped[str] = mapped_column(
+        String(20),
+        nullable=False,
+        doc="'employee' or 'attendance'",
+    )
+    entity_id: Mapped[str] = mapped_column(
+        UUIDKey(),
+        nullable=False,
+    )
+    deleted_at: Mapped[datetime] = mapped_column(
+        Timestamp,
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ChangeTombstone(entity={self.entity}, entity_id={self.entity_id}, deleted_at={self.deleted_at})>"
@@ -0,0 +1,36 @@
+"""Department ORM model — normalized dimension for employee.department."""
+
+from sqlalchemy import Integer, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+# SMALLINT keeps employee.department_id (and its index) at 2 bytes per row.
+# SQLite only auto-increments an INTEGER PRIMARY KEY, hence the variant.
+DepartmentKey = SmallInteger().with_variant(Integer, "sqlite")
+
+
+class Department(Base):
+    """Department entity.
+
+    The API still speaks department names; employees reference this table by
+    a small integer key so filters, joins and GROUP BY operate on integers
+    instead of utf8mb4 strings.
+    """
+
+    __tablename__ = "department"
+
+    id: Mapped[int] = mapped_column(
+        DepartmentKey,
+        primary_key=True,
+        autoincrement=True,
+    )
+    # Case-insensitive like MySQL's utf8mb4_unicode_ci (the department cache relies on it)
+    name: Mapped[str] = mapped_column(
+        String(100).with_variant(String(100, collation="NOCASE"), "sqlite"),
+        unique=True,
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<Department(id={self.id}, name={self.name})>"
@@ -1,13 +1,13 @@
 """Employee ORM model with DB-level integrity constraints."""
 
-import uuid
 from datetime import date, datetime
 
-from sqlalchemy import Boolean, Date, DateTime, String, func
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy import Boolean, Date, ForeignKey, Index, Integer, String, func, literal_column
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.database import Base
+from app.database import Base, Timestamp
+from app.models.department import DepartmentKey
+from app.models.types import UUIDKey, new_id
 
 
 class Employee(Base):
@@ -17,16 +17,25 @@ class Employee(Base):
         - INV-1: email is globally unique
         - INV-2: employee_code is globally unique
         - INV-8: deleting employee cascades attendance deletion
-        - INV-9: created_at / updated_at are system-managed
+        - INV-9: created_at / updated_at / version are system-managed
     """
 
     __tablename__ = "employee"
+    __table_args__ = (
+        # Change feed keyset scan on (updated_at, id); also serves MAX(updated_at) for ETags
+        Index("idx_employee_updated_at_id", "updated_at", "id"),
+        # list(): ORDER BY created_at DESC, optionally narrowed by is_active / department
+        Index("idx_employee_created_at", "created_at"),
+        Index("idx_employee_active_created_at", "is_active", "created_at"),
+        # Department filter (+ active) for list() and dashboard counts; also the FK index
+        Index("idx_employee_department_active_created_at", "department_id", "is_active", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36),
+        UUIDKey(),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
-        doc="UUID primary key — non-enumerable, globally unique",
+        default=new_id,
+        doc="UUIDv7 primary key — time-ordered, non-enumerable, globally unique",
     )
     employee_code: Mapped[str] = mapped_column(
         String(20),
@@ -45,10 +54,11 @@ class Employee(Base):
         nullable=False,
         index=True,
     )
-    department: Mapped[str] = mapped_column(
-        String(100),
+    department_id: Mapped[int] = mapped_column(
+        DepartmentKey,
+        ForeignKey("department.id"),
         nullable=False,
-        index=True,
+        doc="Integer key into the department dimension",
     )
     designation: Mapped[str | None] = mapped_column(
         String(100),
@@ -66,19 +76,34 @@ class Employee(Base):
         Boolean,
         nullable=False,
         default=True,
-        index=True,
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        Timestamp,
         nullable=False,
         server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        Timestamp,
         nullable=False,
         server_default=func.now(),
         onupdate=func.now(),
     )
+    # Bumped by every UPDATE: updated_at has 1s precision, so detail ETags need
+    # this to tell two writes within the same second apart
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+        server_default="1",
+        onupdate=literal_column("version") + 1,
+    )
+
+    # Relationship — many-to-one, always joined (tiny table, name needed in every response)
+    department_ref: Mapped["Department"] = relationship(
+        "Department",
+        lazy="joined",
+        innerjoin=True,
+    )
 
     # Relationship — one-to-many with cascade delete
     attendances: Mapped[list["Attendance"]] = relationship(
@@ -88,5 +113,10 @@ class Employee(Base):
         passive_deletes=True,
     )
 
+    @property
+    def department(self) -> str:
+        """Department name — the API keeps speaking strings."""
+        return self.department_ref.name
+
     def __repr__(self) -> str:
         return f"<Employee(id={self.id}, code={self.employee_code}, name={self.name})>"
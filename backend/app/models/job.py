@@ -0,0 +1,111 @@
+"""Background job ORM model — the persisted state behind /jobs."""
+
+from datetime import datetime
+
+from sqlalchemy import JSON, Boolean, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base, Timestamp
+from app.models.types import new_id
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed", "cancelled")
+FINISHED_STATUSES = ("succeeded", "failed", "cancelled")
+
+
+class Job(Base):
+    """One submitted job (app/services/job_runner.py).
+
+    The table is the queue of record: runners claim queued rows with a
+    conditional UPDATE, keep ``heartbeat_at`` fresh while a job runs, and
+    requeue running rows whose heartbeat went stale. A job therefore
+    survives a worker restart and can be polled from any instance.
+    """
+
+    __tablename__ = "job"
+    __table_args__ = (
+        # Claim scan (status = 'queued' ORDER BY created_at) and stale / retention sweeps
+        Index("idx_job_status_created_at", "status", "created_at"),
+    )
+
+    # Plain CHAR(36) whatever DB_UUID_BINARY says: the table is tiny and never
+    # joined, so the schema stays the same in both key layouts
+    id: Mapped[str] = mapped_column(
+        String(36),
+        primary_key=True,
+        default=new_id,
+    )
+    kind: Mapped[str] = mapped_column(
+        String(40),
+        nullable=False,
+    )
+    status: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        default="queued",
+        doc="One of JOB_STATUSES",
+    )
+    params: Mapped[dict] = mapped_column(
+        JSON,
+        nullable=False,
+        default=dict,
+    )
+    progress: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        doc="Units processed so far (rows or lines, per kind)",
+    )
+    result: Mapped[dict | None] = mapped_column(
+        JSON,
+        nullable=True,
+        doc="Small summary of the outcome (counts); the output itself is result_file",
+    )
+    result_file: Mapped[str | None] = mapped_column(
+        String(255),
+        nullable=True,
+        doc="File name under JOB_RESULT_DIR",
+    )
+    result_media_type: Mapped[str | None] = mapped_column(
+        String(100),
+        nullable=True,
+    )
+    error: Mapped[dict | None] = mapped_column(
+        JSON,
+        nullable=True,
+        doc="{error_code, message} of a failed job",
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+    cancel_requested: Mapped[bool] = mapped_column(
+        Boolean,
+        nullable=False,
+        default=False,
+    )
+    worker: Mapped[str | None] = mapped_column(
+        String(100),
+        nullable=True,
+        doc="host:pid of the runner executing it",
+    )
+    heartbeat_at: Mapped[datetime | None] = mapped_column(
+        Timestamp,
+        nullable=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        Timestamp,
+        nullable=False,
+        server_default=func.now(),
+    )
+    started_at: Mapped[datetime | None] = mapped_column(
+        Timestamp,
+        nullable=True,
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(
+        Timestamp,
+        nullable=True,
+    )
+
+    def __repr__(self) -> str:
+        return f"<Job(id={self.id}, kind={self.kind}, status={self.status})>"
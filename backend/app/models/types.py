@@ -0,0 +1,183 @@
+"""Custom column types and key generators shared by the ORM models."""
+
+import os
+import time
+import uuid
+
+from sqlalchemy import LargeBinary, SmallInteger, String, literal
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+from sqlalchemy.types import TypeDecorator
+
+from app.config import settings
+
+_last_ms = 0
+_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7).
+
+    Layout: 48-bit Unix ms timestamp | ver(4) | 12-bit counter | var(2) | 62 random bits.
+    The 12-bit counter keeps IDs generated in the same millisecond monotonic,
+    so inserts append to the right edge of the clustered index instead of
+    scattering across it like uuid4.
+    """
+    global _last_ms, _counter
+
+    now_ms = time.time_ns() // 1_000_000
+    if now_ms > _last_ms:
+        _last_ms = now_ms
+        _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF  # leave headroom
+    else:
+        _counter += 1
+        if _counter > 0xFFF:
+            # Counter exhausted within one ms — borrow the next millisecond
+            _last_ms += 1
+            _counter = 0
+    ms = _last_ms
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & 0x3FFF_FFFF_FFFF_FFFF
+    value = (ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76
+    value |= _counter << 64
+    value |= 0b10 << 62
+    value |= rand_b
+    return uuid.UUID(int=value)
+
+
+def new_id() -> str:
+    """Default primary key factory: canonical string form of a UUIDv7."""
+    return str(uuid7())
+
+
+class sql_uuid7(FunctionElement):
+    """A UUIDv7 generated by the database, one per row, for INSERT ... SELECT.
+
+    The 48-bit millisecond timestamp comes from uuid7() (same clock and
+    ordering as app-generated keys, once per statement). The version and
+    variant are fixed, and the rest is random per row. Rows from one
+    statement therefore share a key prefix and land together at the right
+    edge of the PK, like app-generated ids. Rendered to match UUIDKey storage
+    (CHAR(36) text or BINARY(16)).
+    """
+
+    type = String()
+    inherit_cache = True
+
+    def __init__(self):
+        seed = uuid7()
+        super().__init__(
+            # "xxxxxxxx-xxxx-7": timestamp + version nibble of a fresh app-side UUIDv7
+            literal(str(seed)[:15]),
+            # Binary storage on SQLite: bytes 0-6 and 8 of the same UUID (see below)
+            literal(seed.bytes[:7], LargeBinary()),
+            literal(seed.bytes[8:9], LargeBinary()),
+        )
+
+
+@compiles(sql_uuid7)
+def _sql_uuid7_mysql(element, compiler, **kw):
+    prefix = compiler.process(element.clauses.clauses[0], **kw)
+    text = (
+        f"CONCAT({prefix}, SUBSTR(LOWER(HEX(RANDOM_BYTES(2))), 2), '-', "
+        f"SUBSTR('89ab', FLOOR(RAND() * 4) + 1, 1), SUBSTR(LOWER(HEX(RANDOM_BYTES(2))), 2), '-', "
+        f"LOWER(HEX(RANDOM_BYTES(6))))"
+    )
+    return f"UNHEX(REPLACE({text}, '-', ''))" if settings.DB_UUID_BINARY else text
+
+
+@compiles(sql_uuid7, "sqlite")
+def _sql_uuid7_sqlite(element, compiler, **kw):
+    prefix, head, variant = (compiler.process(clause, **kw) for clause in element.clauses.clauses)
+    if settings.DB_UUID_BINARY:
+        # No unhex() before SQLite 3.41, and char() cannot build bytes >= 0x80,
+        # so the version and variant bytes come from the statement's seed:
+        # 8 random bytes per row (bytes 7 and 9-15). || keeps blob bytes as-is.
+        return f"CAST({head} || randomblob(1) || {variant} || randomblob(7) AS BLOB)"
+    return (
+        f"({prefix} || substr(lower(hex(randomblob(2))), 2) || '-' || "
+        f"substr('89ab', abs(random()) % 4 + 1, 1) || substr(lower(hex(randomblob(2))), 2) || '-' || "
+        f"lower(hex(randomblob(6))))"
+    )
+
+
+class UUIDKey(TypeDecorator):
+    """UUID key that the application always sees as a canonical 36-char string.
+
+    Storage is chosen by ``DB_UUID_BINARY``:
+        - False (default): CHAR(36) — compatible with existing schema.sql
+        - True: BINARY(16) on MySQL (LargeBinary elsewhere) — 16 bytes per key
+          in the PK, every secondary index and the attendance FK
+
+    Conversion happens at the bind/result boundary, so models, schemas and
+    routes keep using ``str`` ids unchanged.
+    """
+
+    impl = String(36)
+    cache_ok = True
+
+    def __init__(self, binary: bool | None = None):
+        super().__init__()
+        self.binary = settings.DB_UUID_BINARY if binary is None else binary
+
+    def load_dialect_impl(self, dialect):
+        if not self.binary:
+            return dialect.type_descriptor(String(36))
+        if dialect.name == "mysql":
+            return dialect.type_descriptor(mysql.BINARY(16))
+        return dialect.type_descriptor(LargeBinary(16))
+
+    def process_bind_param(self, value, dialect):
+        if value is None or not self.binary:
+            return value
+        try:
+            return uuid.UUID(str(value)).bytes
+        except ValueError:
+            # Malformed ids cannot exist in a BINARY(16) column — match nothing
+            return None
+
+    def process_result_value(self, value, dialect):
+        if value is None or not self.binary:
+            return value
+        return str(uuid.UUID(bytes=bytes(value)))
+
+
+# Closed set of attendance statuses (INV-6) and their 1-byte storage codes.
+# Codes are persisted — never renumber, only append.
+STATUS_CODES: dict[str, int] = {
+    "PRESENT": 1,
+    "ABSENT": 2,
+    "HALF_DAY": 3,
+    "ON_LEAVE": 4,
+}
+STATUS_NAMES: dict[int, str] = {code: name for name, code in STATUS_CODES.items()}
+
+
+class StatusCode(TypeDecorator):
+    """Attendance status stored as TINYINT, exposed to the app as its string name.
+
+    Comparisons such as ``Attendance.status == "PRESENT"`` bind through this
+    type, so repositories keep using names while the DB filters, indexes and
+    aggregates 1-byte integers.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "mysql":
+            return dialect.type_descriptor(mysql.TINYINT(unsigned=True))
+        return dialect.type_descriptor(SmallInteger())
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        # Unknown names bind to NULL: filters match nothing, inserts hit NOT NULL
+        return STATUS_CODES.get(getattr(value, "value", value))
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return STATUS_NAMES[value]
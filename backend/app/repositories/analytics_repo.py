@@ -0,0 +1,375 @@
+"""Analytics repository — narrow column reads that feed the in-process columnar engine."""
+
+from collections.abc import AsyncIterator, Sequence
+from datetime import date, datetime, time
+
+from sqlalchemy import (
+    Date,
+    Integer,
+    Row,
+    SmallInteger,
+    and_,
+    case,
+    distinct,
+    exists,
+    func,
+    literal,
+    select,
+    type_coerce,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import add_days, seconds_of_day, weekday
+from app.models.attendance import Attendance
+from app.models.attendance_archive import AttendanceArchive
+from app.models.change_tombstone import ChangeTombstone
+from app.models.employee import Employee
+from app.repositories.archive_repo import ArchiveRepository
+
+# Chunk size for streaming full loads — bounds driver-side buffering
+LOAD_CHUNK_ROWS = 50_000
+
+
+def _attendance_columns(model):
+    return (
+        model.id,
+        model.employee_id,
+        model.date,
+        model.status,
+        model.check_in,
+        model.check_out,
+        model.updated_at,
+    )
+
+
+def _employee_filters(query, department_id: int | None, include_inactive: bool):
+    if not include_inactive:
+        query = query.where(Employee.is_active == True)
+    if department_id is not None:
+        query = query.where(Employee.department_id == department_id)
+    return query
+
+
+def _calendar(date_from: date, date_to: date):
+    """Working days in [date_from, date_to] as a one-column CTE ``calendar(day)``.
+
+    Generated in SQL by a recursive CTE over day offsets, so the statement is
+    the same for a week or ANALYTICS_MAX_DAYS; weekends and the configured
+    HOLIDAYS in range are filtered out there too (app/services/work_calendar.py).
+    """
+    offsets = select(literal(0, Integer).label("n")).cte("day_offset", recursive=True)
+    offsets = offsets.union_all(
+        select((offsets.c.n + 1).label("n")).where(offsets.c.n < (date_to - date_from).days)
+    )
+    day = add_days(literal(date_from, Date), offsets.c.n)
+    query = select(day.label("day")).where(weekday(day).not_in(sorted(settings.WEEKEND_DAYS)))
+    holidays = sorted(h for h in settings.HOLIDAYS if date_from <= h <= date_to)
+    if holidays:
+        query = query.where(day.not_in(holidays))
+    return query.cte("calendar")
+
+
+class AnalyticsRepository:
+    """Only the columns analytics need (columnar engine, absenteeism) — never full ORM rows.
+
+    Incremental reads are range scans on the (updated_at, id) and
+    (deleted_at, id) indexes added for the change feed.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def stream_attendance(
+        self, skip_archived: tuple[date, date] | None = None
+    ) -> AsyncIterator[Sequence[Row]]:
+        """All live and archived attendance, in chunks of LOAD_CHUNK_ROWS.
+
+        ``skip_archived`` = (first, last) leaves out archived rows in that
+        date range — the months already served from snapshot files.
+        """
+        archived = select(*_attendance_columns(AttendanceArchive))
+        if skip_archived is not None:
+            first, last = skip_archived
+            archived = archived.where(
+                (AttendanceArchive.date < first) | (AttendanceArchive.date > last)
+            )
+        query = union_all(select(*_attendance_columns(Attendance)), archived)
+        result = await self.db.stream(query)
+        async for chunk in result.partitions(LOAD_CHUNK_ROWS):
+            yield chunk
+
+    async def archived_month(self, first: date, last: date) -> AsyncIterator[Sequence[Row]]:
+        """Archived (employee_id, department_id, date, status, check_in, check_out)
+        in [first, last], ordered by (employee_id, date), in chunks of LOAD_CHUNK_ROWS."""
+        query = (
+            select(
+                AttendanceArchive.employee_id,
+                Employee.department_id,
+                AttendanceArchive.date,
+                AttendanceArchive.status,
+                AttendanceArchive.check_in,
+                AttendanceArchive.check_out,
+            )
+            .join(Employee, Employee.id == AttendanceArchive.employee_id)
+            .where(AttendanceArchive.date >= first, AttendanceArchive.date <= last)
+            .order_by(AttendanceArchive.employee_id, AttendanceArchive.date)
+        )
+        result = await self.db.stream(query)
+        async for chunk in result.partitions(LOAD_CHUNK_ROWS):
+            yield chunk
+
+    async def archived_notes(self, first: date, last: date) -> dict[tuple[str, date], str]:
+        """{(employee_id, date): notes} of archived records in [first, last] that have notes —
+        the one export column snapshot files leave out."""
+        result = await self.db.execute(
+            select(AttendanceArchive.employee_id, AttendanceArchive.date, AttendanceArchive.notes)
+            .where(AttendanceArchive.date >= first, AttendanceArchive.date <= last)
+            .where(AttendanceArchive.notes.is_not(None))
+        )
+        return {(employee_id, day): notes for employee_id, day, notes in result}
+
+    async def attendance_changed_since(self, since: datetime) -> Sequence[Row]:
+        """Live attendance rows with updated_at >= ``since``."""
+        result = await self.db.execute(
+            select(*_attendance_columns(Attendance)).where(Attendance.updated_at >= since)
+        )
+        return result.all()
+
+    async def employees_changed_since(self, since: datetime | None) -> Sequence[Row]:
+        """(id, department_id, is_active, updated_at) — all employees when ``since`` is None."""
+        query = select(Employee.id, Employee.department_id, Employee.is_active, Employee.updated_at)
+        if since is not None:
+            query = query.where(Employee.updated_at >= since)
+        result = await self.db.execute(query)
+        return result.all()
+
+    async def tombstones_since(self, since: datetime) -> Sequence[Row]:
+        """(entity, entity_id, deleted_at) for hard deletes at or after ``since``."""
+        result = await self.db.execute(
+            select(ChangeTombstone.entity, ChangeTombstone.entity_id, ChangeTombstone.deleted_at)
+            .where(ChangeTombstone.deleted_at >= since)
+        )
+        return result.all()
+
+    async def employees(self, *, department_id: int | None, include_inactive: bool) -> Sequence[Row]:
+        """(id, employee_code, name, department_id) of the employees in scope."""
+        query = select(Employee.id, Employee.employee_code, Employee.name, Employee.department_id)
+        result = await self.db.execute(_employee_filters(query, department_id, include_inactive))
+        return result.all()
+
+    async def attendance_statuses(
+        self,
+        *,
+        date_from: date,
+        date_to: date,
+        department_id: int | None,
+        include_inactive: bool,
+    ) -> Sequence[Row]:
+        """(employee_id, date, status code) for every record in range — one query.
+
+        Status comes back as the raw TINYINT code, which is what the
+        vectorized consumers need, so there is no per-row name mapping.
+        The archive is read only when the range reaches it.
+        """
+        archive = ArchiveRepository(self.db)
+        facts = archive.attendance_facts(
+            date_from=date_from,
+            date_to=date_to,
+            include_archive=await archive.covers(date_from),
+        )
+        query = (
+            select(facts.c.employee_id, facts.c.date, type_coerce(facts.c.status, SmallInteger))
+            .select_from(facts)
+            .join(Employee, facts.c.employee_id == Employee.id)
+        )
+        result = await self.db.execute(_employee_filters(query, department_id, include_inactive))
+        return result.all()
+
+    async def work_time(
+        self,
+        *,
+        date_from: date,
+        date_to: date,
+        late_after: time,
+        leave_before: time,
+        by_department: bool,
+        department_id: int | None,
+        include_inactive: bool,
+    ) -> Sequence[Row]:
+        """Worked-time and punctuality aggregates per employee (or per department).
+
+        One GROUP BY over the (date, employee_id, check_in, check_out)
+        covering index joined to employee; durations are TIME_TO_SEC
+        arithmetic in SQL. Only records with both times and check_out after
+        check_in count as worked.
+        """
+        archive = ArchiveRepository(self.db)
+        facts = archive.attendance_facts(
+            date_from=date_from,
+            date_to=date_to,
+            include_archive=await archive.covers(date_from),
+            columns=("employee_id", "date", "check_in", "check_out"),
+        )
+        complete = and_(
+            facts.c.check_in.is_not(None),
+            facts.c.check_out.is_not(None),
+            facts.c.check_out > facts.c.check_in,
+        )
+        worked = seconds_of_day(facts.c.check_out) - seconds_of_day(facts.c.check_in)
+        if by_department:
+            keys = (Employee.department_id,)
+            columns = (Employee.department_id, func.count(distinct(facts.c.employee_id)).label("employees"))
+        else:
+            # The rest of the employee columns depend on the PK (valid under ONLY_FULL_GROUP_BY)
+            keys = (Employee.id,)
+            columns = (Employee.id, Employee.employee_code, Employee.name, Employee.department_id,
+                       literal(1).label("employees"))
+
+        query = (
+            select(
+                *columns,
+                func.count(case((complete, 1))).label("days_worked"),
+                func.coalesce(func.sum(case((complete, worked))), 0).label("worked_seconds"),
+                func.count(case((facts.c.check_in > late_after, 1))).label("late_arrivals"),
+                func.count(case((facts.c.check_out < leave_before, 1))).label("early_departures"),
+            )
+            .select_from(facts)
+            .join(Employee, facts.c.employee_id == Employee.id)
+            .group_by(*keys)
+        )
+        result = await self.db.execute(_employee_filters(query, department_id, include_inactive))
+        return result.all()
+
+    async def _missing_predicate(self, calendar, first_day: date):
+        """``NOT EXISTS`` a record for (employee, calendar day) — an anti-join probing
+        uq_attendance_emp_date, plus the archive's twin when the range reaches it."""
+        models = [Attendance]
+        if await ArchiveRepository(self.db).covers(first_day):
+            models.append(AttendanceArchive)
+        return and_(*(
+            ~exists().where(model.employee_id == Employee.id, model.date == calendar.c.day)
+            for model in models
+        ))
+
+    async def missing_attendance_counts(
+        self,
+        *,
+        date_from: date,
+        date_to: date,
+        department_id: int | None,
+        include_inactive: bool,
+    ) -> Sequence[Row]:
+        """Per employee: (id, employee_code, name, department_id, expected, missing).
+
+        Expected = working days in the range on or after date_of_joining (employee ×
+        calendar join); missing = those with no record (anti-join). One
+        grouped statement — no per-employee or per-day round trips.
+        """
+        calendar = _calendar(date_from, date_to)
+        missing = await self._missing_predicate(calendar, date_from)
+        query = (
+            select(
+                Employee.id,
+                Employee.employee_code,
+                Employee.name,
+                Employee.department_id,
+                func.count().label("expected"),
+                func.count(case((missing, 1))).label("missing"),
+            )
+            .select_from(Employee)
+            .join(calendar, calendar.c.day >= Employee.date_of_joining)
+            .group_by(Employee.id)
+        )
+        result = await self.db.execute(_employee_filters(query, department_id, include_inactive))
+        return result.all()
+
+    async def missing_attendance_dates(
+        self, *, date_from: date, date_to: date, employee_ids: list[str]
+    ) -> Sequence[Row]:
+        """(employee_id, day) for each expected working day without a record, for the given employees."""
+        calendar = _calendar(date_from, date_to)
+        query = (
+            select(Employee.id, calendar.c.day)
+            .select_from(Employee)
+            .join(calendar, calendar.c.day >= Employee.date_of_joining)
+            .where(Employee.id.in_(employee_ids), await self._missing_predicate(calendar, date_from))
+            .order_by(Employee.id, calendar.c.day)
+        )
+        result = await self.db.execute(query)
+        return result.all()
+
+    async def export_attendance(
+        self,
+        *,
+        date_from: date | None,
+        date_to: date | None,
+        department_id: int | None,
+        employee_id: str | None,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """(employee_code, name, department_id, date, status, check_in, check_out, notes)
+        ordered by (date, employee_code), in chunks of LOAD_CHUNK_ROWS.
+
+        Streamed from a server-side cursor, so an export of any size holds
+        one chunk at a time. The archive is read only when the range reaches it.
+        """
+        archive = ArchiveRepository(self.db)
+        facts = archive.attendance_facts(
+            date_from=date_from,
+            date_to=date_to,
+            include_archive=await archive.covers(date_from),
+            columns=("employee_id", "date", "status", "check_in", "check_out", "notes"),
+        )
+        query = (
+            select(
+                Employee.employee_code,
+                Employee.name,
+                Employee.department_id,
+                facts.c.date,
+                type_coerce(facts.c.status, SmallInteger),
+                facts.c.check_in,
+                facts.c.check_out,
+                facts.c.notes,
+            )
+            .select_from(facts)
+            .join(Employee, facts.c.employee_id == Employee.id)
+            .order_by(facts.c.date, Employee.employee_code)
+        )
+        query = _employee_filters(query, department_id, include_inactive=True)
+        if employee_id is not None:
+            query = query.where(facts.c.employee_id == employee_id)
+        result = await self.db.stream(query)
+        async for chunk in result.partitions(LOAD_CHUNK_ROWS):
+            yield chunk
+
+    async def month_facts(self, *, first: date, last: date, department_id: int | None) -> Sequence[Row]:
+        """(employee_id, status code, worked seconds or None) for every record in [first, last],
+        grouped by employee (ordered by employee_id) so it can be sharded per employee.
+
+        Worked seconds are computed in SQL and only set when both times are
+        present and check_out is after check_in (same rule as work_time).
+        """
+        archive = ArchiveRepository(self.db)
+        facts = archive.attendance_facts(
+            date_from=first,
+            date_to=last,
+            include_archive=await archive.covers(first),
+            columns=("employee_id", "status", "check_in", "check_out"),
+        )
+        complete = and_(
+            facts.c.check_in.is_not(None),
+            facts.c.check_out.is_not(None),
+            facts.c.check_out > facts.c.check_in,
+        )
+        query = select(
+            facts.c.employee_id,
+            type_coerce(facts.c.status, SmallInteger),
+            case((complete, seconds_of_day(facts.c.check_out) - seconds_of_day(facts.c.check_in))),
+        ).select_from(facts).order_by(facts.c.employee_id)
+        if department_id is not None:
+            query = query.join(Employee, facts.c.employee_id == Employee.id).where(
+                Employee.department_id == department_id
+            )
+        result = await self.db.execute(query)
+        return result.all()
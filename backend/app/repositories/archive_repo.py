@@ -0,0 +1,254 @@
+"""Archive repository — moves cold attendance out of the live table and reads it back.
+
+Rows older than the archive horizon (``ArchiveHorizon``) live in
+``attendance_archive``. Every archived date is strictly earlier than every
+live date: an archival run first closes its dates to writes
+(``closed_through()``, which writers read under a shared lock), then moves
+them whole, oldest first. That lets readers treat the two tables as one
+date-ordered sequence and touch the archive only when a requested range
+reaches back to ``closed_through()``.
+"""
+from datetime import date, timedelta
+
+from sqlalchemy import delete, exists, func, insert, select, text, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.archive_horizon import ArchiveHorizon
+from app.models.attendance import Attendance
+from app.models.attendance_archive import AttendanceArchive
+
+_COLUMNS = [column.name for column in Attendance.__table__.columns]
+
+
+def month_start(day: date, months_back: int = 0) -> date:
+    """First day of the month ``months_back`` months before ``day``'s month."""
+    index = day.year * 12 + day.month - 1 - months_back
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _ranged(query, date_col, date_from: date | None, date_to: date | None):
+    if date_from is not None:
+        query = query.where(date_col >= date_from)
+    if date_to is not None:
+        query = query.where(date_col <= date_to)
+    return query
+
+
+class ArchiveRepository:
+    """Encapsulates archive reads, row movement and MySQL partition upkeep."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def closed_through(self, *, for_write: bool = False) -> date | None:
+        """Latest date closed to writes, or None.  Primary key lookup.
+
+        Writers pass ``for_write`` to hold a shared lock on the horizon row
+        until they commit: ``close()`` then waits for in-flight writes before
+        moving the horizon, and no write can land behind it. Shared locks do
+        not conflict with each other, so writers never wait on one another.
+        """
+        query = select(ArchiveHorizon.closed_through).where(ArchiveHorizon.id == 1)
+        if for_write:
+            query = query.with_for_update(read=True)
+        return (await self.db.execute(query)).scalar_one_or_none()
+
+    async def archived_through(self) -> date | None:
+        """Latest date whose rows are all in the archive, or None."""
+        result = await self.db.execute(select(ArchiveHorizon.archived_through).where(ArchiveHorizon.id == 1))
+        return result.scalar_one_or_none()
+
+    async def archived_span(self) -> tuple[date | None, date | None]:
+        """(earliest archived date, archived_through()); (None, None) if nothing is archived."""
+        through = await self.archived_through()
+        if through is None:
+            return None, None
+        result = await self.db.execute(select(func.min(AttendanceArchive.date)))
+        return result.scalar_one_or_none(), through
+
+    async def covers(self, date_from: date | None) -> bool:
+        """Does a range starting at ``date_from`` (None = unbounded) reach the archive?"""
+        closed_through = await self.closed_through()
+        return closed_through is not None and (date_from is None or date_from <= closed_through)
+
+    async def holds(self, day: date) -> bool:
+        """Are ``day``'s rows in the archive?  Dates move whole, so one index probe decides."""
+        if not await self.covers(day):
+            return False
+        result = await self.db.execute(select(exists().where(AttendanceArchive.date == day)))
+        return result.scalar_one()
+
+    def attendance_facts(
+        self,
+        *,
+        date_from: date,
+        date_to: date,
+        include_archive: bool,
+        columns: tuple[str, ...] = ("employee_id", "date", "status"),
+    ):
+        """``columns`` of the rows in range — live, or live UNION ALL archive.
+
+        The date predicate is applied inside each branch so both tables are
+        read with a range scan on their covering (date, employee_id, ...) index.
+        """
+        live = _ranged(
+            select(*(getattr(Attendance, name) for name in columns)),
+            Attendance.date, date_from, date_to,
+        )
+        if not include_archive:
+            return live.subquery("attendance_facts")
+        archived = _ranged(
+            select(*(getattr(AttendanceArchive, name) for name in columns)),
+            AttendanceArchive.date, date_from, date_to,
+        )
+        return union_all(live, archived).subquery("attendance_facts")
+
+    # ------------------------------------------------------------------
+    # Archival
+    # ------------------------------------------------------------------
+
+    async def _horizon(self) -> ArchiveHorizon:
+        """The horizon row, locked for update (created on first use)."""
+        horizon = (await self.db.execute(
+            select(ArchiveHorizon).where(ArchiveHorizon.id == 1).with_for_update()
+        )).scalar_one_or_none()
+        if horizon is None:
+            horizon = ArchiveHorizon(id=1)
+            self.db.add(horizon)
+        return horizon
+
+    async def close(self, cutoff: date) -> date:
+        """Close dates before ``cutoff`` to writes; returns the new ``closed_through``.
+
+        Takes the horizon row's exclusive lock, so it waits for writers
+        holding it shared. Commit before moving rows. Never moves backwards.
+        """
+        horizon = await self._horizon()
+        through = cutoff - timedelta(days=1)
+        if horizon.closed_through is None or horizon.closed_through < through:
+            horizon.closed_through = through
+        await self.db.flush()
+        return horizon.closed_through
+
+    async def mark_archived(self) -> date | None:
+        """Advance ``archived_through`` to ``closed_through`` once nothing closed is left live."""
+        horizon = await self._horizon()
+        if horizon.closed_through is not None and not await self.count_before(
+            horizon.closed_through + timedelta(days=1)
+        ):
+            horizon.archived_through = horizon.closed_through
+        await self.db.flush()
+        return horizon.archived_through
+
+    async def move_batch(self, cutoff: date, limit: int) -> int:
+        """Move the oldest whole dates before ``cutoff``, about ``limit`` rows.
+
+        Dates are never split across batches (a single date larger than
+        ``limit`` moves on its own), so at any point every date is wholly
+        live or wholly archived. Requires ``close(cutoff)`` to have been
+        committed, so no write can race the copy + delete, which run in the
+        caller's transaction. Returns the rows moved (0 when nothing is left).
+        """
+        days = (await self.db.execute(
+            select(Attendance.date, func.count())
+            .where(Attendance.date < cutoff)
+            .group_by(Attendance.date)
+            .order_by(Attendance.date)
+            .limit(limit)
+        )).all()
+        if not days:
+            return 0
+        through, rows = days[0]
+        for day, count in days[1:]:
+            if rows + count > limit:
+                break
+            through, rows = day, rows + count
+
+        live = Attendance.__table__
+        await self.db.execute(
+            insert(AttendanceArchive).from_select(
+                _COLUMNS, select(*(live.c[name] for name in _COLUMNS)).where(live.c.date <= through)
+            )
+        )
+        result = await self.db.execute(delete(Attendance).where(Attendance.date <= through))
+        return result.rowcount
+
+    async def count_before(self, cutoff: date) -> int:
+        """Live rows that the next archival run would move."""
+        result = await self.db.execute(
+            select(func.count(Attendance.id)).where(Attendance.date < cutoff)
+        )
+        return result.scalar_one()
+
+    # ------------------------------------------------------------------
+    # MySQL partition maintenance (no-ops elsewhere)
+    # ------------------------------------------------------------------
+
+    async def _partitions(self) -> list[tuple[str, str]]:
+        """(partition name, LESS THAN bound) for attendance, in order; [] if unpartitioned."""
+        if self.db.bind.dialect.name != "mysql":
+            return []
+        rows = await self.db.execute(text(
+            "SELECT partition_name, partition_description FROM information_schema.partitions "
+            "WHERE table_schema = DATABASE() AND table_name = 'attendance' "
+            "AND partition_name IS NOT NULL ORDER BY partition_ordinal_position"
+        ))
+        return [(name, bound.strip("'")) for name, bound in rows]
+
+    async def partition_table(self, first_month: date, through: date) -> bool:
+        """Partition an unpartitioned attendance table monthly; False if not applicable."""
+        if self.db.bind.dialect.name != "mysql" or await self._partitions():
+            return False
+        first_month = month_start(first_month)
+        clauses = [f"PARTITION p_history VALUES LESS THAN ('{first_month.isoformat()}')"]
+        clauses += _monthly_partitions(first_month, through)
+        clauses.append("PARTITION p_future VALUES LESS THAN (MAXVALUE)")
+        await self.db.execute(text(
+            "ALTER TABLE attendance PARTITION BY RANGE COLUMNS(date) (" + ", ".join(clauses) + ")"
+        ))
+        return True
+
+    async def add_partitions(self, through: date) -> list[str]:
+        """Split p_future so every month up to ``through`` has its own partition."""
+        partitions = await self._partitions()
+        bounded = [date.fromisoformat(bound) for _, bound in partitions if bound != "MAXVALUE"]
+        if not bounded or not any(name == "p_future" for name, _ in partitions):
+            return []
+        clauses = _monthly_partitions(max(bounded), through)
+        if not clauses:
+            return []
+        await self.db.execute(text(
+            "ALTER TABLE attendance REORGANIZE PARTITION p_future INTO ("
+            + ", ".join(clauses)
+            + ", PARTITION p_future VALUES LESS THAN (MAXVALUE))"
+        ))
+        return [clause.split()[1] for clause in clauses]
+
+    async def drop_archived_partitions(self) -> list[str]:
+        """Drop partitions wholly on or before ``archived_through()`` — archival emptied them.
+
+        Keyed off the stored horizon rather than a live row count: writes
+        behind ``closed_through()`` are rejected, so an archived partition
+        cannot refill between the check and the DROP.
+        """
+        through = await self.archived_through()
+        if through is None:
+            return []
+        dropped = [
+            name for name, bound in await self._partitions()
+            if bound != "MAXVALUE" and date.fromisoformat(bound) <= through + timedelta(days=1)
+        ]
+        if dropped:
+            await self.db.execute(text(f"ALTER TABLE attendance DROP PARTITION {', '.join(dropped)}"))
+        return dropped
+
+
+def _monthly_partitions(start: date, through: date) -> list[str]:
+    """PARTITION clauses for each month from ``start`` up to and including ``through``'s month."""
+    clauses = []
+    month = month_start(start)
+    while month <= through:
+        upper = month_start(month, -1)
+        clauses.append(f"PARTITION p{month:%Y_%m} VALUES LESS THAN ('{upper.isoformat()}')")
+        month = upper
+    return clauses
@@ -1,13 +1,36 @@
 """Attendance repository — data access layer for attendance operations."""
 
-from datetime import date
+from collections.abc import Sequence
+from datetime import date, datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    Date,
+    SmallInteger,
+    Text,
+    and_,
+    case,
+    exists,
+    false,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    type_coerce,
+    union_all,
+)
+from sqlalchemy.dialects import mysql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.models.attendance import Attendance
+from app.models.attendance_archive import AttendanceArchive
+from app.models.change_tombstone import ChangeTombstone
 from app.models.employee import Employee
+from app.models.types import StatusCode, new_id, sql_uuid7
+from app.repositories.archive_repo import ArchiveRepository
+from app.repositories.department_repo import DepartmentRepository
+from app.repositories.filters import match_any
 
 
 class AttendanceRepository:
@@ -23,14 +46,57 @@ class AttendanceRepository:
         await self.db.refresh(attendance)
         return attendance
 
-    async def get_by_id(self, attendance_id: str) -> Attendance | None:
-        """Fetch attendance by UUID with eager-loaded employee."""
+    async def get_by_id(self, attendance_id: str) -> Attendance | AttendanceArchive | None:
+        """Fetch attendance by UUID with eager-loaded employee.
+
+        Falls back to the archive, so ids handed out before a record was
+        archived keep resolving (as a read-only AttendanceArchive).
+        """
+        for model in (Attendance, AttendanceArchive):
+            result = await self.db.execute(
+                select(model)
+                .options(joinedload(model.employee))
+                .where(model.id == attendance_id)
+            )
+            record = result.scalar_one_or_none()
+            if record is not None:
+                return record
+        return None
+
+    async def get_version(self, attendance_id: str) -> tuple[datetime, int, datetime, int] | None:
+        """Fetch (updated_at, version) of the record and of its employee for ETag checks.
+
+        The detail response embeds employee name/code, so both versions matter.
+        Archived records are looked up like ``get_by_id``.
+        """
+        for model in (Attendance, AttendanceArchive):
+            result = await self.db.execute(
+                select(model.updated_at, model.version, Employee.updated_at, Employee.version)
+                .join(Employee, model.employee_id == Employee.id)
+                .where(model.id == attendance_id)
+            )
+            row = result.one_or_none()
+            if row is not None:
+                return tuple(row)
+        return None
+
+    async def get_change_marker(self) -> tuple:
+        """Cheap collection version in one round trip.
+
+        Attendance rows are rendered with employee name/code, so the marker
+        covers both tables: (MAX(updated_at), COUNT(*)) for each. Both are
+        read from the updated_at indexes without locking anything, so
+        writers never wait on the marker.
+        """
         result = await self.db.execute(
-            select(Attendance)
-            .options(joinedload(Attendance.employee))
-            .where(Attendance.id == attendance_id)
+            select(
+                select(func.max(Attendance.updated_at)).scalar_subquery(),
+                select(func.count(Attendance.id)).scalar_subquery(),
+                select(func.max(Employee.updated_at)).scalar_subquery(),
+                select(func.count(Employee.id)).scalar_subquery(),
+            )
         )
-        return result.scalar_one_or_none()
+        return tuple(result.one())
 
     async def get_by_employee_and_date(
         self, employee_id: str, attendance_date: date
@@ -49,61 +115,117 @@ class AttendanceRepository:
         *,
         page: int = 1,
         per_page: int = 20,
-        employee_id: str | None = None,
+        employee_id: str | Sequence[str] | None = None,
         attendance_date: date | None = None,
         date_from: date | None = None,
         date_to: date | None = None,
-        status: str | None = None,
-        department: str | None = None,
+        status: str | Sequence[str] | None = None,
+        department: str | Sequence[str] | None = None,
     ) -> tuple[list[Attendance], int]:
         """Paginated listing with filters and eager-loaded employee data.
 
-        Uses a single JOIN query to prevent N+1 (Section 7.3 of design).
-        """
-        query = select(Attendance).options(joinedload(Attendance.employee))
-        count_query = select(func.count(Attendance.id))
+        Uses a single JOIN query per table to prevent N+1 (Section 7.3 of design).
+        The archive is consulted only when the requested range reaches past
+        ``ArchiveRepository.closed_through()``. Archived dates all precede
+        live dates, so in (date DESC) order the archive simply continues where
+        the live table ends — pages are split between the two, never merged.
+        Archived rows come back as AttendanceArchive (same attributes, read-only).
 
-        # If department filter, need to join employee table for count query too
+        ``employee_id``, ``status`` and ``department`` take one value or a
+        sequence (any of them matches). Unknown department names are dropped;
+        if none is known the result is empty.
+        """
+        department_ids = None
         if department is not None:
-            query = query.join(Employee, Attendance.employee_id == Employee.id).where(
-                Employee.department == department
+            names = [department] if isinstance(department, str) else department
+            department_ids = await DepartmentRepository(self.db).resolve_ids(names)
+            if not department_ids:
+                return [], 0
+
+        lower_bounds = [d for d in (attendance_date, date_from) if d is not None]
+        include_archive = await ArchiveRepository(self.db).covers(max(lower_bounds, default=None))
+
+        filters = dict(
+            employee_id=employee_id,
+            attendance_date=attendance_date,
+            date_from=date_from,
+            date_to=date_to,
+            status=status,
+            department_ids=department_ids,
+        )
+        sources = [Attendance, AttendanceArchive] if include_archive else [Attendance]
+
+        offset = (page - 1) * per_page
+        attendances: list[Attendance] = []
+        total = 0
+        for entity in sources:
+            query, count_query = self._filtered(entity, **filters)
+
+            # Total count
+            source_total = (await self.db.execute(count_query)).scalar_one()
+
+            # Paginated results — this source's share of the requested page
+            source_offset = max(offset - total, 0)
+            remaining = per_page - len(attendances)
+            total += source_total
+            if remaining <= 0 or source_offset >= source_total:
+                continue
+            query = (
+                query.order_by(entity.date.desc(), entity.created_at.desc())
+                .offset(source_offset)
+                .limit(remaining)
             )
+            result = await self.db.execute(query)
+            attendances.extend(result.unique().scalars().all())
+
+        return attendances, total
+
+    @staticmethod
+    def _filtered(
+        entity,
+        *,
+        employee_id: str | Sequence[str] | None,
+        attendance_date: date | None,
+        date_from: date | None,
+        date_to: date | None,
+        status: str | Sequence[str] | None,
+        department_ids: Sequence[int] | None,
+    ):
+        """(row query, count query) over Attendance or AttendanceArchive with filters applied."""
+        query = select(entity).options(joinedload(entity.employee))
+        count_query = select(func.count(entity.id))
+
+        # If department filter, need to join employee table for count query too
+        if department_ids is not None:
+            department_filter = match_any(Employee.department_id, department_ids)
+            query = query.join(Employee, entity.employee_id == Employee.id).where(department_filter)
             count_query = count_query.join(
-                Employee, Attendance.employee_id == Employee.id
-            ).where(Employee.department == department)
+                Employee, entity.employee_id == Employee.id
+            ).where(department_filter)
 
         if employee_id is not None:
-            query = query.where(Attendance.employee_id == employee_id)
-            count_query = count_query.where(Attendance.employee_id == employee_id)
+            employee_filter = match_any(entity.employee_id, employee_id)
+            query = query.where(employee_filter)
+            count_query = count_query.where(employee_filter)
 
         if attendance_date is not None:
-            query = query.where(Attendance.date == attendance_date)
-            count_query = count_query.where(Attendance.date == attendance_date)
+            query = query.where(entity.date == attendance_date)
+            count_query = count_query.where(entity.date == attendance_date)
 
         if date_from is not None:
-            query = query.where(Attendance.date >= date_from)
-            count_query = count_query.where(Attendance.date >= date_from)
+            query = query.where(entity.date >= date_from)
+            count_query = count_query.where(entity.date >= date_from)
 
         if date_to is not None:
-            query = query.where(Attendance.date <= date_to)
-            count_query = count_query.where(Attendance.date <= date_to)
+            query = query.where(entity.date <= date_to)
+            count_query = count_query.where(entity.date <= date_to)
 
         if status is not None:
-            query = query.where(Attendance.status == status)
-            count_query = count_query.where(Attendance.status == status)
-
-        # Total count
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar_one()
+            status_filter = match_any(entity.status, status)
+            query = query.where(status_filter)
+            count_query = count_query.where(status_filter)
 
-        # Paginated results
-        offset = (page - 1) * per_page
-        query = query.order_by(Attendance.date.desc(), Attendance.created_at.desc()).offset(offset).limit(per_page)
-
-        result = await self.db.execute(query)
-        attendances = list(result.unique().scalars().all())
-
-        return attendances, total
+        return query, count_query
 
     async def update(self, attendance: Attendance) -> Attendance:
         """Update an existing attendance record."""
@@ -112,6 +234,187 @@ class AttendanceRepository:
         return attendance
 
     async def delete(self, attendance: Attendance) -> None:
-        """Hard delete an attendance record."""
+        """Hard delete an attendance record, leaving a change-feed tombstone."""
+        self.db.add(ChangeTombstone(entity="attendance", entity_id=attendance.id))
         await self.db.delete(attendance)
         await self.db.flush()
+
+    async def count_auto_absent_candidates(self, day: date) -> tuple[int, int]:
+        """(active employees, of which joined after ``day``) in one scan of the employee table."""
+        result = await self.db.execute(
+            select(func.count(), func.count(case((Employee.date_of_joining > day, 1))))
+            .where(Employee.is_active == True)
+        )
+        return tuple(result.one())
+
+    async def insert_absent_for_unrecorded(self, day: date, notes: str | None = None) -> int:
+        """Mark ABSENT every active employee with no record for ``day``; returns rows inserted.
+
+        One set-based ``INSERT ... SELECT ... WHERE NOT EXISTS``. Ids come
+        from sql_uuid7(); created_at / updated_at come from the server
+        defaults. Employees who join after ``day`` are skipped (INV-10).
+        ``IGNORE`` lets a record created concurrently win on
+        uq_attendance_emp_date instead of failing the statement, so the
+        insert is safe to re-run.
+        """
+        unrecorded = (
+            select(
+                sql_uuid7(),
+                Employee.id,
+                literal(day, Date),
+                literal("ABSENT", StatusCode()),
+                literal(notes, Text),
+            )
+            .where(
+                Employee.is_active == True,
+                Employee.date_of_joining <= day,
+                ~exists().where(Attendance.employee_id == Employee.id, Attendance.date == day),
+            )
+        )
+        statement = (
+            insert(Attendance)
+            .from_select(["id", "employee_id", "date", "status", "notes"], unrecorded)
+            .prefix_with("IGNORE", dialect="mysql")
+            .prefix_with("OR IGNORE", dialect="sqlite")
+        )
+        result = await self.db.execute(statement)
+        return result.rowcount
+
+    async def employee_days(
+        self, employee_id: str, date_from: date, date_to: date, include_archive: bool
+    ) -> Sequence[tuple[date, int]]:
+        """(date, status code) of one employee's records in range — one narrow query.
+
+        A range scan on uq_attendance_emp_date (employee_id, date), plus the
+        archive's twin when ``include_archive``. Unordered; callers place
+        days by date.
+        """
+
+        def days(model):
+            return select(model.date, type_coerce(model.status, SmallInteger)).where(
+                model.employee_id == employee_id, model.date >= date_from, model.date <= date_to
+            )
+
+        query = days(Attendance)
+        if include_archive:
+            query = union_all(query, days(AttendanceArchive))
+        result = await self.db.execute(query)
+        return result.all()
+
+    async def roster(
+        self,
+        day: date,
+        *,
+        department_id: int | None,
+        after_code: str | None,
+        limit: int,
+        archived: bool,
+    ) -> Sequence:
+        """Active employees (joined by ``day``) with their record for ``day`` or NULLs.
+
+        One LEFT JOIN probing uq_attendance_emp_date (the archive's twin when
+        ``archived``), keyset-paged on the unique employee_code: each page is
+        an index range, whatever its depth. Rows are (id, employee_code,
+        name, department_id, attendance_id, status, check_in, check_out, notes).
+        """
+        model = AttendanceArchive if archived else Attendance
+        query = (
+            select(
+                Employee.id,
+                Employee.employee_code,
+                Employee.name,
+                Employee.department_id,
+                model.id.label("attendance_id"),
+                model.status,
+                model.check_in,
+                model.check_out,
+                model.notes,
+            )
+            .select_from(Employee)
+            .outerjoin(model, and_(model.employee_id == Employee.id, model.date == day))
+            .where(Employee.is_active == True, Employee.date_of_joining <= day)
+            .order_by(Employee.employee_code)
+            .limit(limit)
+        )
+        if department_id is not None:
+            query = query.where(Employee.department_id == department_id)
+        if after_code is not None:
+            query = query.where(Employee.employee_code > after_code)
+        result = await self.db.execute(query)
+        return result.all()
+
+    async def keys_to_ids(self, employee_ids: set[str], dates: set[date]) -> dict[tuple[str, date], str]:
+        """{(employee_id, date): id} for live records among the given employees and dates.
+
+        One index range on uq_attendance_emp_date; pairs outside the requested
+        cross product are simply never looked up by the caller.
+        """
+        result = await self.db.execute(
+            select(Attendance.employee_id, Attendance.date, Attendance.id).where(
+                Attendance.employee_id.in_(employee_ids), Attendance.date.in_(dates)
+            )
+        )
+        return {(employee_id, day): attendance_id for employee_id, day, attendance_id in result}
+
+    async def upsert_many(self, rows: Sequence[dict], rules: dict[str, str]) -> None:
+        """Insert ``rows`` or merge each into the record already on its (employee_id, date).
+
+        One ``INSERT ... ON DUPLICATE KEY UPDATE`` (MySQL) or ``INSERT ...
+        ON CONFLICT (employee_id, date) DO UPDATE`` (SQLite) against
+        uq_attendance_emp_date, executed for all rows at once: the statement
+        is a fixed Core insert, so it compiles once and the rows are sent as
+        multi-row VALUES batches (insertmanyvalues / the driver's executemany).
+        ``rules`` maps a field to how the incoming value merges into the
+        stored one (see ATTENDANCE_UPSERT_RULES). updated_at and version move
+        only when a merged value actually differs, so a re-sent identical record does not
+        churn ETags or the change feed.
+        """
+        table = Attendance.__table__
+        rows = [{"id": new_id(), **row} for row in rows]
+        if self.db.bind.dialect.name == "mysql":
+            statement = mysql.insert(table)
+            merged = self._merged(statement.inserted, rules, least=func.least, greatest=func.greatest)
+            # MySQL applies assignments left to right, so updated_at must be
+            # decided before the columns it compares are overwritten
+            statement = statement.on_duplicate_key_update(
+                [
+                    ("updated_at", case((self._changed(merged), func.now()), else_=table.c.updated_at)),
+                    ("version", case((self._changed(merged), table.c.version + 1), else_=table.c.version)),
+                ]
+                + [(column.key, value) for column, value in merged.items()]
+            )
+        else:
+            statement = sqlite.insert(table)
+            # SQLite's scalar min()/max() take several arguments like LEAST/GREATEST
+            merged = self._merged(statement.excluded, rules, least=func.min, greatest=func.max)
+            statement = statement.on_conflict_do_update(
+                index_elements=[table.c.employee_id, table.c.date],
+                set_={
+                    **{column.key: value for column, value in merged.items()},
+                    "updated_at": func.now(),
+                    "version": table.c.version + 1,
+                },
+                where=self._changed(merged),
+            )
+        await self.db.execute(statement, rows)
+
+    @staticmethod
+    def _merged(incoming, rules: dict[str, str], *, least, greatest) -> dict:
+        """{stored column: merged value expression} for the fields a rule may overwrite."""
+        merged = {}
+        for field, rule in rules.items():
+            stored, new = Attendance.__table__.c[field], incoming[field]
+            if rule == "replace":
+                merged[stored] = func.coalesce(new, stored)
+            elif rule == "fill":
+                merged[stored] = func.coalesce(stored, new)
+            elif rule == "earliest":
+                # LEAST/GREATEST are NULL if either side is; fall back to whichever is set
+                merged[stored] = func.coalesce(least(stored, new), stored, new)
+            elif rule == "latest":
+                merged[stored] = func.coalesce(greatest(stored, new), stored, new)
+        return merged
+
+    @staticmethod
+    def _changed(merged: dict):
+        return or_(false(), *(stored.is_distinct_from(value) for stored, value in merged.items()))
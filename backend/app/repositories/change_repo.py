@@ -0,0 +1,109 @@
+"""Change feed repository — keyset scans over (updated_at, id) and tombstones."""
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import and_, delete, func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.config import settings
+from app.models.attendance import Attendance
+from app.models.change_tombstone import ChangeTombstone
+from app.models.employee import Employee
+
+# Streams are merged in (changed_at, stream rank, id) order
+EMPLOYEE_STREAM = 0
+ATTENDANCE_STREAM = 1
+TOMBSTONE_STREAM = 2
+
+
+def _after(ts_col, id_col, rank: int, cursor: tuple[datetime, int, str] | None):
+    """Keyset predicate: rows of stream ``rank`` strictly after ``cursor``.
+
+    Expanded to ``ts > :ts OR (ts = :ts AND id > :id)`` rather than a row-value
+    comparison so MySQL plans it as a range on the (ts, id) index.
+    """
+    if cursor is None:
+        return None
+    c_ts, c_rank, c_id = cursor
+    if rank < c_rank:
+        return ts_col > c_ts
+    if rank > c_rank:
+        return ts_col >= c_ts
+    if rank == TOMBSTONE_STREAM:
+        c_id = int(c_id)
+    return or_(ts_col > c_ts, and_(ts_col == c_ts, id_col > c_id))
+
+
+class ChangeRepository:
+    """Encapsulates change-feed queries.
+
+    Each stream is read with an index-ordered range scan limited to the page
+    size, so cost is proportional to the number of changes returned — not to
+    the size of the tables.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_db_now(self) -> datetime:
+        """Current DB clock."""
+        result = await self.db.execute(select(func.now()))
+        return result.scalar_one()
+
+    async def settled_through(self) -> datetime:
+        """Latest timestamp up to which every write is committed and visible.
+
+        A row's updated_at / deleted_at is the DB clock when its statement
+        ran, but it only becomes visible at COMMIT. Anything stamped before
+        the start of the oldest still-open writing transaction is therefore
+        settled, however long that transaction runs. On MySQL the bound is
+        that start (information_schema.innodb_trx; needs the PROCESS
+        privilege), and never later than CHANGES_SETTLE_SECONDS before now.
+        The margin covers a statement that has read the clock but not yet
+        touched a row. SQLite has no transaction view, so only the margin applies.
+        """
+        now = await self.get_db_now()
+        settled = now - timedelta(seconds=settings.CHANGES_SETTLE_SECONDS)
+        if self.db.bind.dialect.name == "mysql":
+            oldest = (await self.db.execute(text(
+                "SELECT MIN(trx_started) FROM information_schema.innodb_trx "
+                "WHERE trx_mysql_thread_id <> CONNECTION_ID() "
+                "AND (trx_rows_modified > 0 OR trx_rows_locked > 0)"
+            ))).scalar_one_or_none()
+            if oldest is not None:
+                # Strictly before: updated_at has second precision
+                settled = min(settled, oldest - timedelta(seconds=1))
+        return settled
+
+    async def _scan(self, query, ts_col, id_col, rank, cursor, upper_bound, limit):
+        predicate = _after(ts_col, id_col, rank, cursor)
+        if predicate is not None:
+            query = query.where(predicate)
+        query = query.where(ts_col <= upper_bound).order_by(ts_col, id_col).limit(limit)
+        result = await self.db.execute(query)
+        return list(result.unique().scalars().all())
+
+    async def employees_after(self, cursor, upper_bound: datetime, limit: int) -> list[Employee]:
+        return await self._scan(
+            select(Employee), Employee.updated_at, Employee.id,
+            EMPLOYEE_STREAM, cursor, upper_bound, limit,
+        )
+
+    async def attendance_after(self, cursor, upper_bound: datetime, limit: int) -> list[Attendance]:
+        return await self._scan(
+            select(Attendance).options(joinedload(Attendance.employee)),
+            Attendance.updated_at, Attendance.id,
+            ATTENDANCE_STREAM, cursor, upper_bound, limit,
+        )
+
+    async def tombstones_after(self, cursor, upper_bound: datetime, limit: int) -> list[ChangeTombstone]:
+        return await self._scan(
+            select(ChangeTombstone), ChangeTombstone.deleted_at, ChangeTombstone.id,
+            TOMBSTONE_STREAM, cursor, upper_bound, limit,
+        )
+
+    async def purge_tombstones(self, before: datetime) -> int:
+        """Delete tombstones older than ``before``; range delete on the deleted_at index."""
+        result = await self.db.execute(delete(ChangeTombstone).where(ChangeTombstone.deleted_at < before))
+        return result.rowcount
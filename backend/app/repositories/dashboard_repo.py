@@ -1,12 +1,14 @@
 """Dashboard repository — aggregation queries for the summary endpoint."""
 
-from datetime import date
+from datetime import date, timedelta
 
 from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.attendance import Attendance
 from app.models.employee import Employee
+from app.repositories.archive_repo import ArchiveRepository
+from app.repositories.department_repo import DepartmentRepository
 
 
 class DashboardRepository:
@@ -19,6 +21,18 @@ class DashboardRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    async def get_change_marker(self) -> tuple:
+        """(MAX(updated_at), COUNT(*)) for attendance and employee in one round trip."""
+        result = await self.db.execute(
+            select(
+                select(func.max(Attendance.updated_at)).scalar_subquery(),
+                select(func.count(Attendance.id)).scalar_subquery(),
+                select(func.max(Employee.updated_at)).scalar_subquery(),
+                select(func.count(Employee.id)).scalar_subquery(),
+            )
+        )
+        return tuple(result.one())
+
     async def get_summary(
         self,
         *,
@@ -30,42 +44,63 @@ class DashboardRepository:
         """Compute aggregated attendance summary.
 
         Uses conditional aggregation (CASE WHEN) in a single query rather
-        than multiple GROUP BY queries — O(log n + k) on idx_attendance_date.
+        than multiple GROUP BY queries — O(log n + k) on the (date, employee_id,
+        status) covering index. Ranges reaching back into archived months read
+        live UNION ALL archive; all others never touch the archive.
         """
+        departments = DepartmentRepository(self.db)
+        department_id = None
+        if department:
+            department_id = await departments.resolve_id(department)
+            if department_id is None:
+                return {
+                    "total_employees": 0,
+                    "summary": {"present": 0, "absent": 0, "half_day": 0, "on_leave": 0},
+                    "attendance_rate": 0.0,
+                    "department_breakdown": [],
+                }
+
         # Count total employees matching filters (INV-11: exclude inactive by default)
         emp_count_query = select(func.count(Employee.id))
         if not include_inactive:
             emp_count_query = emp_count_query.where(Employee.is_active == True)
         if department:
-            emp_count_query = emp_count_query.where(Employee.department == department)
+            emp_count_query = emp_count_query.where(Employee.department_id == department_id)
 
         emp_result = await self.db.execute(emp_count_query)
         total_employees = emp_result.scalar_one()
 
+        archive = ArchiveRepository(self.db)
+        facts = archive.attendance_facts(
+            date_from=date_from,
+            date_to=date_to,
+            include_archive=await archive.covers(date_from),
+        )
+
         # Attendance summary — single query with conditional aggregation
         summary_query = (
             select(
                 func.count(
-                    case((Attendance.status == "PRESENT", 1))
+                    case((facts.c.status == "PRESENT", 1))
                 ).label("present"),
                 func.count(
-                    case((Attendance.status == "ABSENT", 1))
+                    case((facts.c.status == "ABSENT", 1))
                 ).label("absent"),
                 func.count(
-                    case((Attendance.status == "HALF_DAY", 1))
+                    case((facts.c.status == "HALF_DAY", 1))
                 ).label("half_day"),
                 func.count(
-                    case((Attendance.status == "ON_LEAVE", 1))
+                    case((facts.c.status == "ON_LEAVE", 1))
                 ).label("on_leave"),
             )
-            .join(Employee, Attendance.employee_id == Employee.id)
-            .where(Attendance.date.between(date_from, date_to))
+            .select_from(facts)
+            .join(Employee, facts.c.employee_id == Employee.id)
         )
 
         if not include_inactive:
             summary_query = summary_query.where(Employee.is_active == True)
         if department:
-            summary_query = summary_query.where(Employee.department == department)
+            summary_query = summary_query.where(Employee.department_id == department_id)
 
         summary_result = await self.db.execute(summary_query)
         row = summary_result.one()
@@ -83,43 +118,44 @@ class DashboardRepository:
         if total_records > 0:
             attendance_rate = round((summary["present"] + summary["half_day"] * 0.5) / total_records * 100, 2)
 
-        # Department breakdown — single query with GROUP BY
+        # Department breakdown — single query with GROUP BY over the integer key
         dept_query = (
             select(
-                Employee.department,
+                Employee.department_id,
                 func.count(
-                    case((Attendance.status == "PRESENT", 1))
+                    case((facts.c.status == "PRESENT", 1))
                 ).label("present"),
                 func.count(
-                    case((Attendance.status == "ABSENT", 1))
+                    case((facts.c.status == "ABSENT", 1))
                 ).label("absent"),
                 func.count(
-                    case((Attendance.status == "HALF_DAY", 1))
+                    case((facts.c.status == "HALF_DAY", 1))
                 ).label("half_day"),
                 func.count(
-                    case((Attendance.status == "ON_LEAVE", 1))
+                    case((facts.c.status == "ON_LEAVE", 1))
                 ).label("on_leave"),
             )
-            .join(Employee, Attendance.employee_id == Employee.id)
-            .where(Attendance.date.between(date_from, date_to))
-            .group_by(Employee.department)
+            .select_from(facts)
+            .join(Employee, facts.c.employee_id == Employee.id)
+            .group_by(Employee.department_id)
         )
 
         if not include_inactive:
             dept_query = dept_query.where(Employee.is_active == True)
         if department:
-            dept_query = dept_query.where(Employee.department == department)
+            dept_query = dept_query.where(Employee.department_id == department_id)
 
-        dept_result = await self.db.execute(dept_query)
+        dept_rows = (await self.db.execute(dept_query)).all()
+        names = await departments.names_by_id({row.department_id for row in dept_rows})
         department_breakdown = [
             {
-                "department": row.department,
+                "department": names[row.department_id],
                 "present": row.present or 0,
                 "absent": row.absent or 0,
                 "half_day": row.half_day or 0,
                 "on_leave": row.on_leave or 0,
             }
-            for row in dept_result.all()
+            for row in dept_rows
         ]
 
         return {
@@ -128,3 +164,59 @@ class DashboardRepository:
             "attendance_rate": attendance_rate,
             "department_breakdown": department_breakdown,
         }
+
+    async def get_trend(
+        self,
+        *,
+        date_from: date,
+        date_to: date,
+        department: str | None = None,
+        include_inactive: bool = False,
+    ) -> list[dict]:
+        """Per-day status counts over the range, one entry per calendar day.
+
+        Single GROUP BY date query with conditional aggregation; days with no
+        records are filled with zeros here rather than in SQL.
+        """
+        empty = {"present": 0, "absent": 0, "half_day": 0, "on_leave": 0}
+        days = [date_from + timedelta(days=offset) for offset in range((date_to - date_from).days + 1)]
+
+        department_id = None
+        if department:
+            department_id = await DepartmentRepository(self.db).resolve_id(department)
+            if department_id is None:
+                return [{"date": day, **empty} for day in days]
+
+        archive = ArchiveRepository(self.db)
+        facts = archive.attendance_facts(
+            date_from=date_from,
+            date_to=date_to,
+            include_archive=await archive.covers(date_from),
+        )
+        trend_query = (
+            select(
+                facts.c.date,
+                func.count(case((facts.c.status == "PRESENT", 1))).label("present"),
+                func.count(case((facts.c.status == "ABSENT", 1))).label("absent"),
+                func.count(case((facts.c.status == "HALF_DAY", 1))).label("half_day"),
+                func.count(case((facts.c.status == "ON_LEAVE", 1))).label("on_leave"),
+            )
+            .select_from(facts)
+            .join(Employee, facts.c.employee_id == Employee.id)
+            .group_by(facts.c.date)
+        )
+        if not include_inactive:
+            trend_query = trend_query.where(Employee.is_active == True)
+        if department:
+            trend_query = trend_query.where(Employee.department_id == department_id)
+
+        by_day = {
+            row.date: {
+                "present": row.present,
+                "absent": row.absent,
+                "half_day": row.half_day,
+                "on_leave": row.on_leave,
+            }
+            for row in (await self.db.execute(trend_query)).all()
+        }
+        return [{"date": day, **by_day.get(day, empty)} for day in days]
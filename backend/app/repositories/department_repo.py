@@ -0,0 +1,122 @@
+"""Department repository — name ↔ integer key mapping for the department dimension."""
+
+from collections.abc import Iterable
+
+from sqlalchemy import event, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.department import Department
+
+# Process-wide mapping cache. Departments are only ever added (never renamed
+# or deleted through the API), so entries never go stale; a miss just falls
+# through to the DB, which also picks up departments created by other workers.
+# Keys are casefolded: department.name compares case-insensitively (MySQL's
+# utf8mb4_unicode_ci, NOCASE on SQLite), so "hr" and "HR" are one department.
+_id_by_name: dict[str, int] = {}
+_name_by_id: dict[int, str] = {}
+
+# Session.info key: departments this session inserted but has not committed.
+# They reach the cache only from after_commit, so a rollback leaves no dead id.
+_PENDING = "departments_pending"
+
+
+def reset_department_cache() -> None:
+    """Forget cached mappings (tests recreate the schema between cases)."""
+    _id_by_name.clear()
+    _name_by_id.clear()
+
+
+def _key(name: str) -> str:
+    return name.casefold()
+
+
+def _remember(session: AsyncSession, department: Department) -> None:
+    """Cache a row read from the DB, unless it is this session's uncommitted insert."""
+    if department.id in session.info.get(_PENDING, ()):
+        return
+    _id_by_name[_key(department.name)] = department.id
+    _name_by_id[department.id] = department.name
+
+
+@event.listens_for(Session, "after_commit")
+def _cache_committed(session: Session) -> None:
+    for department_id, name in session.info.pop(_PENDING, {}).items():
+        _id_by_name[_key(name)] = department_id
+        _name_by_id[department_id] = name
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_uncommitted(session: Session) -> None:
+    session.info.pop(_PENDING, None)
+
+
+class DepartmentRepository:
+    """Encapsulates department lookups used by the API's string ↔ id mapping layer."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_name(self, name: str) -> Department | None:
+        """Fetch department by name.  O(log n) unique index lookup."""
+        result = await self.db.execute(select(Department).where(Department.name == name))
+        department = result.scalar_one_or_none()
+        if department is not None:
+            _remember(self.db, department)
+        return department
+
+    async def get_or_create(self, name: str) -> Department:
+        """Return the department row for ``name``, inserting it on first use.
+
+        The INSERT runs in a SAVEPOINT so a concurrent creator winning the
+        unique constraint doesn't abort the caller's transaction.
+        """
+        department = await self.get_by_name(name)
+        if department is not None:
+            return department
+
+        try:
+            async with self.db.begin_nested():
+                department = Department(name=name)
+                self.db.add(department)
+                await self.db.flush()
+        except IntegrityError:
+            department = await self.get_by_name(name)
+            if department is None:
+                raise
+            return department
+        self.db.info.setdefault(_PENDING, {})[department.id] = department.name
+        return department
+
+    async def resolve_id(self, name: str) -> int | None:
+        """Map a department name to its key; None if no such department."""
+        department_id = _id_by_name.get(_key(name))
+        if department_id is not None:
+            return department_id
+        department = await self.get_by_name(name)
+        return department.id if department is not None else None
+
+    async def resolve_ids(self, names: Iterable[str]) -> list[int]:
+        """Keys of the known departments among ``names``; unknown names are dropped.
+
+        Cache misses are looked up together in one ``name IN (...)`` query.
+        """
+        names = set(names)
+        ids = {_id_by_name[_key(name)] for name in names if _key(name) in _id_by_name}
+        missing = {name for name in names if _key(name) not in _id_by_name}
+        if missing:
+            result = await self.db.execute(select(Department).where(Department.name.in_(missing)))
+            for department in result.scalars():
+                _remember(self.db, department)
+                ids.add(department.id)
+        return list(ids)
+
+    async def names_by_id(self, ids: set[int] | None = None) -> dict[int, str]:
+        """Map keys back to names, reloading the (tiny) table on any cache miss."""
+        if ids is None or not ids.issubset(_name_by_id):
+            result = await self.db.execute(select(Department))
+            for department in result.scalars():
+                _remember(self.db, department)
+        # This session's uncommitted inserts are visible to it, though not cached
+        return _name_by_id | self.db.info.get(_PENDING, {})
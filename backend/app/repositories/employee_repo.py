@@ -1,11 +1,18 @@
 """Employee repository — data access layer for employee operations."""
 
 import math
+from collections.abc import Sequence
+from datetime import date, datetime
 
-from sqlalchemy import func, select, or_
+from sqlalchemy import delete, func, insert, literal, select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models.attendance import Attendance
+from app.models.attendance_archive import AttendanceArchive
+from app.models.change_tombstone import ChangeTombstone
 from app.models.employee import Employee
+from app.repositories.department_repo import DepartmentRepository
+from app.repositories.filters import match_any
 
 
 class EmployeeRepository:
@@ -28,6 +35,32 @@ class EmployeeRepository:
         )
         return result.scalar_one_or_none()
 
+    async def joining_dates(self, employee_ids: set[str]) -> dict[str, date]:
+        """{id: date_of_joining} for those of ``employee_ids`` that exist.  One PK range lookup."""
+        result = await self.db.execute(
+            select(Employee.id, Employee.date_of_joining).where(Employee.id.in_(employee_ids))
+        )
+        return dict(result.all())
+
+    async def get_version(self, employee_id: str) -> tuple[datetime, int] | None:
+        """Fetch only (updated_at, version).  O(log n) PK lookup, no row hydration."""
+        result = await self.db.execute(
+            select(Employee.updated_at, Employee.version).where(Employee.id == employee_id)
+        )
+        row = result.one_or_none()
+        return tuple(row) if row is not None else None
+
+    async def get_change_marker(self) -> tuple[datetime | None, int]:
+        """Cheap table-level version: (MAX(updated_at), COUNT(*)).
+
+        MAX is served from idx_employee_updated_at_id; COUNT scans the smallest index.
+        """
+        result = await self.db.execute(
+            select(func.max(Employee.updated_at), func.count(Employee.id))
+        )
+        max_updated_at, count = result.one()
+        return max_updated_at, count
+
     async def get_by_email(self, email: str) -> Employee | None:
         """Fetch employee by email.  O(log n) unique index lookup."""
         result = await self.db.execute(
@@ -47,7 +80,8 @@ class EmployeeRepository:
         *,
         page: int = 1,
         per_page: int = 20,
-        department: str | None = None,
+        department: str | Sequence[str] | None = None,
+        employee_id: str | Sequence[str] | None = None,
         is_active: bool | None = None,
         search: str | None = None,
     ) -> tuple[list[Employee], int]:
@@ -55,14 +89,26 @@ class EmployeeRepository:
 
         Returns (employees, total_count).
         Uses offset-based pagination with keyset-ready abstraction.
+        ``department`` and ``employee_id`` take one value or a sequence (any
+        of them matches).
         """
         query = select(Employee)
         count_query = select(func.count(Employee.id))
 
-        # Apply filters
+        # Apply filters — department names are mapped to their integer keys first
         if department is not None:
-            query = query.where(Employee.department == department)
-            count_query = count_query.where(Employee.department == department)
+            names = [department] if isinstance(department, str) else department
+            department_ids = await DepartmentRepository(self.db).resolve_ids(names)
+            if not department_ids:
+                return [], 0
+            department_filter = match_any(Employee.department_id, department_ids)
+            query = query.where(department_filter)
+            count_query = count_query.where(department_filter)
+
+        if employee_id is not None:
+            id_filter = match_any(Employee.id, employee_id)
+            query = query.where(id_filter)
+            count_query = count_query.where(id_filter)
 
         if is_active is not None:
             query = query.where(Employee.is_active == is_active)
@@ -97,7 +143,24 @@ class EmployeeRepository:
         return employee
 
     async def delete(self, employee: Employee) -> None:
-        """Hard delete an employee (CASCADE to attendance via DB FK)."""
+        """Hard delete an employee together with live and archived attendance.
+
+        Tombstones for the attendance rows are recorded first with INSERT ...
+        SELECT. Attendance is then deleted explicitly instead of relying on the
+        ON DELETE CASCADE: a partitioned attendance table (migrations/004)
+        cannot carry the FK, and the archive never had one.
+        """
+        for table in (Attendance, AttendanceArchive):
+            await self.db.execute(
+                insert(ChangeTombstone).from_select(
+                    ["entity", "entity_id"],
+                    select(literal("attendance"), table.id).where(
+                        table.employee_id == employee.id
+                    ),
+                )
+            )
+            await self.db.execute(delete(table).where(table.employee_id == employee.id))
+        self.db.add(ChangeTombstone(entity="employee", entity_id=employee.id))
         await self.db.delete(employee)
         await self.db.flush()
 
@@ -0,0 +1,18 @@
+"""Shared WHERE-clause builders for the listing repositories."""
+
+from collections.abc import Sequence
+
+from sqlalchemy import ColumnElement
+
+
+def match_any(column, values: str | int | Sequence) -> ColumnElement[bool]:
+    """``column = v`` for one value, ``column IN (...)`` for several.
+
+    ``in_()`` compiles to a single expanding bind parameter, rendered per
+    execution, so the cached statement is the same for 2 ids or 2,000.
+    """
+    if isinstance(values, (str, int)):
+        return column == values
+    if len(values) == 1:
+        return column == values[0]
+    return column.in_(values)
@@ -0,0 +1,155 @@
+"""Job repository — the persisted queue behind the background job runner."""
+
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.job import FINISHED_STATUSES, Job
+
+
+def _owned(job_id: str, worker: str, attempt: int):
+    """The job is still running as ``attempt`` on ``worker``.
+
+    A runner that missed heartbeats for JOB_STALE_SECONDS may still be
+    working while another has requeued and re-claimed the job; the
+    (worker, attempts) pair tells the two runs apart.
+    """
+    return and_(Job.id == job_id, Job.status == "running", Job.worker == worker, Job.attempts == attempt)
+
+
+class JobRepository:
+    """Claiming, heartbeats and state transitions are single conditional UPDATEs.
+
+    Every write from a running job is conditioned on the run that claimed
+    it, so when two runners end up executing the same job, only the current
+    owner's heartbeat, progress and result are recorded.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, kind: str, params: dict, job_id: str | None = None) -> Job:
+        job = Job(kind=kind, params=params)
+        if job_id is not None:
+            job.id = job_id
+        self.db.add(job)
+        await self.db.flush()
+        await self.db.refresh(job)
+        return job
+
+    async def get_by_id(self, job_id: str) -> Job | None:
+        return await self.db.get(Job, job_id, populate_existing=True)
+
+    async def next_queued(self) -> str | None:
+        """Oldest queued job id (idx_job_status_created_at)."""
+        result = await self.db.execute(
+            select(Job.id).where(Job.status == "queued").order_by(Job.created_at, Job.id).limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def claim(self, job_id: str, worker: str, now: datetime) -> bool:
+        """queued → running for this worker; False if another runner got there first."""
+        result = await self.db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == "queued")
+            .values(status="running", worker=worker, started_at=now, heartbeat_at=now, attempts=Job.attempts + 1)
+        )
+        return result.rowcount == 1
+
+    async def heartbeat(
+        self, runs: Mapping[str, int], worker: str, now: datetime
+    ) -> tuple[set[str], set[str]]:
+        """Refresh the heartbeat of each run (job id → attempt) this worker owns.
+
+        Returns (lost, cancel requested): the jobs no longer owned by these
+        runs, and the owned ones flagged by POST /jobs/{id}/cancel.
+        """
+        lost = set()
+        for job_id, attempt in runs.items():
+            result = await self.db.execute(
+                update(Job).where(_owned(job_id, worker, attempt)).values(heartbeat_at=now)
+            )
+            if result.rowcount != 1:
+                lost.add(job_id)
+        owned = [job_id for job_id in runs if job_id not in lost]
+        if not owned:
+            return lost, set()
+        result = await self.db.execute(
+            select(Job.id).where(Job.id.in_(owned), Job.cancel_requested == True)
+        )
+        return lost, set(result.scalars().all())
+
+    async def set_progress(self, job_id: str, worker: str, attempt: int, progress: int) -> bool:
+        """Record progress; False if this run no longer owns the job."""
+        result = await self.db.execute(update(Job).where(_owned(job_id, worker, attempt)).values(progress=progress))
+        return result.rowcount == 1
+
+    async def finish(self, job_id: str, worker: str, attempt: int, status: str, now: datetime, **values) -> bool:
+        """running → succeeded / failed / cancelled (result or error in ``values``).
+
+        False if this run no longer owns the job — its outcome is discarded.
+        """
+        result = await self.db.execute(
+            update(Job)
+            .where(_owned(job_id, worker, attempt))
+            .values(status=status, finished_at=now, heartbeat_at=None, **values)
+        )
+        return result.rowcount == 1
+
+    async def requeue(self, runs: Mapping[str, int], worker: str) -> None:
+        """running → queued for the runs (job id → attempt) this worker owns, e.g. on shutdown."""
+        for job_id, attempt in runs.items():
+            await self.db.execute(
+                update(Job)
+                .where(_owned(job_id, worker, attempt))
+                .values(status="queued", worker=None, heartbeat_at=None)
+            )
+
+    async def cancel(self, job_id: str, now: datetime) -> None:
+        """Cancel a queued job outright; flag a running one for its runner."""
+        await self.db.execute(
+            update(Job)
+            .where(Job.id == job_id, Job.status == "queued")
+            .values(status="cancelled", cancel_requested=True, finished_at=now)
+        )
+        await self.db.execute(
+            update(Job).where(Job.id == job_id, Job.status == "running").values(cancel_requested=True)
+        )
+
+    async def recover_stale(self, stale_before: datetime, max_attempts: int, now: datetime) -> int:
+        """Requeue running jobs whose runner stopped heart-beating.
+
+        Jobs out of attempts fail, and jobs already flagged for cancellation are cancelled.
+
+        Returns the number of jobs requeued.
+        """
+        stale = and_(Job.status == "running", or_(Job.heartbeat_at == None, Job.heartbeat_at < stale_before))
+        await self.db.execute(
+            update(Job)
+            .where(stale, Job.cancel_requested == True)
+            .values(status="cancelled", finished_at=now, heartbeat_at=None)
+        )
+        await self.db.execute(
+            update(Job)
+            .where(stale, Job.attempts >= max_attempts)
+            .values(
+                status="failed",
+                finished_at=now,
+                heartbeat_at=None,
+                error={"error_code": "JOB_ABANDONED", "message": "The job's worker stopped before it finished"},
+            )
+        )
+        result = await self.db.execute(update(Job).where(stale).values(status="queued", worker=None, heartbeat_at=None))
+        return result.rowcount
+
+    async def finished_before(self, cutoff: datetime) -> Sequence[Job]:
+        result = await self.db.execute(
+            select(Job).where(Job.status.in_(FINISHED_STATUSES), Job.finished_at < cutoff)
+        )
+        return result.scalars().all()
+
+    async def delete(self, job_ids: Sequence[str]) -> None:
+        if job_ids:
+            await self.db.execute(delete(Job).where(Job.id.in_(job_ids)))
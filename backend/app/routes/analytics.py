@@ -0,0 +1,163 @@
+"""Analytics API endpoints — absenteeism, worked hours, punctuality, missing attendance and heatmaps."""
+
+from datetime import date, time
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Header, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.schemas.analytics import (
+    AbsenteeismResponse,
+    HeatmapResponse,
+    MissingAttendanceResponse,
+    WorkTimeResponse,
+)
+from app.services.analytics_service import AnalyticsService
+from app.services.etag import etag_matches, not_modified, set_validators
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+
+def _get_service(db: AsyncSession = Depends(get_db)) -> AnalyticsService:
+    return AnalyticsService(db)
+
+
+@router.get(
+    "/absenteeism",
+    response_model=AbsenteeismResponse,
+    summary="Get per-employee absenteeism metrics",
+    description="Absence days, absence spells, Bradford factor (spells² × days), longest present "
+    "streak and days since the last absence, for every employee in scope over a date range "
+    "(defaults to the rolling year ending today). Sorted by Bradford factor, highest first. "
+    "Excludes inactive employees by default (INV-11).",
+    responses={503: {"description": "numpy is not installed"}},
+)
+async def get_absenteeism(
+    response: Response,
+    date_from: date | None = Query(default=None, description="Start date (defaults to 364 days before date_to)"),
+    date_to: date | None = Query(default=None, description="End date (defaults to today)"),
+    department: str | None = Query(default=None),
+    include_inactive: bool = Query(default=False, description="Include inactive employees"),
+    if_none_match: str | None = Header(default=None),
+    service: AnalyticsService = Depends(_get_service),
+):
+    params = dict(
+        date_from=date_from,
+        date_to=date_to,
+        department=department,
+        include_inactive=include_inactive,
+    )
+    etag = await service.get_absenteeism_etag(**params)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_validators(response, etag)
+
+    return await service.get_absenteeism(etag=etag, **params)
+
+
+@router.get(
+    "/work-time",
+    response_model=WorkTimeResponse,
+    summary="Get worked hours and punctuality per employee or department",
+    description="Total and average worked hours (records with both check_in and check_out), "
+    "late arrivals (check_in after start_time) and early departures (check_out before end_time) "
+    "over a date range (defaults to the rolling year ending today). start_time / end_time default "
+    "to WORKDAY_START / WORKDAY_END. Aggregated in SQL.",
+)
+async def get_work_time(
+    response: Response,
+    date_from: date | None = Query(default=None, description="Start date (defaults to 364 days before date_to)"),
+    date_to: date | None = Query(default=None, description="End date (defaults to today)"),
+    group_by: Literal["employee", "department"] = Query(default="employee"),
+    start_time: time | None = Query(default=None, description="Late-arrival threshold (HH:MM)"),
+    end_time: time | None = Query(default=None, description="Early-departure threshold (HH:MM)"),
+    department: str | None = Query(default=None),
+    include_inactive: bool = Query(default=False, description="Include inactive employees"),
+    if_none_match: str | None = Header(default=None),
+    service: AnalyticsService = Depends(_get_service),
+):
+    params = dict(
+        date_from=date_from,
+        date_to=date_to,
+        group_by=group_by,
+        start_time=start_time,
+        end_time=end_time,
+        department=department,
+        include_inactive=include_inactive,
+    )
+    etag = await service.get_work_time_etag(**params)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_validators(response, etag)
+
+    return await service.get_work_time(**params)
+
+
+@router.get(
+    "/missing-attendance",
+    response_model=MissingAttendanceResponse,
+    summary="Get working days without an attendance record",
+    description="Expected days are working days (weekends and configured HOLIDAYS excluded) from "
+    "each employee's date_of_joining up to today; missing days are those with no attendance "
+    "record. Returns per-department totals for everyone in scope, and the `limit` employees "
+    "with the most missing days along with their missing dates. The range defaults to the rolling "
+    "year ending today.",
+)
+async def get_missing_attendance(
+    response: Response,
+    date_from: date | None = Query(default=None, description="Start date (defaults to 364 days before date_to)"),
+    date_to: date | None = Query(default=None, description="End date (defaults to today)"),
+    department: str | None = Query(default=None),
+    include_inactive: bool = Query(default=False, description="Include inactive employees"),
+    limit: int = Query(default=100, ge=1, le=1000, description="Employees listed with their missing dates"),
+    if_none_match: str | None = Header(default=None),
+    service: AnalyticsService = Depends(_get_service),
+):
+    params = dict(
+        date_from=date_from,
+        date_to=date_to,
+        department=department,
+        include_inactive=include_inactive,
+        limit=limit,
+    )
+    etag = await service.get_missing_attendance_etag(**params)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_validators(response, etag)
+
+    return await service.get_missing_attendance(**params)
+
+
+@router.get(
+    "/heatmap",
+    response_model=HeatmapResponse,
+    summary="Get an employee × day attendance status matrix",
+    description="Dense status grid for everyone in scope (typically one department) over at most "
+    "HEATMAP_MAX_DAYS days (defaults to the month to date). Rows follow employee_ids, ordered by "
+    "employee code. The grid is base64 bytes (one status code per cell) or a run-length string. A "
+    "500 × 90 grid is 60 KB of base64, or about 7–14 KB on the wire with response compression.",
+)
+async def get_heatmap(
+    response: Response,
+    date_from: date | None = Query(default=None, description="Start date (defaults to the first of date_to's month)"),
+    date_to: date | None = Query(default=None, description="End date (defaults to today)"),
+    department: str | None = Query(default=None),
+    include_inactive: bool = Query(default=False, description="Include inactive employees"),
+    encoding: Literal["base64", "rle"] = Query(default="base64"),
+    if_none_match: str | None = Header(default=None),
+    service: AnalyticsService = Depends(_get_service),
+):
+    params = dict(
+        date_from=date_from,
+        date_to=date_to,
+        department=department,
+        include_inactive=include_inactive,
+        encoding=encoding,
+    )
+    etag = await service.get_heatmap_etag(**params)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_validators(response, etag)
+
+    return await service.get_heatmap(**params)
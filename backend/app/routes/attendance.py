@@ -3,13 +3,28 @@
 import math
 from datetime import date
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.database import get_db
-from app.schemas.attendance import AttendanceCreate, AttendanceResponse, AttendanceUpdate
+from app.schemas.attendance import (
+    AttendanceCreate,
+    AttendanceIntakeStatus,
+    AttendanceResponse,
+    AttendanceUpdate,
+    AttendanceUpsertBatch,
+    AttendanceUpsertBatchResponse,
+    RosterResponse,
+)
 from app.schemas.common import PaginatedResponse, PaginationMeta
+from app.services.attendance_intake import attendance_intake
 from app.services.attendance_service import AttendanceService
+from app.services.etag import etag_matches, not_modified, set_validators
+from app.services.exceptions import AppException
+from app.services.idempotency import StoredResponse, as_response, fingerprint, idempotency_store
+from app.services.list_filters import split_values
+from app.services.ndjson_ingest import NDJSON_MEDIA_TYPES, DuplexStreamingResponse, ingest
 
 router = APIRouter(prefix="/attendance", tags=["Attendance"])
 
@@ -43,45 +58,202 @@ def _attendance_to_response(attendance) -> AttendanceResponse:
     responses={
         404: {"description": "Employee not found"},
         409: {"description": "Attendance already exists for this date"},
-        422: {"description": "Validation: future date, date before joining, invalid status"},
+        422: {"description": "Validation: future date, date before joining, invalid status, reused Idempotency-Key"},
     },
 )
 async def mark_attendance(
     data: AttendanceCreate,
+    idempotency_key: str | None = Header(default=None, description="Makes retries safe: replays the first response"),
     service: AttendanceService = Depends(_get_service),
 ):
-    attendance = await service.mark_attendance(data)
-    # Reload with employee relationship for response
-    attendance = await service.get_attendance(attendance.id)
+    if idempotency_key is None:
+        attendance = await service.mark_attendance(data)
+        # Reload with employee relationship for response
+        attendance = await service.get_attendance(attendance.id)
+        return _attendance_to_response(attendance)
+
+    async def create() -> StoredResponse:
+        attendance = await service.mark_attendance(data)
+        attendance = await service.get_attendance(attendance.id)
+        # Commit before publishing so a replay never reports an unpersisted row
+        await service.db.commit()
+        return StoredResponse(
+            status_code=201,
+            body=_attendance_to_response(attendance).model_dump(mode="json"),
+        )
+
+    stored, replayed = await idempotency_store.run(
+        "POST /attendance", idempotency_key, fingerprint(data.model_dump_json()), create
+    )
+    return as_response(stored, replayed)
+
+
+@router.post(
+    "/upsert",
+    response_model=AttendanceResponse,
+    status_code=201,
+    summary="Mark attendance, merging into an existing record for the same day",
+    description="Creates the record (201) or merges it into the one already stored for "
+    "(employee_id, date) (200) in one statement. Which fields a re-sent record may overwrite "
+    "is set by ATTENDANCE_UPSERT_RULES — by default the status is replaced, the earliest "
+    "check_in and latest check_out are kept, and notes only fill a blank.",
+    responses={
+        200: {"description": "Merged into the existing record"},
+        404: {"description": "Employee not found"},
+        422: {"description": "Validation: future date, date before joining, archived date, invalid status"},
+    },
+)
+async def upsert_attendance(
+    data: AttendanceCreate,
+    response: Response,
+    service: AttendanceService = Depends(_get_service),
+):
+    attendance, created = await service.upsert_attendance(data)
+    if not created:
+        response.status_code = 200
     return _attendance_to_response(attendance)
 
 
+@router.post(
+    "/upsert/batch",
+    response_model=AttendanceUpsertBatchResponse,
+    summary="Upsert many attendance records in one round trip",
+    description="All valid records are written with a single INSERT ... ON DUPLICATE KEY UPDATE "
+    "(ON CONFLICT on SQLite), merged as in POST /attendance/upsert. Results are returned in "
+    "request order; an invalid record is reported with its error and does not fail the batch.",
+    responses={422: {"description": "More than ATTENDANCE_UPSERT_MAX_BATCH records"}},
+)
+async def upsert_attendance_batch(
+    data: AttendanceUpsertBatch,
+    service: AttendanceService = Depends(_get_service),
+):
+    return await service.upsert_attendance_batch(data.records)
+
+
+@router.post(
+    "/bulk",
+    summary="Stream-ingest attendance as NDJSON",
+    description="Request body: application/x-ndjson, one attendance object per line. The upload is read, "
+    "validated and written in batches as it arrives (merged as in POST /attendance/upsert), and one "
+    "result line per input line is streamed back as it is written, followed by a "
+    '{"summary": ...} line. A bad line is reported and does not stop the upload.',
+    response_class=DuplexStreamingResponse,
+    responses={
+        200: {"content": {"application/x-ndjson": {}}, "description": "AttendanceIngestLine per line, then the summary"},
+        415: {"description": "Body is not NDJSON"},
+    },
+)
+async def bulk_ingest_attendance(
+    request: Request,
+    content_type: str = Header(default=""),
+    db: AsyncSession = Depends(get_db),
+):
+    if content_type.split(";")[0].strip().lower() not in NDJSON_MEDIA_TYPES:
+        raise AppException(
+            error_code="UNSUPPORTED_MEDIA_TYPE",
+            message="Send attendance records as application/x-ndjson, one JSON object per line",
+            status_code=415,
+            details={"content_type": content_type},
+        )
+    return DuplexStreamingResponse(ingest(db, request.stream()), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/intake",
+    response_model=AttendanceIntakeStatus,
+    status_code=202,
+    summary="Queue attendance for asynchronous (write-behind) recording",
+    description="Validates and queues the record, answering before it is written. A background "
+    "writer stores queued records in batches with the merge rules of POST /attendance/upsert. "
+    "Poll the Location for the outcome. Enabled with ATTENDANCE_INTAKE_ENABLED.",
+    responses={
+        422: {"description": "Invalid payload or future date"},
+        429: {"description": "Intake queue full — retry after Retry-After seconds"},
+        503: {"description": "Intake disabled or shutting down"},
+    },
+)
+async def submit_attendance_intake(data: AttendanceCreate, response: Response):
+    status = attendance_intake.submit(data)
+    response.headers["Location"] = f"{settings.API_V1_PREFIX}/attendance/intake/{status.tracking_id}"
+    return status
+
+
+@router.get(
+    "/intake/{tracking_id}",
+    response_model=AttendanceIntakeStatus,
+    summary="Outcome of a queued attendance record",
+    responses={404: {"description": "Unknown or expired tracking id"}},
+)
+async def get_attendance_intake(tracking_id: str):
+    return attendance_intake.status(tracking_id)
+
+
+@router.get(
+    "/roster",
+    response_model=RosterResponse,
+    summary="Get every active employee with their attendance for a date",
+    description="The mark-attendance screen in one call: active employees who had joined by the "
+    "date, ordered by employee code, each with that date's record or null. One LEFT JOIN per "
+    "page; follow next_cursor for the next page.",
+    responses={422: {"description": "Malformed cursor"}},
+)
+async def get_roster(
+    response: Response,
+    day: date | None = Query(default=None, alias="date", description="Defaults to today"),
+    department: str | None = Query(default=None),
+    cursor: str | None = Query(default=None, description="next_cursor of the previous page"),
+    limit: int = Query(default=500, ge=1, le=1000),
+    if_none_match: str | None = Header(default=None),
+    service: AttendanceService = Depends(_get_service),
+):
+    params = dict(day=day or date.today(), department=department, cursor=cursor, limit=limit)
+    etag = await service.roster_etag(**params)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_validators(response, etag)
+
+    return await service.get_roster(**params)
+
+
 @router.get(
     "",
     response_model=PaginatedResponse[AttendanceResponse],
     summary="List attendance records with filters",
+    description="employee_id, status and department accept several values, repeated "
+    "(?status=ABSENT&status=HALF_DAY) or, for employee_id and status, comma-separated "
+    "(?status=ABSENT,HALF_DAY); a record matching any of them is returned. Department names "
+    "may contain commas, so several departments are given as repeated parameters only.",
+    responses={422: {"description": "More than LIST_FILTER_MAX_VALUES values in one filter"}},
 )
 async def list_attendance(
+    response: Response,
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=20, ge=1, le=100),
-    employee_id: str | None = Query(default=None),
+    employee_id: list[str] | None = Query(default=None),
     date: date | None = Query(default=None, alias="date"),
     date_from: date | None = Query(default=None),
     date_to: date | None = Query(default=None),
-    status: str | None = Query(default=None),
-    department: str | None = Query(default=None),
+    status: list[str] | None = Query(default=None),
+    department: list[str] | None = Query(default=None),
+    if_none_match: str | None = Header(default=None),
     service: AttendanceService = Depends(_get_service),
 ):
-    records, total = await service.list_attendance(
+    filters = dict(
         page=page,
         per_page=per_page,
-        employee_id=employee_id,
+        employee_id=split_values("employee_id", employee_id),
         attendance_date=date,
         date_from=date_from,
         date_to=date_to,
-        status=status,
-        department=department,
+        status=split_values("status", status),
+        department=split_values("department", department, commas=False),
     )
+    etag = await service.list_etag(**filters)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_validators(response, etag)
+
+    records, total = await service.list_attendance(**filters)
     return PaginatedResponse(
         data=[_attendance_to_response(r) for r in records],
         meta=PaginationMeta(
@@ -97,13 +269,21 @@ async def list_attendance(
     "/{attendance_id}",
     response_model=AttendanceResponse,
     summary="Get attendance record by ID",
-    responses={404: {"description": "Record not found"}},
+    responses={304: {"description": "Not modified (If-None-Match)"}, 404: {"description": "Record not found"}},
 )
 async def get_attendance(
     attendance_id: str,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
     service: AttendanceService = Depends(_get_service),
 ):
+    if if_none_match:
+        etag = await service.get_attendance_etag(attendance_id)
+        if etag is not None and etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
     attendance = await service.get_attendance(attendance_id)
+    set_validators(response, service.attendance_etag(attendance))
     return _attendance_to_response(attendance)
 
 
@@ -0,0 +1,28 @@
+"""Batch API endpoint — multiplex GET sub-requests in one HTTP round trip."""
+
+from fastapi import APIRouter, Depends, Request
+
+from app.schemas.batch import BatchRequest, BatchResponse
+from app.services.batch_service import BatchService
+
+router = APIRouter(prefix="/batch", tags=["Batch"])
+
+
+def _get_service(request: Request) -> BatchService:
+    return BatchService(request.app, request.scope)
+
+
+@router.post(
+    "",
+    response_model=BatchResponse,
+    summary="Run several GET requests in one round trip",
+    description="Sub-requests run concurrently, each with its own DB session. "
+    "Each one passes through the rate limiter in addition to the batch itself. "
+    "Results are returned in request order; a failing sub-request does not fail the batch.",
+    responses={422: {"description": "Too many sub-requests or a non-API / non-GET path"}},
+)
+async def run_batch(
+    data: BatchRequest,
+    service: BatchService = Depends(_get_service),
+):
+    return BatchResponse(responses=await service.execute(data.requests))
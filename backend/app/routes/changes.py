@@ -0,0 +1,56 @@
+"""Change feed API endpoint — incremental sync for payroll / BI integrations."""
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import get_db
+from app.routes.attendance import _attendance_to_response
+from app.schemas.changes import ChangeEntry, ChangeFeedResponse
+from app.schemas.employee import EmployeeResponse
+from app.services.change_service import ChangeService
+
+router = APIRouter(prefix="/changes", tags=["Changes"])
+
+
+def _get_service(db: AsyncSession = Depends(get_db)) -> ChangeService:
+    return ChangeService(db)
+
+
+@router.get(
+    "",
+    response_model=ChangeFeedResponse,
+    summary="List employee and attendance changes since a cursor",
+    description="Returns upserts and deletes in (changed_at, id) order. "
+    "Omit `since` for a full initial sync, then pass `next_cursor` back on each poll "
+    "until `has_more` is false.",
+    responses={
+        410: {"description": "Cursor older than the tombstone retention — start a full sync"},
+        422: {"description": "Malformed cursor"},
+    },
+)
+async def list_changes(
+    since: str | None = Query(default=None, description="Opaque cursor from a previous response"),
+    limit: int = Query(default=500, ge=1, le=1000),
+    service: ChangeService = Depends(_get_service),
+):
+    changes, next_cursor, has_more = await service.list_changes(since=since, limit=limit)
+
+    entries = []
+    for change in changes:
+        data = None
+        if change.record is not None:
+            data = (
+                EmployeeResponse.model_validate(change.record)
+                if change.entity == "employee"
+                else _attendance_to_response(change.record)
+            )
+        entries.append(
+            ChangeEntry(
+                entity=change.entity,
+                op=change.op,
+                id=change.id,
+                changed_at=change.changed_at,
+                data=data,
+            )
+        )
+    return ChangeFeedResponse(changes=entries, next_cursor=next_cursor, has_more=has_more)
@@ -1,13 +1,14 @@
-"""Dashboard API endpoint — aggregated summary."""
+"""Dashboard API endpoints — aggregated summary and daily trend."""
 
 from datetime import date
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.schemas.dashboard import DashboardSummaryResponse
+from app.schemas.dashboard import DashboardSummaryResponse, DashboardTrendResponse
 from app.services.dashboard_service import DashboardService
+from app.services.etag import etag_matches, not_modified, set_validators
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
@@ -25,15 +26,61 @@ def _get_service(db: AsyncSession = Depends(get_db)) -> DashboardService:
     "Set include_inactive=true to include them.",
 )
 async def get_summary(
+    response: Response,
     date_from: date | None = Query(default=None, description="Start date (defaults to today)"),
     date_to: date | None = Query(default=None, description="End date (defaults to date_from)"),
     department: str | None = Query(default=None),
     include_inactive: bool = Query(default=False, description="Include inactive employees"),
+    if_none_match: str | None = Header(default=None),
     service: DashboardService = Depends(_get_service),
 ):
+    etag = await service.get_summary_etag(
+        date_from=date_from,
+        date_to=date_to,
+        department=department,
+        include_inactive=include_inactive,
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_validators(response, etag)
+
     return await service.get_summary(
         date_from=date_from,
         date_to=date_to,
         department=department,
         include_inactive=include_inactive,
     )
+
+
+@router.get(
+    "/trend",
+    response_model=DashboardTrendResponse,
+    summary="Get day-by-day attendance counts",
+    description="Per-day status counts over a date range (defaults to the trailing 30 days). "
+    "Days without records are returned with zero counts.",
+)
+async def get_trend(
+    response: Response,
+    date_from: date | None = Query(default=None, description="Start date (defaults to 29 days before date_to)"),
+    date_to: date | None = Query(default=None, description="End date (defaults to today)"),
+    department: str | None = Query(default=None),
+    include_inactive: bool = Query(default=False, description="Include inactive employees"),
+    if_none_match: str | None = Header(default=None),
+    service: DashboardService = Depends(_get_service),
+):
+    etag = await service.get_trend_etag(
+        date_from=date_from,
+        date_to=date_to,
+        department=department,
+        include_inactive=include_inactive,
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_validators(response, etag)
+
+    return await service.get_trend(
+        date_from=date_from,
+        date_to=date_to,
+        department=department,
+        include_inactive=include_inactive,
+    )
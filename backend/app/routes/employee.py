@@ -1,14 +1,18 @@
 """Employee API endpoints."""
 
 import math
+from datetime import date
 
-from fastapi import APIRouter, Depends, Query, Response
+from fastapi import APIRouter, Depends, Header, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.schemas.common import PaginatedResponse, PaginationMeta
-from app.schemas.employee import EmployeeCreate, EmployeeResponse, EmployeeUpdate
+from app.schemas.employee import EmployeeCalendarResponse, EmployeeCreate, EmployeeResponse, EmployeeUpdate
 from app.services.employee_service import EmployeeService
+from app.services.etag import etag_matches, not_modified, set_validators
+from app.services.idempotency import StoredResponse, as_response, fingerprint, idempotency_store
+from app.services.list_filters import split_values
 
 router = APIRouter(prefix="/employees", tags=["Employees"])
 
@@ -22,34 +26,69 @@ def _get_service(db: AsyncSession = Depends(get_db)) -> EmployeeService:
     response_model=EmployeeResponse,
     status_code=201,
     summary="Create a new employee",
-    responses={409: {"description": "Email or employee_code conflict"}, 422: {"description": "Validation error"}},
+    responses={409: {"description": "Email or employee_code conflict"}, 422: {"description": "Validation error or reused Idempotency-Key"}},
 )
 async def create_employee(
     data: EmployeeCreate,
     response: Response,
+    idempotency_key: str | None = Header(default=None, description="Makes retries safe: replays the first response"),
     service: EmployeeService = Depends(_get_service),
 ):
-    employee = await service.create_employee(data)
-    response.headers["Location"] = f"/api/v1/employees/{employee.id}"
-    return employee
+    if idempotency_key is None:
+        employee = await service.create_employee(data)
+        response.headers["Location"] = f"/api/v1/employees/{employee.id}"
+        return employee
+
+    async def create() -> StoredResponse:
+        employee = await service.create_employee(data)
+        # Commit before publishing so a replay never reports an unpersisted row
+        await service.db.commit()
+        return StoredResponse(
+            status_code=201,
+            body=EmployeeResponse.model_validate(employee).model_dump(mode="json"),
+            headers={"Location": f"/api/v1/employees/{employee.id}"},
+        )
+
+    stored, replayed = await idempotency_store.run(
+        "POST /employees", idempotency_key, fingerprint(data.model_dump_json()), create
+    )
+    return as_response(stored, replayed)
 
 
 @router.get(
     "",
     response_model=PaginatedResponse[EmployeeResponse],
     summary="List employees with pagination and filters",
+    description="department and employee_id accept several values as repeated parameters "
+    "(?department=HR&department=Finance); employee_id also comma-separated (?employee_id=a,b). "
+    "Department names may contain commas, so they are never split.",
+    responses={422: {"description": "More than LIST_FILTER_MAX_VALUES values in one filter"}},
 )
 async def list_employees(
+    response: Response,
     page: int = Query(default=1, ge=1),
     per_page: int = Query(default=20, ge=1, le=100),
-    department: str | None = Query(default=None),
+    department: list[str] | None = Query(default=None),
+    employee_id: list[str] | None = Query(default=None),
     is_active: bool | None = Query(default=None),
     search: str | None = Query(default=None, description="Search name, email, or code"),
+    if_none_match: str | None = Header(default=None),
     service: EmployeeService = Depends(_get_service),
 ):
-    employees, total = await service.list_employees(
-        page=page, per_page=per_page, department=department, is_active=is_active, search=search
+    filters = dict(
+        page=page,
+        per_page=per_page,
+        department=split_values("department", department, commas=False),
+        employee_id=split_values("employee_id", employee_id),
+        is_active=is_active,
+        search=search,
     )
+    etag = await service.list_etag(**filters)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_validators(response, etag)
+
+    employees, total = await service.list_employees(**filters)
     return PaginatedResponse(
         data=[EmployeeResponse.model_validate(e) for e in employees],
         meta=PaginationMeta(
@@ -65,13 +104,39 @@ async def list_employees(
     "/{employee_id}",
     response_model=EmployeeResponse,
     summary="Get employee by ID",
-    responses={404: {"description": "Employee not found"}},
+    responses={304: {"description": "Not modified (If-None-Match)"}, 404: {"description": "Employee not found"}},
 )
 async def get_employee(
     employee_id: str,
+    response: Response,
+    if_none_match: str | None = Header(default=None),
+    service: EmployeeService = Depends(_get_service),
+):
+    if if_none_match:
+        etag = await service.get_employee_etag(employee_id)
+        if etag is not None and etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+    employee = await service.get_employee(employee_id)
+    set_validators(response, service.employee_etag(employee.id, employee.updated_at, employee.version))
+    return employee
+
+
+@router.get(
+    "/{employee_id}/calendar",
+    response_model=EmployeeCalendarResponse,
+    summary="Get an employee's attendance calendar for a year or month",
+    description="One character per day (see `days`) plus totals, read in one query on the "
+    "(employee_id, date) index. Replaces paging through /attendance?employee_id=.",
+    responses={404: {"description": "Employee not found"}},
+)
+async def get_employee_calendar(
+    employee_id: str,
+    year: int | None = Query(default=None, ge=2000, le=2100, description="Defaults to the current year"),
+    month: int | None = Query(default=None, ge=1, le=12, description="Only this month of the year"),
     service: EmployeeService = Depends(_get_service),
 ):
-    return await service.get_employee(employee_id)
+    return await service.get_calendar(employee_id, year or date.today().year, month)
 
 
 @router.put(
@@ -0,0 +1,162 @@
+"""Background job API endpoints — submit, poll, cancel, download."""
+
+from fastapi import APIRouter, Depends, Header, Request, Response
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import get_db
+from app.models.job import Job
+from app.schemas.common import ErrorResponse
+from app.schemas.job import AttendanceExportParams, JobResponse, MonthlyReportParams
+from app.services import monthly_report
+from app.services.exceptions import AppException
+from app.services.job_service import JobService
+from app.services.ndjson_ingest import NDJSON_MEDIA_TYPES
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+_QUEUED = {
+    202: {"description": "Queued — poll the Location"},
+}
+
+
+def _get_service(db: AsyncSession = Depends(get_db)) -> JobService:
+    return JobService(db)
+
+
+def _location(job_id: str) -> str:
+    return f"{settings.API_V1_PREFIX}/jobs/{job_id}"
+
+
+def _job_to_response(job: Job) -> JobResponse:
+    return JobResponse(
+        id=job.id,
+        kind=job.kind,
+        status=job.status,
+        params=job.params,
+        progress=job.progress,
+        result=job.result,
+        result_url=f"{_location(job.id)}/result" if job.status == "succeeded" and job.result_file else None,
+        error=ErrorResponse(**job.error) if job.error else None,
+        attempts=job.attempts,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+    )
+
+
+def _accepted(job: Job, response: Response) -> JobResponse:
+    response.headers["Location"] = _location(job.id)
+    return _job_to_response(job)
+
+
+@router.post(
+    "/attendance-import",
+    response_model=JobResponse,
+    status_code=202,
+    summary="Import attendance from an NDJSON file in the background",
+    description="Request body: application/x-ndjson, one attendance object per line (as POST "
+    "/attendance/bulk). The upload is saved and imported by a background worker; the result is "
+    "one NDJSON line per input line plus a summary, downloadable from result_url.",
+    responses={
+        **_QUEUED,
+        413: {"description": "Upload larger than JOB_IMPORT_MAX_BYTES"},
+        415: {"description": "Body is not NDJSON"},
+    },
+)
+async def submit_attendance_import(
+    request: Request,
+    response: Response,
+    content_type: str = Header(default=""),
+    service: JobService = Depends(_get_service),
+):
+    if content_type.split(";")[0].strip().lower() not in NDJSON_MEDIA_TYPES:
+        raise AppException(
+            error_code="UNSUPPORTED_MEDIA_TYPE",
+            message="Send attendance records as application/x-ndjson, one JSON object per line",
+            status_code=415,
+            details={"content_type": content_type},
+        )
+    job = await service.submit_import(request.stream())
+    return _accepted(job, response)
+
+
+@router.post(
+    "/attendance-export",
+    response_model=JobResponse,
+    status_code=202,
+    summary="Export attendance as CSV in the background",
+    description="Live and archived records in the range, filtered by department or employee, "
+    "ordered by date and employee code.",
+    responses=_QUEUED,
+)
+async def submit_attendance_export(
+    params: AttendanceExportParams,
+    response: Response,
+    service: JobService = Depends(_get_service),
+):
+    job = await service.submit("attendance_export", params.model_dump(mode="json"))
+    return _accepted(job, response)
+
+
+@router.post(
+    "/monthly-report",
+    response_model=JobResponse,
+    status_code=202,
+    summary="Build the monthly payroll attendance report in the background",
+    description="Per employee: PRESENT / HALF_DAY / ON_LEAVE / ABSENT days and worked hours for "
+    "one month, aggregated in parallel across the job process pool. Output as CSV, or as NumPy "
+    "columns (npz).",
+    responses={**_QUEUED, 503: {"description": "npz requested but numpy is not installed"}},
+)
+async def submit_monthly_report(
+    params: MonthlyReportParams,
+    response: Response,
+    service: JobService = Depends(_get_service),
+):
+    if not monthly_report.format_available(params.format):
+        raise AppException(
+            error_code="REPORT_FORMAT_UNAVAILABLE",
+            message=f"The {params.format} report format requires numpy, which is not installed",
+            status_code=503,
+        )
+    job = await service.submit("monthly_report", params.model_dump(mode="json"))
+    return _accepted(job, response)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobResponse,
+    summary="Get the state of a background job",
+    responses={404: {"description": "Unknown or expired job"}},
+)
+async def get_job(job_id: str, service: JobService = Depends(_get_service)):
+    return _job_to_response(await service.get_job(job_id))
+
+
+@router.get(
+    "/{job_id}/result",
+    response_class=FileResponse,
+    summary="Download the output of a succeeded job",
+    responses={
+        404: {"description": "Unknown job, or its result was purged"},
+        409: {"description": "The job has not succeeded"},
+    },
+)
+async def get_job_result(job_id: str, service: JobService = Depends(_get_service)):
+    path, media_type = await service.result_file(job_id)
+    return FileResponse(path, media_type=media_type, filename=path.name)
+
+
+@router.post(
+    "/{job_id}/cancel",
+    response_model=JobResponse,
+    summary="Cancel a queued or running job",
+    responses={
+        404: {"description": "Unknown job"},
+        409: {"description": "The job has already finished"},
+    },
+)
+async def cancel_job(job_id: str, service: JobService = Depends(_get_service)):
+    return _job_to_response(await service.cancel_job(job_id))
@@ -11,6 +11,9 @@ from app.schemas.attendance import (
     AttendanceResponse,
 )
 from app.schemas.dashboard import DashboardSummaryResponse
+from app.schemas.analytics import MissingAttendanceResponse
+from app.schemas.batch import BatchRequest, BatchResponse
+from app.schemas.changes import ChangeEntry, ChangeFeedResponse
 from app.schemas.common import ErrorResponse, PaginationMeta, PaginatedResponse
 
 __all__ = [
@@ -21,6 +24,11 @@ __all__ = [
     "AttendanceUpdate",
     "AttendanceResponse",
     "DashboardSummaryResponse",
+    "MissingAttendanceResponse",
+    "BatchRequest",
+    "BatchResponse",
+    "ChangeEntry",
+    "ChangeFeedResponse",
     "ErrorResponse",
     "PaginationMeta",
     "PaginatedResponse",
@@ -0,0 +1,111 @@
+"""Analytics response schemas."""
+
+from datetime import date, time
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from app.schemas.dashboard import DateRange
+
+
+class EmployeeAbsenteeism(BaseModel):
+    """Absence metrics for one employee over the requested range."""
+
+    employee_id: str
+    employee_code: str
+    employee_name: str
+    department: str
+    absent_days: int
+    absence_spells: int
+    bradford_factor: int
+    longest_present_streak: int
+    days_since_last_absence: int | None = None
+
+
+class AbsenteeismResponse(BaseModel):
+    """Per-employee absenteeism, highest Bradford factor first."""
+
+    date_range: DateRange
+    employees: list[EmployeeAbsenteeism]
+
+
+class WorkTimeGroup(BaseModel):
+    """Worked-time and punctuality aggregates for one employee or department."""
+
+    department: str
+    employee_id: str | None = None
+    employee_code: str | None = None
+    employee_name: str | None = None
+    employees: int
+    days_worked: int
+    total_worked_hours: float
+    average_worked_hours: float
+    late_arrivals: int
+    early_departures: int
+
+
+class WorkTimeResponse(BaseModel):
+    """Worked hours and punctuality per employee or per department."""
+
+    date_range: DateRange
+    group_by: Literal["employee", "department"]
+    start_time: time
+    end_time: time
+    groups: list[WorkTimeGroup]
+
+
+class EmployeeMissingAttendance(BaseModel):
+    """Working days without an attendance record for one employee."""
+
+    employee_id: str
+    employee_code: str
+    employee_name: str
+    department: str
+    expected_days: int
+    recorded_days: int
+    missing_days: int
+    missing_dates: list[date]
+
+
+class DepartmentMissingAttendance(BaseModel):
+    """Expected vs recorded working days, summed over a department."""
+
+    department: str
+    employees: int
+    expected_days: int
+    recorded_days: int
+    missing_days: int
+
+
+class MissingAttendanceResponse(BaseModel):
+    """Expected-vs-recorded attendance over the working days of a range.
+
+    ``employees`` lists those with missing days, most missing first, up to
+    the requested limit; ``departments`` always covers everyone in scope.
+    """
+
+    date_range: DateRange
+    working_days: int
+    total_missing: int
+    departments: list[DepartmentMissingAttendance]
+    employees: list[EmployeeMissingAttendance]
+
+
+class HeatmapResponse(BaseModel):
+    """Employee × day status matrix.
+
+    Rows are employees (``employee_ids`` order), columns are the days
+    date_from … date_to. Cell values are status codes: 0 no record,
+    1 PRESENT, 2 ABSENT, 3 HALF_DAY, 4 ON_LEAVE.
+    """
+
+    date_range: DateRange
+    days: int
+    employee_ids: list[str]
+    employee_codes: list[str]
+    employee_names: list[str]
+    encoding: Literal["base64", "rle"]
+    grid: str = Field(
+        description="base64: the row-major grid as one signed byte per cell. "
+        "rle: row-major runs as <count><symbol>, symbols . P A H L for codes 0–4, e.g. '3P1A2.'"
+    )
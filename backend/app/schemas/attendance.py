@@ -2,9 +2,12 @@
 
 from datetime import date, datetime, time
 from enum import Enum
+from typing import Literal
 
 from pydantic import BaseModel, Field, field_validator
 
+from app.schemas.common import ErrorResponse
+
 
 class AttendanceStatus(str, Enum):
     """Closed set of attendance status values (INV-6)."""
@@ -68,3 +71,90 @@ class AttendanceResponse(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class AttendanceUpsertBatch(BaseModel):
+    """Request schema for POST /attendance/upsert/batch."""
+
+    records: list[AttendanceCreate] = Field(..., min_length=1)
+
+
+class AttendanceUpsertResult(BaseModel):
+    """Outcome of one record of an upsert batch, in request order."""
+
+    index: int
+    employee_id: str
+    date: date
+    result: Literal["created", "updated", "error"]
+    id: str | None = None
+    error: ErrorResponse | None = None
+
+
+class AttendanceUpsertBatchResponse(BaseModel):
+    """Per-record outcomes; an invalid record does not fail the batch."""
+
+    created: int
+    updated: int
+    failed: int
+    results: list[AttendanceUpsertResult]
+
+
+class AttendanceIntakeStatus(BaseModel):
+    """State of a record submitted to POST /attendance/intake."""
+
+    tracking_id: str
+    status: Literal["queued", "created", "updated", "error"]
+    employee_id: str
+    date: date
+    attendance_id: str | None = None
+    error: ErrorResponse | None = None
+
+
+class AttendanceIngestLine(BaseModel):
+    """Outcome of one line of POST /attendance/bulk (one NDJSON response line)."""
+
+    line: int
+    result: Literal["created", "updated", "error"]
+    id: str | None = None
+    error: ErrorResponse | None = None
+
+
+class AttendanceIngestSummary(BaseModel):
+    """Totals sent as the last NDJSON response line, as ``{"summary": {...}}``.
+
+    ``complete`` is false when a write failed and the rest of the upload was not read.
+    """
+
+    lines: int
+    created: int
+    updated: int
+    failed: int
+    complete: bool
+
+
+class RosterAttendance(BaseModel):
+    """The roster entry's record for the day."""
+
+    id: str
+    status: AttendanceStatus
+    check_in: time | None = None
+    check_out: time | None = None
+    notes: str | None = None
+
+
+class RosterEntry(BaseModel):
+    """One active employee on GET /attendance/roster."""
+
+    employee_id: str
+    employee_code: str
+    employee_name: str
+    department: str
+    attendance: RosterAttendance | None = Field(description="null when nothing is recorded for the date")
+
+
+class RosterResponse(BaseModel):
+    """Response schema for GET /attendance/roster, ordered by employee_code."""
+
+    date: date
+    data: list[RosterEntry]
+    next_cursor: str | None = Field(description="Pass as ?cursor= for the next page; null on the last page")
@@ -0,0 +1,39 @@
+"""Batch request schemas — multiplex GET sub-requests in one round trip."""
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class BatchSubRequest(BaseModel):
+    """A single GET against an existing API route."""
+
+    id: str | None = Field(default=None, max_length=64, description="Client-chosen correlation id")
+    path: str = Field(
+        ...,
+        min_length=1,
+        max_length=2048,
+        description="Absolute API path including query string, e.g. /api/v1/dashboard/summary?date_from=2025-01-01",
+    )
+    headers: dict[str, str] = Field(default_factory=dict, description="Extra headers, e.g. If-None-Match")
+
+
+class BatchRequest(BaseModel):
+    """Request schema for POST /batch."""
+
+    requests: list[BatchSubRequest] = Field(..., min_length=1)
+
+
+class BatchSubResponse(BaseModel):
+    """Result of one sub-request, in the same position as its request."""
+
+    id: str | None = None
+    status: int
+    headers: dict[str, str]
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    """Response schema for POST /batch."""
+
+    responses: list[BatchSubResponse]
@@ -0,0 +1,29 @@
+"""Change feed response schemas."""
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from app.schemas.attendance import AttendanceResponse
+from app.schemas.employee import EmployeeResponse
+
+
+class ChangeEntry(BaseModel):
+    """A single upsert or delete, in feed order."""
+
+    entity: Literal["employee", "attendance"]
+    op: Literal["upsert", "delete"]
+    id: str
+    changed_at: datetime
+    data: EmployeeResponse | AttendanceResponse | None = Field(
+        default=None, description="Current row for upserts; null for deletes"
+    )
+
+
+class ChangeFeedResponse(BaseModel):
+    """Response schema for GET /changes."""
+
+    changes: list[ChangeEntry]
+    next_cursor: str | None = Field(description="Pass as ?since= on the next poll")
+    has_more: bool
@@ -39,3 +39,16 @@ class DashboardSummaryResponse(BaseModel):
     summary: StatusSummary
     attendance_rate: float
     department_breakdown: list[DepartmentBreakdown]
+
+
+class DailyStatusCounts(StatusSummary):
+    """Status counts for one calendar day."""
+
+    date: date
+
+
+class DashboardTrendResponse(BaseModel):
+    """Day-by-day attendance counts over a date range."""
+
+    date_range: DateRange
+    days: list[DailyStatusCounts]
@@ -69,3 +69,27 @@ class EmployeeResponse(BaseModel):
     updated_at: datetime
 
     model_config = {"from_attributes": True}
+
+
+class EmployeeCalendarTotals(BaseModel):
+    """Day counts behind an EmployeeCalendarResponse."""
+
+    present: int
+    absent: int
+    half_day: int
+    on_leave: int
+    missing: int = Field(description="Working days (employed, not in the future) without a record")
+
+
+class EmployeeCalendarResponse(BaseModel):
+    """One employee's attendance for a year or month, one character per day."""
+
+    employee_id: str
+    date_from: date
+    date_to: date
+    days: str = Field(
+        description="Character i is date_from + i days: P present, A absent, H half day, L on leave, "
+        "- working day without a record, _ non-working day without a record, "
+        ". before joining or in the future"
+    )
+    totals: EmployeeCalendarTotals
@@ -0,0 +1,50 @@
+"""Background job Pydantic schemas."""
+
+from datetime import date, datetime
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field, model_validator
+
+from app.schemas.common import ErrorResponse
+
+
+class AttendanceExportParams(BaseModel):
+    """Request schema for POST /jobs/attendance-export. All filters are optional."""
+
+    date_from: date | None = None
+    date_to: date | None = None
+    department: str | None = None
+    employee_id: str | None = None
+
+    @model_validator(mode="after")
+    def validate_range(self):
+        if self.date_from and self.date_to and self.date_from > self.date_to:
+            raise ValueError("date_from must be on or before date_to")
+        return self
+
+
+class MonthlyReportParams(BaseModel):
+    """Request schema for POST /jobs/monthly-report."""
+
+    year: int = Field(..., ge=2000, le=2100)
+    month: int = Field(..., ge=1, le=12)
+    department: str | None = None
+    include_inactive: bool = False
+    format: Literal["csv", "npz"] = Field(default="csv", description="csv, or npz: NumPy columns (needs numpy)")
+
+
+class JobResponse(BaseModel):
+    """State of a background job, as polled at GET /jobs/{id}."""
+
+    id: str
+    kind: str
+    status: Literal["queued", "running", "succeeded", "failed", "cancelled"]
+    params: dict[str, Any]
+    progress: int = Field(description="Units processed so far (lines or rows)")
+    result: dict[str, Any] | None = None
+    result_url: str | None = Field(default=None, description="Where to download the output once succeeded")
+    error: ErrorResponse | None = None
+    attempts: int
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
@@ -0,0 +1,88 @@
+"""Vectorized absenteeism metrics (needs NumPy).
+
+Input is one flat set of attendance records for many employees:
+(employee index, date ordinal, status code). All metrics are computed for
+every employee at once. The records are sorted once by (employee, day),
+then each metric is a boolean mask, a shift-by-one comparison and a
+``bincount`` / ``ufunc.at`` grouped by employee. There is no per-employee
+Python loop.
+
+Definitions (per employee, within the requested range):
+    absent_days              ABSENT records
+    spells                   runs of consecutive ABSENT records; "consecutive"
+                             means adjacent in the employee's own records, so a
+                             Friday + Monday absence with no weekend rows is one spell
+    bradford_factor          spells² × absent_days
+    longest_present_streak   longest run of consecutive PRESENT records
+    last_absence             ordinal of the latest ABSENT date, -1 if none
+
+HALF_DAY and ON_LEAVE records are not absences. Both end a present streak
+and separate two absence spells.
+"""
+
+from dataclasses import dataclass
+
+from app.models.types import STATUS_CODES
+
+try:  # Optional dependency — absenteeism analytics are only available when installed
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+
+_PRESENT = STATUS_CODES["PRESENT"]
+_ABSENT = STATUS_CODES["ABSENT"]
+
+
+def available() -> bool:
+    return np is not None
+
+
+@dataclass
+class AbsenteeismMetrics:
+    """One array per metric, indexed by employee."""
+
+    absent_days: "np.ndarray"
+    spells: "np.ndarray"
+    bradford_factor: "np.ndarray"
+    longest_present_streak: "np.ndarray"
+    last_absence: "np.ndarray"
+
+
+def _run_starts(flag, new_employee):
+    """Positions where a run of ``flag`` begins (previous record differs or is another employee's)."""
+    previous = np.empty_like(flag)
+    previous[:1] = False
+    previous[1:] = flag[:-1]
+    return flag & (new_employee | ~previous)
+
+
+def compute(employee, day, status, employees: int) -> AbsenteeismMetrics:
+    """Metrics for ``employees`` employees from parallel record arrays (any order)."""
+    order = np.lexsort((day, employee))
+    employee, day, status = employee[order], day[order], status[order]
+
+    new_employee = np.ones(len(employee), dtype=bool)
+    new_employee[1:] = employee[1:] != employee[:-1]
+
+    absent = status == _ABSENT
+    absent_days = np.bincount(employee[absent], minlength=employees)
+    spells = np.bincount(employee[_run_starts(absent, new_employee)], minlength=employees)
+
+    # Present runs: number each run, measure it, keep each employee's longest
+    present = status == _PRESENT
+    starts = _run_starts(present, new_employee)
+    run_id = np.cumsum(starts) - 1
+    run_length = np.bincount(run_id[present], minlength=int(starts.sum()))
+    longest = np.zeros(employees, dtype=np.int64)
+    np.maximum.at(longest, employee[starts], run_length)
+
+    last_absence = np.full(employees, -1, dtype=np.int64)
+    np.maximum.at(last_absence, employee[absent], day[absent])
+
+    return AbsenteeismMetrics(
+        absent_days=absent_days,
+        spells=spells,
+        bradford_factor=spells.astype(np.int64) ** 2 * absent_days,
+        longest_present_streak=longest,
+        last_absence=last_absence,
+    )
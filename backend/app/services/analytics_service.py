@@ -0,0 +1,471 @@
+"""Analytics service — absenteeism, worked hours, punctuality, missing attendance and heatmaps."""
+
+import base64
+import logging
+from collections import OrderedDict
+from datetime import date, time
+from itertools import groupby
+from typing import Literal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.types import STATUS_NAMES
+from app.repositories.analytics_repo import AnalyticsRepository
+from app.repositories.dashboard_repo import DashboardRepository
+from app.repositories.department_repo import DepartmentRepository
+from app.schemas.analytics import (
+    AbsenteeismResponse,
+    DepartmentMissingAttendance,
+    EmployeeAbsenteeism,
+    EmployeeMissingAttendance,
+    HeatmapResponse,
+    MissingAttendanceResponse,
+    WorkTimeGroup,
+    WorkTimeResponse,
+)
+from app.schemas.dashboard import DateRange
+from app.services import absenteeism
+from app.services.etag import weak_etag
+from app.services.exceptions import AppException, ValidationException
+from app.services.single_flight import get_group, make_key
+from app.services.work_calendar import working_days
+
+logger = logging.getLogger(__name__)
+
+# {etag: response} — the ETag already encodes the range, filters and data
+# version, so an entry is valid for exactly as long as its tag is current.
+# Superseded entries simply age out of the LRU.
+_cache: OrderedDict[str, AbsenteeismResponse] = OrderedDict()
+_cache_stats = {"hits": 0, "misses": 0}
+
+# Heatmap run-length symbols by status code (0 = no record)
+_RLE_SYMBOLS = "." + "".join(
+    {"PRESENT": "P", "ABSENT": "A", "HALF_DAY": "H", "ON_LEAVE": "L"}[STATUS_NAMES[code]]
+    for code in sorted(STATUS_NAMES)
+)
+
+
+def analytics_cache_stats() -> dict[str, int]:
+    return {**_cache_stats, "entries": len(_cache)}
+
+
+def clear_analytics_cache() -> None:
+    _cache.clear()
+
+
+class AnalyticsService:
+    """Analytics business logic.
+
+    Absenteeism: data is fetched with one narrow query. Metrics are computed
+    for all employees at once with NumPy (app/services/absenteeism.py).
+    Results are cached per (range, department, include_inactive) until the
+    data changes.
+
+    Work time: aggregated entirely in SQL (AnalyticsRepository.work_time).
+
+    Missing attendance: working days (app/services/work_calendar.py) from
+    date_of_joining on, minus recorded days, as an anti-join in SQL.
+
+    Heatmap: one narrow status read packed into an employee × day byte grid.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.repo = AnalyticsRepository(db)
+        self.dashboard_repo = DashboardRepository(db)
+        self.departments = DepartmentRepository(db)
+
+    @staticmethod
+    def _analytics_range(date_from: date | None, date_to: date | None) -> tuple[date, date]:
+        """Default to the rolling year ending today; reject inverted or over-long ranges."""
+        if date_to is None:
+            date_to = date.today()
+        if date_from is None:
+            date_from = date.fromordinal(date_to.toordinal() - 364)
+        days = (date_to - date_from).days + 1
+        if days < 1 or days > settings.ANALYTICS_MAX_DAYS:
+            raise ValidationException(
+                error_code="INVALID_DATE_RANGE",
+                message=f"date_from must be on or before date_to, spanning at most "
+                f"{settings.ANALYTICS_MAX_DAYS} days",
+                details={"date_from": str(date_from), "date_to": str(date_to)},
+            )
+        return date_from, date_to
+
+    async def _department_filter(self, department: str | None) -> tuple[bool, int | None]:
+        """(known, id) — an unknown department name matches nothing."""
+        if not department:
+            return True, None
+        department_id = await self.departments.resolve_id(department)
+        return department_id is not None, department_id
+
+    async def get_absenteeism_etag(
+        self,
+        *,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        department: str | None = None,
+        include_inactive: bool = False,
+    ) -> str:
+        date_from, date_to = self._analytics_range(date_from, date_to)
+        marker = await self.dashboard_repo.get_change_marker()
+        return weak_etag(
+            "analytics-absenteeism",
+            *marker,
+            date_from,
+            date_to,
+            department,
+            include_inactive,
+        )
+
+    async def get_absenteeism(
+        self,
+        *,
+        etag: str,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        department: str | None = None,
+        include_inactive: bool = False,
+    ) -> AbsenteeismResponse:
+        """Absenteeism for the range; ``etag`` (from get_absenteeism_etag) keys the cache."""
+        date_from, date_to = self._analytics_range(date_from, date_to)
+        cached = _cache.get(etag)
+        if cached is not None:
+            _cache.move_to_end(etag)
+            _cache_stats["hits"] += 1
+            return cached
+
+        # Concurrent misses for the same version share one computation
+        response = await get_group("analytics.absenteeism").do(
+            etag,
+            lambda: self._compute_absenteeism(date_from, date_to, department, include_inactive),
+        )
+        _cache_stats["misses"] += 1
+        _cache[etag] = response
+        while len(_cache) > settings.ANALYTICS_CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+        return response
+
+    async def _compute_absenteeism(
+        self, date_from: date, date_to: date, department: str | None, include_inactive: bool
+    ) -> AbsenteeismResponse:
+        if not absenteeism.available():
+            raise AppException(
+                error_code="ANALYTICS_UNAVAILABLE",
+                message="Absenteeism analytics require numpy, which is not installed",
+                status_code=503,
+            )
+        np = absenteeism.np
+        response = AbsenteeismResponse(date_range=DateRange(date_from=date_from, date_to=date_to), employees=[])
+
+        known, department_id = await self._department_filter(department)
+        if not known:
+            return response
+
+        filters = dict(department_id=department_id, include_inactive=include_inactive)
+        employees = await self.repo.employees(**filters)
+        records = await self.repo.attendance_statuses(date_from=date_from, date_to=date_to, **filters)
+
+        index = {row.id: i for i, row in enumerate(employees)}
+        n = len(records)
+        employee = np.fromiter((index.get(row[0], -1) for row in records), np.int64, n)
+        day = np.fromiter((row[1].toordinal() for row in records), np.int64, n)
+        status = np.fromiter((row[2] for row in records), np.int8, n)
+        # An employee created between the two reads has records but no dimension row
+        known = employee >= 0
+        metrics = absenteeism.compute(employee[known], day[known], status[known], len(employees))
+
+        names = await self.departments.names_by_id({row.department_id for row in employees})
+        as_of = date_to.toordinal()
+        response.employees = [
+            EmployeeAbsenteeism(
+                employee_id=row.id,
+                employee_code=row.employee_code,
+                employee_name=row.name,
+                department=names[row.department_id],
+                absent_days=absent_days,
+                absence_spells=spells,
+                bradford_factor=bradford,
+                longest_present_streak=streak,
+                days_since_last_absence=as_of - last if last >= 0 else None,
+            )
+            for row, absent_days, spells, bradford, streak, last in zip(
+                employees,
+                metrics.absent_days.tolist(),
+                metrics.spells.tolist(),
+                metrics.bradford_factor.tolist(),
+                metrics.longest_present_streak.tolist(),
+                metrics.last_absence.tolist(),
+            )
+        ]
+        response.employees.sort(key=lambda e: (-e.bradford_factor, -e.absent_days, e.employee_code))
+        return response
+
+    async def get_work_time_etag(
+        self,
+        *,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        group_by: Literal["employee", "department"] = "employee",
+        start_time: time | None = None,
+        end_time: time | None = None,
+        department: str | None = None,
+        include_inactive: bool = False,
+    ) -> str:
+        date_from, date_to = self._analytics_range(date_from, date_to)
+        marker = await self.dashboard_repo.get_change_marker()
+        return weak_etag(
+            "analytics-work-time",
+            *marker,
+            date_from,
+            date_to,
+            group_by,
+            start_time or settings.WORKDAY_START,
+            end_time or settings.WORKDAY_END,
+            department,
+            include_inactive,
+        )
+
+    async def get_work_time(
+        self,
+        *,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        group_by: Literal["employee", "department"] = "employee",
+        start_time: time | None = None,
+        end_time: time | None = None,
+        department: str | None = None,
+        include_inactive: bool = False,
+    ) -> WorkTimeResponse:
+        """Total / average worked hours, late arrivals and early departures."""
+        date_from, date_to = self._analytics_range(date_from, date_to)
+        start_time = start_time or settings.WORKDAY_START
+        end_time = end_time or settings.WORKDAY_END
+        response = WorkTimeResponse(
+            date_range=DateRange(date_from=date_from, date_to=date_to),
+            group_by=group_by,
+            start_time=start_time,
+            end_time=end_time,
+            groups=[],
+        )
+        known, department_id = await self._department_filter(department)
+        if not known:
+            return response
+
+        params = dict(
+            date_from=date_from,
+            date_to=date_to,
+            late_after=start_time,
+            leave_before=end_time,
+            by_department=group_by == "department",
+            department_id=department_id,
+            include_inactive=include_inactive,
+        )
+        rows = await get_group("analytics.work_time").do(
+            make_key(**params), lambda: self.repo.work_time(**params)
+        )
+
+        names = await self.departments.names_by_id({row.department_id for row in rows})
+        for row in rows:
+            worked_seconds = int(row.worked_seconds)
+            group = WorkTimeGroup(
+                department=names[row.department_id],
+                employees=row.employees,
+                days_worked=row.days_worked,
+                total_worked_hours=round(worked_seconds / 3600, 2),
+                average_worked_hours=round(worked_seconds / 3600 / row.days_worked, 2) if row.days_worked else 0.0,
+                late_arrivals=row.late_arrivals,
+                early_departures=row.early_departures,
+            )
+            if group_by == "employee":
+                group.employee_id = row.id
+                group.employee_code = row.employee_code
+                group.employee_name = row.name
+            response.groups.append(group)
+        response.groups.sort(key=lambda g: (g.department, g.employee_code or ""))
+        return response
+
+    @staticmethod
+    def _heatmap_range(date_from: date | None, date_to: date | None) -> tuple[date, date]:
+        """Default to the month to date; at most HEATMAP_MAX_DAYS."""
+        if date_to is None:
+            date_to = date.today()
+        if date_from is None:
+            date_from = date_to.replace(day=1)
+        days = (date_to - date_from).days + 1
+        if days < 1 or days > settings.HEATMAP_MAX_DAYS:
+            raise ValidationException(
+                error_code="INVALID_DATE_RANGE",
+                message=f"date_from must be on or before date_to, spanning at most "
+                f"{settings.HEATMAP_MAX_DAYS} days",
+                details={"date_from": str(date_from), "date_to": str(date_to)},
+            )
+        return date_from, date_to
+
+    async def get_heatmap_etag(
+        self,
+        *,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        department: str | None = None,
+        include_inactive: bool = False,
+        encoding: Literal["base64", "rle"] = "base64",
+    ) -> str:
+        date_from, date_to = self._heatmap_range(date_from, date_to)
+        marker = await self.dashboard_repo.get_change_marker()
+        return weak_etag(
+            "analytics-heatmap",
+            *marker,
+            date_from,
+            date_to,
+            department,
+            include_inactive,
+            encoding,
+        )
+
+    async def get_heatmap(
+        self,
+        *,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        department: str | None = None,
+        include_inactive: bool = False,
+        encoding: Literal["base64", "rle"] = "base64",
+    ) -> HeatmapResponse:
+        """Employee × day grid of status codes, employees ordered by employee_code.
+
+        The cells come from one (employee_id, date, status code) read on the
+        (date, employee_id, status) covering index; the grid is a flat
+        bytearray, so nothing per cell is built as an object.
+        """
+        date_from, date_to = self._heatmap_range(date_from, date_to)
+        days = (date_to - date_from).days + 1
+        response = HeatmapResponse(
+            date_range=DateRange(date_from=date_from, date_to=date_to),
+            days=days,
+            employee_ids=[],
+            employee_codes=[],
+            employee_names=[],
+            encoding=encoding,
+            grid="",
+        )
+        known, department_id = await self._department_filter(department)
+        if not known:
+            return response
+
+        filters = dict(department_id=department_id, include_inactive=include_inactive)
+        employees = sorted(await self.repo.employees(**filters), key=lambda row: row.employee_code)
+        records = await self.repo.attendance_statuses(date_from=date_from, date_to=date_to, **filters)
+
+        row_start = {row.id: i * days for i, row in enumerate(employees)}
+        first = date_from.toordinal()
+        grid = bytearray(len(employees) * days)
+        for employee_id, day, status in records:
+            start = row_start.get(employee_id)
+            # An employee created between the two reads has records but no row
+            if start is not None:
+                grid[start + day.toordinal() - first] = status
+
+        response.employee_ids = [row.id for row in employees]
+        response.employee_codes = [row.employee_code for row in employees]
+        response.employee_names = [row.name for row in employees]
+        if encoding == "rle":
+            response.grid = "".join(f"{len(list(run))}{_RLE_SYMBOLS[code]}" for code, run in groupby(grid))
+        else:
+            response.grid = base64.b64encode(grid).decode("ascii")
+        return response
+
+    async def get_missing_attendance_etag(
+        self,
+        *,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        department: str | None = None,
+        include_inactive: bool = False,
+        limit: int = 100,
+    ) -> str:
+        date_from, date_to = self._analytics_range(date_from, date_to)
+        marker = await self.dashboard_repo.get_change_marker()
+        return weak_etag(
+            "analytics-missing-attendance",
+            *marker,
+            date_from,
+            date_to,
+            # "today" bounds the expected days
+            min(date_to, date.today()),
+            department,
+            include_inactive,
+            limit,
+        )
+
+    async def get_missing_attendance(
+        self,
+        *,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        department: str | None = None,
+        include_inactive: bool = False,
+        limit: int = 100,
+    ) -> MissingAttendanceResponse:
+        """Working days with no attendance record, per employee and per department.
+
+        Only days up to today are expected, and only from each employee's
+        date_of_joining.
+        """
+        date_from, date_to = self._analytics_range(date_from, date_to)
+        until = min(date_to, date.today())
+        days = working_days(date_from, until)
+        response = MissingAttendanceResponse(
+            date_range=DateRange(date_from=date_from, date_to=date_to),
+            working_days=len(days),
+            total_missing=0,
+            departments=[],
+            employees=[],
+        )
+        known, department_id = await self._department_filter(department)
+        if not known or not days:
+            return response
+
+        rows = await self.repo.missing_attendance_counts(
+            date_from=date_from, date_to=until, department_id=department_id, include_inactive=include_inactive
+        )
+        names = await self.departments.names_by_id({row.department_id for row in rows})
+
+        # Department roll-up over the per-employee counts (one row per employee)
+        departments: dict[int, DepartmentMissingAttendance] = {}
+        for row in rows:
+            totals = departments.get(row.department_id)
+            if totals is None:
+                totals = departments[row.department_id] = DepartmentMissingAttendance(
+                    department=names[row.department_id],
+                    employees=0, expected_days=0, recorded_days=0, missing_days=0,
+                )
+            totals.employees += 1
+            totals.expected_days += row.expected
+            totals.recorded_days += row.expected - row.missing
+            totals.missing_days += row.missing
+        response.departments = sorted(departments.values(), key=lambda d: d.department)
+        response.total_missing = sum(d.missing_days for d in response.departments)
+
+        worst = sorted((row for row in rows if row.missing), key=lambda r: (-r.missing, r.employee_code))[:limit]
+        if not worst:
+            return response
+        dates: dict[str, list[date]] = {row.id: [] for row in worst}
+        for employee_id, day in await self.repo.missing_attendance_dates(
+            date_from=date_from, date_to=until, employee_ids=list(dates)
+        ):
+            dates[employee_id].append(day)
+        response.employees = [
+            EmployeeMissingAttendance(
+                employee_id=row.id,
+                employee_code=row.employee_code,
+                employee_name=row.name,
+                department=names[row.department_id],
+                expected_days=row.expected,
+                recorded_days=row.expected - row.missing,
+                missing_days=row.missing,
+                missing_dates=dates[row.id],
+            )
+            for row in worst
+        ]
+        return response
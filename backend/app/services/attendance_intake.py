@@ -0,0 +1,222 @@
+"""Write-behind attendance intake — absorbs the morning check-in burst.
+
+``POST /attendance/intake`` validates the payload, puts the record on a
+bounded in-process queue and answers 202 with a tracking id. A single
+background writer drains the queue in batches: it flushes once
+ATTENDANCE_INTAKE_BATCH_SIZE records are waiting, or ATTENDANCE_INTAKE_FLUSH_MS
+after the first of them arrived. Each batch is one transaction with one
+multi-row upsert (AttendanceService.upsert_attendance_batch). A burst of
+check-ins therefore holds one pooled connection, not one per request.
+
+Backpressure:
+    - queue full → 429 INTAKE_QUEUE_FULL with Retry-After
+    - intake disabled, not started or shutting down → 503 INTAKE_UNAVAILABLE
+
+Results are polled at ``GET /attendance/intake/{tracking_id}``.
+
+Note: the queue and the results are in-process. Shutdown drains the queue,
+but a crash loses queued records. Clients still holding a ``queued`` id may
+resubmit safely, because the write is an upsert. Poll on the instance that
+accepted the record (same caveat as the idempotency store).
+"""
+
+import asyncio
+import logging
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.database import async_session_factory
+from app.models.types import new_id
+from app.schemas.attendance import AttendanceCreate, AttendanceIntakeStatus
+from app.schemas.common import ErrorResponse
+from app.services.attendance_service import AttendanceService
+from app.services.exceptions import AppException, NotFoundException, ValidationException
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Queued:
+    tracking_id: str
+    record: AttendanceCreate
+
+
+class AttendanceIntake:
+    """Bounded queue + batching writer + LRU of results."""
+
+    def __init__(
+        self,
+        max_queue: int | None = None,
+        batch_size: int | None = None,
+        flush_ms: int | None = None,
+        max_results: int | None = None,
+    ):
+        self.max_queue = max_queue or settings.ATTENDANCE_INTAKE_QUEUE_SIZE
+        self.batch_size = min(
+            batch_size or settings.ATTENDANCE_INTAKE_BATCH_SIZE, settings.ATTENDANCE_UPSERT_MAX_BATCH
+        )
+        self.flush_seconds = (flush_ms or settings.ATTENDANCE_INTAKE_FLUSH_MS) / 1000
+        self.max_results = max_results or settings.ATTENDANCE_INTAKE_MAX_RESULTS
+        self._queue: asyncio.Queue[_Queued] | None = None
+        self._batch_ready = asyncio.Event()
+        self._results: OrderedDict[str, AttendanceIntakeStatus] = OrderedDict()
+        self._session_factory: async_sessionmaker[AsyncSession] | None = None
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+        self.accepted = 0
+        self.rejected = 0
+        self.batches = 0
+        self.written = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done() and not self._stopping
+
+    def start(self, session_factory: async_sessionmaker[AsyncSession] = async_session_factory) -> None:
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue(self.max_queue)
+        self._batch_ready = asyncio.Event()
+        self._session_factory = session_factory
+        self._stopping = False
+        self._task = asyncio.create_task(self._writer(), name="attendance-intake")
+        logger.info(
+            "Attendance intake started (queue %d, batch %d, flush %.0f ms)",
+            self.max_queue, self.batch_size, self.flush_seconds * 1000,
+        )
+
+    async def stop(self) -> None:
+        """Stop accepting records, write everything already queued, then stop the writer."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._batch_ready.set()
+        if not self._task.done():
+            await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def submit(self, record: AttendanceCreate) -> AttendanceIntakeStatus:
+        """Queue one record; raises 422 / 429 / 503 instead of waiting."""
+        if not self.running:
+            raise AppException(
+                error_code="INTAKE_UNAVAILABLE",
+                message="Asynchronous attendance intake is not available; use POST /attendance",
+                status_code=503,
+            )
+        # INV-5 needs no database; everything else is checked by the writer
+        if record.date > date.today():
+            raise ValidationException(
+                error_code="FUTURE_DATE",
+                message="Attendance date cannot be in the future",
+                details={"date": str(record.date), "today": str(date.today())},
+            )
+
+        status = AttendanceIntakeStatus(
+            tracking_id=new_id(), status="queued", employee_id=record.employee_id, date=record.date
+        )
+        try:
+            self._queue.put_nowait(_Queued(status.tracking_id, record))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            retry_after = max(1, math.ceil(self.flush_seconds))
+            raise AppException(
+                error_code="INTAKE_QUEUE_FULL",
+                message="Attendance intake queue is full. Please retry shortly.",
+                status_code=429,
+                details={"retry_after_seconds": retry_after},
+                headers={"Retry-After": str(retry_after)},
+            )
+        self.accepted += 1
+        self._remember(status)
+        if self._queue.qsize() >= self.batch_size:
+            self._batch_ready.set()
+        return status
+
+    def status(self, tracking_id: str) -> AttendanceIntakeStatus:
+        status = self._results.get(tracking_id)
+        if status is None:
+            raise NotFoundException(
+                error_code="INTAKE_NOT_FOUND",
+                message="Unknown or expired intake tracking id",
+                details={"tracking_id": tracking_id},
+            )
+        return status
+
+    def _remember(self, status: AttendanceIntakeStatus) -> None:
+        self._results[status.tracking_id] = status
+        self._results.move_to_end(status.tracking_id)
+        while len(self._results) > self.max_results:
+            self._results.popitem(last=False)
+
+    async def _writer(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            # Wait for the batch to fill, but no longer than the flush interval
+            # (Event.wait is safe to time out, unlike a timed Queue.get)
+            if self._queue.qsize() < self.batch_size - 1 and not self._stopping:
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), self.flush_seconds)
+                except asyncio.TimeoutError:
+                    pass
+            if not self._stopping:
+                self._batch_ready.clear()
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: list[_Queued]) -> None:
+        self.batches += 1
+        try:
+            async with self._session_factory() as session:
+                response = await AttendanceService(session).upsert_attendance_batch([q.record for q in batch])
+                await session.commit()
+        except Exception:
+            logger.exception("Attendance intake batch of %d failed", len(batch))
+            self.failed += len(batch)
+            error = ErrorResponse(
+                error_code="INTAKE_WRITE_FAILED",
+                message="The record could not be written; resubmit it",
+            )
+            for queued in batch:
+                self._set(queued.tracking_id, status="error", error=error)
+            return
+
+        for queued, result in zip(batch, response.results):
+            self._set(queued.tracking_id, status=result.result, attendance_id=result.id, error=result.error)
+        self.written += response.created + response.updated
+        self.failed += response.failed
+
+    def _set(self, tracking_id: str, **changes) -> None:
+        # The entry may have aged out of the LRU while queued
+        status = self._results.get(tracking_id)
+        if status is not None:
+            for field, value in changes.items():
+                setattr(status, field, value)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "batches": self.batches,
+            "written": self.written,
+            "failed": self.failed,
+        }
+
+
+attendance_intake = AttendanceIntake()
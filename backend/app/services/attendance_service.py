@@ -1,43 +1,80 @@
 """Attendance service — business logic with invariant enforcement."""
 
+import base64
 import logging
-from datetime import date, datetime, timezone
+from datetime import date
 
+from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncSessionsddssd
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.models.attendance import Attendance
+from app.repositories.archive_repo import ArchiveRepository
 from app.repositories.attendance_repo import AttendanceRepository
+from app.repositories.department_repo import DepartmentRepository
 from app.repositories.employee_repo import EmployeeRepository
-from app.schemas.attendance import AttendanceCreate, AttendanceUpdate
+from app.schemas.attendance import (
+    AttendanceCreate,
+    AttendanceUpdate,
+    AttendanceUpsertBatchResponse,
+    AttendanceUpsertResult,
+    RosterAttendance,
+    RosterEntry,
+    RosterResponse,
+)
+from app.schemas.common import ErrorResponse
+from app.services.etag import weak_etag
 from app.services.exceptions import (
+    AppException,
     ConflictException,
     NotFoundException,
     ValidationException,
 )
+from app.services.single_flight import get_group, make_key
 
 logger = logging.getLogger(__name__)
 
 
+def _encode_roster_cursor(employee_code: str) -> str:
+    """Opaque, URL-safe roster cursor: the last employee_code of the page."""
+    return base64.urlsafe_b64encode(employee_code.encode()).decode().rstrip("=")
+
+
+def _decode_roster_cursor(value: str) -> str:
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        return base64.b64decode(padded, altchars=b"-_", validate=True).decode()
+    except (ValueError, UnicodeDecodeError):
+        raise ValidationException(
+            error_code="INVALID_CURSOR",
+            message="The roster cursor is malformed",
+            details={"cursor": value},
+        )
+
+
 class AttendanceService:
     """Attendance business logic.
 
     Enforces:
         - INV-5:  Attendance date cannot be in the future
         - INV-10: Attendance date must be ≥ employee.date_of_joining
+        - Archived months are read-only (keeps archived dates < live dates)
         - Pre-validates employee existence (friendly 404 over raw FK error)
     """
 
     def __init__(self, db: AsyncSession):
         self.attendance_repo = AttendanceRepository(db)
         self.employee_repo = EmployeeRepository(db)
+        self.archive_repo = ArchiveRepository(db)
+        self.department_repo = DepartmentRepository(db)
         self.db = db
 
     async def mark_attendance(self, data: AttendanceCreate) -> Attendance:
         """Create an attendance record.
 
         Validates all invariants before INSERT.
-        Rejects duplicates with 409 (not upsert).
+        Rejects duplicates with 409 (see upsert_attendance for merging).
         """
         # Pre-validate employee existence — friendly 404
         employee = await self.employee_repo.get_by_id(data.employee_id)
@@ -48,24 +85,9 @@ class AttendanceService:
                 details={"employee_id": data.employee_id},
             )
 
-        # INV-5: No future dates
-        if data.date > date.today():
-            raise ValidationException(
-                error_code="FUTURE_DATE",
-                message="Attendance date cannot be in the future",
-                details={"date": str(data.date), "today": str(date.today())},
-            )
-
-        # INV-10: Date must be ≥ date_of_joining
-        if data.date < employee.date_of_joining:
-            raise ValidationException(
-                error_code="ATTENDANCE_BEFORE_JOINING",
-                message="Attendance date cannot be before employee's joining date",
-                details={
-                    "date": str(data.date),
-                    "date_of_joining": str(employee.date_of_joining),
-                },
-            )
+        self._check_date(
+            data.date, employee.date_of_joining, await self.archive_repo.closed_through(for_write=True)
+        )
 
         attendance = Attendance(
             employee_id=data.employee_id,
@@ -89,6 +111,132 @@ class AttendanceService:
                 },
             )
 
+    @staticmethod
+    def _check_date(day: date, date_of_joining: date, closed_through: date | None) -> None:
+        """Raise if a record may not be written on ``day`` (INV-5, INV-10, archived months)."""
+        # INV-5: No future dates
+        if day > date.today():
+            raise ValidationException(
+                error_code="FUTURE_DATE",
+                message="Attendance date cannot be in the future",
+                details={"date": str(day), "today": str(date.today())},
+            )
+
+        # INV-10: Date must be ≥ date_of_joining
+        if day < date_of_joining:
+            raise ValidationException(
+                error_code="ATTENDANCE_BEFORE_JOINING",
+                message="Attendance date cannot be before employee's joining date",
+                details={
+                    "date": str(day),
+                    "date_of_joining": str(date_of_joining),
+                },
+            )
+
+        AttendanceService._check_open(day, closed_through)
+
+    @staticmethod
+    def _check_open(day: date, closed_through: date | None) -> None:
+        """Raise if ``day`` is closed by the archive horizon."""
+        # Archived months are closed — the list/dashboard readers rely on it
+        if closed_through is not None and day <= closed_through:
+            raise ValidationException(
+                error_code="ATTENDANCE_ARCHIVED",
+                message="Attendance for archived dates cannot be changed",
+                details={"date": str(day), "archived_through": str(closed_through)},
+            )
+
+    async def upsert_attendance(self, data: AttendanceCreate) -> tuple[Attendance, bool]:
+        """Create a record, or merge into the one already on (employee_id, date).
+
+        Same validation as mark_attendance, but a duplicate is merged per
+        ATTENDANCE_UPSERT_RULES instead of rejected. Returns (record, created).
+        """
+        [outcome] = await self._upsert([data])
+        if isinstance(outcome, AppException):
+            raise outcome
+        attendance_id, created = outcome
+        return await self.get_attendance(attendance_id), created
+
+    async def upsert_attendance_batch(self, records: list[AttendanceCreate]) -> AttendanceUpsertBatchResponse:
+        """Upsert many records in one statement; invalid records are reported, not fatal."""
+        if len(records) > settings.ATTENDANCE_UPSERT_MAX_BATCH:
+            raise ValidationException(
+                error_code="BATCH_TOO_LARGE",
+                message=f"A batch may contain at most {settings.ATTENDANCE_UPSERT_MAX_BATCH} records",
+                details={"received": len(records)},
+            )
+        response = AttendanceUpsertBatchResponse(created=0, updated=0, failed=0, results=[])
+        for index, (record, outcome) in enumerate(zip(records, await self._upsert(records))):
+            result = AttendanceUpsertResult(index=index, employee_id=record.employee_id, date=record.date, result="error")
+            if isinstance(outcome, AppException):
+                result.error = ErrorResponse(error_code=outcome.error_code, message=outcome.message, details=outcome.details)
+                response.failed += 1
+            else:
+                result.id, created = outcome
+                result.result = "created" if created else "updated"
+                if created:
+                    response.created += 1
+                else:
+                    response.updated += 1
+            response.results.append(result)
+        return response
+
+    async def _upsert(self, records: list[AttendanceCreate]) -> list[tuple[str, bool] | AppException]:
+        """(id, created) or the validation error for each record, in order.
+
+        Validation needs one employee lookup for the whole batch; the writes
+        are a single INSERT ... ON DUPLICATE KEY UPDATE / ON CONFLICT
+        (AttendanceRepository.upsert_many) bracketed by two key lookups that
+        tell created from updated and return the ids.
+        """
+        joining_dates = await self.employee_repo.joining_dates({r.employee_id for r in records})
+        closed_through = await self.archive_repo.closed_through(for_write=True)
+        outcomes: list[tuple[str, bool] | AppException | None] = []
+        valid: list[AttendanceCreate] = []
+        for record in records:
+            try:
+                if record.employee_id not in joining_dates:
+                    raise NotFoundException(
+                        error_code="EMPLOYEE_NOT_FOUND",
+                        message="Employee not found",
+                        details={"employee_id": record.employee_id},
+                    )
+                self._check_date(record.date, joining_dates[record.employee_id], closed_through)
+            except AppException as exc:
+                outcomes.append(exc)
+            else:
+                outcomes.append(None)
+                valid.append(record)
+        if not valid:
+            return outcomes
+
+        key_sets = ({r.employee_id for r in valid}, {r.date for r in valid})
+        seen = set(await self.attendance_repo.keys_to_ids(*key_sets))
+        await self.attendance_repo.upsert_many(
+            [
+                dict(
+                    employee_id=r.employee_id,
+                    date=r.date,
+                    status=r.status.value,
+                    check_in=r.check_in,
+                    check_out=r.check_out,
+                    notes=r.notes,
+                )
+                for r in valid
+            ],
+            settings.ATTENDANCE_UPSERT_RULES,
+        )
+        ids = await self.attendance_repo.keys_to_ids(*key_sets)
+
+        for i, (record, outcome) in enumerate(zip(records, outcomes)):
+            if outcome is None:
+                key = (record.employee_id, record.date)
+                # A key repeated within the batch is created once, then updated
+                outcomes[i] = (ids[key], key not in seen)
+                seen.add(key)
+        return outcomes
+
     async def get_attendance(self, attendance_id: str) -> Attendance:
         """Fetch attendance by ID with employee data, or raise 404."""
         attendance = await self.attendance_repo.get_by_id(attendance_id)
@@ -100,21 +248,53 @@ class AttendanceService:
             )
         return attendance
 
+    async def get_attendance_etag(self, attendance_id: str) -> str | None:
+        """Weak ETag for one record, or None if it does not exist."""
+        version = await self.attendance_repo.get_version(attendance_id)
+        if version is None:
+            return None
+        return weak_etag("attendance", attendance_id, *version)
+
+    @staticmethod
+    def attendance_etag(attendance: Attendance) -> str:
+        """Detail ETag from id + updated_at + version (plus the embedded employee's)."""
+        employee = attendance.employee
+        return weak_etag(
+            "attendance",
+            attendance.id,
+            attendance.updated_at,
+            attendance.version,
+            employee.updated_at if employee else None,
+            employee.version if employee else None,
+        )
+
+    async def list_etag(self, **filters) -> str:
+        """Weak ETag for a list page: change markers + normalized filters."""
+        marker = await self.attendance_repo.get_change_marker()
+        return weak_etag(
+            "attendance-list",
+            *marker,
+            *(f"{k}={filters[k]}" for k in sorted(filters)),
+        )
+
     async def list_attendance(
         self,
         *,
         page: int = 1,
         per_page: int = 20,
-        employee_id: str | None = None,
+        employee_id: str | tuple[str, ...] | None = None,
         attendance_date: date | None = None,
         date_from: date | None = None,
         date_to: date | None = None,
-        status: str | None = None,
-        department: str | None = None,
+        status: str | tuple[str, ...] | None = None,
+        department: str | tuple[str, ...] | None = None,
     ) -> tuple[list[Attendance], int]:
-        """Paginated attendance listing with filters."""
+        """Paginated attendance listing with filters.
+
+        Concurrent identical requests share one in-flight query (single-flight).
+        """
         per_page = min(per_page, 100)
-        return await self.attendance_repo.list(
+        filters = dict(
             page=page,
             per_page=per_page,
             employee_id=employee_id,
@@ -124,10 +304,72 @@ class AttendanceService:
             status=status,
             department=department,
         )
+        return await get_group("attendance.list").do(
+            make_key(**filters), lambda: self.attendance_repo.list(**filters)
+        )
+
+    async def roster_etag(self, **filters) -> str:
+        """Weak ETag for a roster page: same change markers as the list."""
+        marker = await self.attendance_repo.get_change_marker()
+        return weak_etag(
+            "attendance-roster",
+            *marker,
+            *(f"{k}={filters[k]}" for k in sorted(filters)),
+        )
+
+    async def get_roster(
+        self,
+        *,
+        day: date,
+        department: str | None = None,
+        cursor: str | None = None,
+        limit: int = 500,
+    ) -> RosterResponse:
+        """Every active employee with their record for ``day`` (or null), keyset-paged.
+
+        One LEFT JOIN per page instead of an employee list plus an
+        attendance list joined on the client.
+        """
+        response = RosterResponse(date=day, data=[], next_cursor=None)
+        department_id = None
+        if department:
+            department_id = await self.department_repo.resolve_id(department)
+            if department_id is None:
+                return response
+
+        rows = await self.attendance_repo.roster(
+            day,
+            department_id=department_id,
+            after_code=_decode_roster_cursor(cursor) if cursor else None,
+            limit=limit + 1,
+            archived=await self.archive_repo.holds(day),
+        )
+        page = rows[:limit]
+        names = await self.department_repo.names_by_id({row.department_id for row in page})
+        response.data = [
+            RosterEntry(
+                employee_id=row.id,
+                employee_code=row.employee_code,
+                employee_name=row.name,
+                department=names[row.department_id],
+                attendance=None if row.attendance_id is None else RosterAttendance(
+                    id=row.attendance_id,
+                    status=row.status,
+                    check_in=row.check_in,
+                    check_out=row.check_out,
+                    notes=row.notes,
+                ),
+            )
+            for row in page
+        ]
+        if len(rows) > limit:
+            response.next_cursor = _encode_roster_cursor(page[-1].employee_code)
+        return response
 
     async def update_attendance(self, attendance_id: str, data: AttendanceUpdate) -> Attendance:
         """Update attendance fields. employee_id and date are immutable."""
         attendance = await self.get_attendance(attendance_id)
+        self._check_open(attendance.date, await self.archive_repo.closed_through(for_write=True))
 
         update_data = data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
@@ -136,7 +378,8 @@ class AttendanceService:
             else:
                 setattr(attendance, field, value)
 
-        attendance.updated_at = datetime.now(timezone.utc)
+        # Stamped by the DB clock, like inserts and the change feed's bounds
+        attendance.updated_at = func.now()
         return await self.attendance_repo.update(attendance)
 
     async def delete_attendance(self, attendance_id: str) -> None:
@@ -145,6 +388,7 @@ class AttendanceService:
         Audit: logs the deleted record before removal.
         """
         attendance = await self.get_attendance(attendance_id)
+        self._check_open(attendance.date, await self.archive_repo.closed_through(for_write=True))
 
         logger.warning(
             "AUDIT: Deleting attendance record",
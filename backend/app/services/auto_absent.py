@@ -0,0 +1,133 @@
+"""Nightly auto-absent job — marks ABSENT every active employee with no record for the day.
+
+One set-based INSERT ... SELECT (AttendanceRepository.insert_absent_for_unrecorded)
+replaces thousands of ``POST /attendance`` calls. It is safe to re-run: employees
+who already have a record for the day, including one created concurrently,
+are left untouched.
+
+Two ways to run it:
+    - in-process: AUTO_ABSENT_ENABLED=true schedules it daily at AUTO_ABSENT_AT
+      (server local time) from the app lifespan. With several workers every
+      worker runs it, which is harmless but redundant — prefer enabling it on
+      one instance, or use the CLI from cron
+    - CLI: python -m scripts.mark_absent [--date YYYY-MM-DD]
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import async_session_factory
+from app.repositories.archive_repo import ArchiveRepository
+from app.repositories.attendance_repo import AttendanceRepository
+from app.services.exceptions import ValidationException
+from app.services.work_calendar import is_working_day
+
+logger = logging.getLogger(__name__)
+
+AUTO_ABSENT_NOTE = "Auto-marked absent: no attendance recorded"
+
+# The scheduler's sleep, so tests can replace it without patching asyncio.sleep globally
+_sleep = asyncio.sleep
+
+
+@dataclass
+class AutoAbsentReport:
+    """What one run did for one date."""
+
+    date: date
+    working_day: bool
+    active_employees: int = 0
+    not_joined: int = 0
+    already_recorded: int = 0
+    inserted: int = 0
+
+
+async def mark_unrecorded_absent(db: AsyncSession, day: date) -> AutoAbsentReport:
+    """Insert ABSENT rows for ``day`` in the caller's transaction.
+
+    Enforces INV-5 (no future dates) and the archived-months rule like
+    ``POST /attendance``; INV-10 is part of the INSERT's WHERE clause.
+    Non-working days (work_calendar) are skipped.
+    """
+    if day > date.today():
+        raise ValidationException(
+            error_code="FUTURE_DATE",
+            message="Attendance date cannot be in the future",
+            details={"date": str(day), "today": str(date.today())},
+        )
+    closed_through = await ArchiveRepository(db).closed_through(for_write=True)
+    if closed_through is not None and day <= closed_through:
+        raise ValidationException(
+            error_code="ATTENDANCE_ARCHIVED",
+            message="Attendance for archived dates cannot be changed",
+            details={"date": str(day), "archived_through": str(closed_through)},
+        )
+
+    report = AutoAbsentReport(date=day, working_day=is_working_day(day))
+    if not report.working_day:
+        return report
+
+    repo = AttendanceRepository(db)
+    report.active_employees, report.not_joined = await repo.count_auto_absent_candidates(day)
+    report.inserted = await repo.insert_absent_for_unrecorded(day, notes=AUTO_ABSENT_NOTE)
+    report.already_recorded = report.active_employees - report.not_joined - report.inserted
+    return report
+
+
+async def run_once(day: date | None = None) -> AutoAbsentReport:
+    """Run the job for ``day`` (default today) in its own transaction."""
+    async with async_session_factory() as session:
+        report = await mark_unrecorded_absent(session, day or date.today())
+        await session.commit()
+    logger.info(
+        "Auto-absent %s: %d inserted, %d already recorded, %d not yet joined%s",
+        report.date, report.inserted, report.already_recorded, report.not_joined,
+        "" if report.working_day else " (non-working day, skipped)",
+    )
+    return report
+
+
+def next_run(at: time, now: datetime) -> datetime:
+    """The next ``at`` after ``now`` (today if still ahead, else tomorrow)."""
+    target = datetime.combine(now.date(), at)
+    if target <= now:
+        target += timedelta(days=1)
+    return target
+
+
+async def _nightly() -> None:
+    while True:
+        target = next_run(settings.AUTO_ABSENT_AT, datetime.now())
+        # Fixed before sleeping: a wake-up that overshoots midnight still closes the intended day
+        day = target.date()
+        await _sleep((target - datetime.now()).total_seconds())
+        try:
+            await run_once(day)
+        except Exception:
+            logger.exception("Auto-absent run failed")
+
+
+_task: asyncio.Task | None = None
+
+
+def start_nightly() -> None:
+    global _task
+    if _task is None:
+        _task = asyncio.create_task(_nightly(), name="auto-absent")
+        logger.info("Auto-absent scheduled daily at %s", settings.AUTO_ABSENT_AT)
+
+
+async def stop_nightly() -> None:
+    global _task
+    if _task is not None:
+        _task.cancel()
+        try:
+            await _task
+        except asyncio.CancelledError:
+            pass
+        _task = None
@@ -0,0 +1,117 @@
+"""Batch service — runs GET sub-requests concurrently inside the app.
+
+Each sub-request is dispatched through the full ASGI application (middleware
+included), so it gets its own DB session via ``get_db``, its own request id,
+its own access-log line and its own rate-limit token — the batch itself is
+counted once more by the outer request.
+"""
+
+import asyncio
+import json
+from urllib.parse import urlsplit
+
+from starlette.types import ASGIApp, Message, Scope
+
+from app.config import settings
+from app.schemas.batch import BatchSubRequest, BatchSubResponse
+from app.services.exceptions import ValidationException
+
+# Hop-by-hop / transport headers that must not be forwarded into sub-requests
+_BLOCKED_HEADERS = {"host", "content-length", "transfer-encoding", "connection", "accept-encoding"}
+
+
+class BatchService:
+    """Dispatch GET sub-requests against the running application."""
+
+    def __init__(self, app: ASGIApp, parent_scope: Scope):
+        self.app = app
+        self.parent_scope = parent_scope
+        self.batch_path = f"{settings.API_V1_PREFIX}/batch"
+
+    def _validate(self, requests: list[BatchSubRequest]) -> None:
+        if len(requests) > settings.BATCH_MAX_REQUESTS:
+            raise ValidationException(
+                error_code="BATCH_TOO_LARGE",
+                message=f"A batch may contain at most {settings.BATCH_MAX_REQUESTS} requests",
+                details={"received": len(requests)},
+            )
+        for index, sub in enumerate(requests):
+            path = urlsplit(sub.path).path
+            if not path.startswith(f"{settings.API_V1_PREFIX}/") or path.rstrip("/") == self.batch_path:
+                raise ValidationException(
+                    error_code="BATCH_INVALID_PATH",
+                    message="Sub-request paths must target an API route other than /batch",
+                    details={"index": index, "path": sub.path},
+                )
+
+    def _build_scope(self, sub: BatchSubRequest) -> Scope:
+        parts = urlsplit(sub.path)
+        host = dict(self.parent_scope.get("headers", [])).get(b"host", b"localhost")
+        headers = [(b"host", host)]
+        headers.extend(
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in sub.headers.items()
+            if name.lower() not in _BLOCKED_HEADERS
+        )
+        return {
+            "type": "http",
+            "asgi": self.parent_scope.get("asgi", {"version": "3.0"}),
+            "http_version": self.parent_scope.get("http_version", "1.1"),
+            "method": "GET",
+            "scheme": self.parent_scope.get("scheme", "http"),
+            "server": self.parent_scope.get("server"),
+            "client": self.parent_scope.get("client"),
+            "root_path": self.parent_scope.get("root_path", ""),
+            "path": parts.path,
+            "raw_path": parts.path.encode("utf-8"),
+            "query_string": parts.query.encode("latin-1"),
+            "headers": headers,
+            "state": dict(self.parent_scope.get("state", {})),
+        }
+
+    async def _dispatch(self, sub: BatchSubRequest) -> BatchSubResponse:
+        scope = self._build_scope(sub)
+        status = 500
+        response_headers: dict[str, str] = {}
+        chunks: list[bytes] = []
+
+        async def receive() -> Message:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                for name, value in message.get("headers", []):
+                    response_headers[name.decode("latin-1")] = value.decode("latin-1")
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        try:
+            await self.app(scope, receive, send)
+        except Exception:
+            # ServerErrorMiddleware re-raises after sending its 500 — keep that
+            # response and don't let one failing sub-request sink the batch
+            if not chunks:
+                status = 500
+                response_headers = {"content-type": "application/json"}
+                chunks = [json.dumps({
+                    "error_code": "INTERNAL_ERROR",
+                    "message": "An unexpected error occurred",
+                    "details": None,
+                }).encode()]
+
+        raw = b"".join(chunks)
+        body = None
+        if raw:
+            if response_headers.get("content-type", "").startswith("application/json"):
+                body = json.loads(raw)
+            else:
+                body = raw.decode("utf-8", errors="replace")
+        response_headers.pop("content-length", None)
+        return BatchSubResponse(id=sub.id, status=status, headers=response_headers, body=body)
+
+    async def execute(self, requests: list[BatchSubRequest]) -> list[BatchSubResponse]:
+        """Run all sub-requests concurrently; results keep request order."""
+        self._validate(requests)
+        return list(await asyncio.gather(*(self._dispatch(sub) for sub in requests)))
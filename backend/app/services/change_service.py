@@ -0,0 +1,122 @@
+"""Change feed service — incremental sync of employees and attendance."""
+
+import base64
+import heapq
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.repositories.change_repo import (
+    ATTENDANCE_STREAM,
+    EMPLOYEE_STREAM,
+    TOMBSTONE_STREAM,
+    ChangeRepository,
+)
+from app.services.exceptions import AppException, ValidationException
+
+Cursor = tuple[datetime, int, str]
+
+
+@dataclass
+class Change:
+    """One entry in the feed. ``record`` is the ORM row for upserts, None for deletes."""
+
+    entity: str
+    op: str
+    id: str
+    changed_at: datetime
+    record: Any
+    position: Cursor
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """Opaque, URL-safe cursor for (changed_at, stream, id)."""
+    raw = json.dumps([cursor[0].isoformat(), cursor[1], cursor[2]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(value: str) -> Cursor:
+    try:
+        padded = value + "=" * (-len(value) % 4)
+        ts, rank, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(ts), int(rank), str(row_id)
+    except (ValueError, TypeError):
+        raise ValidationException(
+            error_code="INVALID_CURSOR",
+            message="The 'since' cursor is malformed",
+            details={"since": value},
+        )
+
+
+class ChangeService:
+    """Merges employee upserts, attendance upserts and tombstones in cursor order.
+
+    Rows stamped after ``ChangeRepository.settled_through()`` are held back
+    until a later poll. That bound trails the oldest open writing
+    transaction, so a transaction that commits late with an earlier
+    updated_at cannot slip behind a cursor that has already passed it.
+
+    Tombstones are kept for CHANGES_TOMBSTONE_RETENTION_DAYS. A cursor older
+    than that may have missed purged deletes, so it is refused with 410 and
+    the consumer starts over with a full sync.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.repo = ChangeRepository(db)
+
+    async def list_changes(
+        self, *, since: str | None = None, limit: int = 500
+    ) -> tuple[list[Change], str | None, bool]:
+        """Return (changes, next_cursor, has_more)."""
+        cursor = decode_cursor(since) if since else None
+        if cursor is not None and cursor[0] < await self._retention_cutoff():
+            raise AppException(
+                error_code="CURSOR_EXPIRED",
+                message="The 'since' cursor is older than the tombstone retention; start a full sync",
+                status_code=410,
+                details={"retention_days": settings.CHANGES_TOMBSTONE_RETENTION_DAYS},
+            )
+        upper_bound = await self.repo.settled_through()
+
+        # Each stream is already ordered; fetch limit + 1 to detect more pages
+        employees = await self.repo.employees_after(cursor, upper_bound, limit + 1)
+        attendance = await self.repo.attendance_after(cursor, upper_bound, limit + 1)
+        tombstones = await self.repo.tombstones_after(cursor, upper_bound, limit + 1)
+
+        streams = [
+            [
+                Change("employee", "upsert", e.id, e.updated_at, e, (e.updated_at, EMPLOYEE_STREAM, e.id))
+                for e in employees
+            ],
+            [
+                Change("attendance", "upsert", a.id, a.updated_at, a, (a.updated_at, ATTENDANCE_STREAM, a.id))
+                for a in attendance
+            ],
+            [
+                Change(t.entity, "delete", t.entity_id, t.deleted_at, None,
+                       (t.deleted_at, TOMBSTONE_STREAM, str(t.id)))
+                for t in tombstones
+            ],
+        ]
+
+        def sort_key(change: Change):
+            ts, rank, row_id = change.position
+            return ts, rank, int(row_id) if rank == TOMBSTONE_STREAM else row_id
+
+        merged = list(heapq.merge(*streams, key=sort_key))
+        has_more = len(merged) > limit
+        page = merged[:limit]
+
+        next_cursor = encode_cursor(page[-1].position) if page else since
+        return page, next_cursor, has_more
+
+    async def purge_tombstones(self) -> int:
+        """Delete tombstones past the retention window. Returns the number deleted."""
+        return await self.repo.purge_tombstones(await self._retention_cutoff())
+
+    async def _retention_cutoff(self) -> datetime:
+        return await self.repo.get_db_now() - timedelta(days=settings.CHANGES_TOMBSTONE_RETENTION_DAYS)
@@ -0,0 +1,500 @@
+"""Columnar in-process attendance analytics engine (optional, needs NumPy).
+
+Keeps every live and archived attendance row in a handful of NumPy arrays:
+
+    employee index  int32   position in the employee dimension arrays
+    day             int32   date.toordinal()
+    status          int8    STATUS_CODES (1=PRESENT … 4=ON_LEAVE)
+    check_in/out    int16   minutes after midnight, -1 when unset
+
+plus per-employee dimension arrays (department id, is_active). Rows are
+kept sorted by (employee, day) so per-employee analytics can work on
+contiguous slices.
+
+Aggregates are masked ``np.bincount`` reductions — a few milliseconds for
+millions of rows, no DB round trip for the data itself. Before answering,
+the engine applies changes since its last refresh (updated_at / deleted_at
+range scans from the previous ``ChangeRepository.settled_through()`` bound,
+so late commits are not missed), so answers are as fresh as the SQL
+backend's.
+
+Selected with ``DASHBOARD_BACKEND=columnar``. The initial full load runs
+in a background task started from the app lifespan (``start_warmup``); it
+can take many seconds on a large table, so until it completes the
+dashboard is served by the SQL backend and no request waits on it.
+Memory is per process:
+roughly 20 bytes per attendance row plus the 36-byte id. When
+``ATTENDANCE_SNAPSHOT_DIR`` holds snapshot files (scripts.snapshot_attendance),
+closed archived months are read from those memory-mapped files instead of
+the database. They stay in the shared page cache and are never copied into
+the process.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.models.types import STATUS_CODES
+from app.repositories.analytics_repo import AnalyticsRepository
+from app.repositories.archive_repo import ArchiveRepository
+from app.repositories.change_repo import ChangeRepository
+from app.repositories.dashboard_repo import DashboardRepository
+from app.repositories.department_repo import DepartmentRepository
+from app.services.attendance_snapshot import AttendanceSnapshot, open_snapshots
+
+try:  # Optional dependency — the columnar backend is only available when installed
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# bincount width: index 0 unused, codes 1..4
+_STATUS_SLOTS = max(STATUS_CODES.values()) + 1
+_PRESENT = STATUS_CODES["PRESENT"]
+_ABSENT = STATUS_CODES["ABSENT"]
+_HALF_DAY = STATUS_CODES["HALF_DAY"]
+_ON_LEAVE = STATUS_CODES["ON_LEAVE"]
+
+
+def available() -> bool:
+    return np is not None
+
+
+def _minutes(value: time | None) -> int:
+    return -1 if value is None else value.hour * 60 + value.minute
+
+
+def _counts(row) -> dict[str, int]:
+    return {
+        "present": int(row[_PRESENT]),
+        "absent": int(row[_ABSENT]),
+        "half_day": int(row[_HALF_DAY]),
+        "on_leave": int(row[_ON_LEAVE]),
+    }
+
+
+def attendance_rate(counts: dict[str, int]) -> float:
+    """Same formula as DashboardRepository.get_summary."""
+    total = sum(counts.values())
+    if total == 0:
+        return 0.0
+    return round((counts["present"] + counts["half_day"] * 0.5) / total * 100, 2)
+
+
+@dataclass
+class AttendanceColumns:
+    """Fixed-width attendance columns; all arrays share one length."""
+
+    ids: "np.ndarray"
+    employee: "np.ndarray"
+    day: "np.ndarray"
+    status: "np.ndarray"
+    check_in: "np.ndarray"
+    check_out: "np.ndarray"
+
+    @classmethod
+    def empty(cls) -> "AttendanceColumns":
+        return cls(
+            ids=np.empty(0, dtype="S36"),
+            employee=np.empty(0, dtype=np.int32),
+            day=np.empty(0, dtype=np.int32),
+            status=np.empty(0, dtype=np.int8),
+            check_in=np.empty(0, dtype=np.int16),
+            check_out=np.empty(0, dtype=np.int16),
+        )
+
+    @classmethod
+    def from_rows(cls, rows, employee_index) -> "AttendanceColumns":
+        """Build columns from (id, employee_id, date, status, check_in, check_out, ...) rows."""
+        n = len(rows)
+        return cls(
+            ids=np.array([row.id for row in rows], dtype="S36"),
+            employee=np.fromiter((employee_index(row.employee_id) for row in rows), np.int32, n),
+            day=np.fromiter((row.date.toordinal() for row in rows), np.int32, n),
+            status=np.fromiter((STATUS_CODES[row.status] for row in rows), np.int8, n),
+            check_in=np.fromiter((_minutes(row.check_in) for row in rows), np.int16, n),
+            check_out=np.fromiter((_minutes(row.check_out) for row in rows), np.int16, n),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def select(self, index) -> "AttendanceColumns":
+        return AttendanceColumns(**{name: getattr(self, name)[index] for name in self.__dataclass_fields__})
+
+    @classmethod
+    def concat(cls, parts: list["AttendanceColumns"]) -> "AttendanceColumns":
+        return cls(**{
+            name: np.concatenate([getattr(part, name) for part in parts])
+            for name in cls.__dataclass_fields__
+        })
+
+    def sorted(self) -> "AttendanceColumns":
+        """Rows ordered by (employee, day) — contiguous per-employee slices."""
+        return self.select(np.lexsort((self.day, self.employee)))
+
+
+class ColumnarAttendanceEngine:
+    """Process-wide columnar copy of attendance, refreshed incrementally."""
+
+    def __init__(self):
+        self.columns: AttendanceColumns | None = None
+        # Memory-mapped closed months, each with its local → engine employee index map
+        self.history: list[tuple[AttendanceSnapshot, "np.ndarray"]] = []
+        self.employee_ids: list[str] = []
+        self._employee_index: dict[str, int] = {}
+        self.employee_department = None
+        self.employee_active = None
+        self.employee_exists = None
+        self._synced_at: datetime | None = None
+        # Changes already applied after the settled bound, so a
+        # re-read row/tombstone isn't re-applied (an O(n) rebuild) every call.
+        # Rows are compared by full content: updated_at alone has 1s precision.
+        self._applied_rows: dict[str, tuple] = {}
+        self._applied_tombstones: dict[str, datetime] = {}
+        self._lock = asyncio.Lock()
+        self._warmup: asyncio.Task | None = None
+        self.full_loads = 0
+        self.refreshes = 0
+        self.rows_applied = 0
+
+    # ------------------------------------------------------------------
+    # Employee dimension
+    # ------------------------------------------------------------------
+
+    def _index_of(self, employee_id: str) -> int:
+        index = self._employee_index.get(employee_id)
+        if index is None:
+            # Unknown until the next employee refresh: excluded from every filter
+            index = len(self.employee_ids)
+            self._employee_index[employee_id] = index
+            self.employee_ids.append(employee_id)
+            self.employee_department = np.append(self.employee_department, np.int16(0))
+            self.employee_active = np.append(self.employee_active, False)
+            self.employee_exists = np.append(self.employee_exists, False)
+        return index
+
+    def _apply_employees(self, rows) -> None:
+        for row in rows:
+            index = self._index_of(row.id)
+            self.employee_department[index] = row.department_id
+            self.employee_active[index] = row.is_active
+            self.employee_exists[index] = True
+
+    # ------------------------------------------------------------------
+    # Loading and refresh
+    # ------------------------------------------------------------------
+
+    async def _full_load(self, repo: AnalyticsRepository, archive: ArchiveRepository) -> None:
+        # Everything stamped after this is re-read by the next refresh
+        synced_at = await ChangeRepository(repo.db).settled_through()
+        self.employee_ids = []
+        self._employee_index = {}
+        self.employee_department = np.empty(0, dtype=np.int16)
+        self.employee_active = np.empty(0, dtype=bool)
+        self.employee_exists = np.empty(0, dtype=bool)
+        self._apply_employees(await repo.employees_changed_since(None))
+
+        # Archived rows never change (employee deletes are masked via
+        # employee_exists), so snapshotted months are never refreshed
+        self.history = []
+        skip_archived = None
+        if settings.ATTENDANCE_SNAPSHOT_DIR:
+            snapshots = open_snapshots(settings.ATTENDANCE_SNAPSHOT_DIR, await archive.archived_through())
+            self.history = [
+                (snapshot, np.fromiter(map(self._index_of, snapshot.employee_ids), np.int32))
+                for snapshot in snapshots
+            ]
+            if snapshots:
+                skip_archived = (snapshots[0].first_day, snapshots[-1].last_day)
+
+        self._applied_rows = {}
+        parts = [AttendanceColumns.empty()]
+        async for chunk in repo.stream_attendance(skip_archived):
+            parts.append(AttendanceColumns.from_rows(chunk, self._index_of))
+            self._applied_rows.update((row.id, tuple(row)) for row in chunk if row.updated_at >= synced_at)
+        self.columns = AttendanceColumns.concat(parts).sorted()
+        self._applied_tombstones = {
+            entity_id: deleted_at for _, entity_id, deleted_at in await repo.tombstones_since(synced_at)
+        }
+        self._synced_at = synced_at
+        self.full_loads += 1
+        logger.info(
+            "Columnar engine loaded %d attendance rows (+%d mapped from %d snapshot months)",
+            len(self.columns), sum(len(snapshot) for snapshot, _ in self.history), len(self.history),
+        )
+
+    async def _apply_changes(self, repo: AnalyticsRepository) -> None:
+        synced_at = await ChangeRepository(repo.db).settled_through()
+        since = self._synced_at
+
+        self._apply_employees(await repo.employees_changed_since(since))
+        changed = [
+            row for row in await repo.attendance_changed_since(since)
+            if self._applied_rows.get(row.id) != tuple(row)
+        ]
+        tombstones = [
+            tombstone for tombstone in await repo.tombstones_since(since)
+            if self._applied_tombstones.get(tombstone.entity_id) != tombstone.deleted_at
+        ]
+        self._applied_rows = {k: v for k, v in self._applied_rows.items() if v[-1] >= since}
+        self._applied_rows.update((row.id, tuple(row)) for row in changed)
+        self._applied_tombstones = {k: v for k, v in self._applied_tombstones.items() if v >= since}
+        self._applied_tombstones.update((t.entity_id, t.deleted_at) for t in tombstones)
+
+        for entity, entity_id, _ in tombstones:
+            if entity == "employee" and entity_id in self._employee_index:
+                self.employee_exists[self._employee_index[entity_id]] = False
+
+        # Upsert = drop any existing copy of the id, then append the new one
+        removed = [row.id for row in changed]
+        removed += [entity_id for entity, entity_id, _ in tombstones if entity == "attendance"]
+        if removed:
+            columns = self.columns
+            keep = ~np.isin(columns.ids, np.array(removed, dtype="S36"))
+            if changed:
+                fresh = AttendanceColumns.from_rows(changed, self._index_of)
+                columns = AttendanceColumns.concat([columns.select(keep), fresh]).sorted()
+            elif not keep.all():
+                columns = columns.select(keep)
+            self.columns = columns
+            self.rows_applied += len(removed)
+
+        self._synced_at = synced_at
+        self.refreshes += 1
+
+    async def refresh(self, db: AsyncSession) -> None:
+        """Bring the arrays up to date; concurrent callers share one refresh."""
+        async with self._lock:
+            repo = AnalyticsRepository(db)
+            if self.columns is None:
+                await self._full_load(repo, ArchiveRepository(db))
+            else:
+                await self._apply_changes(repo)
+
+    @property
+    def loaded(self) -> bool:
+        """Has the initial full load completed?"""
+        return self._synced_at is not None
+
+    def start_warmup(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Run the initial full load in a background task (no-op if loaded or loading)."""
+        if self.loaded or self._warmup is not None:
+            return
+        self._warmup = asyncio.create_task(self._warm(session_factory), name="columnar-warmup")
+
+    async def _warm(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        try:
+            async with session_factory() as session:
+                await self.refresh(session)
+        except Exception:
+            # The next dashboard request starts another attempt
+            logger.exception("Columnar engine warm-up failed; dashboard stays on SQL")
+            self._warmup = None
+
+    async def wait_loaded(self) -> None:
+        """Wait for a running warm-up to finish."""
+        if self._warmup is not None:
+            await asyncio.shield(self._warmup)
+
+    async def stop_warmup(self) -> None:
+        """Cancel a warm-up still in progress (shutdown)."""
+        task, self._warmup = self._warmup, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def reset(self) -> None:
+        """Drop all state; the next refresh performs a full load."""
+        if self._warmup is not None:
+            self._warmup.cancel()
+        self.__init__()
+
+    # ------------------------------------------------------------------
+    # Vectorized queries
+    # ------------------------------------------------------------------
+
+    def _employee_filter(self, department_id: int | None, include_inactive: bool):
+        """Boolean mask over the employee dimension (INV-11 + department)."""
+        mask = self.employee_exists.copy()
+        if not include_inactive:
+            mask &= self.employee_active
+        if department_id is not None:
+            mask &= self.employee_department == department_id
+        return mask
+
+    def _matching(self, date_from: date, date_to: date, employee_mask):
+        """(employee index, day, status) of rows in range whose employee passes the mask.
+
+        Covers the in-memory columns and every overlapping snapshot month;
+        only the matching rows are copied out of the mapped files.
+        """
+        first, last = date_from.toordinal(), date_to.toordinal()
+        parts = [(self.columns, None)] + [
+            (snapshot, remap) for snapshot, remap in self.history
+            if snapshot.first_day <= date_to and snapshot.last_day >= date_from
+        ]
+        employees, days, statuses = [], [], []
+        for columns, remap in parts:
+            local_mask = employee_mask if remap is None else employee_mask[remap]
+            rows = (columns.day >= first) & (columns.day <= last) & local_mask[columns.employee]
+            employee = columns.employee[rows]
+            employees.append(employee if remap is None else remap[employee])
+            days.append(columns.day[rows])
+            statuses.append(columns.status[rows])
+        return np.concatenate(employees), np.concatenate(days), np.concatenate(statuses)
+
+    def summary(
+        self,
+        *,
+        date_from: date,
+        date_to: date,
+        department_id: int | None = None,
+        include_inactive: bool = False,
+    ) -> dict:
+        """Totals + per-department breakdown, keyed by department id."""
+        employee_mask = self._employee_filter(department_id, include_inactive)
+        employee, _, status = self._matching(date_from, date_to, employee_mask)
+        departments = self.employee_department[employee].astype(np.int64)
+
+        by_department = np.bincount(
+            departments * _STATUS_SLOTS + status,
+            minlength=(int(departments.max(initial=0)) + 1) * _STATUS_SLOTS,
+        ).reshape(-1, _STATUS_SLOTS)
+        counts = _counts(by_department.sum(axis=0))
+        return {
+            "total_employees": int(employee_mask.sum()),
+            "summary": counts,
+            "attendance_rate": attendance_rate(counts),
+            "department_breakdown": {
+                int(department): _counts(by_department[department])
+                for department in np.flatnonzero(by_department.sum(axis=1))
+            },
+        }
+
+    def trend(
+        self,
+        *,
+        date_from: date,
+        date_to: date,
+        department_id: int | None = None,
+        include_inactive: bool = False,
+    ) -> list[dict]:
+        """Per-day status counts for every day in the range (zeros included)."""
+        employee_mask = self._employee_filter(department_id, include_inactive)
+        _, day, status = self._matching(date_from, date_to, employee_mask)
+        days = date_to.toordinal() - date_from.toordinal() + 1
+        offsets = (day - date_from.toordinal()).astype(np.int64)
+        by_day = np.bincount(
+            offsets * _STATUS_SLOTS + status, minlength=days * _STATUS_SLOTS
+        ).reshape(days, _STATUS_SLOTS)
+        return [
+            {"date": date_from + timedelta(days=offset), **_counts(by_day[offset])}
+            for offset in range(days)
+        ]
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "rows": len(self.columns) if self.columns is not None else 0,
+            "employees": len(self.employee_ids),
+            "snapshot_months": len(self.history),
+            "snapshot_rows": sum(len(snapshot) for snapshot, _ in self.history),
+            "full_loads": self.full_loads,
+            "refreshes": self.refreshes,
+            "rows_applied": self.rows_applied,
+        }
+
+
+columnar_engine = ColumnarAttendanceEngine()
+
+
+class ColumnarDashboardBackend:
+    """DashboardRepository-compatible facade over the shared columnar engine.
+
+    Until the engine's initial load has completed, queries are answered by
+    DashboardRepository, and the load is started in the background if the
+    lifespan has not started it already.
+    """
+
+    def __init__(self, db: AsyncSession, engine: ColumnarAttendanceEngine | None = None):
+        self.db = db
+        self.engine = engine or columnar_engine
+        self.departments = DepartmentRepository(db)
+
+    def _sql_while_warming(self) -> DashboardRepository | None:
+        if self.engine.loaded:
+            return None
+        self.engine.start_warmup(async_sessionmaker(self.db.bind, expire_on_commit=False))
+        return DashboardRepository(self.db)
+
+    async def _department_id(self, department: str | None) -> tuple[bool, int | None]:
+        """(known, id) — an unknown department name matches nothing."""
+        if not department:
+            return True, None
+        department_id = await self.departments.resolve_id(department)
+        return department_id is not None, department_id
+
+    async def get_summary(
+        self,
+        *,
+        date_from: date,
+        date_to: date,
+        department: str | None = None,
+        include_inactive: bool = False,
+    ) -> dict:
+        if sql := self._sql_while_warming():
+            return await sql.get_summary(
+                date_from=date_from, date_to=date_to, department=department, include_inactive=include_inactive
+            )
+        known, department_id = await self._department_id(department)
+        if not known:
+            return {
+                "total_employees": 0,
+                "summary": {"present": 0, "absent": 0, "half_day": 0, "on_leave": 0},
+                "attendance_rate": 0.0,
+                "department_breakdown": [],
+            }
+
+        await self.engine.refresh(self.db)
+        result = self.engine.summary(
+            date_from=date_from,
+            date_to=date_to,
+            department_id=department_id,
+            include_inactive=include_inactive,
+        )
+        names = await self.departments.names_by_id(set(result["department_breakdown"]))
+        result["department_breakdown"] = [
+            {"department": names[department_id], **counts}
+            for department_id, counts in result["department_breakdown"].items()
+        ]
+        return result
+
+    async def get_trend(
+        self,
+        *,
+        date_from: date,
+        date_to: date,
+        department: str | None = None,
+        include_inactive: bool = False,
+    ) -> list[dict]:
+        if sql := self._sql_while_warming():
+            return await sql.get_trend(
+                date_from=date_from, date_to=date_to, department=department, include_inactive=include_inactive
+            )
+        known, department_id = await self._department_id(department)
+        await self.engine.refresh(self.db)
+        return self.engine.trend(
+            date_from=date_from,
+            date_to=date_to,
+            # Unknown department: an id no employee has
+            department_id=department_id if known else -1,
+            include_inactive=include_inactive,
+        )
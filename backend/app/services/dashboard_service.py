@@ -1,23 +1,79 @@
 """Dashboard service — orchestrates aggregation queries."""
 
+import logging
 from datetime import date
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.repositories.dashboard_repo import DashboardRepository
 from app.schemas.dashboard import (
+    DailyStatusCounts,
     DashboardSummaryResponse,
+    DashboardTrendResponse,
     DateRange,
     DepartmentBreakdown,
     StatusSummary,
 )
+from app.services import columnar_engine
+from app.services.etag import weak_etag
+from app.services.exceptions import ValidationException
+from app.services.single_flight import get_group, make_key
+
+logger = logging.getLogger(__name__)
+_warned_no_numpy = False
+
+
+def select_backend(db: AsyncSession):
+    """Aggregation backend per DASHBOARD_BACKEND; both expose get_summary/get_trend."""
+    global _warned_no_numpy
+    if settings.DASHBOARD_BACKEND == "columnar":
+        if columnar_engine.available():
+            return columnar_engine.ColumnarDashboardBackend(db)
+        if not _warned_no_numpy:
+            logger.warning("DASHBOARD_BACKEND=columnar but numpy is not installed; using SQL")
+            _warned_no_numpy = True
+    return DashboardRepository(db)
 
 
 class DashboardService:
-    """Dashboard business logic — thin orchestration over repository."""
+    """Dashboard business logic — thin orchestration over the selected backend.
+
+    The change marker (and so the ETag) always comes from SQL; aggregates come
+    from DashboardRepository or the columnar engine (DASHBOARD_BACKEND).
+    """
 
     def __init__(self, db: AsyncSession):
         self.repo = DashboardRepository(db)
+        self.backend = select_backend(db)
+
+    async def get_summary_etag(
+        self,
+        *,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        department: str | None = None,
+        include_inactive: bool = False,
+    ) -> str:
+        """Weak ETag for a summary, without running any aggregation.
+
+        The date range is normalized exactly like get_summary so "today"
+        rolls over to a new tag at midnight.
+        """
+        if date_from is None:
+            date_from = date.today()
+        if date_to is None:
+            date_to = date_from
+
+        marker = await self.repo.get_change_marker()
+        return weak_etag(
+            "dashboard-summary",
+            *marker,
+            date_from,
+            date_to,
+            department,
+            include_inactive,
+        )
 
     async def get_summary(
         self,
@@ -36,12 +92,16 @@ class DashboardService:
         if date_to is None:
             date_to = date_from
 
-        result = await self.repo.get_summary(
+        # Concurrent identical summaries share one in-flight aggregation
+        params = dict(
             date_from=date_from,
             date_to=date_to,
             department=department,
             include_inactive=include_inactive,
         )
+        result = await get_group("dashboard.summary").do(
+            make_key(**params), lambda: self.backend.get_summary(**params)
+        )
 
         return DashboardSummaryResponse(
             date_range=DateRange(date_from=date_from, date_to=date_to),
@@ -52,3 +112,63 @@ class DashboardService:
                 DepartmentBreakdown(**dept) for dept in result["department_breakdown"]
             ],
         )
+
+    @staticmethod
+    def _trend_range(date_from: date | None, date_to: date | None) -> tuple[date, date]:
+        """Default to the trailing 30 days; reject inverted or over-long ranges."""
+        if date_to is None:
+            date_to = date.today()
+        if date_from is None:
+            date_from = date.fromordinal(date_to.toordinal() - 29)
+        days = (date_to - date_from).days + 1
+        if days < 1 or days > settings.DASHBOARD_TREND_MAX_DAYS:
+            raise ValidationException(
+                error_code="INVALID_DATE_RANGE",
+                message=f"date_from must be on or before date_to, spanning at most "
+                f"{settings.DASHBOARD_TREND_MAX_DAYS} days",
+                details={"date_from": str(date_from), "date_to": str(date_to)},
+            )
+        return date_from, date_to
+
+    async def get_trend_etag(
+        self,
+        *,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        department: str | None = None,
+        include_inactive: bool = False,
+    ) -> str:
+        date_from, date_to = self._trend_range(date_from, date_to)
+        marker = await self.repo.get_change_marker()
+        return weak_etag(
+            "dashboard-trend",
+            *marker,
+            date_from,
+            date_to,
+            department,
+            include_inactive,
+        )
+
+    async def get_trend(
+        self,
+        *,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        department: str | None = None,
+        include_inactive: bool = False,
+    ) -> DashboardTrendResponse:
+        """Day-by-day status counts (defaults to the trailing 30 days)."""
+        date_from, date_to = self._trend_range(date_from, date_to)
+        params = dict(
+            date_from=date_from,
+            date_to=date_to,
+            department=department,
+            include_inactive=include_inactive,
+        )
+        days = await get_group("dashboard.trend").do(
+            make_key(**params), lambda: self.backend.get_trend(**params)
+        )
+        return DashboardTrendResponse(
+            date_range=DateRange(date_from=date_from, date_to=date_to),
+            days=[DailyStatusCounts(**day) for day in days],
+        )
@@ -1,19 +1,42 @@
 """Employee service — business logic layer for employee operations."""
 
+import calendar
 import json
 import logging
-from datetime import datetime, timezone
+from collections import Counter
+from datetime import date, timedelta
 
+from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.employee import Employee
+from app.models.types import STATUS_CODES
+from app.repositories.archive_repo import ArchiveRepository
+from app.repositories.attendance_repo import AttendanceRepository
+from app.repositories.department_repo import DepartmentRepository
 from app.repositories.employee_repo import EmployeeRepository
-from app.schemas.employee import EmployeeCreate, EmployeeUpdate
+from app.schemas.employee import (
+    EmployeeCalendarResponse,
+    EmployeeCalendarTotals,
+    EmployeeCreate,
+    EmployeeUpdate,
+)
+from app.services.etag import weak_etag
 from app.services.exceptions import ConflictException, NotFoundException
+from app.services.single_flight import get_group, make_key
+from app.services.work_calendar import is_working_day
 
 logger = logging.getLogger(__name__)
 
+# Status code → calendar character (EmployeeCalendarResponse.days)
+_CALENDAR_CODES = {
+    STATUS_CODES["PRESENT"]: "P",
+    STATUS_CODES["ABSENT"]: "A",
+    STATUS_CODES["HALF_DAY"]: "H",
+    STATUS_CODES["ON_LEAVE"]: "L",
+}
+
 
 class EmployeeService:
     """Employee business logic.
@@ -27,6 +50,7 @@ class EmployeeService:
 
     def __init__(self, db: AsyncSession):
         self.repo = EmployeeRepository(db)
+        self.department_repo = DepartmentRepository(db)
         self.db = db
 
     async def create_employee(self, data: EmployeeCreate) -> Employee:
@@ -38,7 +62,7 @@ class EmployeeService:
             employee_code=data.employee_code,
             name=data.name,
             email=data.email,
-            department=data.department,
+            department_ref=await self.department_repo.get_or_create(data.department),
             designation=data.designation,
             date_of_joining=data.date_of_joining,
             phone=data.phone,
@@ -77,24 +101,100 @@ class EmployeeService:
             )
         return employee
 
+    async def get_employee_etag(self, employee_id: str) -> str | None:
+        """Weak ETag for one employee, or None if it does not exist.
+
+        Reads only updated_at and version so a matching If-None-Match costs
+        one PK lookup.
+        """
+        version = await self.repo.get_version(employee_id)
+        if version is None:
+            return None
+        return self.employee_etag(employee_id, *version)
+
+    @staticmethod
+    def employee_etag(employee_id: str, updated_at, version: int) -> str:
+        """Detail ETag derived from id + updated_at + version (same-second writes)."""
+        return weak_etag("employee", employee_id, updated_at, version)
+
+    async def get_calendar(self, employee_id: str, year: int, month: int | None = None) -> EmployeeCalendarResponse:
+        """The employee's statuses for a year (or one month of it), one character per day.
+
+        One PK lookup for the joining date, then one narrow (date, status)
+        read on uq_attendance_emp_date — no ORM rows, no pagination.
+        """
+        joined = (await self.repo.joining_dates({employee_id})).get(employee_id)
+        if joined is None:
+            raise NotFoundException(
+                error_code="EMPLOYEE_NOT_FOUND",
+                message="Employee not found",
+                details={"employee_id": employee_id},
+            )
+        date_from = date(year, month or 1, 1)
+        date_to = date(year, month or 12, calendar.monthrange(year, month or 12)[1])
+
+        archive = ArchiveRepository(self.db)
+        records = await AttendanceRepository(self.db).employee_days(
+            employee_id, date_from, date_to, include_archive=await archive.covers(date_from)
+        )
+
+        today = date.today()
+        days = [
+            "." if day < joined or day > today else "-" if is_working_day(day) else "_"
+            for day in (date_from + timedelta(days=offset) for offset in range((date_to - date_from).days + 1))
+        ]
+        for day, status in records:
+            days[(day - date_from).days] = _CALENDAR_CODES[status]
+        counts = Counter(days)
+        return EmployeeCalendarResponse(
+            employee_id=employee_id,
+            date_from=date_from,
+            date_to=date_to,
+            days="".join(days),
+            totals=EmployeeCalendarTotals(
+                present=counts["P"],
+                absent=counts["A"],
+                half_day=counts["H"],
+                on_leave=counts["L"],
+                missing=counts["-"],
+            ),
+        )
+
+    async def list_etag(self, **filters) -> str:
+        """Weak ETag for a list page: table change marker + normalized filters."""
+        marker = await self.repo.get_change_marker()
+        return weak_etag(
+            "employee-list",
+            *marker,
+            *(f"{k}={filters[k]}" for k in sorted(filters)),
+        )
+
     async def list_employees(
         self,
         *,
         page: int = 1,
         per_page: int = 20,
-        department: str | None = None,
+        department: str | tuple[str, ...] | None = None,
+        employee_id: str | tuple[str, ...] | None = None,
         is_active: bool | None = None,
         search: str | None = None,
     ) -> tuple[list[Employee], int]:
-        """Paginated employee listing with filters."""
+        """Paginated employee listing with filters.
+
+        Concurrent identical requests share one in-flight query (single-flight).
+        """
         per_page = min(per_page, 100)  # Cap at 100
-        return await self.repo.list(
+        filters = dict(
             page=page,
             per_page=per_page,
             department=department,
+            employee_id=employee_id,
             is_active=is_active,
             search=search,
         )
+        return await get_group("employee.list").do(
+            make_key(**filters), lambda: self.repo.list(**filters)
+        )
 
     async def update_employee(self, employee_id: str, data: EmployeeUpdate) -> Employee:
         """Update employee fields. employee_code is immutable."""
@@ -102,9 +202,15 @@ class EmployeeService:
 
         update_data = data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
-            setattr(employee, field, value)
-
-        employee.updated_at = datetime.now(timezone.utc)
+            if field == "department":
+                # API speaks names; the row stores the department key
+                if value is not None:
+                    employee.department_ref = await self.department_repo.get_or_create(value)
+            else:
+                setattr(employee, field, value)
+
+        # Stamped by the DB clock, like inserts and the change feed's bounds
+        employee.updated_at = func.now()
 
         try:
             return await self.repo.update(employee)
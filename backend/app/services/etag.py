@@ -0,0 +1,53 @@
+"""Weak ETag helpers for conditional GET support.
+
+Detail resources are versioned by ``id + updated_at`` plus a per-row
+``version`` that every UPDATE bumps (DATETIME has second precision, so two
+writes within one second would otherwise share a tag). Collections (lists,
+dashboard) are versioned by a cheap per-table change marker —
+``(MAX(updated_at), COUNT(*))`` read in one round trip. MAX is the last
+entry of the ``updated_at`` index and COUNT scans a narrow secondary index;
+both are plain consistent reads, so writers never wait on them or on each
+other. COUNT catches deletes, which leave MAX unchanged.
+"""
+
+import hashlib
+from typing import Any
+
+from starlette.responses import Response
+
+
+def weak_etag(*parts: Any) -> str:
+    """Build a weak ETag from arbitrary version components.
+
+    Components are stringified and hashed so the tag is short, opaque and
+    does not leak timestamps or row counts.
+    """
+    raw = "|".join("" if p is None else str(p) for p in parts)
+    digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against our ETag (RFC 9110 §13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        if candidate.strip().removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def set_validators(response: Response, etag: str) -> None:
+    """Attach the ETag and force clients to revalidate before reuse."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response — the body is never built or serialized."""
+    response = Response(status_code=304)
+    set_validators(response, etag)
+    return response
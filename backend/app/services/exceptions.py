@@ -4,11 +4,19 @@
 class AppException(Exception):
     """Base application exception that maps to HTTP error responses."""
 
-    def __init__(self, error_code: str, message: str, status_code: int = 400, details: dict | None = None):
+    def __init__(
+        self,
+        error_code: str,
+        message: str,
+        status_code: int = 400,
+        details: dict | None = None,
+        headers: dict[str, str] | None = None,
+    ):
         self.error_code = error_code
         self.message = message
         self.status_code = status_code
         self.details = details
+        self.headers = headers
         super().__init__(message)
 
 
@@ -0,0 +1,177 @@
+"""Idempotency-Key support for create endpoints.
+
+Kiosk clients retry ``POST /attendance`` and ``POST /employees`` on timeouts.
+With an ``Idempotency-Key`` header the first successful response is stored
+and any retry with the same key is replayed from memory without touching
+the database. A retry that arrives while the original is still running waits
+for it instead of racing it into a duplicate INSERT.
+
+Semantics (following the IETF httpapi Idempotency-Key draft):
+    - Keys are scoped per endpoint
+    - Only successful responses are stored; failures release the key
+    - Reusing a key with a different payload → 422 IDEMPOTENCY_KEY_REUSED
+
+Note: the store is in-process. For multi-instance deployments, back it with
+Redis (same caveat as the rate limiter).
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+from app.config import settings
+from app.services.exceptions import AppException, ValidationException
+
+logger = logging.getLogger(__name__)
+
+MAX_KEY_LENGTH = 255
+
+
+@dataclass
+class StoredResponse:
+    """A replayable response captured from the first successful request."""
+
+    status_code: int
+    body: Any
+    headers: dict[str, str] = field(default_factory=dict)
+    fingerprint: str = ""
+    expires_at: float = 0.0
+
+
+def fingerprint(payload: str | bytes) -> str:
+    """Stable hash of the request payload, used to detect key reuse."""
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class IdempotencyStore:
+    """Bounded (LRU) in-memory store of responses with per-entry TTL."""
+
+    def __init__(self, max_entries: int | None = None, ttl_seconds: int | None = None):
+        self.max_entries = max_entries or settings.IDEMPOTENCY_MAX_ENTRIES
+        self.ttl_seconds = ttl_seconds or settings.IDEMPOTENCY_TTL_SECONDS
+        self._entries: OrderedDict[tuple[str, str], StoredResponse] = OrderedDict()
+        self._inflight: dict[tuple[str, str], tuple[str, asyncio.Future]] = {}
+        self.replayed = 0
+        self.waited = 0
+        self.executed = 0
+
+    def _get(self, scoped_key: tuple[str, str]) -> StoredResponse | None:
+        entry = self._entries.get(scoped_key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            del self._entries[scoped_key]
+            return None
+        self._entries.move_to_end(scoped_key)
+        return entry
+
+    def _put(self, scoped_key: tuple[str, str], entry: StoredResponse) -> None:
+        entry.expires_at = time.monotonic() + self.ttl_seconds
+        self._entries[scoped_key] = entry
+        self._entries.move_to_end(scoped_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    @staticmethod
+    def _check_fingerprint(key: str, expected: str, actual: str) -> None:
+        if expected != actual:
+            raise ValidationException(
+                error_code="IDEMPOTENCY_KEY_REUSED",
+                message="Idempotency-Key was already used with a different request payload",
+                details={"idempotency_key": key},
+            )
+
+    async def run(
+        self,
+        scope: str,
+        key: str,
+        request_fingerprint: str,
+        fn: Callable[[], Awaitable[StoredResponse]],
+    ) -> tuple[StoredResponse, bool]:
+        """Execute ``fn`` at most once per (scope, key).
+
+        Returns (response, replayed). ``fn`` must return a StoredResponse and
+        should only return once its transaction is committed.
+        """
+        if not key or len(key) > MAX_KEY_LENGTH:
+            raise ValidationException(
+                error_code="INVALID_IDEMPOTENCY_KEY",
+                message=f"Idempotency-Key must be 1-{MAX_KEY_LENGTH} characters",
+            )
+
+        scoped_key = (scope, key)
+        while True:
+            entry = self._get(scoped_key)
+            if entry is not None:
+                self._check_fingerprint(key, entry.fingerprint, request_fingerprint)
+                self.replayed += 1
+                return entry, True
+
+            inflight = self._inflight.get(scoped_key)
+            if inflight is None:
+                break
+
+            # Another request with this key is running — wait for its outcome
+            inflight_fingerprint, future = inflight
+            self._check_fingerprint(key, inflight_fingerprint, request_fingerprint)
+            self.waited += 1
+            try:
+                await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+            except AppException as exc:
+                # Rejected (validation, conflict, ...): the key was released,
+                # so this request runs itself and gets its own answer
+                logger.info("Idempotency key %r: original request failed (%s), retrying", key, exc.error_code)
+            except Exception:
+                logger.exception("Idempotency key %r: original request failed, retrying", key)
+            # Loop: replay the stored result, or become the leader if it failed
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[scoped_key] = (request_fingerprint, future)
+        self.executed += 1
+        try:
+            response = await fn()
+            response.fingerprint = request_fingerprint
+            self._put(scoped_key, response)
+            future.set_result(None)
+            return response, False
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved
+            raise
+        finally:
+            self._inflight.pop(scoped_key, None)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "in_flight": len(self._inflight),
+            "executed": self.executed,
+            "replayed": self.replayed,
+            "waited": self.waited,
+        }
+
+
+def as_response(stored: StoredResponse, replayed: bool) -> JSONResponse:
+    """Render a stored response, flagging replays for the client."""
+    headers = dict(stored.headers)
+    if replayed:
+        headers["Idempotent-Replayed"] = "true"
+    return JSONResponse(status_code=stored.status_code, content=stored.body, headers=headers)
+
+
+idempotency_store = IdempotencyStore()
@@ -0,0 +1,215 @@
+"""Job handlers — the work behind each job kind (registered with @job_handler).
+
+    attendance_import   NDJSON upload (saved as ``<id>.input.ndjson``) written
+                        through the bulk ingest path; per-line results in
+                        ``<id>.<attempt>.result.ndjson``
+    attendance_export   CSV of attendance (live + archive) in a date range,
+                        streamed straight to ``<id>.<attempt>.csv`` — closed months
+                        from their snapshot files (app/services/attendance_snapshot.py)
+                        when ATTENDANCE_SNAPSHOT_DIR is set, the rest from the database
+    monthly_report      payroll totals per employee for one month, sharded
+                        across the process pool (app/services/monthly_report.py),
+                        as ``<id>.<attempt>.csv`` or ``.npz``
+
+Every handler writes its output from the start to JobContext.output(), so a
+job requeued after a worker restart simply runs again.
+"""
+
+import asyncio
+import calendar
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Iterable
+from datetime import date, timedelta
+
+from app.config import settings
+from app.models.types import STATUS_NAMES
+from app.repositories.analytics_repo import LOAD_CHUNK_ROWS, AnalyticsRepository
+from app.repositories.archive_repo import ArchiveRepository
+from app.repositories.department_repo import DepartmentRepository
+from app.services import attendance_snapshot
+from app.services.job_runner import JobContext, JobOutcome, job_handler, open_file
+from app.services.monthly_report import REPORT_FORMATS, aggregate, write_report
+from app.services.ndjson_ingest import ingest
+
+CSV_MEDIA_TYPE = "text/csv"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Bytes read from an import file per step
+_READ_CHUNK_BYTES = 256 * 1024
+
+EXPORT_COLUMNS = ("employee_code", "name", "department", "date", "status", "check_in", "check_out", "notes")
+
+
+def _date(value: str | None) -> date | None:
+    return date.fromisoformat(value) if value else None
+
+
+async def _department_id(ctx: JobContext, name: str | None) -> tuple[bool, int | None]:
+    """(known, id) — an unknown department name matches nothing, as in analytics."""
+    if not name:
+        return True, None
+    async with ctx.session_factory() as session:
+        department_id = await DepartmentRepository(session).resolve_id(name)
+    return department_id is not None, department_id
+
+
+async def _read_chunks(path) -> AsyncIterator[bytes]:
+    async with open_file(path, "rb") as file:
+        while chunk := await asyncio.to_thread(file.read, _READ_CHUNK_BYTES):
+            yield chunk
+
+
+def _csv_chunk(rows: Iterable[Iterable]) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+@job_handler("attendance_import")
+async def attendance_import(ctx: JobContext) -> JobOutcome:
+    output = ctx.output(".result.ndjson")
+    summary = None
+    lines = 0
+    async with ctx.session_factory() as session:
+        async with open_file(output, "wb") as out:
+            async for line in ingest(session, _read_chunks(ctx.path(".input.ndjson"))):
+                if line.startswith(b'{"summary"'):
+                    summary = json.loads(line)["summary"]
+                else:
+                    lines += 1
+                    if lines % settings.ATTENDANCE_NDJSON_BATCH_SIZE == 0:
+                        await ctx.progress(lines)
+                await asyncio.to_thread(out.write, line)
+    await ctx.progress(lines)
+    return JobOutcome(result=summary, result_file=output, media_type=NDJSON_MEDIA_TYPE)
+
+
+async def _snapshots(session, date_from: date | None, date_to: date | None) -> list:
+    """Mapped snapshot months overlapping [date_from, date_to] (a contiguous run)."""
+    if not (settings.ATTENDANCE_SNAPSHOT_DIR and attendance_snapshot.available()):
+        return []
+    through = await ArchiveRepository(session).archived_through()
+    snapshots = await asyncio.to_thread(attendance_snapshot.open_snapshots, settings.ATTENDANCE_SNAPSHOT_DIR, through)
+    return [
+        snapshot for snapshot in snapshots
+        if (date_from is None or snapshot.last_day >= date_from) and (date_to is None or snapshot.first_day <= date_to)
+    ]
+
+
+async def _export_rows(
+    session,
+    *,
+    date_from: date | None,
+    date_to: date | None,
+    department_id: int | None,
+    employee_id: str | None,
+) -> AsyncIterator[list]:
+    """Chunks of export rows ordered by (date, employee_code), as export_attendance yields them.
+
+    Months with a snapshot file are read from its mapping; only the range
+    before and after that run of months goes to the database. Snapshots do
+    not store notes, so those come from a narrow archive query per month.
+    """
+    analytics = AnalyticsRepository(session)
+
+    def database(range_from: date | None, range_to: date | None) -> AsyncIterator:
+        return analytics.export_attendance(
+            date_from=range_from, date_to=range_to, department_id=department_id, employee_id=employee_id,
+        )
+
+    snapshots = await _snapshots(session, date_from, date_to)
+    if not snapshots:
+        async for chunk in database(date_from, date_to):
+            yield chunk
+        return
+
+    first, last = snapshots[0].first_day, snapshots[-1].last_day
+    if date_from is None or date_from < first:
+        async for chunk in database(date_from, first - timedelta(days=1)):
+            yield chunk
+
+    employees = {
+        row.id: (row.employee_code, row.name, row.department_id)
+        for row in await analytics.employees(department_id=department_id, include_inactive=True)
+        if employee_id is None or row.id == employee_id
+    }
+    order = {key: rank for rank, key in enumerate(sorted(employees, key=lambda key: employees[key][0]))}
+    for snapshot in snapshots:
+        day_from = max(snapshot.first_day, date_from or snapshot.first_day)
+        day_to = min(snapshot.last_day, date_to or snapshot.last_day)
+        notes = await analytics.archived_notes(day_from, day_to)
+        chunk = []
+        for key, day, status, check_in, check_out in snapshot.ordered_rows(day_from, day_to, order):
+            chunk.append((*employees[key], day, status, check_in, check_out, notes.get((key, day))))
+            if len(chunk) == LOAD_CHUNK_ROWS:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    if date_to is None or date_to > last:
+        async for chunk in database(last + timedelta(days=1), date_to):
+            yield chunk
+
+
+@job_handler("attendance_export")
+async def attendance_export(ctx: JobContext) -> JobOutcome:
+    params = ctx.params
+    output = ctx.output(".csv")
+    known, department_id = await _department_id(ctx, params.get("department"))
+    rows = 0
+    async with open_file(output, "w", newline="", encoding="utf-8") as out:
+        await asyncio.to_thread(out.write, _csv_chunk([EXPORT_COLUMNS]))
+        if known:
+            async with ctx.session_factory() as session:
+                departments = await DepartmentRepository(session).names_by_id()
+                chunks = _export_rows(
+                    session,
+                    date_from=_date(params.get("date_from")),
+                    date_to=_date(params.get("date_to")),
+                    department_id=department_id,
+                    employee_id=params.get("employee_id"),
+                )
+                async for chunk in chunks:
+                    text = _csv_chunk(
+                        (code, name, departments.get(dept_id), day, STATUS_NAMES[status], check_in, check_out, notes)
+                        for code, name, dept_id, day, status, check_in, check_out, notes in chunk
+                    )
+                    await asyncio.to_thread(out.write, text)
+                    rows += len(chunk)
+                    await ctx.progress(rows)
+    return JobOutcome(result={"rows": rows}, result_file=output, media_type=CSV_MEDIA_TYPE)
+
+
+@job_handler("monthly_report")
+async def monthly_report(ctx: JobContext) -> JobOutcome:
+    params = ctx.params
+    year, month = params["year"], params["month"]
+    fmt = params.get("format", "csv")
+    first = date(year, month, 1)
+    last = date(year, month, calendar.monthrange(year, month)[1])
+    output = ctx.output(f".{fmt}")
+    known, department_id = await _department_id(ctx, params.get("department"))
+
+    employees, facts, departments = [], [], {}
+    if known:
+        async with ctx.session_factory() as session:
+            analytics = AnalyticsRepository(session)
+            employees = await analytics.employees(
+                department_id=department_id, include_inactive=params.get("include_inactive", False)
+            )
+            facts = await analytics.month_facts(first=first, last=last, department_id=department_id)
+            departments = await DepartmentRepository(session).names_by_id()
+    # One shard per pool process; each employee's records stay in one shard
+    totals = await aggregate(facts, max(1, ctx.runner.process_workers), ctx.run_cpu)
+
+    employees = sorted(employees, key=lambda row: row.employee_code)
+    await asyncio.to_thread(write_report, output, fmt, employees, departments, totals)
+    await ctx.progress(len(employees))
+    return JobOutcome(
+        result={"employees": len(employees), "records": len(facts)},
+        result_file=output,
+        media_type=REPORT_FORMATS[fmt],
+    )
@@ -0,0 +1,362 @@
+"""Background job runner — imports, exports and reports outside the request cycle.
+
+A job is submitted as a row in the ``job`` table (JobService.submit) and
+polled at ``GET /jobs/{id}``. Its output is a file downloaded from
+``GET /jobs/{id}/result``. Each process runs a JobRunner:
+
+    - JOB_WORKERS asyncio workers claim queued jobs with a conditional UPDATE
+      (oldest first) and run the handler registered for the job's kind
+      (@job_handler, app/services/job_handlers.py). Handlers do their I/O on
+      the event loop and send CPU-bound steps to a process pool
+      (JobContext.run_cpu, JOB_PROCESS_WORKERS processes)
+    - a maintenance task refreshes the heartbeat of running jobs every
+      JOB_POLL_SECONDS, cancels jobs flagged by ``POST /jobs/{id}/cancel``,
+      requeues jobs whose runner died (no heartbeat for JOB_STALE_SECONDS,
+      at most JOB_MAX_ATTEMPTS runs) and deletes finished jobs and their
+      files after JOB_RETENTION_HOURS
+    - on shutdown, jobs still running are put back in the queue
+
+Handlers must therefore be safe to re-run from the start: imports upsert,
+and exports and reports rewrite their output file.
+
+A runner that stalls past JOB_STALE_SECONDS can find its job requeued and
+claimed by another while it is still working. Every state write is
+therefore tied to the claiming run (worker id + attempt number): a run
+whose heartbeat no longer matches is cancelled locally, and its progress
+and outcome are dropped. Outputs are written to a per-run
+``<id>.<attempt><suffix>.part`` file (JobContext.output) and renamed
+only when the run succeeds, so two runs never write the same file and a
+download never sees a partial one.
+
+Note: result files live under JOB_RESULT_DIR. With several instances, point
+it at shared storage, or the download must hit the instance that ran the job.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import socket
+import tempfile
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from pathlib import Path
+from typing import IO, Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.database import async_session_factory
+from app.models.job import Job
+from app.repositories.job_repo import JobRepository
+from app.services.exceptions import AppException
+
+logger = logging.getLogger(__name__)
+
+# Retention sweeps are cheap but need not run on every maintenance tick
+_PURGE_INTERVAL_SECONDS = 15 * 60
+
+
+@dataclass
+class JobOutcome:
+    """What a handler produced: a small summary and optionally an output file."""
+
+    result: dict[str, Any] | None = None
+    result_file: Path | None = None
+    media_type: str | None = None
+
+
+JobHandler = Callable[["JobContext"], Awaitable[JobOutcome]]
+_handlers: dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """Register the coroutine that runs jobs of ``kind``."""
+
+    def register(fn: JobHandler) -> JobHandler:
+        _handlers[kind] = fn
+        return fn
+
+    return register
+
+
+def result_dir() -> Path:
+    path = Path(settings.JOB_RESULT_DIR or Path(tempfile.gettempdir()) / "hrms-jobs")
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def job_files(job_id: str) -> list[Path]:
+    """Every input / output file of a job (all are named ``<job id>.*``)."""
+    return list(result_dir().glob(f"{job_id}.*"))
+
+
+@asynccontextmanager
+async def open_file(path, mode: str = "rb", **kwargs) -> AsyncIterator[IO]:
+    """``open()`` a job file from a worker thread and close it there too.
+
+    Opening and closing block (closing flushes the buffer), which on shared
+    storage can take as long as a write. Reads and writes in between go
+    through ``asyncio.to_thread(file.write, ...)`` as usual.
+    """
+    file = await asyncio.to_thread(open, path, mode, **kwargs)
+    try:
+        yield file
+    finally:
+        await asyncio.to_thread(file.close)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class JobContext:
+    """What a handler gets: its parameters, sessions, files, progress and the process pool."""
+
+    def __init__(self, runner: "JobRunner", job: Job):
+        self.runner = runner
+        self.job_id = job.id
+        self.params = dict(job.params)
+        self.attempt = job.attempts
+        self.outputs: list[Path] = []
+
+    @property
+    def session_factory(self) -> async_sessionmaker[AsyncSession]:
+        return self.runner.session_factory
+
+    def path(self, suffix: str) -> Path:
+        """File for this job under JOB_RESULT_DIR, e.g. path(".input.ndjson")."""
+        return result_dir() / f"{self.job_id}{suffix}"
+
+    def output(self, suffix: str) -> Path:
+        """Scratch file for this run's output, e.g. output(".csv").
+
+        Return it as JobOutcome.result_file: the runner renames it to its
+        final name only if the run succeeds and still owns the job.
+        """
+        path = result_dir() / f"{self.job_id}.{self.attempt}{suffix}.part"
+        self.outputs.append(path)
+        return path
+
+    async def progress(self, done: int) -> None:
+        async with self.session_factory() as session:
+            await JobRepository(session).set_progress(self.job_id, self.runner.worker_id, self.attempt, done)
+            await session.commit()
+
+    async def run_cpu(self, fn: Callable[..., Any], *args: Any) -> Any:
+        return await self.runner.run_cpu(fn, *args)
+
+
+class JobRunner:
+    """Bounded asyncio workers + process pool over the persisted job queue."""
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        process_workers: int | None = None,
+        poll_seconds: float | None = None,
+    ):
+        self.workers = workers or settings.JOB_WORKERS
+        self.process_workers = settings.JOB_PROCESS_WORKERS if process_workers is None else process_workers
+        self.poll_seconds = poll_seconds or settings.JOB_POLL_SECONDS
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"[:100]
+        self.session_factory: async_sessionmaker[AsyncSession] = async_session_factory
+        self._tasks: list[asyncio.Task] = []
+        self._running: dict[tuple[str, int], asyncio.Task] = {}  # (job id, attempt) → task running its handler
+        self._cancelled: set[tuple[str, int]] = set()  # runs cancelled through the API
+        self._lost: set[tuple[str, int]] = set()  # runs whose job was taken over by another runner
+        self._wake = asyncio.Event()
+        self._pool: ProcessPoolExecutor | None = None
+        self._last_purge = 0.0
+        self.stats_counters = {"succeeded": 0, "failed": 0, "cancelled": 0, "recovered": 0, "abandoned": 0}
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    def start(self, session_factory: async_sessionmaker[AsyncSession] = async_session_factory) -> None:
+        if self._tasks:
+            return
+        self.session_factory = session_factory
+        self._wake = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._worker(), name=f"job-worker-{i}") for i in range(self.workers)]
+        self._tasks.append(asyncio.create_task(self._maintenance(), name="job-maintenance"))
+        logger.info("Job runner %s started (%d workers, %d processes)", self.worker_id, self.workers, self.process_workers)
+
+    async def stop(self) -> None:
+        """Stop the workers; jobs they were running go back to the queue."""
+        if not self._tasks:
+            return
+        interrupted = dict(self._running)  # (job id, attempt) keys
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if interrupted:
+            async with self.session_factory() as session:
+                await JobRepository(session).requeue(dict(interrupted.keys()), self.worker_id)
+                await session.commit()
+            logger.info("Requeued %d interrupted jobs", len(interrupted))
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def wake(self) -> None:
+        """A job was queued — let an idle worker look now instead of at the next poll."""
+        self._wake.set()
+
+    def cancel_local(self, job_id: str) -> None:
+        """Interrupt the job if this runner is executing it (others notice via heartbeat)."""
+        for run, task in list(self._running.items()):
+            if run[0] == job_id:
+                self._cancelled.add(run)
+                task.cancel()
+
+    def _abandon(self, job_id: str) -> None:
+        """Stop running a job that another runner has taken over."""
+        for run, task in list(self._running.items()):
+            if run[0] == job_id:
+                self._lost.add(run)
+                task.cancel()
+
+    async def run_cpu(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn(*args)`` in the process pool (a thread when JOB_PROCESS_WORKERS=0)."""
+        if self.process_workers == 0:
+            return await asyncio.to_thread(fn, *args)
+        if self._pool is None:
+            # spawn: forking a process that holds event-loop and driver threads is unsafe
+            self._pool = ProcessPoolExecutor(self.process_workers, mp_context=multiprocessing.get_context("spawn"))
+        return await asyncio.get_running_loop().run_in_executor(self._pool, partial(fn, *args))
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._claim_next()
+            if job is not None:
+                await self._execute(job)
+                continue
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def _claim_next(self) -> Job | None:
+        async with self.session_factory() as session:
+            repo = JobRepository(session)
+            while (job_id := await repo.next_queued()) is not None:
+                claimed = await repo.claim(job_id, self.worker_id, _now())
+                await session.commit()
+                if claimed:
+                    return await repo.get_by_id(job_id)
+        return None
+
+    async def _execute(self, job: Job) -> None:
+        handler = _handlers.get(job.kind)
+        if handler is None:
+            await self._finish(job, "failed", error={"error_code": "UNKNOWN_JOB_KIND", "message": job.kind})
+            return
+
+        run = (job.id, job.attempts)
+        ctx = JobContext(self, job)
+        task = asyncio.create_task(handler(ctx), name=f"job-{job.id}")
+        self._running[run] = task
+        try:
+            outcome = await task
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                raise  # the runner is stopping; stop() requeues the job
+            if run in self._lost:
+                self.stats_counters["abandoned"] += 1
+                logger.warning("Job %s (%s) attempt %d abandoned: taken over by another runner",
+                               job.id, job.kind, job.attempts)
+            elif run in self._cancelled:
+                await self._finish(job, "cancelled")
+            else:
+                raise
+        except AppException as exc:
+            await self._finish(job, "failed", error={"error_code": exc.error_code, "message": exc.message})
+        except Exception:
+            logger.exception("Job %s (%s) failed", job.id, job.kind)
+            await self._finish(
+                job, "failed", error={"error_code": "INTERNAL_ERROR", "message": "The job failed unexpectedly"}
+            )
+        else:
+            result_file = outcome.result_file
+            if result_file is not None and result_file.suffix == ".part":
+                # Per-run name, so the rename never replaces another run's file
+                result_file = result_file.rename(result_file.with_suffix(""))
+            finished = await self._finish(
+                job,
+                "succeeded",
+                result=outcome.result,
+                result_file=result_file.name if result_file else None,
+                result_media_type=outcome.media_type,
+            )
+            if not finished and result_file is not None:
+                result_file.unlink(missing_ok=True)
+        finally:
+            self._running.pop(run, None)
+            self._cancelled.discard(run)
+            self._lost.discard(run)
+            for path in ctx.outputs:
+                path.unlink(missing_ok=True)  # leftovers of a run that did not succeed
+
+    async def _finish(self, job: Job, status: str, **values) -> bool:
+        """Record the outcome; False (and nothing recorded) if this run lost the job."""
+        async with self.session_factory() as session:
+            finished = await JobRepository(session).finish(job.id, self.worker_id, job.attempts, status, _now(), **values)
+            await session.commit()
+        if not finished:
+            logger.warning("Job %s (%s) attempt %d outcome %s discarded: no longer owned",
+                           job.id, job.kind, job.attempts, status)
+            return False
+        self.stats_counters[status] += 1
+        logger.info("Job %s (%s) %s", job.id, job.kind, status)
+        return True
+
+    async def _maintenance(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_seconds)
+            try:
+                await self._tick()
+            except Exception:
+                logger.exception("Job maintenance failed")
+
+    async def _tick(self) -> None:
+        now = _now()
+        async with self.session_factory() as session:
+            repo = JobRepository(session)
+            lost, cancel = await repo.heartbeat(dict(self._running.keys()), self.worker_id, now)
+            for job_id in lost:
+                logger.warning("Job %s was requeued while running here; stopping it", job_id)
+                self._abandon(job_id)
+            for job_id in cancel:
+                self.cancel_local(job_id)
+            recovered = await repo.recover_stale(
+                now - timedelta(seconds=settings.JOB_STALE_SECONDS), settings.JOB_MAX_ATTEMPTS, now
+            )
+            await session.commit()
+            if recovered:
+                self.stats_counters["recovered"] += recovered
+                logger.warning("Requeued %d jobs abandoned by their runner", recovered)
+                self.wake()
+
+            if time.monotonic() - self._last_purge >= _PURGE_INTERVAL_SECONDS:
+                self._last_purge = time.monotonic()
+                expired = await repo.finished_before(now - timedelta(hours=settings.JOB_RETENTION_HOURS))
+                for job in expired:
+                    for path in job_files(job.id):
+                        path.unlink(missing_ok=True)
+                await repo.delete([job.id for job in expired])
+                await session.commit()
+
+    def stats(self) -> dict[str, int]:
+        return {"running": len(self._running), **self.stats_counters}
+
+
+job_runner = JobRunner()
@@ -0,0 +1,87 @@
+"""Job service — submitting, polling, cancelling and downloading background jobs."""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.job import FINISHED_STATUSES, Job
+from app.models.types import new_id
+from app.repositories.job_repo import JobRepository
+from app.services import job_handlers  # noqa: F401 — registers the job kinds
+from app.services.exceptions import AppException, ConflictException, NotFoundException
+from app.services.job_runner import job_runner, open_file, result_dir
+
+logger = logging.getLogger(__name__)
+
+
+class JobService:
+    """Jobs are committed before the runner is woken, so any instance can claim them."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.repo = JobRepository(db)
+
+    async def submit(self, kind: str, params: dict, job_id: str | None = None) -> Job:
+        job = await self.repo.create(kind, params, job_id=job_id)
+        await self.db.commit()
+        job_runner.wake()
+        logger.info("Job %s (%s) queued", job.id, kind)
+        return job
+
+    async def submit_import(self, chunks: AsyncIterator[bytes]) -> Job:
+        """Save an NDJSON upload (at most JOB_IMPORT_MAX_BYTES) and queue its import."""
+        job_id = new_id()
+        path = result_dir() / f"{job_id}.input.ndjson"
+        size = 0
+        try:
+            async with open_file(path, "wb") as file:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if size > settings.JOB_IMPORT_MAX_BYTES:
+                        raise AppException(
+                            error_code="PAYLOAD_TOO_LARGE",
+                            message=f"Imports may be at most {settings.JOB_IMPORT_MAX_BYTES} bytes",
+                            status_code=413,
+                        )
+                    await asyncio.to_thread(file.write, chunk)
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+        return await self.submit("attendance_import", {"bytes": size}, job_id=job_id)
+
+    async def get_job(self, job_id: str) -> Job:
+        job = await self.repo.get_by_id(job_id)
+        if job is None:
+            raise NotFoundException(error_code="JOB_NOT_FOUND", message=f"Job '{job_id}' not found")
+        return job
+
+    async def cancel_job(self, job_id: str) -> Job:
+        """Queued jobs are cancelled at once; running ones stop at their next await."""
+        job = await self.get_job(job_id)
+        if job.status in FINISHED_STATUSES:
+            raise ConflictException(
+                error_code="JOB_FINISHED", message=f"Job '{job_id}' has already {job.status}"
+            )
+        await self.repo.cancel(job_id, datetime.now(timezone.utc))
+        await self.db.commit()
+        job_runner.cancel_local(job_id)
+        return await self.get_job(job_id)
+
+    async def result_file(self, job_id: str) -> tuple[Path, str | None]:
+        """(path, media type) of a succeeded job's output."""
+        job = await self.get_job(job_id)
+        if job.status != "succeeded" or not job.result_file:
+            raise ConflictException(
+                error_code="JOB_NOT_FINISHED",
+                message=f"Job '{job_id}' has no result ({job.status})",
+                details={"status": job.status},
+            )
+        path = result_dir() / job.result_file
+        if not path.is_file():
+            raise NotFoundException(error_code="JOB_RESULT_EXPIRED", message=f"The result of job '{job_id}' is gone")
+        return path, job.result_media_type
@@ -0,0 +1,30 @@
+"""Multi-value list filters — ``?status=A&status=B``, or ``?status=A,B`` for ids and enums."""
+
+from collections.abc import Iterable
+
+from app.config import settings
+from app.services.exceptions import ValidationException
+
+
+def split_values(name: str, values: Iterable[str] | None, *, commas: bool = True) -> tuple[str, ...] | None:
+    """The distinct non-empty values of a repeated (and, with ``commas``, comma-separated) filter.
+
+    Free-text names such as departments may contain commas, so they pass
+    ``commas=False`` and take several values only as repeated parameters.
+    Sorted, so equivalent requests share one single-flight key and ETag.
+    None when nothing was given (no filter); 422 past LIST_FILTER_MAX_VALUES.
+    """
+    if not values:
+        return None
+    if commas:
+        parts = {part.strip() for value in values for part in value.split(",")}
+    else:
+        parts = {value.strip() for value in values}
+    parts.discard("")
+    if len(parts) > settings.LIST_FILTER_MAX_VALUES:
+        raise ValidationException(
+            error_code="TOO_MANY_FILTER_VALUES",
+            message=f"At most {settings.LIST_FILTER_MAX_VALUES} values per filter",
+            details={"filter": name, "count": len(parts)},
+        )
+    return tuple(sorted(parts)) or None
@@ -0,0 +1,140 @@
+"""Monthly payroll attendance report — per-employee totals aggregated in parallel.
+
+The ``monthly_report`` job (app/services/job_handlers.py) reads the month's
+(employee_id, status code, worked seconds) in one narrow query ordered by
+employee, and splits it into contiguous shards that never split an
+employee. Each shard travels to the job process pool as three flat
+columns (compact to pickle) and is reduced there by summarize_shard.
+The parent only merges the per-shard dicts and writes the file, so the
+aggregation scales with JOB_PROCESS_WORKERS
+(benchmark: python -m scripts.bench_monthly_report).
+
+Output formats:
+    csv   one row per employee, REPORT_COLUMNS
+    npz   the same columns as NumPy arrays (numpy.load / pandas), needs numpy
+"""
+
+import asyncio
+import csv
+from collections.abc import Awaitable, Callable, Sequence
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
+
+from app.models.types import STATUS_CODES
+
+try:  # Optional dependency — only the npz output needs it
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on environment
+    np = None
+
+REPORT_COLUMNS = (
+    "employee_code", "name", "department", "present", "half_day", "on_leave", "absent", "worked_hours",
+)
+REPORT_FORMATS = {"csv": "text/csv", "npz": "application/octet-stream"}
+
+# Positions in a totals row: one count per status code (1..4), then worked seconds
+_WORKED = len(STATUS_CODES)
+_COUNT_ORDER = [STATUS_CODES[name] - 1 for name in ("PRESENT", "HALF_DAY", "ON_LEAVE", "ABSENT")]
+
+Shard = tuple[Sequence[str], Sequence[int], Sequence[int | None]]
+
+
+def format_available(fmt: str) -> bool:
+    return fmt == "csv" or (fmt == "npz" and np is not None)
+
+
+def summarize_shard(employee_ids: Sequence[str], statuses: Sequence[int], worked: Sequence[int | None]) -> dict:
+    """employee_id → [PRESENT, ABSENT, HALF_DAY, ON_LEAVE counts, worked seconds].
+
+    Pure and top-level so it can run in the job process pool.
+    """
+    totals: dict[str, list[int]] = {}
+    row = None
+    current = None
+    for employee_id, status, seconds in zip(employee_ids, statuses, worked):
+        if employee_id != current:  # input is grouped by employee
+            current = employee_id
+            row = totals.get(employee_id)
+            if row is None:
+                row = totals[employee_id] = [0] * (_WORKED + 1)
+        row[status - 1] += 1
+        if seconds:
+            row[_WORKED] += seconds
+    return totals
+
+
+def split_shards(facts: Sequence[Sequence], shards: int) -> list[Shard]:
+    """Cut facts ordered by employee into ≤ ``shards`` columnar slices of similar size.
+
+    A cut is moved forward to the next change of employee, so every
+    employee's records land in exactly one shard.
+    """
+    if not facts:
+        return []
+    bounds = [0]
+    for k in range(1, shards):
+        cut = max(len(facts) * k // shards, bounds[-1])
+        while 0 < cut < len(facts) and facts[cut][0] == facts[cut - 1][0]:
+            cut += 1
+        if cut < len(facts) and cut > bounds[-1]:
+            bounds.append(cut)
+    bounds.append(len(facts))
+    # map(itemgetter) is several times faster than zip(*rows) at this size, and this part is serial
+    return [
+        tuple(list(map(itemgetter(column), facts[lo:hi])) for column in range(3))
+        for lo, hi in zip(bounds, bounds[1:])
+    ]
+
+
+async def aggregate(
+    facts: Sequence[Sequence],
+    shards: int,
+    run: Callable[..., Awaitable[Any]],
+) -> dict[str, list[int]]:
+    """Totals per employee: summarize_shard over every shard, concurrently via ``run``."""
+    results = await asyncio.gather(*(run(summarize_shard, *shard) for shard in split_shards(facts, shards)))
+    totals: dict[str, list[int]] = {}
+    for result in results:
+        totals.update(result)
+    return totals
+
+
+def _report_rows(employees: Sequence, departments: dict[int, str], totals: dict[str, list[int]]):
+    empty = [0] * (_WORKED + 1)
+    for employee_id, code, name, department_id in employees:
+        counts = totals.get(employee_id, empty)
+        yield (
+            code,
+            name,
+            departments.get(department_id),
+            *(counts[i] for i in _COUNT_ORDER),
+            round(counts[_WORKED] / 3600, 2),
+        )
+
+
+def write_report(
+    path: Path,
+    fmt: str,
+    employees: Sequence,
+    departments: dict[int, str],
+    totals: dict[str, list[int]],
+) -> None:
+    """Write the report for ``employees`` (id, employee_code, name, department_id), in that order."""
+    rows = _report_rows(employees, departments, totals)
+    if fmt == "npz":
+        columns = list(zip(*rows)) or [()] * len(REPORT_COLUMNS)
+        with open(path, "wb") as out:  # a file object: savez would append ".npz" to a path
+            np.savez_compressed(
+                out,
+                employee_code=np.array(columns[0], dtype=str),
+                name=np.array(columns[1], dtype=str),
+                department=np.array([d or "" for d in columns[2]], dtype=str),
+                **{key: np.array(columns[i], dtype=np.int32) for i, key in enumerate(REPORT_COLUMNS[3:7], start=3)},
+                worked_hours=np.array(columns[7], dtype=np.float64),
+            )
+        return
+    with open(path, "w", newline="", encoding="utf-8") as out:
+        writer = csv.writer(out)
+        writer.writerow(REPORT_COLUMNS)
+        writer.writerows(rows)
@@ -0,0 +1,156 @@
+"""NDJSON bulk attendance ingest — bounded memory, results streamed back per line.
+
+``POST /attendance/bulk`` takes ``application/x-ndjson``: one AttendanceCreate
+object per line. The body is consumed from the request stream as it
+arrives:
+    - each line is validated on its own (a bad line is reported, not fatal)
+    - every ATTENDANCE_NDJSON_BATCH_SIZE lines the valid records are written
+      with one multi-row upsert (AttendanceService.upsert_attendance_batch)
+      and committed
+    - that batch's results are streamed back as NDJSON before more of the
+      upload is read
+
+Memory is therefore bounded by one batch plus one line, whatever the upload
+size. The last response line is ``{"summary": {...}}`` (AttendanceIngestSummary).
+"""
+
+import json
+import logging
+from collections.abc import AsyncIterator
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from app.config import settings
+from app.schemas.attendance import AttendanceCreate, AttendanceIngestLine, AttendanceIngestSummary
+from app.schemas.common import ErrorResponse
+from app.services.attendance_service import AttendanceService
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson")
+
+
+async def split_lines(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[tuple[int, bytes | None]]:
+    """(line number, line) for each non-blank line of a chunked byte stream.
+
+    Line numbers are 1-based and count blank lines. A line longer than
+    ``max_line_bytes`` is yielded once as None; the rest of it is skipped
+    without being buffered.
+    """
+    buffer = bytearray()
+    number = 0
+    skipping = False
+    async for chunk in chunks:
+        buffer += chunk
+        while (end := buffer.find(b"\n")) >= 0:
+            number += 1
+            line = bytes(buffer[:end])
+            del buffer[: end + 1]
+            if skipping:
+                skipping = False
+            elif len(line) > max_line_bytes:
+                yield number, None
+            elif line.strip():
+                yield number, line
+        if len(buffer) > max_line_bytes and not skipping:
+            yield number + 1, None
+            skipping = True
+        if skipping:
+            buffer.clear()
+    if buffer.strip() and not skipping:
+        yield number + 1, bytes(buffer)
+
+
+def _parse(line: bytes | None) -> AttendanceCreate | ErrorResponse:
+    if line is None:
+        return ErrorResponse(
+            error_code="LINE_TOO_LONG",
+            message=f"Lines may be at most {settings.ATTENDANCE_NDJSON_MAX_LINE_BYTES} bytes",
+        )
+    try:
+        return AttendanceCreate.model_validate_json(line)
+    except ValidationError as exc:
+        # Same shape as the 422 body of a single POST /attendance
+        errors = [
+            {"field": " → ".join(str(loc) for loc in error["loc"]) or "line", "message": error["msg"]}
+            for error in exc.errors()
+        ]
+        return ErrorResponse(
+            error_code="VALIDATION_ERROR", message="Request validation failed", details={"errors": errors}
+        )
+
+
+def _dump(model) -> bytes:
+    return model.model_dump_json(exclude_none=True).encode() + b"\n"
+
+
+async def ingest(db: AsyncSession, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Validate, write and report an NDJSON upload batch by batch; yields response lines."""
+    service = AttendanceService(db)
+    batch_size = min(settings.ATTENDANCE_NDJSON_BATCH_SIZE, settings.ATTENDANCE_UPSERT_MAX_BATCH)
+    summary = AttendanceIngestSummary(lines=0, created=0, updated=0, failed=0, complete=True)
+    # (line number, record or parse error) in upload order, until the next write
+    pending: list[tuple[int, AttendanceCreate | ErrorResponse]] = []
+
+    async def flush() -> AsyncIterator[bytes]:
+        records = [item for _, item in pending if isinstance(item, AttendanceCreate)]
+        results = iter([])
+        if records:
+            try:
+                response = await service.upsert_attendance_batch(records)
+                await db.commit()
+            except Exception:
+                logger.exception("NDJSON ingest batch of %d records failed", len(records))
+                await db.rollback()
+                summary.complete = False
+                failure = ErrorResponse(error_code="INGEST_WRITE_FAILED", message="The batch could not be written")
+                pending[:] = [(number, failure) for number, _ in pending]
+            else:
+                results = iter(response.results)
+
+        for number, item in pending:
+            summary.lines += 1
+            if isinstance(item, ErrorResponse):
+                summary.failed += 1
+                yield _dump(AttendanceIngestLine(line=number, result="error", error=item))
+                continue
+            result = next(results)
+            if result.result == "created":
+                summary.created += 1
+            elif result.result == "updated":
+                summary.updated += 1
+            else:
+                summary.failed += 1
+            yield _dump(AttendanceIngestLine(line=number, result=result.result, id=result.id, error=result.error))
+        pending.clear()
+
+    async for number, line in split_lines(chunks, settings.ATTENDANCE_NDJSON_MAX_LINE_BYTES):
+        pending.append((number, _parse(line)))
+        if len(pending) >= batch_size:
+            async for out in flush():
+                yield out
+            if not summary.complete:
+                break
+    else:
+        async for out in flush():
+            yield out
+
+    yield json.dumps({"summary": summary.model_dump()}).encode() + b"\n"
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """A StreamingResponse whose body generator is still reading the request.
+
+    Starlette's StreamingResponse listens for client disconnects by calling
+    ``receive()`` concurrently, which would swallow request body messages.
+    Here the generator is the only reader; a disconnect surfaces from
+    ``request.stream()`` as ClientDisconnect.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
@@ -0,0 +1,104 @@
+"""Single-flight coalescing for identical concurrent reads.
+
+At the 9:00 peak many managers load the same dashboard summary and the same
+first attendance page within the same second. Instead of each request running
+its own queries, the first caller for a given key (the *leader*) executes the
+query and every concurrent caller with the same key (a *follower*) awaits the
+leader's result.
+
+Only in-flight work is shared — nothing is cached once the leader finishes,
+so there is no staleness beyond the duration of a single query.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Collapse concurrent calls that share a key into one execution.
+
+    Counters:
+        - calls:      total calls made through this group
+        - executions: calls that actually ran the underlying function
+        - collapsed:  calls served from another caller's in-flight execution
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+        self.calls = 0
+        self.executions = 0
+        self.collapsed = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` once per key among concurrent callers and share the result."""
+        self.calls += 1
+
+        future = self._inflight.get(key)
+        if future is not None:
+            try:
+                # shield: a follower being cancelled must not cancel the leader
+                result = await asyncio.shield(future)
+                self.collapsed += 1
+                return result
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise  # this follower itself was cancelled
+                # Leader was cancelled (e.g. client disconnect) — run our own query
+                logger.debug("single-flight leader cancelled, re-executing", extra={"group": self.name})
+                return await self.do(key, fn)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.executions += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark retrieved so an exception with no followers is not logged
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "collapsed": self.collapsed,
+            "in_flight": len(self._inflight),
+        }
+
+
+# Process-wide groups, one per coalesced read path
+_groups: dict[str, SingleFlight] = {}
+
+
+def get_group(name: str) -> SingleFlight:
+    """Return (creating on first use) the named single-flight group."""
+    group = _groups.get(name)
+    if group is None:
+        group = _groups[name] = SingleFlight(name)
+    return group
+
+
+def make_key(**kwargs: Any) -> tuple:
+    """Normalize keyword arguments into a hashable, order-independent key."""
+    return tuple(sorted(kwargs.items()))
+
+
+def coalescing_stats() -> dict[str, dict[str, Any]]:
+    """Counters for every group, exposed on the metrics endpoint."""
+    return {name: group.stats() for name, group in sorted(_groups.items())}
@@ -0,0 +1,20 @@
+"""Working-day calendar — weekends plus configured holidays are non-working days.
+
+Configured through settings:
+    WEEKEND_DAYS   weekday numbers (Monday = 0) that are never working days
+    HOLIDAYS       individual non-working dates, e.g. HOLIDAYS='["2025-12-25"]'
+"""
+
+from datetime import date, timedelta
+
+from app.config import settings
+
+
+def is_working_day(day: date) -> bool:
+    return day.weekday() not in settings.WEEKEND_DAYS and day not in settings.HOLIDAYS
+
+
+def working_days(date_from: date, date_to: date) -> list[date]:
+    """Working days in [date_from, date_to], ascending."""
+    days = (date_from + timedelta(days=offset) for offset in range((date_to - date_from).days + 1))
+    return [day for day in days if is_working_day(day)]
@@ -0,0 +1,61 @@
+-- ============================================================
+-- Migration 001 — UUID keys: CHAR(36) → BINARY(16)
+--
+-- Requires MySQL 8.0+ (UUID_TO_BIN). Apply on top of schema.sql, then
+-- deploy the app with DB_UUID_BINARY=true. Existing uuid4 ids convert
+-- losslessly; new rows get time-ordered UUIDv7 ids from the app.
+--
+-- UUID_TO_BIN(x) is used WITHOUT the swap flag: UUIDv7 already puts the
+-- timestamp first, and swapping would break that ordering.
+--
+-- Each key shrinks from 36 bytes (CHAR(36) ascii; up to 144 in utf8mb4
+-- sort buffers) to 16 bytes in the PK, in every secondary index (InnoDB
+-- appends the PK) and in the attendance → employee FK.
+--
+-- On large tables run the ALTERs through gh-ost / pt-online-schema-change.
+-- ============================================================
+
+-- 1. Detach everything that references the old key columns
+ALTER TABLE attendance DROP FOREIGN KEY fk_attendance_employee;
+ALTER TABLE attendance DROP INDEX uq_attendance_emp_date;
+DROP INDEX idx_attendance_employee_id   ON attendance;
+DROP INDEX idx_attendance_updated_at_id ON attendance;
+DROP INDEX idx_employee_updated_at_id   ON employee;
+
+-- 2. employee.id
+ALTER TABLE employee ADD COLUMN id_bin BINARY(16) NULL AFTER id;
+UPDATE employee SET id_bin = UUID_TO_BIN(id);
+ALTER TABLE employee DROP PRIMARY KEY;
+ALTER TABLE employee DROP COLUMN id;
+ALTER TABLE employee RENAME COLUMN id_bin TO id;
+ALTER TABLE employee MODIFY id BINARY(16) NOT NULL, ADD PRIMARY KEY (id);
+
+-- 3. attendance.id / attendance.employee_id
+ALTER TABLE attendance
+    ADD COLUMN id_bin          BINARY(16) NULL AFTER id,
+    ADD COLUMN employee_id_bin BINARY(16) NULL AFTER employee_id;
+UPDATE attendance SET id_bin = UUID_TO_BIN(id), employee_id_bin = UUID_TO_BIN(employee_id);
+ALTER TABLE attendance DROP PRIMARY KEY;
+ALTER TABLE attendance DROP COLUMN id, DROP COLUMN employee_id;
+ALTER TABLE attendance RENAME COLUMN id_bin TO id, RENAME COLUMN employee_id_bin TO employee_id;
+ALTER TABLE attendance
+    MODIFY id          BINARY(16) NOT NULL,
+    MODIFY employee_id BINARY(16) NOT NULL,
+    ADD PRIMARY KEY (id);
+
+-- 4. change_tombstone.entity_id
+ALTER TABLE change_tombstone ADD COLUMN entity_id_bin BINARY(16) NULL AFTER entity_id;
+UPDATE change_tombstone SET entity_id_bin = UUID_TO_BIN(entity_id);
+ALTER TABLE change_tombstone DROP COLUMN entity_id;
+ALTER TABLE change_tombstone RENAME COLUMN entity_id_bin TO entity_id;
+ALTER TABLE change_tombstone MODIFY entity_id BINARY(16) NOT NULL;
+
+-- 5. Re-create constraints and indexes on the new columns
+ALTER TABLE attendance ADD CONSTRAINT uq_attendance_emp_date UNIQUE (employee_id, date);
+CREATE INDEX idx_attendance_employee_id   ON attendance (employee_id);
+CREATE INDEX idx_attendance_updated_at_id ON attendance (updated_at, id);
+CREATE INDEX idx_employee_updated_at_id   ON employee (updated_at, id);
+ALTER TABLE attendance ADD CONSTRAINT fk_attendance_employee FOREIGN KEY (employee_id)
+    REFERENCES employee (id) ON DELETE CASCADE;
+
+-- Ad-hoc queries: SELECT BIN_TO_UUID(id) AS id, ... FROM employee;
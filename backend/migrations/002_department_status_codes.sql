@@ -0,0 +1,53 @@
+-- ============================================================
+-- Migration 002 — department dimension + 1-byte status codes
+--
+-- Apply on top of schema.sql (+ 001 if used) before deploying the app
+-- version that maps department names / status strings to integer keys.
+--
+--   employee.department VARCHAR(100) → department_id SMALLINT UNSIGNED
+--       FK into a new `department` table; GROUP BY department and the
+--       department filter now work on 2-byte integers.
+--   attendance.status VARCHAR(20) → TINYINT UNSIGNED
+--       1=PRESENT, 2=ABSENT, 3=HALF_DAY, 4=ON_LEAVE. Codes are persisted —
+--       never renumber (see STATUS_CODES in app/models/types.py).
+--
+-- The API contract is unchanged: names are mapped at the ORM boundary.
+-- On large tables run the ALTERs through gh-ost / pt-online-schema-change.
+-- ============================================================
+
+-- 1. Department dimension, populated from existing employee rows
+CREATE TABLE IF NOT EXISTS department (
+    id              SMALLINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    name            VARCHAR(100)    NOT NULL,
+
+    CONSTRAINT uq_department_name      UNIQUE (name)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+INSERT INTO department (name)
+SELECT DISTINCT department FROM employee ORDER BY department;
+
+-- 2. employee.department → employee.department_id
+ALTER TABLE employee ADD COLUMN department_id SMALLINT UNSIGNED NULL AFTER department;
+UPDATE employee e JOIN department d ON d.name = e.department SET e.department_id = d.id;
+DROP INDEX idx_employee_department ON employee;
+ALTER TABLE employee DROP COLUMN department;
+ALTER TABLE employee MODIFY department_id SMALLINT UNSIGNED NOT NULL;
+ALTER TABLE employee
+    ADD CONSTRAINT fk_employee_department FOREIGN KEY (department_id) REFERENCES department (id);
+CREATE INDEX idx_employee_department_id ON employee (department_id);
+
+-- 3. attendance.status → TINYINT code
+ALTER TABLE attendance ADD COLUMN status_code TINYINT UNSIGNED NULL AFTER status;
+UPDATE attendance SET status_code = CASE status
+    WHEN 'PRESENT'  THEN 1
+    WHEN 'ABSENT'   THEN 2
+    WHEN 'HALF_DAY' THEN 3
+    WHEN 'ON_LEAVE' THEN 4
+END;
+ALTER TABLE attendance DROP CHECK ck_attendance_status;
+DROP INDEX idx_attendance_status ON attendance;
+ALTER TABLE attendance DROP COLUMN status;
+ALTER TABLE attendance RENAME COLUMN status_code TO status;
+ALTER TABLE attendance MODIFY status TINYINT UNSIGNED NOT NULL;
+ALTER TABLE attendance ADD CONSTRAINT ck_attendance_status CHECK (status IN (1, 2, 3, 4));
+CREATE INDEX idx_attendance_status ON attendance (status);
@@ -0,0 +1,35 @@
+-- ============================================================
+-- Migration 003 — composite indexes shaped after the hot queries
+--
+-- Replaces the single-column indexes, which left MySQL choosing filesorts
+-- and index merges, with composites matching what the repositories build:
+--
+--   AttendanceRepository.list   date / range / status filters,
+--                               ORDER BY date DESC, created_at DESC
+--   EmployeeRepository.list     is_active / department filters,
+--                               ORDER BY created_at DESC
+--   DashboardRepository         date range joined to employee, counted by status
+--
+-- tests/test_query_plans.py EXPLAINs these queries and fails on full scans
+-- (set EXPLAIN_MYSQL_URL to run it against MySQL).
+--
+-- Create the new indexes before dropping the old ones so no query is left
+-- without an index in between. On large tables use gh-ost / pt-osc.
+-- ============================================================
+
+-- employee
+CREATE INDEX idx_employee_created_at                   ON employee (created_at);
+CREATE INDEX idx_employee_active_created_at            ON employee (is_active, created_at);
+CREATE INDEX idx_employee_department_active_created_at ON employee (department_id, is_active, created_at);
+DROP INDEX idx_employee_is_active     ON employee;
+-- fk_employee_department now uses the composite above
+DROP INDEX idx_employee_department_id ON employee;
+
+-- attendance
+CREATE INDEX idx_attendance_date_created_at        ON attendance (date, created_at);
+CREATE INDEX idx_attendance_status_date_created_at ON attendance (status, date, created_at);
+CREATE INDEX idx_attendance_date_employee_status   ON attendance (date, employee_id, status);
+DROP INDEX idx_attendance_date        ON attendance;
+DROP INDEX idx_attendance_status      ON attendance;
+-- fk_attendance_employee is served by the uq_attendance_emp_date prefix
+DROP INDEX idx_attendance_employee_id ON attendance;
@@ -0,0 +1,48 @@
+-- ============================================================
+-- Migration 004 — monthly RANGE partitioning of attendance + archive table
+--
+-- Partitioning lets old months leave the live table as an instant
+-- DROP PARTITION once `python -m scripts.archive_attendance` has copied
+-- them to attendance_archive, and lets date-range queries prune to the
+-- months they touch.
+--
+-- InnoDB partitioning rules drive the two key changes below:
+--   - every unique key must include the partition column, so the PK
+--     becomes (id, date); uq_attendance_emp_date already includes date
+--   - partitioned tables cannot have foreign keys, so
+--     fk_attendance_employee is dropped. INV-4/INV-8 are still enforced by
+--     the application: attendance creation checks the employee exists, and
+--     EmployeeRepository.delete removes attendance explicitly.
+--
+-- The partition layout itself is created by the archive script on its
+-- first run (monthly partitions from the archive horizon, plus p_future).
+-- Run it right after this migration:
+--     python -m scripts.archive_attendance
+--
+-- On large tables run the ALTERs through gh-ost / pt-online-schema-change.
+-- ============================================================
+
+-- 1. Archive table
+CREATE TABLE IF NOT EXISTS attendance_archive (
+    id              CHAR(36)        NOT NULL PRIMARY KEY,
+    employee_id     CHAR(36)        NOT NULL,
+    date            DATE            NOT NULL,
+    status          TINYINT UNSIGNED NOT NULL,
+    check_in        TIME            DEFAULT NULL,
+    check_out       TIME            DEFAULT NULL,
+    notes           TEXT            DEFAULT NULL,
+    created_at      DATETIME        NOT NULL,
+    updated_at      DATETIME        NOT NULL,
+    version         INT UNSIGNED    NOT NULL,
+
+    CONSTRAINT uq_attendance_archive_emp_date UNIQUE (employee_id, date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE INDEX idx_attendance_archive_date_created_at      ON attendance_archive (date, created_at);
+CREATE INDEX idx_attendance_archive_date_employee_status ON attendance_archive (date, employee_id, status);
+
+-- (With migrations/001 applied, use BINARY(16) for id and employee_id above.)
+
+-- 2. Make attendance partitionable
+ALTER TABLE attendance DROP FOREIGN KEY fk_attendance_employee;
+ALTER TABLE attendance DROP PRIMARY KEY, ADD PRIMARY KEY (id, date);
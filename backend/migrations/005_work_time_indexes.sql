@@ -0,0 +1,13 @@
+-- ============================================================
+-- Migration 005 — covering indexes for worked-hours / punctuality aggregates
+--
+-- GET /analytics/work-time reads (employee_id, check_in, check_out) for a
+-- date range and aggregates them in SQL (TIME_TO_SEC arithmetic, GROUP BY
+-- employee or department). With these indexes it is an index-only range
+-- scan on both the live and the archive table.
+--
+-- On large tables use gh-ost / pt-online-schema-change.
+-- ============================================================
+
+CREATE INDEX idx_attendance_date_employee_times         ON attendance (date, employee_id, check_in, check_out);
+CREATE INDEX idx_attendance_archive_date_employee_times ON attendance_archive (date, employee_id, check_in, check_out);
@@ -0,0 +1,33 @@
+-- ============================================================
+-- Migration 006 — persisted background jobs
+--
+-- Imports, exports and monthly reports run as background jobs
+-- (POST /jobs/..., polled at GET /jobs/{id}). This table is their queue
+-- and state. Runners claim queued rows with a conditional UPDATE and
+-- requeue running rows whose heartbeat went stale, so a job survives a
+-- worker restart.
+--
+-- job.id stays CHAR(36) under DB_UUID_BINARY too (the model maps it as a
+-- plain string): the table is small and joins nothing.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS job (
+    id                  CHAR(36)        NOT NULL PRIMARY KEY,
+    kind                VARCHAR(40)     NOT NULL,
+    status              VARCHAR(16)     NOT NULL DEFAULT 'queued',
+    params              JSON            NOT NULL,
+    progress            INT             NOT NULL DEFAULT 0,
+    result              JSON            DEFAULT NULL,
+    result_file         VARCHAR(255)    DEFAULT NULL,
+    result_media_type   VARCHAR(100)    DEFAULT NULL,
+    error               JSON            DEFAULT NULL,
+    attempts            INT             NOT NULL DEFAULT 0,
+    cancel_requested    BOOLEAN         NOT NULL DEFAULT FALSE,
+    worker              VARCHAR(100)    DEFAULT NULL,
+    heartbeat_at        DATETIME        DEFAULT NULL,
+    created_at          DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    started_at          DATETIME        DEFAULT NULL,
+    finished_at         DATETIME        DEFAULT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE INDEX idx_job_status_created_at ON job (status, created_at);
@@ -0,0 +1,29 @@
+-- ============================================================
+-- Migration 007 — explicit attendance archive horizon
+--
+-- The archive horizon used to be derived as MAX(attendance_archive.date).
+-- Archival moves rows in batches, so mid-run that date could be partly
+-- archived: the list endpoint's live/archive page split saw the date in
+-- both tables, and the live rows left on it could no longer be written.
+-- The horizon is now stored:
+--   - closed_through: set when a run starts; writes on or before it are
+--     rejected (writers read it under a shared lock)
+--   - archived_through: set when the run completes; snapshot files and
+--     partition drops only go up to it
+--
+-- Existing archives are seeded from their newest archived date. Only the
+-- dates before it are known to be archived whole (rows moved in date
+-- order); re-run `python -m scripts.archive_attendance` afterwards to
+-- finish that date and advance archived_through.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS attendance_archive_horizon (
+    id                  TINYINT UNSIGNED NOT NULL PRIMARY KEY,
+    closed_through      DATE            DEFAULT NULL,
+    archived_through    DATE            DEFAULT NULL,
+    updated_at          DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+INSERT INTO attendance_archive_horizon (id, closed_through, archived_through)
+SELECT 1, MAX(date), MAX(date) - INTERVAL 1 DAY FROM attendance_archive
+HAVING MAX(date) IS NOT NULL;
@@ -3,10 +3,25 @@
 -- Run this in MySQL Workbench to create the database schema.
 -- ============================================================
 
+-- Keys are CHAR(36) UUID strings (UUIDv7, time-ordered, generated by the app).
+-- For 16-byte keys apply migrations/001_uuid_binary16.sql and set DB_UUID_BINARY=true.
+
 -- Create the database (uncomment if needed)
 -- CREATE DATABASE IF NOT EXISTS hrms_lite CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
 -- USE hrms_lite;
 
+-- -----------------------------------------------------------
+-- Table: department
+-- Dimension table; employees reference it by a 2-byte key
+-- -----------------------------------------------------------
+CREATE TABLE IF NOT EXISTS department (
+    id              SMALLINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    name            VARCHAR(100)    NOT NULL,
+
+    CONSTRAINT uq_department_name      UNIQUE (name)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+
 -- -----------------------------------------------------------
 -- Table: employee
 -- -----------------------------------------------------------
@@ -15,23 +30,32 @@ CREATE TABLE IF NOT EXISTS employee (
     employee_code   VARCHAR(20)     NOT NULL,
     name            VARCHAR(100)    NOT NULL,
     email           VARCHAR(255)    NOT NULL,
-    department      VARCHAR(100)    NOT NULL,
+    department_id   SMALLINT UNSIGNED NOT NULL,
     designation     VARCHAR(100)    DEFAULT NULL,
     date_of_joining DATE            NOT NULL,
     phone           VARCHAR(20)     DEFAULT NULL,
     is_active       BOOLEAN         NOT NULL DEFAULT TRUE,
     created_at      DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at      DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    version         INT UNSIGNED    NOT NULL DEFAULT 1,
 
     -- INV-1: email is globally unique
     CONSTRAINT uq_employee_email       UNIQUE (email),
     -- INV-2: employee_code is globally unique
-    CONSTRAINT uq_employee_code        UNIQUE (employee_code)
+    CONSTRAINT uq_employee_code        UNIQUE (employee_code),
+
+    CONSTRAINT fk_employee_department  FOREIGN KEY (department_id)
+        REFERENCES department (id)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
--- Indexes for filtered queries
-CREATE INDEX idx_employee_department ON employee (department);
-CREATE INDEX idx_employee_is_active  ON employee (is_active);
+-- Indexes shaped after EmployeeRepository.list (filters + ORDER BY created_at DESC)
+-- and the dashboard's active/department head-counts. The department index
+-- also backs fk_employee_department.
+CREATE INDEX idx_employee_created_at                   ON employee (created_at);
+CREATE INDEX idx_employee_active_created_at            ON employee (is_active, created_at);
+CREATE INDEX idx_employee_department_active_created_at ON employee (department_id, is_active, created_at);
+-- Change feed keyset scan + cheap MAX(updated_at) change marker for ETags
+CREATE INDEX idx_employee_updated_at_id ON employee (updated_at, id);
 
 
 -- -----------------------------------------------------------
@@ -41,12 +65,13 @@ CREATE TABLE IF NOT EXISTS attendance (
     id              CHAR(36)        NOT NULL PRIMARY KEY,
     employee_id     CHAR(36)        NOT NULL,
     date            DATE            NOT NULL,
-    status          VARCHAR(20)     NOT NULL,
+    status          TINYINT UNSIGNED NOT NULL,
     check_in        TIME            DEFAULT NULL,
     check_out       TIME            DEFAULT NULL,
     notes           TEXT            DEFAULT NULL,
     created_at      DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at      DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    version         INT UNSIGNED    NOT NULL DEFAULT 1,
 
     -- INV-3: one attendance record per employee per date
     CONSTRAINT uq_attendance_emp_date  UNIQUE (employee_id, date),
@@ -56,10 +81,98 @@ CREATE TABLE IF NOT EXISTS attendance (
         REFERENCES employee (id) ON DELETE CASCADE,
 
     -- INV-6: closed set of status values
-    CONSTRAINT ck_attendance_status    CHECK (status IN ('PRESENT', 'ABSENT', 'HALF_DAY', 'ON_LEAVE'))
+    -- 1=PRESENT, 2=ABSENT, 3=HALF_DAY, 4=ON_LEAVE (app/models/types.py STATUS_CODES)
+    CONSTRAINT ck_attendance_status    CHECK (status IN (1, 2, 3, 4))
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Indexes shaped after AttendanceRepository.list (ORDER BY date DESC, created_at DESC)
+-- and the dashboard aggregates. employee_id lookups and the FK use the
+-- uq_attendance_emp_date prefix, so there is no separate employee_id index.
+CREATE INDEX idx_attendance_date_created_at        ON attendance (date, created_at);
+CREATE INDEX idx_attendance_status_date_created_at ON attendance (status, date, created_at);
+-- Covering for date range → join key → status (no row lookups for the summary)
+CREATE INDEX idx_attendance_date_employee_status   ON attendance (date, employee_id, status);
+-- Covering for date range → join key → check_in/check_out (worked hours, punctuality)
+CREATE INDEX idx_attendance_date_employee_times    ON attendance (date, employee_id, check_in, check_out);
+-- Change feed keyset scan + cheap MAX(updated_at) change marker for ETags
+CREATE INDEX idx_attendance_updated_at_id ON attendance (updated_at, id);
+
+
+-- -----------------------------------------------------------
+-- Table: change_tombstone
+-- Hard deletes recorded for the incremental change feed (GET /changes)
+-- -----------------------------------------------------------
+CREATE TABLE IF NOT EXISTS change_tombstone (
+    id              BIGINT          NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    entity          VARCHAR(20)     NOT NULL,
+    entity_id       CHAR(36)        NOT NULL,
+    deleted_at      DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE INDEX idx_change_tombstone_deleted_at_id ON change_tombstone (deleted_at, id);
+
+
+-- -----------------------------------------------------------
+-- Table: job
+-- Background jobs (/jobs): the persisted queue and state of imports,
+-- exports and reports; see app/services/job_runner.py
+-- -----------------------------------------------------------
+CREATE TABLE IF NOT EXISTS job (
+    id                  CHAR(36)        NOT NULL PRIMARY KEY,
+    kind                VARCHAR(40)     NOT NULL,
+    status              VARCHAR(16)     NOT NULL DEFAULT 'queued',
+    params              JSON            NOT NULL,
+    progress            INT             NOT NULL DEFAULT 0,
+    result              JSON            DEFAULT NULL,
+    result_file         VARCHAR(255)    DEFAULT NULL,
+    result_media_type   VARCHAR(100)    DEFAULT NULL,
+    error               JSON            DEFAULT NULL,
+    attempts            INT             NOT NULL DEFAULT 0,
+    cancel_requested    BOOLEAN         NOT NULL DEFAULT FALSE,
+    worker              VARCHAR(100)    DEFAULT NULL,
+    heartbeat_at        DATETIME        DEFAULT NULL,
+    created_at          DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    started_at          DATETIME        DEFAULT NULL,
+    finished_at         DATETIME        DEFAULT NULL
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
--- Indexes for filtered/sorted queries
-CREATE INDEX idx_attendance_date        ON attendance (date);
-CREATE INDEX idx_attendance_employee_id ON attendance (employee_id);
-CREATE INDEX idx_attendance_status      ON attendance (status);
+CREATE INDEX idx_job_status_created_at ON job (status, created_at);
+
+
+-- -----------------------------------------------------------
+-- Table: attendance_archive
+-- Attendance older than ATTENDANCE_ARCHIVE_AFTER_MONTHS, moved here by
+-- `python -m scripts.archive_attendance`. Same columns as attendance; no FK
+-- (employee deletes clean it up in the application).
+-- -----------------------------------------------------------
+CREATE TABLE IF NOT EXISTS attendance_archive (
+    id              CHAR(36)        NOT NULL PRIMARY KEY,
+    employee_id     CHAR(36)        NOT NULL,
+    date            DATE            NOT NULL,
+    status          TINYINT UNSIGNED NOT NULL,
+    check_in        TIME            DEFAULT NULL,
+    check_out       TIME            DEFAULT NULL,
+    notes           TEXT            DEFAULT NULL,
+    created_at      DATETIME        NOT NULL,
+    updated_at      DATETIME        NOT NULL,
+    version         INT UNSIGNED    NOT NULL,
+
+    CONSTRAINT uq_attendance_archive_emp_date UNIQUE (employee_id, date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE INDEX idx_attendance_archive_date_created_at      ON attendance_archive (date, created_at);
+CREATE INDEX idx_attendance_archive_date_employee_status ON attendance_archive (date, employee_id, status);
+CREATE INDEX idx_attendance_archive_date_employee_times  ON attendance_archive (date, employee_id, check_in, check_out);
+
+-- -----------------------------------------------------------
+-- Table: attendance_archive_horizon
+-- One row (id = 1). closed_through: writes on or before it are rejected;
+-- set when an archival run starts. archived_through: every row on or
+-- before it is in attendance_archive; set when the run completes.
+-- -----------------------------------------------------------
+CREATE TABLE IF NOT EXISTS attendance_archive_horizon (
+    id                  TINYINT UNSIGNED NOT NULL PRIMARY KEY,
+    closed_through      DATE            DEFAULT NULL,
+    archived_through    DATE            DEFAULT NULL,
+    updated_at          DATETIME        NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
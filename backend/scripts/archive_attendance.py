@@ -0,0 +1,91 @@
+"""Move attendance older than the archive horizon into attendance_archive.
+
+Keeps the live ``attendance`` table (and its indexes) bounded to the last
+``ATTENDANCE_ARCHIVE_AFTER_MONTHS`` whole months. The run first closes the
+dates before the cutoff to writes (``ArchiveHorizon.closed_through``), then
+copies and deletes whole dates in batches of about
+``ATTENDANCE_ARCHIVE_BATCH_SIZE`` rows, one transaction per batch, and
+finally records ``archived_through``. An interrupted run leaves the dates
+closed but not marked archived; re-running completes it.
+
+On MySQL it also maintains monthly RANGE partitions on ``attendance.date``
+(see migrations/004_attendance_partitioning.sql):
+    - partitions the table on first run if it is not partitioned yet
+    - drops partitions behind ``archived_through`` (instant, no row deletes)
+    - keeps ``ATTENDANCE_PARTITIONS_AHEAD`` future months pre-created
+
+Run monthly, e.g. from cron:
+    python -m scripts.archive_attendance
+    python -m scripts.archive_attendance --months 12 --dry-run
+"""
+
+import argparse
+import asyncio
+import logging
+from datetime import date, timedelta
+
+from app.config import settings
+from app.database import async_session_factory
+from app.repositories.archive_repo import ArchiveRepository, month_start
+
+logger = logging.getLogger("archive_attendance")
+
+
+async def archive(months: int, batch_size: int, dry_run: bool = False, today: date | None = None) -> int:
+    """Archive rows dated before the first day of the month ``months`` ago. Returns rows moved."""
+    today = today or date.today()
+    cutoff = month_start(today, months)
+
+    async with async_session_factory() as session:
+        repo = ArchiveRepository(session)
+        pending = await repo.count_before(cutoff)
+        logger.info("archiving attendance before %s: %d rows", cutoff, pending)
+        if dry_run:
+            return 0
+
+        # Waits for in-flight writes to those dates, then rejects new ones.
+        # An earlier run may have closed further; finish that too.
+        cutoff = await repo.close(cutoff) + timedelta(days=1)
+        await session.commit()
+
+        moved = 0
+        while True:
+            batch = await repo.move_batch(cutoff, batch_size)
+            if not batch:
+                break
+            await session.commit()
+            moved += batch
+            logger.info("moved %d/%d rows", moved, pending)
+        archived_through = await repo.mark_archived()
+        await session.commit()
+        logger.info("attendance archived through %s", archived_through)
+
+        # Partition upkeep (MySQL only; each ALTER commits implicitly)
+        if await repo.partition_table(first_month=cutoff, through=today):
+            logger.info("partitioned attendance monthly from %s", cutoff)
+        dropped = await repo.drop_archived_partitions()
+        if dropped:
+            logger.info("dropped archived partitions: %s", ", ".join(dropped))
+        added = await repo.add_partitions(month_start(today, -settings.ATTENDANCE_PARTITIONS_AHEAD))
+        if added:
+            logger.info("added partitions: %s", ", ".join(added))
+        await session.commit()
+
+    return moved
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--months", type=int, default=settings.ATTENDANCE_ARCHIVE_AFTER_MONTHS,
+                        help="whole months to keep in the live table")
+    parser.add_argument("--batch-size", type=int, default=settings.ATTENDANCE_ARCHIVE_BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="only report how many rows would move")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=settings.LOG_LEVEL, format="%(asctime)s %(levelname)s %(message)s")
+    moved = asyncio.run(archive(args.months, args.batch_size, args.dry_run))
+    print(f"✅ Archived {moved} attendance rows.")
+
+
+if __name__ == "__main__":
+    main()
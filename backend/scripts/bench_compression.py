@@ -0,0 +1,85 @@
+"""Compression cost/benefit benchmark for typical /attendance list pages.
+
+Builds realistic paginated attendance payloads (20 and 100 rows) through the
+real response schemas, then measures compressed size and CPU time for each
+gzip level and brotli quality.
+
+Usage:
+    python -m scripts.bench_compression
+"""
+
+import json
+import random
+import time
+import uuid
+import zlib
+from datetime import date, datetime, time as dtime, timedelta
+
+from app.schemas.attendance import AttendanceResponse
+from app.schemas.common import PaginatedResponse, PaginationMeta
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+STATUSES = ["PRESENT", "ABSENT", "HALF_DAY", "ON_LEAVE"]
+ITERATIONS = 200
+
+
+def build_page(per_page: int) -> bytes:
+    """Serialize one attendance list page exactly like the API does."""
+    today = date.today()
+    rows = []
+    for i in range(per_page):
+        status = random.choice(STATUSES)
+        rows.append(
+            AttendanceResponse(
+                id=str(uuid.uuid4()),
+                employee_id=str(uuid.uuid4()),
+                employee_name=f"Employee {i}",
+                employee_code=f"EMP-{i:04d}",
+                date=today - timedelta(days=i // 10),
+                status=status,
+                check_in=dtime(9, random.randint(0, 30)) if status == "PRESENT" else None,
+                check_out=dtime(18, random.randint(0, 30)) if status == "PRESENT" else None,
+                notes=None,
+                created_at=datetime.now(),
+                updated_at=datetime.now(),
+            )
+        )
+    page = PaginatedResponse[AttendanceResponse](
+        data=rows,
+        meta=PaginationMeta(page=1, per_page=per_page, total=5000, total_pages=5000 // per_page),
+    )
+    return json.dumps(page.model_dump(mode="json")).encode()
+
+
+def measure(label: str, payload: bytes, compress) -> None:
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        out = compress(payload)
+    elapsed_us = (time.perf_counter() - start) / ITERATIONS * 1_000_000
+    saved = len(payload) - len(out)
+    print(
+        f"  {label:<12} {len(out):>8} B  ratio {len(payload) / len(out):5.1f}x  "
+        f"{elapsed_us:8.1f} µs  {saved / max(elapsed_us, 1e-9):8.1f} B saved/µs"
+    )
+
+
+def main() -> None:
+    random.seed(42)
+    for per_page in (20, 100):
+        payload = build_page(per_page)
+        print(f"/attendance page, per_page={per_page}: {len(payload)} B raw")
+        for level in (1, 6, 9):
+            measure(f"gzip-{level}", payload, lambda b, lv=level: zlib.compress(b, lv))
+        if brotli is not None:
+            for quality in (1, 4, 11):
+                measure(f"br-{quality}", payload, lambda b, q=quality: brotli.compress(b, quality=q))
+        else:
+            print("  (brotli not installed — skipping br)")
+
+
+if __name__ == "__main__":
+    main()
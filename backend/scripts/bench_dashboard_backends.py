@@ -0,0 +1,154 @@
+"""Dashboard aggregation: SQL (DashboardRepository) vs the columnar NumPy engine.
+
+Seeds a scratch database with ``--employees`` × ``--days`` attendance rows,
+then times summary and trend queries over several ranges on both backends,
+plus the columnar engine's initial load and an incremental refresh.
+
+Point ``--url`` at an empty scratch database; all tables are dropped and
+recreated. The default is a temporary SQLite file.
+
+Usage:
+    python -m scripts.bench_dashboard_backends --employees 2000 --days 500
+    python -m scripts.bench_dashboard_backends --url mysql+aiomysql://u:p@localhost/bench
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import settings
+from app.database import Base
+from app.models.attendance import Attendance
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.types import STATUS_CODES, new_id
+from app.repositories.dashboard_repo import DashboardRepository
+from app.services.columnar_engine import ColumnarAttendanceEngine, ColumnarDashboardBackend
+
+DEPARTMENTS = ["Engineering", "HR", "Finance", "Marketing", "Operations", "Sales"]
+INSERT_BATCH = 10_000
+REPEAT = 5
+
+
+async def seed(session: AsyncSession, employees: int, days: int, end: date) -> None:
+    rng = random.Random(36)
+    await session.execute(insert(Department), [{"name": name} for name in DEPARTMENTS])
+    employee_rows = [
+        {
+            "id": new_id(),
+            "employee_code": f"EMP-{i:06d}",
+            "name": f"Employee {i}",
+            "email": f"employee{i}@bench.example",
+            "department_id": i % len(DEPARTMENTS) + 1,
+            "date_of_joining": end - timedelta(days=days),
+            "is_active": i % 20 != 0,
+        }
+        for i in range(employees)
+    ]
+    await session.execute(insert(Employee), employee_rows)
+
+    statuses = list(STATUS_CODES)
+    batch = []
+    for offset in range(days):
+        day = end - timedelta(days=offset)
+        for employee in employee_rows:
+            batch.append({
+                "id": new_id(),
+                "employee_id": employee["id"],
+                "date": day,
+                "status": rng.choices(statuses, weights=[7, 1, 1, 1])[0],
+            })
+            if len(batch) == INSERT_BATCH:
+                await session.execute(insert(Attendance), batch)
+                batch = []
+    if batch:
+        await session.execute(insert(Attendance), batch)
+    await session.commit()
+
+
+async def timed(fn) -> float:
+    """Median wall time in ms over REPEAT runs."""
+    samples = []
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+async def run(url: str, employees: int, days: int) -> None:
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    end = date.today()
+    sessions = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with sessions() as session:
+            t0 = time.perf_counter()
+            await seed(session, employees, days, end)
+            print(f"{engine.dialect.name}: seeded {employees * days:,} rows in {time.perf_counter() - t0:.1f}s")
+
+        # Steady state: let the seed fall outside the engine's refresh overlap window
+        await asyncio.sleep(settings.CHANGES_SETTLE_SECONDS + 1)
+
+        async with sessions() as session:
+            sql = DashboardRepository(session)
+            columnar = ColumnarDashboardBackend(session, ColumnarAttendanceEngine())
+
+            t0 = time.perf_counter()
+            await columnar.engine.refresh(session)
+            print(f"columnar initial load: {(time.perf_counter() - t0) * 1000:,.0f} ms")
+            refresh_ms = await timed(lambda: columnar.engine.refresh(session))
+            print(f"columnar incremental refresh (no changes): {refresh_ms:.1f} ms\n")
+
+            print(f"  {'query':<34} {'sql ms':>9} {'columnar ms':>12} {'speedup':>8}")
+            cases = []
+            for span in sorted({min(span, days) for span in (1, 30, 365, days)}):
+                start = end - timedelta(days=span - 1)
+                label = f"{span}d"
+                cases.append((f"summary {label}", "get_summary", dict(date_from=start, date_to=end)))
+                cases.append((f"summary {label} dept=HR", "get_summary",
+                              dict(date_from=start, date_to=end, department="HR")))
+                if span <= 366:
+                    cases.append((f"trend {label}", "get_trend", dict(date_from=start, date_to=end)))
+
+            for label, method, params in cases:
+                sql_result = await getattr(sql, method)(**params)
+                columnar_result = await getattr(columnar, method)(**params)
+                if method == "get_summary":
+                    assert sql_result["summary"] == columnar_result["summary"], label
+                sql_ms = await timed(lambda: getattr(sql, method)(**params))
+                col_ms = await timed(lambda: getattr(columnar, method)(**params))
+                print(f"  {label:<34} {sql_ms:>9.1f} {col_ms:>12.1f} {sql_ms / col_ms:>7.1f}x")
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=None, help="scratch database URL (default: temp SQLite file)")
+    parser.add_argument("--employees", type=int, default=1_000)
+    parser.add_argument("--days", type=int, default=365)
+    args = parser.parse_args()
+
+    if args.url:
+        asyncio.run(run(args.url, args.employees, args.days))
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}", args.employees, args.days))
+
+
+if __name__ == "__main__":
+    main()
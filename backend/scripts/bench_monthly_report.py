@@ -0,0 +1,160 @@
+"""Monthly payroll report: sharded aggregation scaling across process-pool sizes.
+
+Seeds a scratch database with ``--employees`` × one month of attendance
+(with check-in / check-out times), reads the month once the way the
+``monthly_report`` job does (AnalyticsRepository.month_facts), then times
+the aggregation (app.services.monthly_report.aggregate) in-process and
+with 1, 2, 4 … ``--max-workers`` spawn processes, one shard per process.
+Speedup is against the in-process run; efficiency = speedup / processes.
+
+Point ``--url`` at an empty scratch database; all tables are dropped and
+recreated. The default is a temporary SQLite file.
+
+Usage:
+    python -m scripts.bench_monthly_report --employees 50000
+    python -m scripts.bench_monthly_report --url mysql+aiomysql://u:p@localhost/bench --max-workers 16
+"""
+
+import argparse
+import asyncio
+import calendar
+import multiprocessing
+import os
+import random
+import statistics
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, time as clock, timedelta
+from functools import partial
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.database import Base
+from app.models.attendance import Attendance
+from app.models.department import Department
+from app.models.employee import Employee
+from app.models.types import STATUS_CODES, new_id
+from app.repositories.analytics_repo import AnalyticsRepository
+from app.services.monthly_report import aggregate
+
+DEPARTMENTS = ["Engineering", "HR", "Finance", "Marketing", "Operations", "Sales"]
+INSERT_BATCH = 10_000
+REPEAT = 5
+
+
+async def seed(session: AsyncSession, employees: int, first: date, last: date) -> None:
+    rng = random.Random(46)
+    await session.execute(insert(Department), [{"name": name} for name in DEPARTMENTS])
+    employee_ids = [new_id() for _ in range(employees)]
+    await session.execute(insert(Employee), [
+        {
+            "id": employee_id,
+            "employee_code": f"EMP-{i:06d}",
+            "name": f"Employee {i}",
+            "email": f"employee{i}@bench.example",
+            "department_id": i % len(DEPARTMENTS) + 1,
+            "date_of_joining": first - timedelta(days=365),
+        }
+        for i, employee_id in enumerate(employee_ids)
+    ])
+
+    statuses = list(STATUS_CODES)
+    batch = []
+    day = first
+    while day <= last:
+        for employee_id in employee_ids:
+            status = rng.choices(statuses, weights=[7, 1, 1, 1])[0]
+            worked = status in ("PRESENT", "HALF_DAY")
+            batch.append({
+                "id": new_id(),
+                "employee_id": employee_id,
+                "date": day,
+                "status": status,
+                "check_in": clock(9, rng.randrange(30)) if worked else None,
+                "check_out": clock(17 if status == "PRESENT" else 13, rng.randrange(60)) if worked else None,
+            })
+            if len(batch) == INSERT_BATCH:
+                await session.execute(insert(Attendance), batch)
+                batch = []
+        day += timedelta(days=1)
+    if batch:
+        await session.execute(insert(Attendance), batch)
+    await session.commit()
+
+
+async def timed(fn) -> float:
+    """Median wall time in ms over REPEAT runs."""
+    samples = []
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+async def in_process(fn, *args):
+    return fn(*args)
+
+
+async def run(url: str, employees: int, max_workers: int) -> None:
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    today = date.today()
+    first = date(today.year, today.month, 1) - timedelta(days=1)
+    first = first.replace(day=1)  # last complete month
+    last = first.replace(day=calendar.monthrange(first.year, first.month)[1])
+    sessions = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with sessions() as session:
+            t0 = time.perf_counter()
+            await seed(session, employees, first, last)
+            t1 = time.perf_counter()
+            facts = await AnalyticsRepository(session).month_facts(first=first, last=last, department_id=None)
+            t2 = time.perf_counter()
+        print(f"{engine.dialect.name}: seeded {len(facts):,} rows in {t1 - t0:.1f}s; "
+              f"month read in {(t2 - t1) * 1000:,.0f} ms ({os.cpu_count()} CPUs)\n")
+
+        expected = await aggregate(facts, 1, in_process)
+        baseline = await timed(lambda: aggregate(facts, 1, in_process))
+        print(f"  {'processes':>9} {'aggregate ms':>13} {'speedup':>8} {'efficiency':>11}")
+        print(f"  {'in-proc':>9} {baseline:>13,.0f} {1:>7.2f}x {'':>11}")
+
+        loop = asyncio.get_running_loop()
+        workers = 1
+        while workers <= max_workers:
+            with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+                async def run_in_pool(fn, *args):
+                    return await loop.run_in_executor(pool, partial(fn, *args))
+
+                assert await aggregate(facts, workers, run_in_pool) == expected  # also warms the pool
+                ms = await timed(lambda: aggregate(facts, workers, run_in_pool))
+            speedup = baseline / ms
+            print(f"  {workers:>9} {ms:>13,.0f} {speedup:>7.2f}x {speedup / workers:>10.0%}")
+            workers *= 2
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=20_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--url", default=None, help="Scratch database URL (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    if args.url:
+        asyncio.run(run(args.url, args.employees, args.max_workers))
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        asyncio.run(run(f"sqlite+aiosqlite:///{os.path.join(tmp, 'bench.db')}", args.employees, args.max_workers))
+
+
+if __name__ == "__main__":
+    main()
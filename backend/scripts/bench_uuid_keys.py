@@ -0,0 +1,147 @@
+"""Insert throughput and index size: uuid4 CHAR(36) vs UUIDv7 CHAR(36) vs UUIDv7 BINARY(16).
+
+Creates three scratch tables shaped like ``attendance`` (PK, employee FK
+column with a secondary index, unique (employee_id, date), a date and a
+status), seeds each with the same number of rows and reports rows/s plus
+data and index sizes. Scratch tables are dropped afterwards.
+
+Meaningful numbers need MySQL/InnoDB (clustered PK). SQLite is supported
+for a quick smoke run; sizes there come from the dbstat virtual table, or
+from total page growth when SQLite is built without dbstat.
+
+Usage:
+    python -m scripts.bench_uuid_keys --rows 1000000
+    python -m scripts.bench_uuid_keys --url sqlite+aiosqlite:///bench.db --rows 200000
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import date, timedelta
+
+from sqlalchemy import Column, Date, Index, MetaData, String, Table, UniqueConstraint, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.config import settings
+from app.models.types import UUIDKey, new_id
+
+BATCH_SIZE = 5_000
+EMPLOYEES = 5_000
+
+VARIANTS = [
+    ("bench_char36_uuid4", False, lambda: str(uuid.uuid4())),
+    ("bench_char36_uuid7", False, new_id),
+    ("bench_binary16_uuid7", True, new_id),
+]
+
+
+def build_table(metadata: MetaData, name: str, binary: bool) -> Table:
+    return Table(
+        name,
+        metadata,
+        Column("id", UUIDKey(binary=binary), primary_key=True),
+        Column("employee_id", UUIDKey(binary=binary), nullable=False),
+        Column("date", Date, nullable=False),
+        Column("status", String(20), nullable=False),
+        UniqueConstraint("employee_id", "date", name=f"uq_{name}_emp_date"),
+        Index(f"idx_{name}_employee_id", "employee_id"),
+    )
+
+
+async def table_sizes(conn, dialect: str, name: str) -> tuple[int | None, int | None]:
+    """(data_bytes, index_bytes) for a table, or (None, None) if unavailable."""
+    if dialect == "mysql":
+        await conn.execute(text(f"ANALYZE TABLE {name}"))
+        row = (await conn.execute(text(
+            "SELECT data_length, index_length FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = :name"
+        ), {"name": name})).one()
+        return int(row[0]), int(row[1])
+    if dialect == "sqlite":
+        try:
+            rows = (await conn.execute(text(
+                "SELECT name, SUM(pgsize) FROM dbstat WHERE tbl_name = :name GROUP BY name"
+            ), {"name": name})).all()
+        except Exception:
+            return None, None
+        data = sum(size for idx, size in rows if idx == name)
+        index = sum(size for idx, size in rows if idx != name)
+        return data, index
+    return None, None
+
+
+async def database_bytes(conn, dialect: str) -> int | None:
+    """Total allocated size — fallback when per-index sizes are unavailable."""
+    if dialect != "sqlite":
+        return None
+    page_count = (await conn.execute(text("PRAGMA page_count"))).scalar_one()
+    page_size = (await conn.execute(text("PRAGMA page_size"))).scalar_one()
+    return page_count * page_size
+
+
+async def run(url: str, rows: int) -> None:
+    engine = create_async_engine(url)
+    dialect = engine.dialect.name
+    metadata = MetaData()
+    tables = {name: (build_table(metadata, name, binary), gen) for name, binary, gen in VARIANTS}
+
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.drop_all)
+        await conn.run_sync(metadata.create_all)
+
+    start_date = date(2020, 1, 1)
+    print(f"{dialect}: {rows:,} rows per variant, batch {BATCH_SIZE:,}")
+    print(f"  {'variant':<22} {'rows/s':>10} {'data MB':>9} {'index MB':>9} {'total MB':>9}")
+
+    try:
+        for name, (table, gen) in tables.items():
+            employees = [gen() for _ in range(EMPLOYEES)]
+            async with engine.connect() as conn:
+                size_before = await database_bytes(conn, dialect)
+            elapsed = 0.0
+            for offset in range(0, rows, BATCH_SIZE):
+                batch = [
+                    {
+                        "id": gen(),
+                        "employee_id": employees[i % EMPLOYEES],
+                        "date": start_date + timedelta(days=i // EMPLOYEES),
+                        "status": "PRESENT",
+                    }
+                    for i in range(offset, min(offset + BATCH_SIZE, rows))
+                ]
+                t0 = time.perf_counter()
+                async with engine.begin() as conn:
+                    await conn.execute(table.insert(), batch)
+                elapsed += time.perf_counter() - t0
+
+            async with engine.begin() as conn:
+                data_bytes, index_bytes = await table_sizes(conn, dialect, name)
+                size_after = await database_bytes(conn, dialect)
+            if data_bytes is not None and index_bytes is not None:
+                total_bytes = data_bytes + index_bytes
+            elif size_before is not None and size_after is not None:
+                total_bytes = size_after - size_before
+            else:
+                total_bytes = None
+            fmt = lambda b: f"{b / 1_048_576:9.1f}" if b is not None else f"{'n/a':>9}"
+            print(
+                f"  {name:<22} {rows / elapsed:>10,.0f} "
+                f"{fmt(data_bytes)} {fmt(index_bytes)} {fmt(total_bytes)}"
+            )
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(metadata.drop_all)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=settings.DATABASE_URL)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.url, args.rows))
+
+
+if __name__ == "__main__":
+    main()
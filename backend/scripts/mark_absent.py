@@ -0,0 +1,42 @@
+"""Mark ABSENT every active employee with no attendance record for a date.
+
+One INSERT ... SELECT ... WHERE NOT EXISTS (see app/services/auto_absent.py).
+Safe to re-run; non-working days (WEEKEND_DAYS / HOLIDAYS) are skipped.
+
+Run nightly, e.g. from cron just before midnight:
+    python -m scripts.mark_absent
+    python -m scripts.mark_absent --date 2025-03-14
+"""
+
+import argparse
+import asyncio
+import logging
+from datetime import date
+
+from app.config import settings
+from app.services.auto_absent import run_once
+from app.services.exceptions import AppException
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--date", type=date.fromisoformat, default=None, help="YYYY-MM-DD (default: today)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=settings.LOG_LEVEL, format="%(asctime)s %(levelname)s %(message)s")
+    try:
+        report = asyncio.run(run_once(args.date))
+    except AppException as exc:
+        parser.exit(1, f"❌ {exc.error_code}: {exc.message}\n")
+    if not report.working_day:
+        print(f"⏭️  {report.date} is not a working day; nothing marked.")
+        return
+    print(
+        f"✅ {report.date}: marked {report.inserted} absent "
+        f"({report.already_recorded} already recorded, {report.not_joined} not yet joined, "
+        f"{report.active_employees} active)."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Delete change-feed tombstones older than the retention window.
+
+Hard deletes leave a row in ``change_tombstone`` so ``GET /changes``
+consumers learn about them. Tombstones older than
+``CHANGES_TOMBSTONE_RETENTION_DAYS`` are deleted here; the feed answers
+cursors that old with 410 CURSOR_EXPIRED, so no consumer silently misses one.
+
+Run daily, e.g. from cron:
+    python -m scripts.purge_tombstones
+"""
+
+import asyncio
+import logging
+
+from app.config import settings
+from app.database import async_session_factory
+from app.services.change_service import ChangeService
+
+
+async def purge() -> int:
+    """Purge in one transaction. Returns the number of tombstones deleted."""
+    async with async_session_factory() as session:
+        deleted = await ChangeService(session).purge_tombstones()
+        await session.commit()
+    return deleted
+
+
+def main() -> None:
+    logging.basicConfig(level=settings.LOG_LEVEL, format="%(asctime)s %(levelname)s %(message)s")
+    deleted = asyncio.run(purge())
+    print(f"✅ Purged {deleted} tombstones older than {settings.CHANGES_TOMBSTONE_RETENTION_DAYS} days.")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ from datetime import date, time, timedelta
 from app.database import async_session_factory, init_db
 from app.models.attendance import Attendance
 from app.models.employee import Employee
+from app.repositories.department_repo import DepartmentRepository
 
 
 DEPARTMENTS = ["Engineering", "HR", "Finance", "Marketing", "Operations"]
@@ -41,6 +42,8 @@ async def seed():
     await init_db()
 
     async with async_session_factory() as session:
+        departments = DepartmentRepository(session)
+
         # Create employees
         employees = []
         for i, emp_data in enumerate(SAMPLE_EMPLOYEES, start=1):
@@ -48,7 +51,7 @@ async def seed():
                 employee_code=f"EMP-{i:03d}",
                 name=emp_data["name"],
                 email=emp_data["email"],
-                department=emp_data["department"],
+                department_ref=await departments.get_or_create(emp_data["department"]),
                 designation=random.choice(DESIGNATIONS),
                 date_of_joining=date(2025, random.randint(1, 12), random.randint(1, 28)),
                 phone=f"+91{random.randint(7000000000, 9999999999)}",
@@ -0,0 +1,79 @@
+"""Write closed months of archived attendance to memory-mapped columnar snapshot files.
+
+A month is closed once its last day is on or before ``archived_through()``.
+From then on the service rejects writes to it, so its archived rows can no
+longer change. Each closed month gets one ``attendance-YYYY-MM.col`` file in
+``ATTENDANCE_SNAPSHOT_DIR`` (format: app/services/attendance_snapshot.py).
+The columnar engine maps these files instead of reading the month from the DB.
+
+Months that already have a file are skipped unless ``--force`` is given.
+Run after scripts.archive_attendance, e.g. from the same cron entry:
+    python -m scripts.snapshot_attendance
+    python -m scripts.snapshot_attendance --dir /var/lib/hrms/snapshots --force
+
+Restart (or reload) the app workers to pick up new months.
+"""
+
+import argparse
+import asyncio
+import logging
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.database import async_session_factory
+from app.repositories.analytics_repo import AnalyticsRepository
+from app.repositories.archive_repo import ArchiveRepository, month_start
+from app.repositories.department_repo import DepartmentRepository
+from app.services.attendance_snapshot import month_end, snapshot_path, write_snapshot
+
+logger = logging.getLogger("snapshot_attendance")
+
+
+async def write_closed_months(session: AsyncSession, directory: str, force: bool = False) -> list[date]:
+    """Write a file for every closed month missing one; returns the months written."""
+    first, archived_through = await ArchiveRepository(session).archived_span()
+    if archived_through is None:
+        logger.info("nothing archived yet")
+        return []
+
+    repo = AnalyticsRepository(session)
+    departments = await DepartmentRepository(session).names_by_id()
+    written = []
+    month = month_start(first)
+    while month_end(month) <= archived_through:
+        path = snapshot_path(directory, month)
+        if force or not path.exists():
+            rows = []
+            async for chunk in repo.archived_month(month, month_end(month)):
+                rows.extend(chunk)
+            count = write_snapshot(path, month, rows, departments)
+            logger.info("wrote %s: %d rows, %d bytes", path.name, count, path.stat().st_size)
+            written.append(month)
+        month = month_start(month, -1)
+    return written
+
+
+async def snapshot(directory: str, force: bool = False) -> list[date]:
+    async with async_session_factory() as session:
+        return await write_closed_months(session, directory, force)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dir", default=settings.ATTENDANCE_SNAPSHOT_DIR,
+                        help="output directory (default: ATTENDANCE_SNAPSHOT_DIR)")
+    parser.add_argument("--force", action="store_true", help="rewrite months that already have a file")
+    args = parser.parse_args()
+    if not args.dir:
+        parser.error("set ATTENDANCE_SNAPSHOT_DIR or pass --dir")
+
+    logging.basicConfig(level=settings.LOG_LEVEL, format="%(asctime)s %(levelname)s %(message)s")
+    written = asyncio.run(snapshot(str(Path(args.dir)), args.force))
+    print(f"✅ Wrote {len(written)} attendance snapshot month(s).")
+
+
+if __name__ == "__main__":
+    main()
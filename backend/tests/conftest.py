@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from app.database import Base, get_db
 from app.main import create_app
+from app.repositories.department_repo import reset_department_cache
 
 
 # In-memory SQLite for tests — fast, isolated, no cleanup needed
@@ -39,6 +40,7 @@ def event_loop():
 @pytest_asyncio.fixture(autouse=True)
 async def setup_database():
     """Create tables before each test, drop after."""
+    reset_department_cache()
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
@@ -46,6 +48,12 @@ async def setup_database():
         await conn.run_sync(Base.metadata.drop_all)
 
 
+@pytest.fixture
+def test_engine():
+    """The shared test engine, for tests that work below the HTTP layer."""
+    return engine
+
+
 async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
     """Override DB dependency with test session."""
     async with TestSessionLocal() as session:
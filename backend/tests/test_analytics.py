@@ -0,0 +1,246 @@
+"""Analytics endpoints: absenteeism, work time, missing attendance and the heatmap."""
+
+import base64
+from datetime import date, timedelta
+
+import pytest
+
+from app.config import settings
+from app.services.analytics_service import analytics_cache_stats, clear_analytics_cache
+from app.services.work_calendar import working_days
+
+np = pytest.importorskip("numpy")
+
+from app.services import absenteeism  # noqa: E402
+
+START = date.today() - timedelta(days=9)
+
+
+def test_metrics_grouped_by_employee():
+    P, A, H = 1, 2, 3
+    # employee 0: P P A A P P P H A   employee 1: A P A   employee 2: no records
+    records = [(0, d, s) for d, s in enumerate([P, P, A, A, P, P, P, H, A])]
+    records += [(1, d, s) for d, s in enumerate([A, P, A])]
+    records.reverse()  # input order must not matter
+    employee, day, status = (np.array(column) for column in zip(*records))
+
+    metrics = absenteeism.compute(employee, day, status, 3)
+    assert metrics.absent_days.tolist() == [3, 2, 0]
+    assert metrics.spells.tolist() == [2, 2, 0]
+    assert metrics.bradford_factor.tolist() == [12, 8, 0]
+    assert metrics.longest_present_streak.tolist() == [3, 1, 0]
+    assert metrics.last_absence.tolist() == [8, 2, -1]
+
+
+@pytest.mark.asyncio
+async def test_absenteeism_endpoint(client):
+    clear_analytics_cache()
+    employee_ids = []
+    for i, department in enumerate(["Engineering", "HR"]):
+        resp = await client.post("/api/v1/employees", json={
+            "employee_code": f"EMP-ABS-{i}",
+            "name": f"Absence {i}",
+            "email": f"absence{i}@company.com",
+            "department": department,
+            "date_of_joining": "2025-01-01",
+        })
+        employee_ids.append(resp.json()["id"])
+
+    # Employee 0: absent on days 2-3 and 7 (two spells, 3 days); employee 1 always present
+    for offset in range(8):
+        for i, employee_id in enumerate(employee_ids):
+            status = "ABSENT" if i == 0 and offset in (2, 3, 7) else "PRESENT"
+            await client.post("/api/v1/attendance", json={
+                "employee_id": employee_id,
+                "date": (START + timedelta(days=offset)).isoformat(),
+                "status": status,
+            })
+
+    response = await client.get("/api/v1/analytics/absenteeism")
+    assert response.status_code == 200
+    first, second = response.json()["employees"]
+    assert first["employee_code"] == "EMP-ABS-0"
+    assert (first["absent_days"], first["absence_spells"], first["bradford_factor"]) == (3, 2, 12)
+    assert first["longest_present_streak"] == 3
+    assert first["days_since_last_absence"] == 2
+    assert second["bradford_factor"] == 0
+    assert second["longest_present_streak"] == 8
+    assert second["days_since_last_absence"] is None
+
+    # Cached per (range, department) until the data changes; conditional GET works
+    hr = await client.get("/api/v1/analytics/absenteeism?department=HR")
+    assert [e["employee_code"] for e in hr.json()["employees"]] == ["EMP-ABS-1"]
+    misses = analytics_cache_stats()["misses"]
+    again = await client.get("/api/v1/analytics/absenteeism?department=HR")
+    assert again.json() == hr.json()
+    assert analytics_cache_stats()["misses"] == misses
+    assert (await client.get(
+        "/api/v1/analytics/absenteeism?department=HR", headers={"If-None-Match": hr.headers["ETag"]}
+    )).status_code == 304
+
+    await client.post("/api/v1/attendance", json={
+        "employee_id": employee_ids[1], "date": (START + timedelta(days=8)).isoformat(), "status": "ABSENT",
+    })
+    hr = await client.get("/api/v1/analytics/absenteeism?department=HR")
+    assert hr.json()["employees"][0]["bradford_factor"] == 1
+    assert analytics_cache_stats()["misses"] == misses + 1
+
+    unknown = await client.get("/api/v1/analytics/absenteeism?department=Nope")
+    assert unknown.json()["employees"] == []
+    inverted = await client.get(f"/api/v1/analytics/absenteeism?date_from={date.today()}&date_to={START}")
+    assert inverted.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_work_time_per_employee_and_department(client):
+    employee_ids = []
+    for i, department in enumerate(["Engineering", "HR"]):
+        resp = await client.post("/api/v1/employees", json={
+            "employee_code": f"EMP-WT-{i}",
+            "name": f"Work Time {i}",
+            "email": f"worktime{i}@company.com",
+            "department": department,
+            "date_of_joining": "2025-01-01",
+        })
+        employee_ids.append(resp.json()["id"])
+
+    records = [
+        (0, 0, "PRESENT", "09:30:00", "17:30:00"),  # late + early, 8h
+        (0, 1, "PRESENT", "08:45:00", "18:15:00"),  # 9.5h
+        (0, 2, "ABSENT", None, None),
+        (1, 0, "PRESENT", "09:00:00", "18:00:00"),  # exactly on time, 9h
+        (1, 1, "HALF_DAY", "09:10:00", None),       # late, no check-out: not worked
+    ]
+    for employee, offset, status, check_in, check_out in records:
+        resp = await client.post("/api/v1/attendance", json={
+            "employee_id": employee_ids[employee],
+            "date": (START + timedelta(days=offset)).isoformat(),
+            "status": status,
+            "check_in": check_in,
+            "check_out": check_out,
+        })
+        assert resp.status_code == 201
+
+    response = await client.get("/api/v1/analytics/work-time")
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["start_time"], body["end_time"]) == ("09:00:00", "18:00:00")
+    engineering, hr = body["groups"]
+    assert engineering["employee_code"] == "EMP-WT-0"
+    assert (engineering["days_worked"], engineering["total_worked_hours"], engineering["average_worked_hours"]) \
+        == (2, 17.5, 8.75)
+    assert (engineering["late_arrivals"], engineering["early_departures"]) == (1, 1)
+    assert (hr["days_worked"], hr["total_worked_hours"], hr["late_arrivals"]) == (1, 9.0, 1)
+
+    by_department = await client.get("/api/v1/analytics/work-time?group_by=department&start_time=09:45")
+    groups = {g["department"]: g for g in by_department.json()["groups"]}
+    assert groups["Engineering"]["employee_id"] is None
+    assert groups["Engineering"]["employees"] == 1
+    assert groups["HR"]["late_arrivals"] == 0
+    assert groups["Engineering"]["total_worked_hours"] == 17.5
+
+    hr_only = await client.get("/api/v1/analytics/work-time?department=HR")
+    assert [g["employee_code"] for g in hr_only.json()["groups"]] == ["EMP-WT-1"]
+
+
+@pytest.mark.asyncio
+async def test_missing_attendance_against_working_day_calendar(client, monkeypatch):
+    # Mon 3 – Sun 9 March 2025, Wednesday the 5th a holiday → 4 working days
+    monkeypatch.setattr(settings, "HOLIDAYS", {date(2025, 3, 5)})
+    employee_ids = []
+    for i, (department, joined) in enumerate([
+        ("Engineering", "2025-01-01"), ("HR", "2025-03-06"), ("HR", "2025-04-01"),
+    ]):
+        resp = await client.post("/api/v1/employees", json={
+            "employee_code": f"EMP-MIS-{i}",
+            "name": f"Missing {i}",
+            "email": f"missing{i}@company.com",
+            "department": department,
+            "date_of_joining": joined,
+        })
+        employee_ids.append(resp.json()["id"])
+
+    for employee, day in [(0, "2025-03-03"), (0, "2025-03-04"), (0, "2025-03-05"), (0, "2025-03-08"),
+                          (1, "2025-03-06")]:
+        resp = await client.post("/api/v1/attendance", json={
+            "employee_id": employee_ids[employee], "date": day, "status": "PRESENT",
+        })
+        assert resp.status_code == 201
+
+    url = "/api/v1/analytics/missing-attendance?date_from=2025-03-03&date_to=2025-03-09"
+    body = (await client.get(url)).json()
+    assert body["working_days"] == 4
+    assert body["total_missing"] == 3
+    # The employee who joins after the range is not expected at all
+    assert [(d["department"], d["employees"], d["expected_days"], d["recorded_days"], d["missing_days"])
+            for d in body["departments"]] == [("Engineering", 1, 4, 2, 2), ("HR", 1, 2, 1, 1)]
+    first, second = body["employees"]
+    assert first["employee_code"] == "EMP-MIS-0"
+    assert first["missing_dates"] == ["2025-03-06", "2025-03-07"]
+    assert second["missing_dates"] == ["2025-03-07"]
+
+    limited = (await client.get(f"{url}&limit=1")).json()
+    assert [e["employee_code"] for e in limited["employees"]] == ["EMP-MIS-0"]
+    assert limited["total_missing"] == 3
+    hr = (await client.get(f"{url}&department=HR")).json()
+    assert [d["department"] for d in hr["departments"]] == ["HR"]
+
+
+@pytest.mark.asyncio
+async def test_missing_attendance_over_the_longest_range(client, monkeypatch):
+    """ANALYTICS_MAX_DAYS of working days come from one recursive calendar CTE."""
+    date_to = date.today()
+    date_from = date_to - timedelta(days=settings.ANALYTICS_MAX_DAYS - 1)
+    holiday = next(d for d in (date_to - timedelta(days=n) for n in range(30, 40)) if d.weekday() < 5)
+    monkeypatch.setattr(settings, "HOLIDAYS", {holiday})
+    resp = await client.post("/api/v1/employees", json={
+        "employee_code": "EMP-MIS-LONG", "name": "Long", "email": "long@company.com",
+        "department": "Engineering", "date_of_joining": date_from.isoformat(),
+    })
+    await client.post("/api/v1/attendance", json={
+        "employee_id": resp.json()["id"], "date": date_from.isoformat(), "status": "PRESENT",
+    })
+
+    resp = await client.get("/api/v1/analytics/missing-attendance", params={
+        "date_from": date_from.isoformat(), "date_to": date_to.isoformat(),
+    })
+    assert resp.status_code == 200
+    body = resp.json()
+    expected = working_days(date_from, date_to)
+    assert body["working_days"] == len(expected) > 500
+    (employee,) = body["employees"]
+    assert employee["expected_days"] == len(expected)
+    assert employee["missing_dates"] == [d.isoformat() for d in expected if d != date_from]
+    assert holiday.isoformat() not in employee["missing_dates"]
+
+
+@pytest.mark.asyncio
+async def test_heatmap_grid_encodings(client):
+    employee_ids = []
+    for code in ("EMP-HM-B", "EMP-HM-A", "EMP-HM-X"):
+        resp = await client.post("/api/v1/employees", json={
+            "employee_code": code,
+            "name": code,
+            "email": f"{code.lower()}@company.com",
+            "department": "Finance" if code != "EMP-HM-X" else "HR",
+            "date_of_joining": "2025-01-01",
+        })
+        employee_ids.append(resp.json()["id"])
+    b, a, _ = employee_ids
+    for employee_id, offset, status in [(a, 0, "PRESENT"), (a, 1, "ABSENT"), (b, 2, "ON_LEAVE")]:
+        await client.post("/api/v1/attendance", json={
+            "employee_id": employee_id, "date": (START + timedelta(days=offset)).isoformat(), "status": status,
+        })
+
+    params = {"date_from": START.isoformat(), "date_to": (START + timedelta(days=3)).isoformat(),
+              "department": "Finance"}
+    data = (await client.get("/api/v1/analytics/heatmap", params=params)).json()
+    assert data["days"] == 4
+    assert data["employee_ids"] == [a, b]  # ordered by employee_code
+    assert list(base64.b64decode(data["grid"])) == [1, 2, 0, 0, 0, 0, 4, 0]
+
+    rle = (await client.get("/api/v1/analytics/heatmap", params={**params, "encoding": "rle"})).json()
+    assert rle["grid"] == "1P1A4.1L1."
+
+    too_long = {"date_from": START.isoformat(), "date_to": (START + timedelta(days=200)).isoformat()}
+    assert (await client.get("/api/v1/analytics/heatmap", params=too_long)).status_code == 422
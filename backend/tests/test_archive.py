@@ -0,0 +1,167 @@
+"""Attendance archival: row movement and transparent live + archive reads."""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.attendance_archive import AttendanceArchive
+from app.models.change_tombstone import ChangeTombstone
+from app.repositories.archive_repo import ArchiveRepository, month_start
+
+CUTOFF = date(2025, 3, 1)
+
+
+@pytest.fixture
+async def archived(client, test_engine):
+    """Two employees with attendance in Feb and Mar 2025; February archived."""
+    employee_ids = []
+    for i, department in enumerate(["Engineering", "HR"]):
+        resp = await client.post("/api/v1/employees", json={
+            "employee_code": f"EMP-ARC-{i}",
+            "name": f"Archive User {i}",
+            "email": f"archive{i}@company.com",
+            "department": department,
+            "date_of_joining": "2025-01-01",
+        })
+        employee_ids.append(resp.json()["id"])
+
+    for employee_id in employee_ids:
+        for day in ["2025-02-10", "2025-02-11", "2025-03-10"]:
+            resp = await client.post("/api/v1/attendance", json={
+                "employee_id": employee_id, "date": day, "status": "PRESENT",
+            })
+            assert resp.status_code == 201
+
+    async with AsyncSession(test_engine) as session:
+        repo = ArchiveRepository(session)
+        await repo.close(CUTOFF)
+        await session.commit()
+        batches = []
+        while batch := await repo.move_batch(CUTOFF, limit=3):
+            batches.append(batch)
+        assert await repo.mark_archived() == date(2025, 2, 28)
+        await session.commit()
+    # Whole dates per batch: two rows a day, so a limit of 3 moves one day at a time
+    assert batches == [2, 2]
+    return employee_ids
+
+
+def test_month_start():
+    assert month_start(date(2025, 3, 17)) == date(2025, 3, 1)
+    assert month_start(date(2025, 3, 17), 3) == date(2024, 12, 1)
+    assert month_start(date(2025, 12, 5), -1) == date(2026, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_list_reads_archive_only_when_range_needs_it(client, archived):
+    live_only = await client.get("/api/v1/attendance?date_from=2025-03-01")
+    assert live_only.json()["meta"]["total"] == 2
+
+    everything = await client.get("/api/v1/attendance")
+    data = everything.json()
+    assert data["meta"]["total"] == 6
+    assert [item["date"] for item in data["data"]] == ["2025-03-10"] * 2 + ["2025-02-11"] * 2 + ["2025-02-10"] * 2
+    assert data["data"][-1]["employee_name"].startswith("Archive User")
+
+    # A page straddling the live/archive boundary, and one wholly in the archive
+    page = await client.get("/api/v1/attendance?per_page=4&page=1")
+    assert [item["date"] for item in page.json()["data"]] == ["2025-03-10"] * 2 + ["2025-02-11"] * 2
+    page = await client.get("/api/v1/attendance?per_page=4&page=2")
+    assert [item["date"] for item in page.json()["data"]] == ["2025-02-10"] * 2
+
+    by_department = await client.get("/api/v1/attendance?department=HR&date_from=2025-02-01")
+    assert by_department.json()["meta"]["total"] == 3
+
+
+@pytest.mark.asyncio
+async def test_dashboard_includes_archived_range(client, archived):
+    response = await client.get("/api/v1/dashboard/summary?date_from=2025-02-01&date_to=2025-03-31")
+    assert response.json()["summary"]["present"] == 6
+
+    response = await client.get("/api/v1/dashboard/summary?date_from=2025-03-01&date_to=2025-03-31")
+    assert response.json()["summary"]["present"] == 2
+
+
+@pytest.mark.asyncio
+async def test_archived_months_are_read_only(client, archived):
+    response = await client.post("/api/v1/attendance", json={
+        "employee_id": archived[0], "date": "2025-02-05", "status": "ABSENT",
+    })
+    assert response.status_code == 422
+    assert response.json()["error_code"] == "ATTENDANCE_ARCHIVED"
+
+
+@pytest.mark.asyncio
+async def test_employee_delete_removes_archived_attendance(client, archived, test_engine):
+    assert (await client.delete(f"/api/v1/employees/{archived[0]}")).status_code == 204
+
+    async with AsyncSession(test_engine) as session:
+        remaining = await session.execute(
+            select(func.count()).select_from(AttendanceArchive).where(AttendanceArchive.employee_id == archived[0])
+        )
+        assert remaining.scalar_one() == 0
+        # Live and archived rows both leave change-feed tombstones
+        tombstones = await session.execute(
+            select(func.count()).select_from(ChangeTombstone).where(ChangeTombstone.entity == "attendance")
+        )
+        assert tombstones.scalar_one() == 3
+
+
+@pytest.mark.asyncio
+async def test_horizon_is_recorded_only_when_run_completes(client, test_engine):
+    """Mid-run the dates are closed and read from both tables, but not yet marked archived."""
+    resp = await client.post("/api/v1/employees", json={
+        "employee_code": "EMP-ARC-RUN",
+        "name": "Archive Run",
+        "email": "archive.run@company.com",
+        "department": "Engineering",
+        "date_of_joining": "2025-01-01",
+    })
+    employee_id = resp.json()["id"]
+    for day in ["2025-02-10", "2025-02-11", "2025-03-10"]:
+        await client.post("/api/v1/attendance", json={"employee_id": employee_id, "date": day, "status": "PRESENT"})
+
+    async with AsyncSession(test_engine) as session:
+        repo = ArchiveRepository(session)
+        assert await repo.close(CUTOFF) == CUTOFF - timedelta(days=1)
+        await session.commit()
+        assert await repo.move_batch(CUTOFF, limit=1) == 1
+        await session.commit()
+        assert await repo.archived_through() is None
+        # Not everything closed has moved yet
+        assert await repo.mark_archived() is None
+        await session.commit()
+
+    # 2025-02-11 is still live but closed; the list spans both tables in date order
+    response = await client.post("/api/v1/attendance", json={
+        "employee_id": employee_id, "date": "2025-02-11", "status": "ABSENT",
+    })
+    assert response.json()["error_code"] == "ATTENDANCE_ARCHIVED"
+    listed = await client.get("/api/v1/attendance")
+    assert [item["date"] for item in listed.json()["data"]] == ["2025-03-10", "2025-02-11", "2025-02-10"]
+
+    async with AsyncSession(test_engine) as session:
+        repo = ArchiveRepository(session)
+        assert await repo.move_batch(CUTOFF, limit=1) == 1
+        assert await repo.mark_archived() == date(2025, 2, 28)
+        await session.commit()
+        assert await repo.archived_span() == (date(2025, 2, 10), date(2025, 2, 28))
+
+
+@pytest.mark.asyncio
+async def test_archived_record_by_id_is_read_only(client, archived):
+    listed = await client.get("/api/v1/attendance?date_to=2025-02-28")
+    record_id = listed.json()["data"][0]["id"]
+
+    detail = await client.get(f"/api/v1/attendance/{record_id}")
+    assert detail.status_code == 200
+    assert detail.json()["date"] == "2025-02-11"
+    cached = await client.get(f"/api/v1/attendance/{record_id}", headers={"If-None-Match": detail.headers["ETag"]})
+    assert cached.status_code == 304
+
+    response = await client.put(f"/api/v1/attendance/{record_id}", json={"notes": "late"})
+    assert response.json()["error_code"] == "ATTENDANCE_ARCHIVED"
+    response = await client.delete(f"/api/v1/attendance/{record_id}")
+    assert response.json()["error_code"] == "ATTENDANCE_ARCHIVED"
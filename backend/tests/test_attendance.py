@@ -120,6 +120,38 @@ async def test_list_attendance_with_filters(client, employee_id):
     assert data["data"][0]["employee_id"] == employee_id
 
 
+@pytest.mark.asyncio
+async def test_list_attendance_multi_value_filters(client, employee_id):
+    """Repeated and comma-separated filter values match any of them."""
+    ids = [employee_id]
+    for n, department in [(2, "HR"), (3, "Finance")]:
+        resp = await client.post("/api/v1/employees", json={
+            "employee_code": f"EMP-ATT-00{n}", "name": f"User {n}", "email": f"user{n}@company.com",
+            "department": department, "date_of_joining": "2025-01-01",
+        })
+        ids.append(resp.json()["id"])
+    day = date.today().isoformat()
+    for emp, status in zip(ids, ["PRESENT", "ABSENT", "HALF_DAY"]):
+        await client.post("/api/v1/attendance", json={"employee_id": emp, "date": day, "status": status})
+
+    resp = await client.get("/api/v1/attendance", params=[("status", "ABSENT"), ("status", "HALF_DAY")])
+    assert sorted(r["status"] for r in resp.json()["data"]) == ["ABSENT", "HALF_DAY"]
+    resp = await client.get("/api/v1/attendance", params={"employee_id": f"{ids[0]},{ids[2]}"})
+    assert {r["employee_id"] for r in resp.json()["data"]} == {ids[0], ids[2]}
+    # Unknown department names are ignored as long as one is known
+    resp = await client.get("/api/v1/attendance", params=[
+        ("department", "Engineering"), ("department", "HR"), ("department", "Nowhere"),
+    ])
+    assert resp.json()["meta"]["total"] == 2
+    resp = await client.get("/api/v1/attendance", params=[("department", "Nowhere"), ("department", "Elsewhere")])
+    assert resp.json()["meta"]["total"] == 0
+
+    too_many = ",".join(f"id-{i}" for i in range(501))
+    resp = await client.get("/api/v1/attendance", params={"employee_id": too_many})
+    assert resp.status_code == 422
+    assert resp.json()["error_code"] == "TOO_MANY_FILTER_VALUES"
+
+
 @pytest.mark.asyncio
 async def test_delete_attendance_success(client, employee_id):
     """Test attendance deletion returns 204."""
@@ -140,3 +172,218 @@ async def test_delete_attendance_not_found_404(client):
     """DELETE non-existent attendance returns 404."""
     response = await client.delete("/api/v1/attendance/nonexistent-uuid")
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_list_attendance_etag_invalidated_by_write(client, employee_id):
+    """List ETag: 304 while unchanged, new tag after a record is added."""
+    first = await client.get("/api/v1/attendance")
+    etag = first.headers["ETag"]
+
+    cached = await client.get("/api/v1/attendance", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    await client.post("/api/v1/attendance", json={
+        "employee_id": employee_id,
+        "date": date.today().isoformat(),
+        "status": "PRESENT",
+    })
+    refreshed = await client.get("/api/v1/attendance", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.json()["meta"]["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_etags_follow_db_markers_across_workers(client, employee_id, test_engine):
+    """A delete by another worker (no shared process state) moves the list tag through COUNT;
+    detail tags depend only on their own row."""
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.repositories.attendance_repo import AttendanceRepository
+
+    ids = []
+    for offset in (1, 2):
+        resp = await client.post("/api/v1/attendance", json={
+            "employee_id": employee_id,
+            "date": (date.today() - timedelta(days=offset)).isoformat(),
+            "status": "PRESENT",
+        })
+        ids.append(resp.json()["id"])
+    kept, deleted = ids
+    list_etag = (await client.get("/api/v1/attendance")).headers["ETag"]
+    detail_etag = (await client.get(f"/api/v1/attendance/{kept}")).headers["ETag"]
+
+    async with AsyncSession(test_engine) as session:
+        repo = AttendanceRepository(session)
+        await repo.delete(await repo.get_by_id(deleted))
+        await session.commit()
+
+    refreshed = await client.get("/api/v1/attendance", headers={"If-None-Match": list_etag})
+    assert refreshed.status_code == 200
+    assert [r["id"] for r in refreshed.json()["data"]] == [kept]
+    detail = await client.get(f"/api/v1/attendance/{kept}", headers={"If-None-Match": detail_etag})
+    assert detail.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_auto_absent_marks_only_unrecorded(client, test_engine):
+    """One INSERT ... SELECT marks active, joined, unrecorded employees; re-runs add nothing."""
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.services.auto_absent import mark_unrecorded_absent
+    from app.services.exceptions import ValidationException
+
+    day = date.today() - timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    ids = {}
+    for code, joined in [("REC", "2025-01-01"), ("NONE", "2025-01-01"), ("GONE", "2025-01-01"), ("NEW", None)]:
+        resp = await client.post("/api/v1/employees", json={
+            "employee_code": f"EMP-AUTO-{code}",
+            "name": f"Auto {code}",
+            "email": f"auto.{code.lower()}@company.com",
+            "department": "Engineering",
+            "date_of_joining": joined or date.today().isoformat(),
+        })
+        ids[code] = resp.json()["id"]
+    await client.post("/api/v1/attendance", json={"employee_id": ids["REC"], "date": day.isoformat(), "status": "PRESENT"})
+    await client.put(f"/api/v1/employees/{ids['GONE']}", json={"is_active": False})
+
+    async with AsyncSession(test_engine) as session:
+        report = await mark_unrecorded_absent(session, day)
+        await session.commit()
+        assert (report.active_employees, report.not_joined, report.already_recorded, report.inserted) == (3, 1, 1, 1)
+        assert (await mark_unrecorded_absent(session, day)).inserted == 0
+
+        saturday = day + timedelta(days=5 - day.weekday())
+        if saturday <= date.today():
+            assert not (await mark_unrecorded_absent(session, saturday)).working_day
+        with pytest.raises(ValidationException) as exc:
+            await mark_unrecorded_absent(session, date.today() + timedelta(days=1))
+        assert exc.value.error_code == "FUTURE_DATE"
+
+    resp = await client.get("/api/v1/attendance", params={"date_from": day.isoformat(), "date_to": day.isoformat()})
+    statuses = {row["employee_id"]: row["status"] for row in resp.json()["data"]}
+    assert statuses == {ids["REC"]: "PRESENT", ids["NONE"]: "ABSENT"}
+
+
+@pytest.mark.asyncio
+async def test_nightly_auto_absent_closes_the_scheduled_day(monkeypatch):
+    """A wake-up that overshoots midnight still runs for the day it was scheduled for."""
+    import asyncio
+    from datetime import datetime, time
+
+    from app.services import auto_absent
+
+    clock = iter([datetime(2025, 3, 3, 23, 0), datetime(2025, 3, 4, 0, 5)])
+
+    class FakeDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return next(clock)
+
+    async def no_sleep(seconds):
+        pass
+
+    runs = []
+
+    async def run_once(day=None):
+        runs.append(day)
+        raise asyncio.CancelledError
+
+    monkeypatch.setattr(auto_absent, "datetime", FakeDatetime)
+    monkeypatch.setattr(auto_absent, "_sleep", no_sleep)
+    monkeypatch.setattr(auto_absent, "run_once", run_once)
+    monkeypatch.setattr(auto_absent.settings, "AUTO_ABSENT_AT", time(23, 55))
+    with pytest.raises(asyncio.CancelledError):
+        await auto_absent._nightly()
+    assert runs == [date(2025, 3, 3)]
+
+
+@pytest.mark.asyncio
+async def test_upsert_merges_repeated_punches(client, employee_id):
+    """A re-sent punch merges: earliest check_in, latest check_out, notes only fill a blank."""
+    today = date.today().isoformat()
+    first = await client.post("/api/v1/attendance/upsert", json={
+        "employee_id": employee_id, "date": today, "status": "PRESENT", "check_in": "09:05:00", "notes": "gate A",
+    })
+    assert first.status_code == 201
+
+    second = await client.post("/api/v1/attendance/upsert", json={
+        "employee_id": employee_id, "date": today, "status": "PRESENT",
+        "check_in": "09:30:00", "check_out": "18:10:00", "notes": "gate B",
+    })
+    assert second.status_code == 200
+    data = second.json()
+    assert data["id"] == first.json()["id"]
+    assert (data["check_in"], data["check_out"], data["notes"]) == ("09:05:00", "18:10:00", "gate A")
+
+    # Identical re-send changes nothing, so the record's version stays put
+    again = await client.post("/api/v1/attendance/upsert", json={
+        "employee_id": employee_id, "date": today, "status": "PRESENT", "check_out": "17:00:00",
+    })
+    assert again.status_code == 200
+    assert again.json()["check_out"] == "18:10:00"
+    assert again.json()["updated_at"] == data["updated_at"]
+
+    future = await client.post("/api/v1/attendance/upsert", json={
+        "employee_id": employee_id, "date": (date.today() + timedelta(days=1)).isoformat(), "status": "PRESENT",
+    })
+    assert future.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_upsert_batch_reports_each_record(client, employee_id):
+    today = date.today()
+    yesterday = (today - timedelta(days=1)).isoformat()
+    resp = await client.post("/api/v1/attendance/upsert/batch", json={"records": [
+        {"employee_id": employee_id, "date": yesterday, "status": "PRESENT", "check_in": "09:00:00"},
+        {"employee_id": employee_id, "date": yesterday, "status": "HALF_DAY", "check_out": "13:00:00"},
+        {"employee_id": employee_id, "date": today.isoformat(), "status": "ABSENT"},
+        {"employee_id": "00000000-0000-0000-0000-000000000000", "date": yesterday, "status": "PRESENT"},
+    ]})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert (data["created"], data["updated"], data["failed"]) == (2, 1, 1)
+    assert [r["result"] for r in data["results"]] == ["created", "updated", "created", "error"]
+    assert data["results"][0]["id"] == data["results"][1]["id"]
+    assert data["results"][3]["error"]["error_code"] == "EMPLOYEE_NOT_FOUND"
+
+    record = (await client.get(f"/api/v1/attendance/{data['results'][0]['id']}")).json()
+    assert (record["status"], record["check_in"], record["check_out"]) == ("HALF_DAY", "09:00:00", "13:00:00")
+
+
+@pytest.mark.asyncio
+async def test_roster_pages_active_employees_with_their_record(client, employee_id):
+    """Active employees with the day's record or null; keyset pages by employee_code."""
+    day = date.today() - timedelta(days=1)
+    ids = {"EMP-ATT-001": employee_id}
+    for code, department, joined in [("EMP-ATT-002", "Engineering", "2025-01-01"),
+                                     ("EMP-ATT-003", "HR", "2025-01-01"),
+                                     ("EMP-ATT-004", "Engineering", date.today().isoformat())]:
+        resp = await client.post("/api/v1/employees", json={
+            "employee_code": code, "name": code, "email": f"{code.lower()}@company.com",
+            "department": department, "date_of_joining": joined,
+        })
+        ids[code] = resp.json()["id"]
+    await client.put(f"/api/v1/employees/{ids['EMP-ATT-003']}", json={"is_active": False})
+    await client.post("/api/v1/attendance", json={
+        "employee_id": ids["EMP-ATT-002"], "date": day.isoformat(), "status": "PRESENT", "check_in": "09:00:00",
+    })
+
+    first = (await client.get("/api/v1/attendance/roster", params={"date": day.isoformat(), "limit": 1})).json()
+    assert [e["employee_code"] for e in first["data"]] == ["EMP-ATT-001"]
+    assert first["data"][0]["attendance"] is None
+    second = (await client.get("/api/v1/attendance/roster", params={
+        "date": day.isoformat(), "limit": 1, "cursor": first["next_cursor"],
+    })).json()
+    # EMP-ATT-003 is inactive and EMP-ATT-004 had not joined yet
+    assert [e["employee_code"] for e in second["data"]] == ["EMP-ATT-002"]
+    assert second["data"][0]["attendance"]["status"] == "PRESENT"
+    assert second["data"][0]["attendance"]["check_in"] == "09:00:00"
+    assert second["next_cursor"] is None
+
+    hr = await client.get("/api/v1/attendance/roster", params={"department": "HR"})
+    assert hr.json()["data"] == []
+    bad = await client.get("/api/v1/attendance/roster", params={"cursor": "%%%"})
+    assert bad.status_code == 422
@@ -0,0 +1,88 @@
+"""Write-behind attendance intake: 202 + tracking id, batched writer, backpressure."""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.schemas.attendance import AttendanceCreate
+from app.services.attendance_intake import AttendanceIntake, attendance_intake
+from app.services.exceptions import AppException
+
+
+@pytest.fixture
+async def employee_id(client):
+    resp = await client.post("/api/v1/employees", json={
+        "employee_code": "EMP-INTAKE",
+        "name": "Intake User",
+        "email": "intake@company.com",
+        "department": "Engineering",
+        "date_of_joining": "2025-01-01",
+    })
+    return resp.json()["id"]
+
+
+@pytest.fixture
+async def running_intake(test_engine):
+    attendance_intake.start(async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False))
+    yield attendance_intake
+    await attendance_intake.stop()
+
+
+@pytest.mark.asyncio
+async def test_intake_unavailable_when_not_running(client, employee_id):
+    resp = await client.post("/api/v1/attendance/intake", json={
+        "employee_id": employee_id, "date": date.today().isoformat(), "status": "PRESENT",
+    })
+    assert resp.status_code == 503
+    assert resp.json()["error_code"] == "INTAKE_UNAVAILABLE"
+
+
+@pytest.mark.asyncio
+async def test_intake_queues_then_writes_in_one_batch(client, employee_id, running_intake):
+    today = date.today()
+    payloads = [
+        {"employee_id": employee_id, "date": (today - timedelta(days=1)).isoformat(), "status": "PRESENT"},
+        {"employee_id": employee_id, "date": today.isoformat(), "status": "PRESENT", "check_in": "09:01:00"},
+        {"employee_id": "00000000-0000-0000-0000-000000000000", "date": today.isoformat(), "status": "PRESENT"},
+    ]
+    tracking = []
+    for payload in payloads:
+        resp = await client.post("/api/v1/attendance/intake", json=payload)
+        assert resp.status_code == 202
+        assert resp.json()["status"] == "queued"
+        assert resp.headers["Location"].endswith(resp.json()["tracking_id"])
+        tracking.append(resp.json()["tracking_id"])
+
+    future = await client.post("/api/v1/attendance/intake", json={
+        "employee_id": employee_id, "date": (today + timedelta(days=1)).isoformat(), "status": "PRESENT",
+    })
+    assert future.status_code == 422
+
+    batches_before = running_intake.batches
+    await running_intake.stop()  # drains the queue
+    assert running_intake.batches == batches_before + 1
+
+    results = [(await client.get(f"/api/v1/attendance/intake/{t}")).json() for t in tracking]
+    assert [r["status"] for r in results] == ["created", "created", "error"]
+    assert results[2]["error"]["error_code"] == "EMPLOYEE_NOT_FOUND"
+    record = (await client.get(f"/api/v1/attendance/{results[1]['attendance_id']}")).json()
+    assert record["check_in"] == "09:01:00"
+
+    assert (await client.get("/api/v1/attendance/intake/unknown")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_full_queue_is_rejected_with_429(test_engine):
+    intake = AttendanceIntake(max_queue=1)
+    intake.start(async_sessionmaker(test_engine, class_=AsyncSession))
+    record = AttendanceCreate(employee_id="e", date=date.today(), status="PRESENT")
+    try:
+        intake.submit(record)
+        with pytest.raises(AppException) as exc:
+            intake.submit(record)
+        assert exc.value.status_code == 429
+        assert exc.value.headers["Retry-After"] == "1"
+        assert intake.stats()["rejected"] == 1
+    finally:
+        await intake.stop()
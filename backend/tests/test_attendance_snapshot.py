@@ -0,0 +1,130 @@
+"""Columnar snapshot files: closed-month selection, zero-copy reads, engine integration."""
+
+from datetime import date, time
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.repositories.archive_repo import ArchiveRepository
+from app.services.attendance_snapshot import AttendanceSnapshot, snapshot_months, snapshot_path
+from app.services.columnar_engine import columnar_engine
+from app.services.job_handlers import _export_rows
+from scripts.snapshot_attendance import write_closed_months
+
+pytest.importorskip("numpy")
+
+RANGE = "date_from=2025-01-01&date_to=2025-03-31&include_inactive=true"
+
+
+@pytest.fixture
+async def snapshotted(client, test_engine, tmp_path, monkeypatch):
+    """Attendance before 2025-02-15 archived; only January is closed (Feb ends after archived_through)."""
+    employee_ids = []
+    for i, department in enumerate(["Engineering", "HR"]):
+        resp = await client.post("/api/v1/employees", json={
+            "employee_code": f"EMP-SNAP-{i}",
+            "name": f"Snapshot User {i}",
+            "email": f"snapshot{i}@company.com",
+            "department": department,
+            "date_of_joining": "2025-01-01",
+        })
+        employee_ids.append(resp.json()["id"])
+
+    for employee_id in employee_ids:
+        for day, status in [("2025-01-10", "PRESENT"), ("2025-01-31", "ABSENT"),
+                            ("2025-02-10", "HALF_DAY"), ("2025-03-10", "PRESENT")]:
+            resp = await client.post("/api/v1/attendance", json={
+                "employee_id": employee_id, "date": day, "status": status,
+                "check_in": "09:15:00" if status == "PRESENT" else None,
+                "notes": "sick" if status == "ABSENT" else None,
+            })
+            assert resp.status_code == 201
+
+    async with AsyncSession(test_engine) as session:
+        repo = ArchiveRepository(session)
+        await repo.close(date(2025, 2, 15))
+        while await repo.move_batch(date(2025, 2, 15), limit=100):
+            pass
+        assert await repo.mark_archived() == date(2025, 2, 14)
+        await session.commit()
+        assert await write_closed_months(session, str(tmp_path)) == [date(2025, 1, 1)]
+        # Already written months are skipped
+        assert await write_closed_months(session, str(tmp_path)) == []
+
+    monkeypatch.setattr(settings, "ATTENDANCE_SNAPSHOT_DIR", str(tmp_path))
+    columnar_engine.reset()
+    columnar_engine.start_warmup(async_sessionmaker(test_engine, expire_on_commit=False))
+    await columnar_engine.wait_loaded()
+    yield employee_ids
+    columnar_engine.reset()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_columns_are_zero_copy_views(snapshotted, tmp_path):
+    assert snapshot_months(tmp_path) == [date(2025, 1, 1)]
+    snapshot = AttendanceSnapshot(snapshot_path(tmp_path, date(2025, 1, 1)))
+    assert len(snapshot) == 4
+    for column in (snapshot.employee, snapshot.day, snapshot.status, snapshot.check_in):
+        assert not column.flags.owndata
+        assert not column.flags.writeable
+
+    records = list(snapshot.records())
+    assert {record["employee_id"] for record in records} == set(snapshotted)
+    assert {record["department"] for record in records} == {"Engineering", "HR"}
+    first = next(r for r in records if r["employee_id"] == snapshot.employee_ids[0] and r["status"] == "PRESENT")
+    assert first["date"] == date(2025, 1, 10)
+    assert first["check_in"] == time(9, 15)
+    assert first["check_out"] is None
+
+
+async def _compare(client, monkeypatch, path: str) -> dict:
+    bodies = {}
+    for backend in ("sql", "columnar"):
+        monkeypatch.setattr(settings, "DASHBOARD_BACKEND", backend)
+        bodies[backend] = (await client.get(path)).json()
+        bodies[backend].get("department_breakdown", []).sort(key=lambda d: d["department"])
+    assert bodies["columnar"] == bodies["sql"]
+    return bodies["sql"]
+
+
+@pytest.mark.asyncio
+async def test_engine_serves_closed_months_from_snapshot(client, snapshotted, monkeypatch):
+    summary = await _compare(client, monkeypatch, f"/api/v1/dashboard/summary?{RANGE}")
+    assert summary["summary"] == {"present": 4, "absent": 2, "half_day": 2, "on_leave": 0}
+    await _compare(client, monkeypatch, f"/api/v1/dashboard/summary?{RANGE}&department=HR")
+    await _compare(client, monkeypatch, "/api/v1/dashboard/trend?date_from=2025-01-01&date_to=2025-02-28")
+
+    stats = columnar_engine.stats()
+    assert stats["snapshot_months"] == 1
+    assert stats["snapshot_rows"] == 4
+    assert stats["rows"] == 4  # February (archived, not closed) and March from the DB
+
+    # Deleting an employee removes their archived rows; the mapped month masks them out
+    await client.delete(f"/api/v1/employees/{snapshotted[0]}")
+    summary = await _compare(client, monkeypatch, f"/api/v1/dashboard/summary?{RANGE}")
+    assert sum(summary["summary"].values()) == 4
+    assert columnar_engine.full_loads == 1
+
+
+@pytest.mark.asyncio
+async def test_export_reads_closed_months_from_snapshot(snapshotted, test_engine, monkeypatch):
+    async def export(**filters):
+        async with AsyncSession(test_engine) as session:
+            return [tuple(row) async for chunk in _export_rows(session, **filters) for row in chunk]
+
+    for filters in (
+        {"date_from": None, "date_to": None, "department_id": None, "employee_id": None},
+        {"date_from": date(2025, 1, 20), "date_to": date(2025, 2, 28), "department_id": None, "employee_id": None},
+        {"date_from": date(2025, 1, 1), "date_to": date(2025, 1, 31), "department_id": None,
+         "employee_id": snapshotted[1]},
+    ):
+        mapped = await export(**filters)
+        with monkeypatch.context() as patch:
+            patch.setattr(settings, "ATTENDANCE_SNAPSHOT_DIR", None)
+            assert mapped == await export(**filters)
+
+    rows = await export(date_from=None, date_to=None, department_id=None, employee_id=None)
+    assert [row[3] for row in rows] == sorted(row[3] for row in rows)
+    assert [row[0] for row in rows[:2]] == ["EMP-SNAP-0", "EMP-SNAP-1"]
+    assert {row[7] for row in rows if row[3] == date(2025, 1, 31)} == {"sick"}
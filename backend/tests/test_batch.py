@@ -0,0 +1,56 @@
+"""Batch endpoint tests."""
+
+from datetime import date
+
+import pytest
+
+
+@pytest.fixture
+async def employee_id(client):
+    resp = await client.post("/api/v1/employees", json={
+        "employee_code": "EMP-B01",
+        "name": "Batch User",
+        "email": "batch@company.com",
+        "department": "Engineering",
+        "date_of_joining": "2025-01-01",
+    })
+    return resp.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_results_in_order(client, employee_id):
+    """Dashboard-style page load: several GETs in one round trip."""
+    today = date.today().isoformat()
+    response = await client.post("/api/v1/batch", json={"requests": [
+        {"id": "summary", "path": f"/api/v1/dashboard/summary?date_from={today}"},
+        {"id": "employees", "path": "/api/v1/employees?is_active=true"},
+        {"id": "attendance", "path": f"/api/v1/attendance?date={today}"},
+        {"id": "missing", "path": "/api/v1/employees/does-not-exist"},
+    ]})
+    assert response.status_code == 200
+    results = response.json()["responses"]
+
+    assert [r["id"] for r in results] == ["summary", "employees", "attendance", "missing"]
+    assert results[0]["status"] == 200
+    assert results[0]["body"]["total_employees"] == 1
+    assert results[1]["body"]["data"][0]["id"] == employee_id
+    assert results[2]["body"]["meta"]["total"] == 0
+    assert results[3]["status"] == 404
+    assert results[3]["body"]["error_code"] == "EMPLOYEE_NOT_FOUND"
+
+
+@pytest.mark.asyncio
+async def test_batch_forwards_conditional_headers(client, employee_id):
+    first = await client.get(f"/api/v1/employees/{employee_id}")
+    response = await client.post("/api/v1/batch", json={"requests": [
+        {"path": f"/api/v1/employees/{employee_id}", "headers": {"If-None-Match": first.headers["ETag"]}},
+    ]})
+    assert response.json()["responses"][0]["status"] == 304
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_non_api_and_recursive_paths(client):
+    for path in ("/docs", "/api/v1/batch"):
+        response = await client.post("/api/v1/batch", json={"requests": [{"path": path}]})
+        assert response.status_code == 422
+        assert response.json()["error_code"] == "BATCH_INVALID_PATH"
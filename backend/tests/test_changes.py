@@ -0,0 +1,112 @@
+"""Change feed tests."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.change_tombstone import ChangeTombstone
+from app.services.change_service import ChangeService, encode_cursor
+
+
+@pytest.fixture(autouse=True)
+def no_settle_window(monkeypatch):
+    """Tests read their own writes immediately."""
+    monkeypatch.setattr(settings, "CHANGES_SETTLE_SECONDS", 0)
+
+
+async def _create_employee(client, code: str) -> str:
+    resp = await client.post("/api/v1/employees", json={
+        "employee_code": code,
+        "name": f"Feed {code}",
+        "email": f"{code.lower()}@company.com",
+        "department": "Engineering",
+        "date_of_joining": "2025-01-01",
+    })
+    return resp.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_initial_sync_then_incremental(client):
+    """Full sync without cursor, then an empty poll returns the same cursor."""
+    emp_id = await _create_employee(client, "EMP-F01")
+    await client.post("/api/v1/attendance", json={
+        "employee_id": emp_id, "date": date.today().isoformat(), "status": "PRESENT",
+    })
+
+    first = (await client.get("/api/v1/changes")).json()
+    assert [(c["entity"], c["op"]) for c in first["changes"]] == [
+        ("employee", "upsert"),
+        ("attendance", "upsert"),
+    ]
+    assert first["changes"][1]["data"]["employee_name"] == "Feed EMP-F01"
+    assert first["has_more"] is False
+
+    poll = (await client.get(f"/api/v1/changes?since={first['next_cursor']}")).json()
+    assert poll["changes"] == []
+    assert poll["next_cursor"] == first["next_cursor"]
+
+
+@pytest.mark.asyncio
+async def test_cascade_delete_emits_tombstones(client):
+    """INV-8 cascade: deleted employee and its attendance both appear as deletes."""
+    emp_id = await _create_employee(client, "EMP-F02")
+    att = await client.post("/api/v1/attendance", json={
+        "employee_id": emp_id, "date": date.today().isoformat(), "status": "ABSENT",
+    })
+    cursor = (await client.get("/api/v1/changes")).json()["next_cursor"]
+
+    await client.delete(f"/api/v1/employees/{emp_id}")
+
+    changes = (await client.get(f"/api/v1/changes?since={cursor}")).json()["changes"]
+    assert {(c["entity"], c["op"], c["id"]) for c in changes} == {
+        ("attendance", "delete", att.json()["id"]),
+        ("employee", "delete", emp_id),
+    }
+    assert all(c["data"] is None for c in changes)
+
+
+@pytest.mark.asyncio
+async def test_paging_with_limit(client):
+    ids = [await _create_employee(client, f"EMP-P{i}") for i in range(3)]
+
+    seen, cursor, has_more = [], None, True
+    while has_more:
+        url = "/api/v1/changes?limit=2" + (f"&since={cursor}" if cursor else "")
+        page = (await client.get(url)).json()
+        seen.extend(c["id"] for c in page["changes"])
+        cursor, has_more = page["next_cursor"], page["has_more"]
+
+    assert sorted(seen) == sorted(ids)
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_422(client):
+    response = await client.get("/api/v1/changes?since=not-a-cursor")
+    assert response.status_code == 422
+    assert response.json()["error_code"] == "INVALID_CURSOR"
+
+
+@pytest.mark.asyncio
+async def test_tombstone_retention(client, test_engine):
+    """Old tombstones are purged, and cursors older than the retention are refused."""
+    kept = await _create_employee(client, "EMP-F10")
+    purged = await _create_employee(client, "EMP-F11")
+    await client.delete(f"/api/v1/employees/{kept}")
+    await client.delete(f"/api/v1/employees/{purged}")
+
+    expired = datetime.now() - timedelta(days=settings.CHANGES_TOMBSTONE_RETENTION_DAYS + 1)
+    async with AsyncSession(test_engine) as session:
+        await session.execute(
+            update(ChangeTombstone).where(ChangeTombstone.entity_id == purged).values(deleted_at=expired)
+        )
+        assert await ChangeService(session).purge_tombstones() == 1
+        await session.commit()
+        remaining = await session.execute(select(func.count()).select_from(ChangeTombstone))
+        assert remaining.scalar_one() == 1
+
+    response = await client.get(f"/api/v1/changes?since={encode_cursor((expired, 0, ''))}")
+    assert response.status_code == 410
+    assert response.json()["error_code"] == "CURSOR_EXPIRED"
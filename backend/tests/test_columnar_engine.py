@@ -0,0 +1,119 @@
+"""Columnar dashboard backend: results must match the SQL backend after every kind of write."""
+
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.config import settings
+from app.services.columnar_engine import columnar_engine
+
+pytest.importorskip("numpy")
+
+START = date.today() - timedelta(days=6)
+
+
+@pytest.fixture(autouse=True)
+async def fresh_engine(test_engine):
+    """Each test gets a new database, so the shared engine must start empty.
+
+    Loaded up front so columnar requests are answered by the engine rather
+    than the SQL fallback used while it warms up.
+    """
+    columnar_engine.reset()
+    columnar_engine.start_warmup(async_sessionmaker(test_engine, expire_on_commit=False))
+    await columnar_engine.wait_loaded()
+    yield
+    columnar_engine.reset()
+
+
+async def _both_backends(client, monkeypatch, path: str) -> dict:
+    """GET ``path`` from each backend and assert identical bodies."""
+    bodies = {}
+    for backend in ("sql", "columnar"):
+        monkeypatch.setattr(settings, "DASHBOARD_BACKEND", backend)
+        response = await client.get(path)
+        assert response.status_code == 200
+        body = response.json()
+        if "department_breakdown" in body:
+            body["department_breakdown"].sort(key=lambda d: d["department"])
+        bodies[backend] = body
+    assert bodies["columnar"] == bodies["sql"]
+    return bodies["sql"]
+
+
+async def _check(client, monkeypatch) -> dict:
+    summary = await _both_backends(
+        client, monkeypatch, f"/api/v1/dashboard/summary?date_from={START}&date_to={date.today()}"
+    )
+    await _both_backends(client, monkeypatch, f"/api/v1/dashboard/summary?date_from={START}&department=HR")
+    await _both_backends(client, monkeypatch, f"/api/v1/dashboard/trend?date_from={START}&include_inactive=true")
+    return summary
+
+
+@pytest.mark.asyncio
+async def test_columnar_matches_sql_through_writes(client, monkeypatch):
+    employee_ids = []
+    for i, department in enumerate(["Engineering", "HR", "HR"]):
+        resp = await client.post("/api/v1/employees", json={
+            "employee_code": f"EMP-COL-{i}",
+            "name": f"Columnar {i}",
+            "email": f"columnar{i}@company.com",
+            "department": department,
+            "date_of_joining": "2025-01-01",
+        })
+        employee_ids.append(resp.json()["id"])
+
+    attendance_ids = []
+    for offset in range(7):
+        for i, employee_id in enumerate(employee_ids):
+            resp = await client.post("/api/v1/attendance", json={
+                "employee_id": employee_id,
+                "date": (START + timedelta(days=offset)).isoformat(),
+                "status": ["PRESENT", "ABSENT", "HALF_DAY", "ON_LEAVE"][(offset + i) % 4],
+            })
+            attendance_ids.append(resp.json()["id"])
+
+    summary = await _check(client, monkeypatch)
+    assert sum(summary["summary"].values()) == 21
+    assert columnar_engine.full_loads == 1
+
+    # Update, delete, deactivate and department move are picked up incrementally
+    await client.put(f"/api/v1/attendance/{attendance_ids[0]}", json={"status": "ABSENT"})
+    await client.delete(f"/api/v1/attendance/{attendance_ids[1]}")
+    await client.put(f"/api/v1/employees/{employee_ids[2]}", json={"is_active": False})
+    await client.put(f"/api/v1/employees/{employee_ids[0]}", json={"department": "HR"})
+    summary = await _check(client, monkeypatch)
+    assert summary["total_employees"] == 2
+
+    await client.delete(f"/api/v1/employees/{employee_ids[1]}")
+    await _check(client, monkeypatch)
+    assert columnar_engine.full_loads == 1
+    assert columnar_engine.stats()["rows"] == 21 - 1 - 6  # one deleted row, then employee 1's other six
+
+
+@pytest.mark.asyncio
+async def test_sql_answers_until_warmup_completes(client, monkeypatch):
+    columnar_engine.reset()
+    monkeypatch.setattr(settings, "DASHBOARD_BACKEND", "columnar")
+
+    response = await client.get(f"/api/v1/dashboard/summary?date_from={START}")
+    assert response.status_code == 200
+    assert columnar_engine.refreshes == 0  # answered by SQL; the load runs in the background
+
+    await columnar_engine.wait_loaded()
+    assert columnar_engine.loaded and columnar_engine.full_loads == 1
+    assert (await client.get(f"/api/v1/dashboard/summary?date_from={START}")).json() == response.json()
+    assert columnar_engine.refreshes == 1
+
+
+@pytest.mark.asyncio
+async def test_trend_fills_empty_days_and_validates_range(client):
+    response = await client.get(f"/api/v1/dashboard/trend?date_from={START}")
+    days = response.json()["days"]
+    assert len(days) == 7
+    assert all(day["present"] == 0 for day in days)
+
+    response = await client.get(f"/api/v1/dashboard/trend?date_from={date.today()}&date_to={START}")
+    assert response.status_code == 422
+    assert response.json()["error_code"] == "INVALID_DATE_RANGE"
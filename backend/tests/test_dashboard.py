@@ -63,6 +63,27 @@ async def test_dashboard_department_filter(client, seeded_data):
     assert data["summary"]["present"] == 1
     assert data["summary"]["absent"] == 0
 
+    # Unknown department: empty result, not an error
+    response = await client.get(f"/api/v1/dashboard/summary?date_from={today}&date_to={today}&department=Legal")
+    assert response.status_code == 200
+    assert response.json()["total_employees"] == 0
+    assert response.json()["department_breakdown"] == []
+
+
+@pytest.mark.asyncio
+async def test_dashboard_conditional_304(client, seeded_data):
+    """Dashboard ETag varies with filters and short-circuits to 304."""
+    today = seeded_data["date"]
+    url = f"/api/v1/dashboard/summary?date_from={today}&date_to={today}"
+    first = await client.get(url)
+    etag = first.headers["ETag"]
+
+    cached = await client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+
+    filtered = await client.get(f"{url}&department=HR", headers={"If-None-Match": etag})
+    assert filtered.status_code == 200
+
 
 @pytest.mark.asyncio
 async def test_cascade_delete_employee_removes_attendance(client, seeded_data):
@@ -76,6 +76,90 @@ async def test_list_employees_pagination(client):
     assert data["meta"]["total"] == 0
 
 
+@pytest.mark.asyncio
+async def test_list_employees_multi_value_filters(client):
+    """department and employee_id take several values, repeated or comma-separated."""
+    ids = []
+    for n, department in enumerate(["Engineering", "HR", "Finance", "HR"]):
+        resp = await client.post("/api/v1/employees", json={
+            "employee_code": f"EMP-{n:03d}", "name": f"User {n}", "email": f"user{n}@company.com",
+            "department": department, "date_of_joining": "2025-01-01",
+        })
+        ids.append(resp.json()["id"])
+
+    resp = await client.get("/api/v1/employees", params=[("department", "HR"), ("department", "Finance")])
+    assert resp.json()["meta"]["total"] == 3
+    resp = await client.get("/api/v1/employees", params={"employee_id": f"{ids[0]}, {ids[3]}"})
+    assert {e["id"] for e in resp.json()["data"]} == {ids[0], ids[3]}
+    resp = await client.get("/api/v1/employees", params={"department": "HR", "employee_id": ",".join(ids[:2])})
+    assert [e["id"] for e in resp.json()["data"]] == [ids[1]]
+
+
+@pytest.mark.asyncio
+async def test_list_employees_department_name_with_comma(client, test_engine):
+    """Department names are never comma-split; misses resolve in one query."""
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.repositories.department_repo import DepartmentRepository, reset_department_cache
+
+    await client.post("/api/v1/employees", json={
+        "employee_code": "EMP-RD", "name": "R and D", "email": "rd@company.com",
+        "department": "Research, Development", "date_of_joining": "2025-01-01",
+    })
+    resp = await client.get("/api/v1/employees", params={"department": "Research, Development"})
+    assert resp.json()["meta"]["total"] == 1
+
+    reset_department_cache()
+    selects = []
+
+    def record(conn, cursor, statement, *args):
+        selects.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        async with AsyncSession(test_engine) as session:
+            names = ["Research, Development", *(f"Bogus {i}" for i in range(50))]
+            assert len(await DepartmentRepository(session).resolve_ids(names)) == 1
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+    assert len(selects) == 1
+
+
+@pytest.mark.asyncio
+async def test_department_cache_holds_only_committed_rows(client, test_engine):
+    """A rolled-back insert leaves no id behind; names match case-insensitively."""
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    from app.repositories import department_repo
+    from app.repositories.department_repo import DepartmentRepository
+
+    async with AsyncSession(test_engine) as session:
+        repo = DepartmentRepository(session)
+        created = await repo.get_or_create("Operations")
+        assert await repo.resolve_id("Operations") == created.id
+        assert (await repo.names_by_id({created.id}))[created.id] == "Operations"
+        assert created.id not in department_repo._name_by_id
+        await session.rollback()
+    assert created.id not in department_repo._name_by_id
+
+    async with AsyncSession(test_engine) as session:
+        repo = DepartmentRepository(session)
+        department_id = (await repo.get_or_create("Operations")).id
+        await session.commit()
+    assert department_repo._name_by_id[department_id] == "Operations"
+
+    await client.post("/api/v1/employees", json={
+        "employee_code": "EMP-CI", "name": "Case Insensitive", "email": "ci@company.com",
+        "department": "Engineering", "date_of_joining": "2025-01-01",
+    })
+    async with AsyncSession(test_engine) as session:
+        repo = DepartmentRepository(session)
+        assert await repo.resolve_ids(["engineering", "ENGINEERING"]) == [await repo.resolve_id("Engineering")]
+    resp = await client.get("/api/v1/employees", params={"department": "engineering"})
+    assert resp.json()["meta"]["total"] == 1
+
+
 @pytest.mark.asyncio
 async def test_update_employee(client):
     """Test employee update."""
@@ -120,3 +204,61 @@ async def test_delete_employee_not_found_404(client):
     """DELETE non-existent employee returns 404."""
     response = await client.delete("/api/v1/employees/nonexistent-uuid")
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_employee_conditional_304(client):
+    """Detail ETag: matching If-None-Match returns 304, an update invalidates it."""
+    create_resp = await client.post("/api/v1/employees", json={
+        "employee_code": "EMP-ETAG",
+        "name": "Etag User",
+        "email": "etag@company.com",
+        "department": "Engineering",
+        "date_of_joining": "2025-06-15",
+    })
+    emp_id = create_resp.json()["id"]
+
+    first = await client.get(f"/api/v1/employees/{emp_id}")
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    cached = await client.get(f"/api/v1/employees/{emp_id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    await client.put(f"/api/v1/employees/{emp_id}", json={"designation": "Lead"})
+    refreshed = await client.get(f"/api/v1/employees/{emp_id}", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["ETag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_employee_calendar(client):
+    """One character per day plus totals; days before joining are '.'."""
+    create = await client.post("/api/v1/employees", json={
+        "employee_code": "EMP-CAL",
+        "name": "Calendar User",
+        "email": "calendar@company.com",
+        "department": "Engineering",
+        "date_of_joining": "2025-01-06",
+    })
+    employee_id = create.json()["id"]
+    for day, status in [("06", "PRESENT"), ("07", "ABSENT"), ("08", "HALF_DAY"), ("09", "ON_LEAVE")]:
+        resp = await client.post("/api/v1/attendance", json={
+            "employee_id": employee_id, "date": f"2025-01-{day}", "status": status,
+        })
+        assert resp.status_code == 201
+
+    response = await client.get(f"/api/v1/employees/{employee_id}/calendar", params={"year": 2025, "month": 1})
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["date_from"], data["date_to"]) == ("2025-01-01", "2025-01-31")
+    assert data["days"][:13] == ".....PAHL-__-"
+    assert len(data["days"]) == 31
+    assert data["totals"] == {"present": 1, "absent": 1, "half_day": 1, "on_leave": 1, "missing": 16}
+
+    year = await client.get(f"/api/v1/employees/{employee_id}/calendar", params={"year": 2025})
+    assert len(year.json()["days"]) == 365
+
+    missing = await client.get("/api/v1/employees/00000000-0000-0000-0000-000000000000/calendar")
+    assert missing.status_code == 404
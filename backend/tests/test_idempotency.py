@@ -0,0 +1,117 @@
+"""Idempotency-Key tests for create endpoints."""
+
+import asyncio
+import uuid
+from datetime import date
+
+import pytest
+
+from app.services.idempotency import IdempotencyStore, StoredResponse
+
+EMPLOYEE_PAYLOAD = {
+    "employee_code": "EMP-IDEM",
+    "name": "Idempotent User",
+    "email": "idem@company.com",
+    "department": "Engineering",
+    "date_of_joining": "2025-01-01",
+}
+
+
+@pytest.mark.asyncio
+async def test_retry_replays_first_response(client):
+    """A retried POST with the same key replays the stored 201 instead of 409."""
+    key = str(uuid.uuid4())
+    first = await client.post("/api/v1/employees", json=EMPLOYEE_PAYLOAD, headers={"Idempotency-Key": key})
+    retry = await client.post("/api/v1/employees", json=EMPLOYEE_PAYLOAD, headers={"Idempotency-Key": key})
+
+    assert first.status_code == 201
+    assert retry.status_code == 201
+    assert retry.json()["id"] == first.json()["id"]
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.headers["Location"] == first.headers["Location"]
+
+    listing = await client.get("/api/v1/employees")
+    assert listing.json()["meta"]["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_attendance_retry_does_not_hit_duplicate_check(client):
+    emp = await client.post("/api/v1/employees", json=EMPLOYEE_PAYLOAD)
+    payload = {"employee_id": emp.json()["id"], "date": date.today().isoformat(), "status": "PRESENT"}
+    key = str(uuid.uuid4())
+
+    first = await client.post("/api/v1/attendance", json=payload, headers={"Idempotency-Key": key})
+    retry = await client.post("/api/v1/attendance", json=payload, headers={"Idempotency-Key": key})
+    assert first.status_code == retry.status_code == 201
+    assert retry.json()["id"] == first.json()["id"]
+
+
+@pytest.mark.asyncio
+async def test_key_reuse_with_different_payload_422(client):
+    key = str(uuid.uuid4())
+    await client.post("/api/v1/employees", json=EMPLOYEE_PAYLOAD, headers={"Idempotency-Key": key})
+    other = {**EMPLOYEE_PAYLOAD, "employee_code": "EMP-OTHER", "email": "other@company.com"}
+    response = await client.post("/api/v1/employees", json=other, headers={"Idempotency-Key": key})
+    assert response.status_code == 422
+    assert response.json()["error_code"] == "IDEMPOTENCY_KEY_REUSED"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_wait_for_first():
+    """Concurrent requests with one key run the work once; the rest replay."""
+    store = IdempotencyStore(max_entries=10, ttl_seconds=60)
+    executions = 0
+
+    async def create():
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.01)
+        return StoredResponse(status_code=201, body={"id": "abc"})
+
+    results = await asyncio.gather(*(store.run("POST /x", "k1", "fp", create) for _ in range(4)))
+
+    assert executions == 1
+    assert [replayed for _, replayed in results].count(False) == 1
+    assert all(resp.body == {"id": "abc"} for resp, _ in results)
+
+
+@pytest.mark.asyncio
+async def test_waiter_runs_itself_when_first_request_fails(caplog):
+    """A failed original releases the key: the waiting retry logs it and runs the work."""
+    store = IdempotencyStore(max_entries=10, ttl_seconds=60)
+    attempts = 0
+
+    async def create():
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0.01)
+        if attempts == 1:
+            raise RuntimeError("connection lost")
+        return StoredResponse(status_code=201, body={"id": "abc"})
+
+    first, retry = await asyncio.gather(
+        store.run("POST /x", "k1", "fp", create),
+        store.run("POST /x", "k1", "fp", create),
+        return_exceptions=True,
+    )
+
+    assert isinstance(first, RuntimeError)
+    response, replayed = retry
+    assert response.body == {"id": "abc"} and replayed is False
+    assert attempts == 2
+    assert "original request failed" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_store_evicts_least_recently_used():
+    store = IdempotencyStore(max_entries=2, ttl_seconds=60)
+
+    async def create():
+        return StoredResponse(status_code=201, body={})
+
+    for key in ("a", "b", "c"):
+        await store.run("POST /x", key, "fp", create)
+    assert store.stats()["entries"] == 2
+
+    _, replayed = await store.run("POST /x", "a", "fp", create)
+    assert replayed is False  # evicted as least recently used
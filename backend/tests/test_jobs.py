@@ -0,0 +1,245 @@
+"""Background jobs: submit → poll → download, cancellation, recovery of abandoned jobs."""
+
+import asyncio
+import csv
+import io
+import json
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import settings
+from app.database import Base, get_db
+from app.main import create_app
+from app.repositories.job_repo import JobRepository
+from app.services.job_runner import JobOutcome, job_handler, job_runner
+from app.services.monthly_report import aggregate, split_shards
+
+
+@pytest.fixture(autouse=True)
+def job_settings(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "JOB_RESULT_DIR", str(tmp_path))
+    monkeypatch.setattr(job_runner, "poll_seconds", 0.05)
+    monkeypatch.setattr(job_runner, "process_workers", 0)
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    """A file database: the runner works concurrently with requests, which needs a
+    connection per session (the shared in-memory connection has no isolation)."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+async def client(session_factory):
+    async def get_test_db():
+        async with session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    app = create_app()
+    app.dependency_overrides[get_db] = get_test_db
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture
+async def runner(session_factory):
+    job_runner.start(session_factory)
+    yield job_runner
+    await job_runner.stop()
+
+
+@pytest.fixture
+async def employee_id(client):
+    resp = await client.post("/api/v1/employees", json={
+        "employee_code": "EMP-JOB",
+        "name": "Job User",
+        "email": "job@company.com",
+        "department": "Engineering",
+        "date_of_joining": "2025-01-01",
+    })
+    return resp.json()["id"]
+
+
+async def _wait(client, session_factory, job_id: str) -> dict:
+    """Poll the job row directly (HTTP polling would trip the rate limiter), then GET it once."""
+    for _ in range(200):
+        async with session_factory() as session:
+            job = await JobRepository(session).get_by_id(job_id)
+            if job.status in ("succeeded", "failed", "cancelled"):
+                return (await client.get(f"/api/v1/jobs/{job_id}")).json()
+        await asyncio.sleep(0.02)
+    raise AssertionError(f"job {job_id} did not finish: {job.status}")
+
+
+@pytest.mark.asyncio
+async def test_import_then_export_and_monthly_report(client, employee_id, session_factory, runner):
+    day = date.today() - timedelta(days=1)
+    body = "\n".join([
+        json.dumps({"employee_id": employee_id, "date": day.isoformat(), "status": "PRESENT",
+                    "check_in": "09:00:00", "check_out": "17:30:00"}),
+        "not json",
+    ]) + "\n"
+    resp = await client.post("/api/v1/jobs/attendance-import", content=body,
+                             headers={"Content-Type": "application/x-ndjson"})
+    assert resp.status_code == 202
+    assert resp.headers["Location"].endswith(resp.json()["id"])
+    job = await _wait(client, session_factory, resp.json()["id"])
+    assert job["status"] == "succeeded"
+    assert job["result"] == {"lines": 2, "created": 1, "updated": 0, "failed": 1, "complete": True}
+    lines = (await client.get(job["result_url"])).text.splitlines()
+    assert [json.loads(line).get("result") for line in lines[:2]] == ["created", "error"]
+
+    resp = await client.post("/api/v1/jobs/attendance-export", json={"department": "Engineering"})
+    job = await _wait(client, session_factory, resp.json()["id"])
+    assert job["status"] == "succeeded" and job["result"] == {"rows": 1}
+    download = await client.get(job["result_url"])
+    assert download.headers["content-type"].startswith("text/csv")
+    rows = list(csv.reader(io.StringIO(download.text)))
+    assert rows[1][:6] == ["EMP-JOB", "Job User", "Engineering", day.isoformat(), "PRESENT", "09:00:00"]
+
+    resp = await client.post("/api/v1/jobs/monthly-report", json={"year": day.year, "month": day.month})
+    job = await _wait(client, session_factory, resp.json()["id"])
+    assert job["status"] == "succeeded"
+    report = list(csv.DictReader(io.StringIO((await client.get(job["result_url"])).text)))
+    assert report[0]["present"] == "1" and report[0]["absent"] == "0"
+    assert report[0]["worked_hours"] == "8.5"
+
+
+@pytest.mark.asyncio
+async def test_cancel_queued_job(client):
+    resp = await client.post("/api/v1/jobs/attendance-export", json={})
+    job_id = resp.json()["id"]
+    assert resp.json()["status"] == "queued"
+
+    cancelled = await client.post(f"/api/v1/jobs/{job_id}/cancel")
+    assert cancelled.json()["status"] == "cancelled"
+    assert (await client.post(f"/api/v1/jobs/{job_id}/cancel")).status_code == 409
+    assert (await client.get(f"/api/v1/jobs/{job_id}/result")).json()["error_code"] == "JOB_NOT_FINISHED"
+    assert (await client.get("/api/v1/jobs/unknown")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_job_abandoned_by_dead_worker_is_requeued_and_run(client, session_factory):
+    resp = await client.post("/api/v1/jobs/attendance-export", json={})
+    job_id = resp.json()["id"]
+    long_ago = datetime.now(timezone.utc) - timedelta(seconds=settings.JOB_STALE_SECONDS + 1)
+    async with session_factory() as session:
+        assert await JobRepository(session).claim(job_id, "dead-host:1", long_ago)
+        await session.commit()
+
+    job_runner.start(session_factory)
+    try:
+        job = await _wait(client, session_factory, job_id)
+    finally:
+        await job_runner.stop()
+    assert job["status"] == "succeeded"
+    assert job["attempts"] == 2
+
+
+_release = asyncio.Event()
+
+
+@job_handler("test_blocking")
+async def _blocking_handler(ctx):
+    output = ctx.output(".txt")
+    output.write_text(f"attempt {ctx.attempt}")
+    await _release.wait()
+    return JobOutcome(result_file=output, media_type="text/plain")
+
+
+@pytest.mark.asyncio
+async def test_runner_stops_a_job_taken_over_by_another_runner(session_factory, tmp_path):
+    """A stalled run whose job was requeued and re-claimed elsewhere stops and records nothing."""
+    _release.clear()
+    async with session_factory() as session:
+        job = await JobRepository(session).create("test_blocking", {})
+        await session.commit()
+    job_runner.start(session_factory)
+    try:
+        # Running, and the handler has written its per-run output
+        for _ in range(200):
+            if job_runner.stats()["running"] and list(tmp_path.glob(f"{job.id}.1.txt.part")):
+                break
+            await asyncio.sleep(0.01)
+        assert list(tmp_path.glob(f"{job.id}.1.txt.part"))
+
+        # Meanwhile the job went stale, was requeued and another runner claimed it
+        async with session_factory() as session:
+            repo = JobRepository(session)
+            await repo.requeue({job.id: 1}, job_runner.worker_id)
+            assert await repo.claim(job.id, "other-host:1", datetime.now(timezone.utc))
+            await session.commit()
+
+        abandoned = job_runner.stats()["abandoned"]
+        await job_runner._tick()
+        for _ in range(200):
+            if not job_runner.stats()["running"]:
+                break
+            await asyncio.sleep(0.01)
+        assert job_runner.stats()["abandoned"] == abandoned + 1
+    finally:
+        _release.set()
+        await job_runner.stop()
+
+    async with session_factory() as session:
+        repo = JobRepository(session)
+        row = await repo.get_by_id(job.id)
+        assert (row.status, row.worker, row.attempts) == ("running", "other-host:1", 2)
+        # The stale run can no longer record anything; the new owner can
+        assert not await repo.finish(job.id, job_runner.worker_id, 1, "succeeded", datetime.now(timezone.utc))
+        assert await repo.finish(job.id, "other-host:1", 2, "succeeded", datetime.now(timezone.utc))
+        await session.commit()
+    assert not list(tmp_path.glob(f"{job.id}.*"))
+
+
+@pytest.mark.asyncio
+async def test_monthly_report_shards_never_split_an_employee():
+    facts = [("a", 1, 3600), ("a", 2, None), ("a", 1, 1800), ("b", 4, None), ("c", 3, 900), ("c", 1, 60)]
+    shards = split_shards(facts, 4)
+    assert [shard[0] for shard in shards] == [["a", "a", "a"], ["b"], ["c", "c"]]
+
+    async def run(fn, *args):
+        return fn(*args)
+
+    expected = {"a": [2, 1, 0, 0, 5400], "b": [0, 0, 0, 1, 0], "c": [1, 0, 1, 0, 960]}
+    for n in (1, 2, 3, 8):
+        assert await aggregate(facts, n, run) == expected
+    assert await aggregate([], 4, run) == {}
+
+
+@pytest.mark.asyncio
+async def test_monthly_report_npz_in_process_pool(client, employee_id, session_factory, monkeypatch):
+    np = pytest.importorskip("numpy")
+    monkeypatch.setattr(job_runner, "process_workers", 2)
+    day = date.today() - timedelta(days=1)
+    await client.post("/api/v1/attendance", json={"employee_id": employee_id, "date": day.isoformat(),
+                                                  "status": "HALF_DAY"})
+    job_runner.start(session_factory)
+    try:
+        resp = await client.post("/api/v1/jobs/monthly-report",
+                                 json={"year": day.year, "month": day.month, "format": "npz"})
+        job = await _wait(client, session_factory, resp.json()["id"])
+    finally:
+        await job_runner.stop()
+    assert job["status"] == "succeeded"
+    report = np.load(io.BytesIO((await client.get(job["result_url"])).content))
+    assert list(report["employee_code"]) == ["EMP-JOB"]
+    assert list(report["half_day"]) == [1]
+
+
+@pytest.mark.asyncio
+async def test_import_requires_ndjson(client):
+    resp = await client.post("/api/v1/jobs/attendance-import", json={})
+    assert resp.status_code == 415
@@ -0,0 +1,78 @@
+"""Middleware behaviour tests (compression)."""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+
+from app.middleware.compression import CompressionMiddleware, negotiate_encoding
+
+
+@pytest.fixture
+async def seeded_employees(client):
+    """Create enough employees that the list page exceeds the size threshold."""
+    for i in range(20):
+        await client.post("/api/v1/employees", json={
+            "employee_code": f"EMP-C{i:02d}",
+            "name": f"Compression User {i}",
+            "email": f"compress{i}@company.com",
+            "department": "Engineering",
+            "date_of_joining": "2025-01-01",
+        })
+
+
+@pytest.mark.asyncio
+async def test_large_list_is_gzipped(client, seeded_employees):
+    """Large JSON bodies are compressed when the client accepts gzip."""
+    response = await client.get(
+        "/api/v1/employees?per_page=20", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert len(response.json()["data"]) == 20
+
+
+@pytest.mark.asyncio
+async def test_small_body_is_not_compressed(client):
+    """Bodies under the minimum size are sent as-is."""
+    response = await client.get("/api/v1/health", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_is_compressed_incrementally():
+    """Multi-chunk streaming responses are compressed without buffering."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=10)
+
+    @app.get("/export")
+    async def export():
+        async def rows():
+            for i in range(100):
+                yield f"row-{i},PRESENT\n".encode()
+
+        return StreamingResponse(rows(), media_type="text/csv")
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        async with ac.stream("GET", "/export", headers={"Accept-Encoding": "gzip"}) as response:
+            raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    body = gzip.decompress(raw).decode()
+    assert body.startswith("row-0,PRESENT\n")
+    assert body.count("\n") == 100
+
+
+def test_negotiate_encoding_respects_q_values():
+    """q=0 disables a coding; unknown codings are ignored."""
+    assert negotiate_encoding("") is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("gzip;q=0") is None
+    assert negotiate_encoding("deflate, gzip") == "gzip"
+    assert negotiate_encoding("br;q=0, gzip") == "gzip"
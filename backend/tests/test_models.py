@@ -0,0 +1,67 @@
+"""Model-level tests: key generation and storage types."""
+
+import uuid
+
+import pytest
+from sqlalchemy import String, select
+from sqlalchemy.dialects import mysql, sqlite
+
+from app.config import settings
+from app.models.types import STATUS_CODES, StatusCode, UUIDKey, new_id, sql_uuid7, uuid7
+
+
+def test_uuid7_is_version_7_and_monotonic():
+    """IDs generated in sequence sort in generation order (clustered-index friendly)."""
+    ids = [uuid7() for _ in range(10_000)]
+    assert all(u.version == 7 for u in ids)
+    assert all(u.variant == uuid.RFC_4122 for u in ids)
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    assert [str(u) for u in ids] == sorted(str(u) for u in ids)
+
+
+def test_uuid_key_binary_round_trip():
+    key = UUIDKey(binary=True)
+    value = new_id()
+
+    stored = key.process_bind_param(value, sqlite.dialect())
+    assert isinstance(stored, bytes) and len(stored) == 16
+    assert key.process_result_value(stored, sqlite.dialect()) == value
+    # Malformed ids bind to NULL so lookups simply find nothing
+    assert key.process_bind_param("nonexistent-uuid", sqlite.dialect()) is None
+
+
+def test_uuid_key_storage_type_per_dialect():
+    assert UUIDKey(binary=True).load_dialect_impl(mysql.dialect()).__class__ is mysql.BINARY
+    assert UUIDKey(binary=False).load_dialect_impl(mysql.dialect()).length == 36
+    assert UUIDKey(binary=False).process_bind_param("abc", mysql.dialect()) == "abc"
+
+    # job.id is CHAR(36) in every schema variant, so it must never bind as bytes
+    from app.models.job import Job
+
+    assert type(Job.__table__.c.id.type) is String and Job.__table__.c.id.type.length == 36
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("binary", [False, True])
+async def test_sql_uuid7_on_sqlite(test_engine, monkeypatch, binary):
+    """DB-side keys are valid UUIDv7s in either storage form, without unhex() (SQLite < 3.41)."""
+    monkeypatch.setattr(settings, "DB_UUID_BINARY", binary)
+    # DB_UUID_BINARY is fixed per process in production, so it is not part of the
+    # statement cache key; bypass the cache to compile both forms here
+    async with test_engine.connect() as conn:
+        conn = await conn.execution_options(compiled_cache=None)
+        values = (await conn.execute(select(sql_uuid7(), sql_uuid7()))).one()
+    ids = [uuid.UUID(bytes=value) if binary else uuid.UUID(value) for value in values]
+    assert all(u.version == 7 and u.variant == uuid.RFC_4122 for u in ids)
+    assert ids[0] != ids[1]
+
+
+def test_status_code_round_trip():
+    status = StatusCode()
+    for name, code in STATUS_CODES.items():
+        assert status.process_bind_param(name, sqlite.dialect()) == code
+        assert status.process_result_value(code, sqlite.dialect()) == name
+    # Unknown names bind to NULL: filters match nothing, inserts violate NOT NULL
+    assert status.process_bind_param("LATE", sqlite.dialect()) is None
+    assert status.load_dialect_impl(mysql.dialect()).__class__ is mysql.TINYINT
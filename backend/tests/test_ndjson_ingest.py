@@ -0,0 +1,69 @@
+"""NDJSON streaming bulk ingest: incremental parsing, batched writes, per-line results."""
+
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from app.config import settings
+from app.services.ndjson_ingest import split_lines
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+@pytest.mark.asyncio
+async def test_split_lines_across_chunks_and_overlong_lines():
+    lines = [
+        item async for item in split_lines(
+            _chunks(b'{"a":', b'1}\n\n{"b"', b":2}\n" + b"x" * 10, b"y" * 10 + b"\nlast"),
+            max_line_bytes=15,
+        )
+    ]
+    assert lines == [(1, b'{"a":1}'), (3, b'{"b":2}'), (4, None), (5, b"last")]
+
+
+@pytest.mark.asyncio
+async def test_bulk_ingest_streams_results_per_line(client, monkeypatch):
+    monkeypatch.setattr(settings, "ATTENDANCE_NDJSON_BATCH_SIZE", 2)
+    resp = await client.post("/api/v1/employees", json={
+        "employee_code": "EMP-NDJSON",
+        "name": "Ndjson User",
+        "email": "ndjson@company.com",
+        "department": "Engineering",
+        "date_of_joining": "2025-01-01",
+    })
+    employee_id = resp.json()["id"]
+    today = date.today()
+    body = "\n".join([
+        json.dumps({"employee_id": employee_id, "date": (today - timedelta(days=2)).isoformat(), "status": "PRESENT"}),
+        json.dumps({"employee_id": employee_id, "date": (today - timedelta(days=1)).isoformat(), "status": "BOGUS"}),
+        "not json",
+        json.dumps({"employee_id": employee_id, "date": (today - timedelta(days=2)).isoformat(), "status": "ABSENT"}),
+        json.dumps({"employee_id": employee_id, "date": (today + timedelta(days=1)).isoformat(), "status": "PRESENT"}),
+    ]) + "\n"
+
+    resp = await client.post(
+        "/api/v1/attendance/bulk", content=body, headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert [(line["line"], line["result"]) for line in lines[:-1]] == [
+        (1, "created"), (2, "error"), (3, "error"), (4, "updated"), (5, "error"),
+    ]
+    assert lines[1]["error"]["error_code"] == "VALIDATION_ERROR"
+    assert lines[4]["error"]["error_code"] == "FUTURE_DATE"
+    assert lines[-1] == {"summary": {"lines": 5, "created": 1, "updated": 1, "failed": 3, "complete": True}}
+
+    record = (await client.get(f"/api/v1/attendance/{lines[0]['id']}")).json()
+    assert record["status"] == "ABSENT"
+
+
+@pytest.mark.asyncio
+async def test_bulk_ingest_requires_ndjson(client):
+    resp = await client.post("/api/v1/attendance/bulk", json=[{"status": "PRESENT"}])
+    assert resp.status_code == 415
+    assert resp.json()["error_code"] == "UNSUPPORTED_MEDIA_TYPE"
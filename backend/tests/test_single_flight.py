@@ -0,0 +1,66 @@
+"""Single-flight coalescing tests."""
+
+import asyncio
+
+import pytest
+
+from app.services.single_flight import SingleFlight, make_key
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_execution():
+    """Followers receive the leader's result; the function runs once."""
+    group = SingleFlight("test")
+    executions = 0
+
+    async def query():
+        nonlocal executions
+        executions += 1
+        await asyncio.sleep(0.01)
+        return ["row"]
+
+    key = make_key(page=1, per_page=20)
+    results = await asyncio.gather(*(group.do(key, query) for _ in range(5)))
+
+    assert executions == 1
+    assert all(r == ["row"] for r in results)
+    assert group.stats() == {"calls": 5, "executions": 1, "collapsed": 4, "in_flight": 0}
+
+
+@pytest.mark.asyncio
+async def test_different_keys_and_sequential_calls_are_not_collapsed():
+    """Only concurrent calls with the same key are shared — nothing is cached."""
+    group = SingleFlight("test")
+
+    async def query():
+        await asyncio.sleep(0)
+        return 1
+
+    await asyncio.gather(group.do(make_key(page=1), query), group.do(make_key(page=2), query))
+    await group.do(make_key(page=1), query)
+
+    assert group.executions == 3
+    assert group.collapsed == 0
+
+
+@pytest.mark.asyncio
+async def test_leader_error_propagates_to_followers():
+    group = SingleFlight("test")
+
+    async def failing():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db down")
+
+    results = await asyncio.gather(
+        *(group.do("k", failing) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert group.executions == 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_exposes_counters(client):
+    await client.get("/api/v1/employees")
+    response = await client.get("/api/v1/metrics")
+    assert response.status_code == 200
+    assert "employee.list" in response.json()["single_flight"]